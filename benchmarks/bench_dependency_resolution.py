@@ -0,0 +1,72 @@
+"""
+Micro-benchmark do custo por requisição da resolução de dependências.
+
+Compara o padrão anterior (dependency síncrona, executada pelo FastAPI no threadpool,
+construindo um caso de uso novo a cada chamada) com o atual (dependency assíncrona
+devolvendo o singleton construído no startup).
+
+Uso:
+    python -m benchmarks.bench_dependency_resolution [iterações]
+"""
+
+import asyncio
+import sys
+import time
+from unittest.mock import MagicMock
+
+from starlette.concurrency import run_in_threadpool
+
+from src.adapters.http.dependencies import get_create_order_use_case
+from src.app.container import container
+from src.application.use_cases.create_order import CreateOrderUseCase
+
+
+def legacy_get_create_order_use_case() -> CreateOrderUseCase:
+    """Reproduz a dependency anterior: checagem de inicialização + nova instância."""
+    if not container._repository:
+        raise RuntimeError("Container não inicializado")
+    return CreateOrderUseCase(container._repository)
+
+
+async def measure(iterations: int) -> dict[str, float]:
+    """
+    Mede o custo médio por resolução em microssegundos.
+
+    Args:
+        iterations: Número de resoluções por variante
+
+    Returns:
+        Custo médio em µs de cada variante
+    """
+    container._repository = MagicMock()
+    container._message_broker = MagicMock()
+    container._build_use_cases()
+
+    # Aquece o threadpool antes de medir
+    await run_in_threadpool(legacy_get_create_order_use_case)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await run_in_threadpool(legacy_get_create_order_use_case)
+    legacy = (time.perf_counter() - started) / iterations * 1e6
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await get_create_order_use_case()
+    singleton = (time.perf_counter() - started) / iterations * 1e6
+
+    return {"legacy_threadpool_new_instance_us": legacy, "async_singleton_us": singleton}
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    results = asyncio.run(measure(iterations))
+    for name, value in results.items():
+        print(f"{name:40s} {value:10.3f} µs/req")
+    speedup = results["legacy_threadpool_new_instance_us"] / results["async_singleton_us"]
+    print(f"{'speedup':40s} {speedup:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
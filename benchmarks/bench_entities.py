@@ -0,0 +1,137 @@
+"""
+Benchmark de memória e throughput das entidades Order e Money.
+
+Compara as classes atuais (com `__slots__`, itens em tupla e Money em centavos
+inteiros) com uma cópia das implementações anteriores (`__dict__` por instância,
+`items.copy()` a cada acesso e `Decimal(str(amount))` sempre).
+
+Uso:
+    python -m benchmarks.bench_entities [quantidade_de_pedidos]
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+class LegacyMoney:
+    """Money anterior: `__dict__` e conversão por str sempre."""
+
+    def __init__(self, amount: Decimal | float | int, currency: str = "BRL") -> None:
+        if amount < 0:
+            raise ValueError("Valor monetário não pode ser negativo")
+        self._amount = Decimal(str(amount))
+        self._currency = currency
+
+
+class LegacyOrder:
+    """Order anterior: `__dict__` e cópia da lista de itens a cada acesso."""
+
+    def __init__(
+        self,
+        order_id: str,
+        customer_id: str,
+        items: list[dict[str, Any]],
+        total_amount: LegacyMoney,
+        status: OrderStatus = OrderStatus.PENDING,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ) -> None:
+        self._id = order_id
+        self._customer_id = customer_id
+        self._items = items
+        self._total_amount = total_amount
+        self._status = status
+        self._created_at = created_at or datetime.utcnow()
+        self._updated_at = updated_at or datetime.utcnow()
+
+    @property
+    def items(self) -> list[dict[str, Any]]:
+        return self._items.copy()
+
+
+def build_current(index: int, items: list[dict[str, Any]], now: datetime) -> Order:
+    """Constrói um pedido com as classes atuais."""
+    return Order(
+        order_id=OrderId(f"order-{index}"),
+        customer_id="customer-1",
+        items=items,
+        total_amount=Money(Decimal("100.00")),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def build_legacy(index: int, items: list[dict[str, Any]], now: datetime) -> LegacyOrder:
+    """Constrói um pedido com as classes anteriores."""
+    return LegacyOrder(
+        order_id=f"order-{index}",
+        customer_id="customer-1",
+        items=items,
+        total_amount=LegacyMoney(Decimal("100.00")),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def measure(build: Callable[[int, list[dict[str, Any]], datetime], Any], count: int) -> dict:
+    """
+    Mede memória retida e throughput de construção/leitura de itens.
+
+    Args:
+        build: Função que constrói um pedido
+        count: Quantidade de pedidos
+
+    Returns:
+        Métricas da variante
+    """
+    item = {"product_id": "prod-1", "quantity": 1, "price": 10.0}
+    now = datetime.utcnow()
+
+    # Cada pedido recebe sua própria lista, como acontece ao decodificar documentos
+    tracemalloc.start()
+    orders = [build(i, [item] * 10, now) for i in range(count)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del orders
+    started = time.perf_counter()
+    orders = [build(i, [item] * 10, now) for i in range(count)]
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for order in orders:
+        order.items
+        order.items
+    access_seconds = time.perf_counter() - started
+
+    return {
+        "bytes_per_order": retained / count,
+        "builds_per_second": count / build_seconds,
+        "items_reads_per_second": 2 * count / access_seconds,
+    }
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for name, build in (("legacy", build_legacy), ("current", build_current)):
+        results = measure(build, count)
+        print(
+            f"{name:8s} {results['bytes_per_order']:8.1f} B/order  "
+            f"{results['builds_per_second']:12,.0f} builds/s  "
+            f"{results['items_reads_per_second']:14,.0f} items reads/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
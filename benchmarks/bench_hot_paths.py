@@ -0,0 +1,290 @@
+"""
+Suite de micro-benchmarks dos caminhos quentes de domínio e serialização.
+
+Cobre construção de `Order`, `Order.to_dict`, a conversão do repositório
+(`_order_to_dict`/`_dict_to_order`), aritmética de `Money`,
+`OrderStatus.can_transition_to` e a validação de `OrderResponse`; os casos que
+dependem do tamanho do pedido rodam com 1, 10, 100 e 1000 itens.
+
+Cada caso é medido com `timeit`: o número de chamadas por rodada é calibrado
+para ~0,2 s e vale a menor média entre as rodadas, a menos sujeita a ruído.
+Os resultados podem ser gravados em JSON e comparados com um baseline:
+
+Uso:
+    python -m benchmarks.bench_hot_paths run [-o resultados.json] [--items 1,10] [-k filtro]
+    python -m benchmarks.bench_hot_paths compare baseline.json atual.json [--threshold 0.10]
+
+`compare` termina com código 1 se algum caso ficou mais lento que o limite.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.adapters.http.schemas import OrderResponse
+from src.adapters.persistence.mongo_order_repository import MongoOrderRepository
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+ITEM_COUNTS = (1, 10, 100, 1000)
+DEFAULT_THRESHOLD = 0.10
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+ORDER_ID = OrderId("01890a5d-ac96-774b-bcce-b302099a8057")
+
+# Só as conversões são medidas: o banco nunca é acessado
+repository = MongoOrderRepository(MagicMock())
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """Caso de benchmark: `setup` recebe a quantidade de itens e devolve a função medida."""
+
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    by_items: bool = True
+
+
+def build_items(count: int) -> list[dict[str, Any]]:
+    """Itens de pedido como chegam da API e do MongoDB."""
+    return [
+        {"product_id": f"prod-{i}", "quantity": i % 5 + 1, "price": 10.0 + i % 100}
+        for i in range(count)
+    ]
+
+
+def build_order(count: int) -> Order:
+    """Pedido com `count` itens."""
+    return Order(
+        order_id=ORDER_ID,
+        customer_id="customer-1",
+        items=build_items(count),
+        total_amount=Money(100),
+        status=OrderStatus.CONFIRMED,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def setup_order_construction(count: int) -> Callable[[], Any]:
+    """Construção de Order (cópia dos itens em tupla incluída)."""
+    items = build_items(count)
+    total = Money(100)
+
+    def run() -> Order:
+        return Order(
+            order_id=ORDER_ID,
+            customer_id="customer-1",
+            items=items,
+            total_amount=total,
+            status=OrderStatus.CONFIRMED,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+    return run
+
+
+def setup_order_to_dict(count: int) -> Callable[[], Any]:
+    """Order.to_dict, usado pelas respostas HTTP."""
+    return build_order(count).to_dict
+
+
+def setup_repository_to_document(count: int) -> Callable[[], Any]:
+    """Order para documento MongoDB."""
+    order = build_order(count)
+    return lambda: repository._order_to_dict(order)
+
+
+def setup_repository_from_document(count: int) -> Callable[[], Any]:
+    """Documento MongoDB para Order."""
+    document = repository._order_to_dict(build_order(count))
+    return lambda: repository._dict_to_order(document)
+
+
+def setup_money_arithmetic(count: int) -> Callable[[], Any]:
+    """Subtotal (preço × quantidade) de cada item e soma do pedido."""
+    lines = [(Money(item["price"]), item["quantity"]) for item in build_items(count)]
+
+    def run() -> Money:
+        return Money.sum(price * quantity for price, quantity in lines)
+
+    return run
+
+
+def setup_status_transitions(count: int) -> Callable[[], Any]:
+    """Todas as combinações de `can_transition_to` (36 verificações)."""
+    pairs = [(current, new) for current in OrderStatus for new in OrderStatus]
+
+    def run() -> int:
+        return sum(current.can_transition_to(new) for current, new in pairs)
+
+    return run
+
+
+def setup_order_response(count: int) -> Callable[[], Any]:
+    """Validação de OrderResponse a partir de Order.to_dict."""
+    payload = build_order(count).to_dict()
+    return lambda: OrderResponse.model_validate(payload)
+
+
+CASES = (
+    Case("order_construction", setup_order_construction),
+    Case("order_to_dict", setup_order_to_dict),
+    Case("repository_order_to_dict", setup_repository_to_document),
+    Case("repository_dict_to_order", setup_repository_from_document),
+    Case("money_arithmetic", setup_money_arithmetic),
+    Case("status_can_transition_to", setup_status_transitions, by_items=False),
+    Case("order_response_validation", setup_order_response),
+)
+
+
+def measure(function: Callable[[], Any], repeat: int = 5) -> dict[str, float]:
+    """
+    Mede o custo por chamada.
+
+    Args:
+        function: Função sem argumentos
+        repeat: Rodadas de medição
+
+    Returns:
+        Menor e mediana do custo por chamada (ns) e chamadas por rodada
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    per_call = sorted(total / number * 1e9 for total in timer.repeat(repeat, number))
+    return {
+        "ns_per_op": round(per_call[0], 1),
+        "median_ns": round(per_call[len(per_call) // 2], 1),
+        "number": number,
+    }
+
+
+def run(
+    item_counts: Sequence[int] = ITEM_COUNTS, name_filter: str | None = None, repeat: int = 5
+) -> dict[str, Any]:
+    """
+    Executa a suite, imprimindo cada resultado.
+
+    Args:
+        item_counts: Quantidades de itens dos casos parametrizados
+        name_filter: Executa só casos cujo nome contém o texto
+        repeat: Rodadas de medição por caso
+
+    Returns:
+        Resultados por caso (`nome[items=N]`) e informações do ambiente
+    """
+    results: dict[str, dict[str, float]] = {}
+    for case in CASES:
+        if name_filter and name_filter not in case.name:
+            continue
+        for count in item_counts if case.by_items else (0,):
+            key = f"{case.name}[items={count}]" if case.by_items else case.name
+            results[key] = measure(case.setup(count), repeat)
+            print(f"{key:45s} {results[key]['ns_per_op']:14,.1f} ns/op", flush=True)
+
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """
+    Compara dois resultados, imprimindo a variação de cada caso.
+
+    Args:
+        baseline: Resultado de referência
+        current: Resultado novo
+        threshold: Aumento relativo de `ns_per_op` considerado regressão (0.10 = 10%)
+
+    Returns:
+        Casos com regressão acima do limite
+    """
+    regressions = []
+    baseline_results = baseline["results"]
+    for key, result in current["results"].items():
+        reference = baseline_results.get(key)
+        if reference is None:
+            print(f"{key:45s} {'(novo)':>14s}")
+            continue
+        change = result["ns_per_op"] / reference["ns_per_op"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSÃO"
+        print(
+            f"{key:45s} {reference['ns_per_op']:12,.1f} -> {result['ns_per_op']:12,.1f} ns/op"
+            f"  {change:+7.1%}{flag}"
+        )
+    for key in sorted(baseline_results.keys() - current["results"].keys()):
+        print(f"{key:45s} {'(ausente)':>14s}")
+    return regressions
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Executa a suite")
+    run_parser.add_argument("-o", "--output", type=Path, help="Grava os resultados em JSON")
+    run_parser.add_argument(
+        "--items",
+        default=",".join(map(str, ITEM_COUNTS)),
+        help="Quantidades de itens, separadas por vírgula (padrão: 1,10,100,1000)",
+    )
+    run_parser.add_argument("-k", "--filter", help="Executa só casos cujo nome contém o texto")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Rodadas por caso")
+
+    compare_parser = subparsers.add_parser("compare", help="Compara com um baseline")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Aumento relativo considerado regressão (padrão: 0.10)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Executa o comando pedido e retorna o código de saída."""
+    args = parse_args(argv)
+
+    if args.command == "run":
+        item_counts = [int(count) for count in args.items.split(",") if count.strip()]
+        results = run(item_counts, args.filter, args.repeat)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+            print(f"Resultados gravados em {args.output}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} caso(s) acima de {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"Nenhuma regressão acima de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark do custo da instrumentação Prometheus por chamada.
+
+Compara uma coroutine sem instrumentação com a mesma coroutine decorada com
+`timed`. Uma requisição típica passa por um caso de uso, uma ou duas operações
+do repositório e, nas escritas, uma publicação: o custo por requisição é o
+overhead medido vezes o número de camadas instrumentadas.
+
+Uso:
+    python -m benchmarks.bench_metrics [iterações]
+"""
+
+import asyncio
+import sys
+import time
+
+from src.application.metrics import USE_CASE_SECONDS, timed
+
+
+async def plain() -> int:
+    """Coroutine de referência."""
+    return 1
+
+
+instrumented = timed(USE_CASE_SECONDS, "benchmark")(plain)
+
+
+async def measure(iterations: int) -> dict[str, float]:
+    """
+    Mede o custo médio por chamada em microssegundos.
+
+    Args:
+        iterations: Número de chamadas por variante
+
+    Returns:
+        Custo médio em µs de cada variante
+    """
+    results: dict[str, float] = {}
+    for name, function in (("plain_us", plain), ("timed_us", instrumented)):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await function()
+        results[name] = (time.perf_counter() - started) / iterations * 1e6
+    results["overhead_us"] = results["timed_us"] - results["plain_us"]
+    return results
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    results = asyncio.run(measure(iterations))
+    for name, value in results.items():
+        print(f"{name:40s} {value:10.3f} µs/chamada")
+    print(f"{'overhead por requisição (4 camadas)':40s} {results['overhead_us'] * 4:10.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark de inserção e tamanho do índice único `id` por estratégia de ID.
+
+Insere a mesma quantidade de pedidos em coleções temporárias, uma para cada
+combinação de estratégia (uuid4, uuid7, objectid) e formato de armazenamento
+(string ou binário), e reporta inserções por segundo e o tamanho do índice `id_1`.
+
+Requer um MongoDB acessível (variável `MONGODB_URL`, padrão localhost).
+
+Uso:
+    python -m benchmarks.bench_order_ids [quantidade_de_pedidos]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from src.adapters.identifiers.order_id_generators import ORDER_ID_STRATEGIES
+from src.adapters.persistence.mongo_order_repository import MongoOrderRepository
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+
+BATCH_SIZE = 1000
+
+
+async def measure(
+    client: AsyncIOMotorClient, strategy: str, binary_ids: bool, count: int
+) -> dict[str, float]:
+    """
+    Mede throughput de inserção e tamanho do índice de uma variante.
+
+    Args:
+        client: Cliente MongoDB
+        strategy: Estratégia de geração de IDs
+        binary_ids: Grava IDs em formato binário
+        count: Quantidade de pedidos
+
+    Returns:
+        Métricas da variante
+    """
+    database = client["bench_order_ids"]
+    name = f"orders_{strategy}_{'bin' if binary_ids else 'str'}"
+    await database.drop_collection(name)
+    collection = database[name]
+    await collection.create_index("id", unique=True)
+
+    repository = MongoOrderRepository(database, name, binary_ids=binary_ids)
+    generator = ORDER_ID_STRATEGIES[strategy]()
+    now = datetime.utcnow()
+    item = {"product_id": "prod-1", "quantity": 1, "price": 10.0}
+
+    elapsed = 0.0
+    for start in range(0, count, BATCH_SIZE):
+        documents = [
+            repository._order_to_dict(
+                Order(
+                    order_id=generator.new_id(),
+                    customer_id="customer-1",
+                    items=[item],
+                    total_amount=Money(10),
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            for _ in range(min(BATCH_SIZE, count - start))
+        ]
+        started = time.perf_counter()
+        await collection.insert_many(documents, ordered=False)
+        elapsed += time.perf_counter() - started
+
+    stats = await database.command("collStats", name)
+    await database.drop_collection(name)
+    return {
+        "inserts_per_second": count / elapsed,
+        "index_bytes": stats["indexSizes"]["id_1"],
+    }
+
+
+async def main() -> None:
+    """Executa o benchmark e imprime os resultados."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    client = AsyncIOMotorClient(os.environ.get("MONGODB_URL", "mongodb://localhost:27017"))
+    try:
+        for strategy in ORDER_ID_STRATEGIES:
+            for binary_ids in (False, True):
+                results = await measure(client, strategy, binary_ids, count)
+                storage = "binary" if binary_ids else "string"
+                print(
+                    f"{strategy:9s} {storage:7s} "
+                    f"{results['inserts_per_second']:10,.0f} inserts/s  "
+                    f"{results['index_bytes'] / count:6.1f} B/entry (id_1)"
+                )
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
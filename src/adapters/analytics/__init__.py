@@ -0,0 +1,9 @@
+"""Adapters de exportação para análise de dados."""
+
+from src.adapters.analytics.parquet_order_writer import (
+    ParquetOrderWriter,
+    load_watermark,
+    save_watermark,
+)
+
+__all__ = ["ParquetOrderWriter", "load_watermark", "save_watermark"]
@@ -0,0 +1,336 @@
+"""
+Exportação de pedidos para Parquet particionado (dia de criação e status).
+
+Requer `pyarrow` (requirements-analytics.txt), importado apenas quando o
+exportador é criado.
+"""
+
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import currency_exponent, to_minor_units
+
+logger = structlog.get_logger()
+
+WATERMARK_FILE = "_watermark.json"
+
+Partition = tuple[str, str]
+
+
+def _load_pyarrow() -> tuple[Any, Any]:
+    """
+    Importa o pyarrow sob demanda.
+
+    Returns:
+        Módulos `pyarrow` e `pyarrow.parquet`
+
+    Raises:
+        ImportError: Se o pyarrow não estiver instalado
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Exportação Parquet requer pyarrow: pip install -r requirements-analytics.txt"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def load_watermark(output_dir: str | Path) -> datetime | None:
+    """
+    Lê o `updated_at` até onde a última exportação foi concluída.
+
+    Args:
+        output_dir: Diretório da exportação
+
+    Returns:
+        Marca d'água ou None se nunca houve exportação
+    """
+    try:
+        with open(Path(output_dir) / WATERMARK_FILE, encoding="utf-8") as handle:
+            return datetime.fromisoformat(json.load(handle)["updated_to"])
+    except FileNotFoundError:
+        return None
+
+
+def save_watermark(output_dir: str | Path, updated_to: datetime) -> None:
+    """
+    Grava a marca d'água de forma atômica.
+
+    Args:
+        output_dir: Diretório da exportação
+        updated_to: Fim (exclusivo) do intervalo exportado
+    """
+    path = Path(output_dir) / WATERMARK_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{WATERMARK_FILE}.tmp")
+    temporary.write_text(json.dumps({"updated_to": updated_to.isoformat()}), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+class ParquetOrderWriter:
+    """
+    Grava pedidos em duas tabelas Parquet com partições no estilo Hive.
+
+    `orders/date=AAAA-MM-DD/status=<status>/part-<run>-<n>.parquet` guarda um
+    pedido por linha e `order_items/...` os itens achatados (um por linha, com
+    `order_id`). Cada partição acumula pedidos até `row_group_size` antes de
+    gravar um row group; o total em memória é limitado por `max_buffered_rows` e
+    o número de arquivos abertos por `max_open_writers`.
+
+    Os arquivos são gravados com nome oculto e só ficam visíveis em `close()`,
+    para que uma execução interrompida não deixe dados parciais no dataset.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        run_id: str,
+        row_group_size: int = 50_000,
+        max_buffered_rows: int = 200_000,
+        max_open_writers: int = 64,
+        compression: str = "zstd",
+    ) -> None:
+        """
+        Inicializa o exportador.
+
+        Args:
+            output_dir: Diretório raiz do dataset
+            run_id: Identificador da execução (entra no nome dos arquivos)
+            row_group_size: Pedidos por row group
+            max_buffered_rows: Pedidos mantidos em memória antes de gravar tudo
+            max_open_writers: Arquivos Parquet abertos ao mesmo tempo
+            compression: Codec de compressão
+        """
+        self._pa, self._pq = _load_pyarrow()
+        self._output_dir = Path(output_dir)
+        self._run_id = run_id
+        self._row_group_size = row_group_size
+        self._max_buffered_rows = max_buffered_rows
+        self._max_open_writers = max_open_writers
+        self._compression = compression
+
+        self._buffers: dict[Partition, list[Order]] = {}
+        self._buffered = 0
+        self._writers: OrderedDict[tuple[str, Partition], Any] = OrderedDict()
+        self._sequence: dict[tuple[str, Partition], int] = {}
+        self._pending_files: list[tuple[Path, Path]] = []
+        self._orders = 0
+        self._items = 0
+
+        pa = self._pa
+        timestamp = pa.timestamp("ms")
+        self._schemas = {
+            "orders": pa.schema(
+                [
+                    ("id", pa.string()),
+                    ("customer_id", pa.string()),
+                    ("total_amount_minor", pa.int64()),
+                    ("currency", pa.string()),
+                    ("currency_exponent", pa.int8()),
+                    ("items_count", pa.int32()),
+                    ("created_at", timestamp),
+                    ("updated_at", timestamp),
+                ]
+            ),
+            "order_items": pa.schema(
+                [
+                    ("order_id", pa.string()),
+                    ("line", pa.int32()),
+                    ("product_id", pa.string()),
+                    ("quantity", pa.int64()),
+                    ("price", pa.float64()),
+                    ("price_minor", pa.int64()),
+                    ("updated_at", timestamp),
+                ]
+            ),
+        }
+
+    def write(self, orders: Sequence[Order]) -> None:
+        """
+        Acrescenta pedidos às partições, gravando row groups quando cheias.
+
+        Args:
+            orders: Lote de pedidos
+        """
+        for order in orders:
+            partition = (order.created_at.strftime("%Y-%m-%d"), order.status.value)
+            buffer = self._buffers.setdefault(partition, [])
+            buffer.append(order)
+            self._buffered += 1
+            if len(buffer) >= self._row_group_size:
+                self._flush(partition)
+
+        if self._buffered >= self._max_buffered_rows:
+            for partition in list(self._buffers):
+                self._flush(partition)
+
+    async def write_batches(self, batches: AsyncIterator[list[Order]]) -> dict[str, Any]:
+        """
+        Consome os lotes gravando cada um em uma thread enquanto o próximo é lido.
+
+        Em caso de erro os arquivos da execução são descartados.
+
+        Args:
+            batches: Lotes de pedidos
+
+        Returns:
+            Estatísticas da exportação (ver `close`)
+        """
+        pending: asyncio.Task[None] | None = None
+        try:
+            async for batch in batches:
+                if pending is not None:
+                    await pending
+                pending = asyncio.create_task(asyncio.to_thread(self.write, batch))
+            if pending is not None:
+                await pending
+        except BaseException:
+            if pending is not None and not pending.done():
+                await asyncio.gather(pending, return_exceptions=True)
+            self.abort()
+            raise
+        return self.close()
+
+    def close(self) -> dict[str, Any]:
+        """
+        Grava o que restou em memória, fecha os arquivos e os torna visíveis.
+
+        Returns:
+            Pedidos, itens e arquivos gravados
+        """
+        for partition in list(self._buffers):
+            self._flush(partition)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+        for temporary, final in self._pending_files:
+            os.replace(temporary, final)
+        files = [str(final) for _, final in self._pending_files]
+        self._pending_files = []
+
+        result = {"orders": self._orders, "items": self._items, "files": len(files)}
+        logger.info("Exportação Parquet concluída", run_id=self._run_id, **result)
+        return result
+
+    def abort(self) -> None:
+        """Fecha e apaga os arquivos ainda não publicados desta execução."""
+        for writer in self._writers.values():
+            try:
+                writer.close()
+            except Exception as e:
+                logger.warning("Erro ao fechar arquivo Parquet", error=str(e))
+        self._writers.clear()
+        for temporary, _ in self._pending_files:
+            temporary.unlink(missing_ok=True)
+        self._pending_files = []
+        self._buffers.clear()
+        self._buffered = 0
+
+    def _flush(self, partition: Partition) -> None:
+        """
+        Grava o buffer de uma partição como um row group em cada tabela.
+
+        Args:
+            partition: (dia, status)
+        """
+        orders = self._buffers.pop(partition, [])
+        if not orders:
+            return
+        self._buffered -= len(orders)
+
+        order_columns: dict[str, list[Any]] = {name: [] for name in self._schemas["orders"].names}
+        item_columns: dict[str, list[Any]] = {
+            name: [] for name in self._schemas["order_items"].names
+        }
+        for order in orders:
+            money = order.total_amount
+            exponent = currency_exponent(money.currency)
+            order_columns["id"].append(str(order.id))
+            order_columns["customer_id"].append(order.customer_id)
+            order_columns["total_amount_minor"].append(money.minor_units)
+            order_columns["currency"].append(money.currency)
+            order_columns["currency_exponent"].append(exponent)
+            order_columns["items_count"].append(len(order.items))
+            order_columns["created_at"].append(order.created_at)
+            order_columns["updated_at"].append(order.updated_at)
+            for line, item in enumerate(order.items):
+                price = item.get("price")
+                item_columns["order_id"].append(str(order.id))
+                item_columns["line"].append(line)
+                item_columns["product_id"].append(item.get("product_id"))
+                item_columns["quantity"].append(item.get("quantity"))
+                item_columns["price"].append(price)
+                item_columns["price_minor"].append(
+                    to_minor_units(price, exponent) if price is not None else None
+                )
+                item_columns["updated_at"].append(order.updated_at)
+
+        self._write("orders", partition, order_columns)
+        if item_columns["order_id"]:
+            self._write("order_items", partition, item_columns)
+        self._orders += len(orders)
+        self._items += len(item_columns["order_id"])
+
+    def _write(self, table: str, partition: Partition, columns: dict[str, list[Any]]) -> None:
+        """
+        Converte as colunas em um RecordBatch e grava no arquivo da partição.
+
+        Args:
+            table: "orders" ou "order_items"
+            partition: (dia, status)
+            columns: Valores por coluna
+        """
+        schema = self._schemas[table]
+        batch = self._pa.RecordBatch.from_pydict(columns, schema=schema)
+        self._writer(table, partition).write_batch(batch)
+
+    def _writer(self, table: str, partition: Partition) -> Any:
+        """
+        Retorna o arquivo aberto da partição, abrindo um novo se preciso.
+
+        Acima de `max_open_writers` o arquivo usado há mais tempo é fechado; se a
+        partição voltar a receber dados, um novo arquivo (`part-<run>-<n+1>`) é criado.
+
+        Args:
+            table: "orders" ou "order_items"
+            partition: (dia, status)
+
+        Returns:
+            `pyarrow.parquet.ParquetWriter`
+        """
+        key = (table, partition)
+        writer = self._writers.get(key)
+        if writer is not None:
+            self._writers.move_to_end(key)
+            return writer
+
+        if len(self._writers) >= self._max_open_writers:
+            _, oldest = self._writers.popitem(last=False)
+            oldest.close()
+
+        sequence = self._sequence.get(key, 0)
+        self._sequence[key] = sequence + 1
+        day, status = partition
+        directory = self._output_dir / table / f"date={day}" / f"status={status}"
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"part-{self._run_id}-{sequence:05d}.parquet"
+        temporary = directory / f".{name}.inprogress"
+
+        writer = self._pq.ParquetWriter(
+            temporary, self._schemas[table], compression=self._compression
+        )
+        self._pending_files.append((temporary, directory / name))
+        self._writers[key] = writer
+        return writer
@@ -0,0 +1,15 @@
+"""Adapters de leitura e escrita de arquivos de pedidos."""
+
+from src.adapters.files.order_files import (
+    detect_format,
+    load_import_checkpoint,
+    read_order_records,
+    save_import_checkpoint,
+)
+
+__all__ = [
+    "detect_format",
+    "load_import_checkpoint",
+    "read_order_records",
+    "save_import_checkpoint",
+]
@@ -0,0 +1,144 @@
+"""Leitura de arquivos NDJSON/CSV de pedidos e checkpoint da importação."""
+
+import csv
+import gzip
+import json
+import os
+from collections.abc import Iterator
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import IO, Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+SUPPORTED_FORMATS = ("ndjson", "csv")
+
+
+def detect_format(path: str | Path) -> str:
+    """
+    Deduz o formato pelo nome do arquivo (`.ndjson`, `.jsonl`, `.csv`, com ou sem `.gz`).
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        "ndjson" ou "csv"
+
+    Raises:
+        ValueError: Se a extensão não for reconhecida
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes if suffix.lower() != ".gz"]
+    extension = suffixes[-1] if suffixes else ""
+    if extension in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Formato não reconhecido para {path}; use --format")
+
+
+def _open_text(path: str | Path) -> IO[str]:
+    """Abre o arquivo em modo texto, descomprimindo `.gz` em streaming."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _csv_record(row: dict[str, str]) -> dict[str, Any]:
+    """
+    Converte uma linha CSV para o formato de registro da importação.
+
+    Colunas: id, customer_id, items (JSON), total_amount, currency, status,
+    created_at, updated_at.
+
+    Args:
+        row: Linha lida pelo `csv.DictReader`
+
+    Returns:
+        Registro com `items` decodificado e `total_amount` decimal
+    """
+    record: dict[str, Any] = {key: value for key, value in row.items() if value not in (None, "")}
+    record["items"] = json.loads(record.get("items", "[]"))
+    if "total_amount" in record:
+        record["total_amount"] = Decimal(record["total_amount"])
+    return record
+
+
+def read_order_records(
+    path: str | Path, file_format: str, start_after: int = 0
+) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """
+    Lê os registros do arquivo em streaming, uma linha por vez.
+
+    Linhas até `start_after` são puladas sem serem decodificadas. Linhas que não
+    puderem ser decodificadas são devolvidas com registro None.
+
+    Args:
+        path: Caminho do arquivo
+        file_format: "ndjson" ou "csv"
+        start_after: Última linha já processada (checkpoint)
+
+    Yields:
+        Número da linha (1 = primeiro registro) e o registro
+    """
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Formato inválido: {file_format}")
+
+    with _open_text(path) as handle:
+        if file_format == "ndjson":
+            for line_number, line in enumerate(handle, start=1):
+                if line_number <= start_after or not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    yield line_number, None
+                    continue
+                yield line_number, record if isinstance(record, dict) else None
+        else:
+            for line_number, row in enumerate(csv.DictReader(handle), start=1):
+                if line_number <= start_after:
+                    continue
+                try:
+                    yield line_number, _csv_record(row)
+                except (ValueError, InvalidOperation):
+                    yield line_number, None
+
+
+def load_import_checkpoint(checkpoint_path: str | Path, source: str | Path) -> int:
+    """
+    Lê a última linha confirmada de uma importação anterior do mesmo arquivo.
+
+    Args:
+        checkpoint_path: Arquivo de checkpoint
+        source: Arquivo importado
+
+    Returns:
+        Última linha confirmada (0 se não houver checkpoint)
+    """
+    try:
+        with open(checkpoint_path, encoding="utf-8") as handle:
+            checkpoint = json.load(handle)
+    except FileNotFoundError:
+        return 0
+
+    if checkpoint.get("source") != str(Path(source).resolve()):
+        logger.warning("Checkpoint de outro arquivo ignorado", checkpoint=str(checkpoint_path))
+        return 0
+    return int(checkpoint.get("line", 0))
+
+
+def save_import_checkpoint(checkpoint_path: str | Path, source: str | Path, line: int) -> None:
+    """
+    Grava a última linha confirmada de forma atômica (arquivo temporário + rename).
+
+    Args:
+        checkpoint_path: Arquivo de checkpoint
+        source: Arquivo importado
+        line: Última linha confirmada
+    """
+    temporary = f"{checkpoint_path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump({"source": str(Path(source).resolve()), "line": line}, handle)
+    os.replace(temporary, checkpoint_path)
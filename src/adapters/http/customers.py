@@ -0,0 +1,43 @@
+"""Endpoints de clientes."""
+
+from fastapi import APIRouter, Depends
+
+from src.adapters.http.dependencies import get_get_customer_summary_use_case
+from src.adapters.http.schemas import CustomerSummaryResponse, LastOrderSchema, MoneySchema
+from src.application.use_cases.get_customer_summary import GetCustomerSummaryUseCase
+
+router = APIRouter(prefix="/customers", tags=["customers"])
+
+
+@router.get("/{customer_id}/summary", response_model=CustomerSummaryResponse)
+async def get_customer_summary(
+    customer_id: str,
+    get_customer_summary_use_case: GetCustomerSummaryUseCase = Depends(
+        get_get_customer_summary_use_case
+    ),
+) -> CustomerSummaryResponse:
+    """
+    Obtém o resumo de pedidos de um cliente.
+
+    O resumo é mantido incrementalmente a cada criação e transição de pedido, então
+    a consulta é uma única leitura, sem percorrer os pedidos do cliente.
+
+    Args:
+        customer_id: ID do cliente
+        get_customer_summary_use_case: Caso de uso de resumo
+
+    Returns:
+        Quantidade de pedidos, gasto acumulado e último pedido
+    """
+    summary = await get_customer_summary_use_case.execute(customer_id)
+    last_order = summary["last_order"]
+    return CustomerSummaryResponse(
+        customer_id=summary["customer_id"],
+        order_count=summary["order_count"],
+        lifetime_spend=[
+            MoneySchema(amount=float(money.amount), currency=money.currency)
+            for money in summary["lifetime_spend"]
+        ],
+        last_order=LastOrderSchema(**last_order) if last_order else None,
+        updated_at=summary["updated_at"],
+    )
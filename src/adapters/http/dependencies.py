@@ -1,18 +1,87 @@
-"""Dependency functions para FastAPI."""
+"""Dependency functions para FastAPI.
 
+As dependências são `async def` para que o FastAPI as aguarde diretamente no event
+loop: funções síncronas seriam despachadas para o threadpool a cada requisição.
+"""
+
+from fastapi import HTTPException, Request, status
+
+from src.adapters.http.middleware import is_admin
+from src.adapters.messaging.order_event_hub import OrderEventHub
+from src.app.config import settings
 from src.app.container import container
+from src.app.memory_diagnostics import MemoryDiagnostics
+from src.application.use_cases.create_order import CreateOrderUseCase
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.application.use_cases.get_customer_summary import GetCustomerSummaryUseCase
+from src.application.use_cases.get_order import GetOrderUseCase
+from src.application.use_cases.get_order_history import GetOrderHistoryUseCase
+from src.application.use_cases.get_order_stats import GetOrderStatsUseCase
+from src.application.use_cases.list_orders_by_product import ListOrdersByProductUseCase
+from src.application.use_cases.update_order_status import UpdateOrderStatusUseCase
 
 
-def get_create_order_use_case():
+async def get_create_order_use_case() -> CreateOrderUseCase:
     """Dependency para criar pedido."""
     return container.get_create_order_use_case()
 
 
-def get_get_order_use_case():
+async def get_get_order_use_case() -> GetOrderUseCase:
     """Dependency para buscar pedido."""
     return container.get_get_order_use_case()
 
 
-def get_update_order_status_use_case():
+async def get_get_order_history_use_case() -> GetOrderHistoryUseCase:
+    """Dependency para buscar o histórico de status."""
+    return container.get_get_order_history_use_case()
+
+
+async def get_get_order_stats_use_case() -> GetOrderStatsUseCase:
+    """Dependency para buscar os contadores de pedidos."""
+    return container.get_get_order_stats_use_case()
+
+
+async def get_list_orders_by_product_use_case() -> ListOrdersByProductUseCase:
+    """Dependency para caso de uso de pedidos por produto."""
+    return container.get_list_orders_by_product_use_case()
+
+
+async def get_export_orders_use_case() -> ExportOrdersUseCase:
+    """Dependency para caso de uso de exportação."""
+    return container.get_export_orders_use_case()
+
+
+async def get_update_order_status_use_case() -> UpdateOrderStatusUseCase:
     """Dependency para atualizar status."""
     return container.get_update_order_status_use_case()
+
+
+async def get_get_customer_summary_use_case() -> GetCustomerSummaryUseCase:
+    """Dependency para buscar o resumo de pedidos de um cliente."""
+    return container.get_get_customer_summary_use_case()
+
+
+async def get_order_event_hub() -> OrderEventHub:
+    """Dependency para o hub de eventos de pedidos."""
+    return container.get_event_hub()
+
+
+async def get_memory_diagnostics() -> MemoryDiagnostics:
+    """Dependency para o diagnóstico de memória."""
+    return container.get_memory_diagnostics()
+
+
+async def require_admin(request: Request) -> None:
+    """
+    Dependency que restringe o endpoint a requisições com `X-Admin-Token` válido.
+
+    Args:
+        request: Requisição HTTP
+
+    Raises:
+        HTTPException: 403 se o token não conferir ou não houver `ADMIN_TOKEN`
+    """
+    if not is_admin(request, settings.admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="X-Admin-Token ausente ou inválido"
+        )
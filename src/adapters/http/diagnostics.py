@@ -0,0 +1,158 @@
+"""Endpoints administrativos de diagnóstico de memória."""
+
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+
+from src.adapters.http.dependencies import get_memory_diagnostics, require_admin
+from src.app.memory_diagnostics import KEY_TYPES, MemoryDiagnostics, SnapshotNotFoundError
+
+router = APIRouter(
+    prefix="/admin/memory",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+    include_in_schema=False,
+)
+
+KEY_TYPE_PATTERN = f"^({'|'.join(KEY_TYPES)})$"
+
+
+def _not_found(exc: SnapshotNotFoundError) -> JSONResponse:
+    """Resposta 404 para snapshot inexistente."""
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": str(exc), "error_type": "SnapshotNotFoundError"},
+    )
+
+
+@router.get("")
+async def memory_status(
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any]:
+    """
+    Estado do tracemalloc e snapshots disponíveis.
+
+    Returns:
+        Memória rastreada, overhead e snapshots
+    """
+    return diagnostics.status()
+
+
+@router.post("/start")
+async def start_tracing(
+    frames: int = Query(1, ge=1, le=25),
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any]:
+    """
+    Liga o tracemalloc.
+
+    Args:
+        frames: Frames guardados por alocação (necessário > 1 para `key_type=traceback`)
+
+    Returns:
+        Estado atual
+    """
+    return diagnostics.start(frames)
+
+
+@router.post("/stop")
+async def stop_tracing(
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any]:
+    """
+    Desliga o tracemalloc e descarta os snapshots.
+
+    Returns:
+        Estado atual
+    """
+    return diagnostics.stop()
+
+
+@router.post("/snapshots", status_code=status.HTTP_201_CREATED)
+async def take_snapshot(
+    limit: int = Query(20, ge=1, le=100),
+    key_type: str = Query("lineno", pattern=KEY_TYPE_PATTERN),
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any]:
+    """
+    Tira um snapshot e retorna os maiores pontos de alocação.
+
+    O snapshot e as estatísticas são calculados em uma thread, fora do event loop.
+
+    Args:
+        limit: Quantidade de pontos retornados
+        key_type: Agrupamento: `lineno`, `filename` ou `traceback`
+
+    Returns:
+        ID do snapshot e os maiores pontos de alocação
+    """
+    snapshot = await asyncio.to_thread(diagnostics.take_snapshot)
+    return await asyncio.to_thread(diagnostics.top, snapshot.id, limit, key_type)
+
+
+@router.get("/snapshots/{snapshot_id}", response_model=None)
+async def snapshot_top(
+    snapshot_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    key_type: str = Query("lineno", pattern=KEY_TYPE_PATTERN),
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any] | JSONResponse:
+    """
+    Maiores pontos de alocação de um snapshot.
+
+    Args:
+        snapshot_id: ID do snapshot
+        limit: Quantidade de pontos retornados
+        key_type: Agrupamento: `lineno`, `filename` ou `traceback`
+
+    Returns:
+        Pontos de alocação, do maior para o menor (404 se o snapshot não existir)
+    """
+    try:
+        return await asyncio.to_thread(diagnostics.top, snapshot_id, limit, key_type)
+    except SnapshotNotFoundError as e:
+        return _not_found(e)
+
+
+@router.get("/snapshots/{snapshot_id}/diff", response_model=None)
+async def snapshot_diff(
+    snapshot_id: int,
+    base: int = Query(..., description="ID do snapshot de referência"),
+    limit: int = Query(20, ge=1, le=100),
+    key_type: str = Query("lineno", pattern=KEY_TYPE_PATTERN),
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any] | JSONResponse:
+    """
+    Pontos de alocação que mais cresceram desde o snapshot `base`.
+
+    Args:
+        snapshot_id: ID do snapshot mais recente
+        base: ID do snapshot de referência
+        limit: Quantidade de pontos retornados
+        key_type: Agrupamento: `lineno`, `filename` ou `traceback`
+
+    Returns:
+        Diferença por ponto de alocação (404 se algum snapshot não existir)
+    """
+    try:
+        return await asyncio.to_thread(diagnostics.diff, snapshot_id, base, limit, key_type)
+    except SnapshotNotFoundError as e:
+        return _not_found(e)
+
+
+@router.get("/objects")
+async def object_counts(
+    diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+) -> dict[str, Any]:
+    """
+    Instâncias vivas de Order, Money e StatusChange e entradas dos caches.
+
+    Não depende do tracemalloc; a varredura do coletor de lixo roda em uma
+    thread, fora do event loop.
+
+    Returns:
+        Contagem por tipo e estatísticas dos caches
+    """
+    return await asyncio.to_thread(diagnostics.object_counts)
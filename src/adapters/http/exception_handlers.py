@@ -4,7 +4,17 @@ import structlog
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from src.domain.exceptions import InvalidStatusTransitionError, OrderNotFoundError
+from src.adapters.messaging.order_event_hub import SubscriberLimitError
+from src.application.deadline import DeadlineExceededError
+from src.application.metrics import count_error
+from src.domain.exceptions import (
+    CustomerNotFoundError,
+    InvalidOrderItemError,
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderStatusConflictError,
+    OrderTotalMismatchError,
+)
 
 logger = structlog.get_logger()
 
@@ -21,6 +31,7 @@ async def order_not_found_handler(request: Request, exc: OrderNotFoundError) ->
         Resposta JSON com erro 404
     """
     correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_404_NOT_FOUND)
     logger.warning(
         "Pedido não encontrado",
         path=request.url.path,
@@ -33,6 +44,31 @@ async def order_not_found_handler(request: Request, exc: OrderNotFoundError) ->
     )
 
 
+async def customer_not_found_handler(request: Request, exc: CustomerNotFoundError) -> JSONResponse:
+    """
+    Handler para exceção de cliente sem pedidos.
+
+    Args:
+        request: Requisição HTTP
+        exc: Exceção lançada
+
+    Returns:
+        Resposta JSON com erro 404
+    """
+    correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_404_NOT_FOUND)
+    logger.warning(
+        "Cliente não encontrado",
+        path=request.url.path,
+        correlation_id=correlation_id,
+        error=str(exc),
+    )
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": str(exc), "error_type": "CustomerNotFoundError"},
+    )
+
+
 async def invalid_status_transition_handler(
     request: Request, exc: InvalidStatusTransitionError
 ) -> JSONResponse:
@@ -47,6 +83,7 @@ async def invalid_status_transition_handler(
         Resposta JSON com erro 400
     """
     correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_400_BAD_REQUEST)
     logger.warning(
         "Transição de status inválida",
         path=request.url.path,
@@ -59,6 +96,110 @@ async def invalid_status_transition_handler(
     )
 
 
+async def order_status_conflict_handler(
+    request: Request, exc: OrderStatusConflictError
+) -> JSONResponse:
+    """
+    Handler para status alterado por outra operação durante a atualização.
+
+    Args:
+        request: Requisição HTTP
+        exc: Exceção lançada
+
+    Returns:
+        Resposta JSON com erro 409
+    """
+    correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_409_CONFLICT)
+    logger.warning(
+        "Conflito ao atualizar status do pedido",
+        path=request.url.path,
+        correlation_id=correlation_id,
+        error=str(exc),
+    )
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(exc), "error_type": "OrderStatusConflictError"},
+    )
+
+
+async def invalid_order_items_handler(
+    request: Request, exc: InvalidOrderItemError | OrderTotalMismatchError
+) -> JSONResponse:
+    """
+    Handler para itens inválidos ou total divergente dos itens.
+
+    Args:
+        request: Requisição HTTP
+        exc: Exceção lançada
+
+    Returns:
+        Resposta JSON com erro 422
+    """
+    correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_422_UNPROCESSABLE_ENTITY)
+    logger.warning(
+        "Itens do pedido inválidos",
+        path=request.url.path,
+        correlation_id=correlation_id,
+        error=str(exc),
+    )
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": str(exc), "error_type": type(exc).__name__},
+    )
+
+
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError) -> JSONResponse:
+    """
+    Handler para exceção de deadline expirado.
+
+    Args:
+        request: Requisição HTTP
+        exc: Exceção lançada
+
+    Returns:
+        Resposta JSON com erro 504
+    """
+    correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_504_GATEWAY_TIMEOUT)
+    logger.warning(
+        "Deadline da requisição expirado",
+        path=request.url.path,
+        correlation_id=correlation_id,
+        error=str(exc),
+    )
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": str(exc), "error_type": "DeadlineExceededError"},
+    )
+
+
+async def subscriber_limit_handler(request: Request, exc: SubscriberLimitError) -> JSONResponse:
+    """
+    Handler para limite de assinantes de eventos atingido.
+
+    Args:
+        request: Requisição HTTP
+        exc: Exceção lançada
+
+    Returns:
+        Resposta JSON com erro 503
+    """
+    correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_503_SERVICE_UNAVAILABLE)
+    logger.warning(
+        "Limite de assinantes SSE atingido",
+        path=request.url.path,
+        correlation_id=correlation_id,
+    )
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc), "error_type": "SubscriberLimitError"},
+        headers={"Retry-After": "5"},
+    )
+
+
 async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
     """
     Handler para exceção de valor inválido.
@@ -71,6 +212,7 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
         Resposta JSON com erro 400
     """
     correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_400_BAD_REQUEST)
     logger.warning(
         "Valor inválido",
         path=request.url.path,
@@ -95,6 +237,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         Resposta JSON com erro 500
     """
     correlation_id = getattr(request.state, "correlation_id", None)
+    count_error(exc, status.HTTP_500_INTERNAL_SERVER_ERROR)
     logger.error(
         "Erro interno do servidor",
         path=request.url.path,
@@ -122,6 +265,12 @@ def register_exception_handlers(app) -> None:
         app: Instância da aplicação FastAPI
     """
     app.add_exception_handler(OrderNotFoundError, order_not_found_handler)
+    app.add_exception_handler(CustomerNotFoundError, customer_not_found_handler)
     app.add_exception_handler(InvalidStatusTransitionError, invalid_status_transition_handler)
+    app.add_exception_handler(OrderStatusConflictError, order_status_conflict_handler)
+    app.add_exception_handler(InvalidOrderItemError, invalid_order_items_handler)
+    app.add_exception_handler(OrderTotalMismatchError, invalid_order_items_handler)
+    app.add_exception_handler(DeadlineExceededError, deadline_exceeded_handler)
+    app.add_exception_handler(SubscriberLimitError, subscriber_limit_handler)
     app.add_exception_handler(ValueError, value_error_handler)
     app.add_exception_handler(Exception, generic_exception_handler)
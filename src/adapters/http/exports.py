@@ -0,0 +1,95 @@
+"""Endpoints de exportação de pedidos em streaming."""
+
+import json
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+import structlog
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from src.adapters.http.dependencies import get_export_orders_use_case
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.domain.entities.order import Order
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+router = APIRouter(prefix="/orders", tags=["orders"])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def ndjson_chunks(
+    batches: AsyncIterator[list[Order]], compress: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Serializa lotes de pedidos em NDJSON, um chunk por lote.
+
+    O próximo lote só é lido do MongoDB depois que o chunk anterior foi entregue
+    ao servidor, que por sua vez só aceita mais dados quando o cliente consome o
+    que já foi enviado; assim a memória fica limitada a um lote.
+
+    Args:
+        batches: Lotes de pedidos
+        compress: Comprime o stream em gzip
+
+    Yields:
+        Chunks de bytes
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+    exported = 0
+    try:
+        async for batch in batches:
+            chunk = "".join(
+                json.dumps(order.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n"
+                for order in batch
+            ).encode()
+            exported += len(batch)
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+            yield chunk
+        if compressor is not None:
+            yield compressor.flush()
+    finally:
+        logger.info("Exportação de pedidos finalizada", orders=exported)
+
+
+@router.get("/export")
+async def export_orders(
+    created_from: datetime = Query(..., description="Início do intervalo de criação (inclusivo)"),
+    created_to: datetime = Query(..., description="Fim do intervalo de criação (exclusivo)"),
+    status_filter: list[str] | None = Query(
+        default=None, alias="status", description="Status aceitos (pode repetir)"
+    ),
+    gzip: bool = Query(default=False, description="Comprime a resposta em gzip"),
+    batch_size: int = Query(default=1000, description="Pedidos por lote lido do MongoDB"),
+    export_orders_use_case: ExportOrdersUseCase = Depends(get_export_orders_use_case),
+) -> StreamingResponse:
+    """
+    Exporta em NDJSON (um pedido por linha) os pedidos criados em um intervalo.
+
+    Args:
+        created_from: Início do intervalo
+        created_to: Fim do intervalo
+        status_filter: Status aceitos (padrão: todos)
+        gzip: Comprime a resposta (`Content-Encoding: gzip`)
+        batch_size: Pedidos por lote
+        export_orders_use_case: Caso de uso de exportação
+
+    Returns:
+        Resposta `application/x-ndjson` em streaming
+    """
+    statuses = [OrderStatus(value) for value in status_filter] if status_filter else None
+    batches = export_orders_use_case.execute(created_from, created_to, statuses, batch_size)
+
+    filename = f"orders-{created_from:%Y%m%dT%H%M%S}-{created_to:%Y%m%dT%H%M%S}.ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        ndjson_chunks(batches, compress=gzip), media_type=NDJSON_MEDIA_TYPE, headers=headers
+    )
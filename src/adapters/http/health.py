@@ -1,6 +1,10 @@
-"""Endpoint de healthcheck."""
+"""Endpoints de healthcheck e readiness."""
 
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Response, status
+
+from src.app.container import container
 
 router = APIRouter(tags=["health"])
 
@@ -14,3 +18,34 @@ async def health_check() -> dict[str, str]:
         Status da aplicação
     """
     return {"status": "healthy"}
+
+
+@router.get("/ready")
+async def readiness_check(response: Response) -> dict[str, Any]:
+    """
+    Endpoint de readiness com o estado das dependências.
+
+    O resultado vem do cache mantido pelo prober em background, então chamadas
+    frequentes não geram carga no MongoDB nem no RabbitMQ.
+
+    Args:
+        response: Resposta HTTP (para ajustar o status code)
+
+    Returns:
+        Estado do MongoDB, do pool de conexões e do RabbitMQ
+    """
+    snapshot = container.get_readiness_snapshot()
+    if snapshot["status"] != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return snapshot
+
+
+@router.get("/jobs")
+async def jobs_status() -> dict[str, Any]:
+    """
+    Estado dos jobs periódicos (última execução, duração, resultado e erro).
+
+    Returns:
+        Estado de cada job habilitado
+    """
+    return {"jobs": container.get_jobs_snapshot()}
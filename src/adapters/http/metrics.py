@@ -0,0 +1,17 @@
+"""Endpoint de métricas no formato de exposição do Prometheus."""
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Exporta as métricas do processo (histogramas, contadores e gauges).
+
+    Returns:
+        Métricas em texto no formato do Prometheus
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
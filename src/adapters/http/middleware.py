@@ -1,11 +1,19 @@
 """Middlewares para a aplicação."""
 
+import hmac
+import random
 import uuid
 from collections.abc import Callable
 
 import structlog
-from fastapi import Request, Response
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from src.application.deadline import deadline_scope
+from src.application.profiling import profiled
+from src.application.tracing import server_span
 
 logger = structlog.get_logger()
 
@@ -41,3 +49,216 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         response.headers["X-Correlation-ID"] = correlation_id
 
         return response
+
+
+class DeadlineMiddleware(BaseHTTPMiddleware):
+    """Middleware que define o deadline da requisição a partir de header ou padrão por rota."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout_ms: int | None,
+        max_timeout_ms: int | None = None,
+        route_timeouts_ms: dict[str, int] | None = None,
+        header_name: str = "X-Request-Timeout-Ms",
+    ) -> None:
+        """
+        Inicializa o middleware.
+
+        Args:
+            app: Aplicação ASGI
+            default_timeout_ms: Timeout padrão em milissegundos (None desativa)
+            max_timeout_ms: Teto aplicado ao timeout pedido pelo cliente
+            route_timeouts_ms: Timeouts padrão por prefixo de rota (<= 0 desativa)
+            header_name: Header com o timeout pedido pelo cliente
+        """
+        super().__init__(app)
+        self._default_timeout_ms = default_timeout_ms
+        self._max_timeout_ms = max_timeout_ms
+        # Prefixos mais longos primeiro para que a rota mais específica vença
+        self._route_timeouts_ms = sorted(
+            (route_timeouts_ms or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._header_name = header_name
+
+    def _resolve_timeout_ms(self, request: Request) -> int | None:
+        """
+        Resolve o timeout da requisição.
+
+        Args:
+            request: Requisição HTTP
+
+        Returns:
+            Timeout em milissegundos ou None se não houver
+        """
+        timeout_ms = self._default_timeout_ms
+        path = request.url.path
+        for prefix, route_timeout_ms in self._route_timeouts_ms:
+            if path.startswith(prefix):
+                # Zero ou negativo desativa o deadline padrão (ex.: rotas de streaming)
+                timeout_ms = route_timeout_ms if route_timeout_ms > 0 else None
+                break
+
+        header_value = request.headers.get(self._header_name)
+        if header_value:
+            try:
+                requested_ms = int(header_value)
+            except ValueError:
+                logger.warning("Header de timeout inválido", value=header_value)
+            else:
+                if requested_ms > 0:
+                    timeout_ms = requested_ms
+
+        if timeout_ms is not None and self._max_timeout_ms is not None:
+            timeout_ms = min(timeout_ms, self._max_timeout_ms)
+
+        return timeout_ms
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Executa a requisição dentro do deadline resolvido.
+
+        Args:
+            request: Requisição HTTP
+            call_next: Próximo middleware/handler
+
+        Returns:
+            Resposta HTTP
+        """
+        timeout_ms = self._resolve_timeout_ms(request)
+        timeout_seconds = timeout_ms / 1000 if timeout_ms is not None else None
+
+        with deadline_scope(timeout_seconds):
+            return await call_next(request)
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """
+    Abre o span de cada requisição, continuando o trace do header `traceparent`.
+
+    Só é registrado quando o tracing está ativo. O nome final do span usa o
+    template da rota (`PATCH /orders/{order_id}/status`), não o caminho real.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Executa a requisição dentro do span.
+
+        Args:
+            request: Requisição HTTP
+            call_next: Próximo middleware/handler
+
+        Returns:
+            Resposta HTTP
+        """
+        with server_span(
+            f"{request.method} {request.url.path}",
+            request.headers,
+            {"http.request.method": request.method, "url.path": request.url.path},
+        ) as span:
+            response = await call_next(request)
+            if span is not None:
+                route = request.scope.get("route")
+                if route is not None:
+                    span.update_name(f"{request.method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+                span.set_attribute("http.response.status_code", response.status_code)
+            return response
+
+
+def is_admin(request: Request, admin_token: str | None) -> bool:
+    """
+    Verifica o header `X-Admin-Token` em tempo constante.
+
+    Args:
+        request: Requisição HTTP
+        admin_token: Token configurado (None: nenhuma requisição é administrativa)
+
+    Returns:
+        True se o token confere
+    """
+    provided = request.headers.get("X-Admin-Token")
+    if not admin_token or not provided:
+        return False
+    return hmac.compare_digest(provided.encode(), admin_token.encode())
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Executa requisições sob o profiler por amostragem.
+
+    Uma requisição é perfilada quando traz `X-Profile: 1` com um `X-Admin-Token`
+    válido, ou quando sorteada por `sample_rate`. O profile é gravado em
+    `output_dir` (nome no header `X-Profile-File`) ou, com
+    `X-Profile-Output: inline`, devolvido no lugar da resposta. Só é registrado
+    com `PROFILING_ENABLED=true`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        admin_token: str | None,
+        sample_rate: float = 0.0,
+        output_dir: str = "profiles",
+        output_format: str = "html",
+        interval_seconds: float = 0.001,
+    ) -> None:
+        """
+        Inicializa o middleware.
+
+        Args:
+            app: Aplicação ASGI
+            admin_token: Token exigido para o header `X-Profile`
+            sample_rate: Fração das requisições perfiladas automaticamente
+            output_dir: Diretório dos profiles
+            output_format: `html` ou `speedscope`
+            interval_seconds: Intervalo de amostragem do profiler
+        """
+        super().__init__(app)
+        self._admin_token = admin_token
+        self._sample_rate = sample_rate
+        self._output_dir = output_dir
+        self._output_format = output_format
+        self._interval_seconds = interval_seconds
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Executa a requisição, perfilando-a quando pedida ou sorteada.
+
+        Args:
+            request: Requisição HTTP
+            call_next: Próximo middleware/handler
+
+        Returns:
+            Resposta HTTP (ou o profile, no modo inline)
+        """
+        requested = request.headers.get("X-Profile") == "1"
+        if requested and not is_admin(request, self._admin_token):
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={
+                    "detail": "X-Profile exige X-Admin-Token válido",
+                    "error_type": "Forbidden",
+                },
+            )
+        if not requested and not (self._sample_rate and random.random() < self._sample_rate):
+            return await call_next(request)
+
+        inline = requested and request.headers.get("X-Profile-Output") == "inline"
+        with profiled(
+            f"{request.method} {request.url.path}",
+            output_dir=None if inline else self._output_dir,
+            output_format=self._output_format,
+            interval_seconds=self._interval_seconds,
+        ) as profile:
+            response = await call_next(request)
+
+        if inline:
+            return Response(
+                profile.content,
+                media_type=profile.media_type,
+                headers={"X-Profile-Status": str(response.status_code)},
+            )
+        if requested and profile.path is not None:
+            response.headers["X-Profile-File"] = profile.path.name
+        return response
@@ -0,0 +1,99 @@
+"""Endpoints de Server-Sent Events para mudanças de status de pedidos."""
+
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from src.adapters.http.dependencies import get_order_event_hub
+from src.adapters.messaging.order_event_hub import OrderEventHub, Subscription
+from src.app.config import settings
+
+router = APIRouter(tags=["events"])
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _stream(event_hub: OrderEventHub, subscription: Subscription) -> AsyncIterator[bytes]:
+    """
+    Gera o stream SSE de uma assinatura, removendo-a ao final.
+
+    Se o cliente desconectar antes do primeiro frame o gerador nunca roda; a
+    remoção fica garantida pela tarefa de fundo de `_response`.
+
+    Args:
+        event_hub: Hub de eventos
+        subscription: Assinatura do cliente
+
+    Yields:
+        Frames SSE
+    """
+    try:
+        # Sugere ao cliente o intervalo de reconexão
+        yield b"retry: 3000\n\n"
+        async for frame in subscription.frames(settings.sse_heartbeat_seconds):
+            yield frame
+    finally:
+        event_hub.unsubscribe(subscription)
+
+
+def _response(event_hub: OrderEventHub, subscription: Subscription) -> StreamingResponse:
+    """
+    Monta a resposta SSE de uma assinatura.
+
+    A assinatura é feita no endpoint para que o limite de assinantes responda
+    antes do início do stream; a tarefa de fundo a remove mesmo quando o stream
+    é cancelado sem chegar ao `finally` de `_stream` (`unsubscribe` é idempotente).
+
+    Args:
+        event_hub: Hub de eventos
+        subscription: Assinatura do cliente
+
+    Returns:
+        Resposta `text/event-stream`
+    """
+    return StreamingResponse(
+        _stream(event_hub, subscription),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+        background=BackgroundTask(event_hub.unsubscribe, subscription),
+    )
+
+
+@router.get("/orders/{order_id}/events")
+async def stream_order_events(
+    order_id: str,
+    event_hub: OrderEventHub = Depends(get_order_event_hub),
+) -> StreamingResponse:
+    """
+    Stream SSE das mudanças de status de um pedido.
+
+    Args:
+        order_id: ID do pedido
+        event_hub: Hub de eventos
+
+    Returns:
+        Resposta `text/event-stream`
+    """
+    subscription = event_hub.subscribe(order_id=order_id)
+    return _response(event_hub, subscription)
+
+
+@router.get("/customers/{customer_id}/orders/events")
+async def stream_customer_order_events(
+    customer_id: str,
+    event_hub: OrderEventHub = Depends(get_order_event_hub),
+) -> StreamingResponse:
+    """
+    Stream SSE das mudanças de status de todos os pedidos de um cliente.
+
+    Args:
+        customer_id: ID do cliente
+        event_hub: Hub de eventos
+
+    Returns:
+        Resposta `text/event-stream`
+    """
+    subscription = event_hub.subscribe(customer_id=customer_id)
+    return _response(event_hub, subscription)
@@ -1,15 +1,34 @@
 """Routers FastAPI para endpoints da API."""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from src.adapters.http.dependencies import (
     get_create_order_use_case,
+    get_get_order_history_use_case,
+    get_get_order_stats_use_case,
     get_get_order_use_case,
+    get_list_orders_by_product_use_case,
     get_update_order_status_use_case,
 )
-from src.adapters.http.schemas import CreateOrderRequest, OrderResponse, UpdateOrderStatusRequest
+from src.adapters.http.schemas import (
+    CreateOrderRequest,
+    OrderHistoryResponse,
+    OrderPageResponse,
+    OrderResponse,
+    OrderStatsResponse,
+    PartialOrderResponse,
+    StatusChangeSchema,
+    UpdateOrderStatusRequest,
+    decode_order_cursor,
+    encode_order_cursor,
+    parse_order_fields,
+    partial_order_response_model,
+)
 from src.application.use_cases.create_order import CreateOrderUseCase
 from src.application.use_cases.get_order import GetOrderUseCase
+from src.application.use_cases.get_order_history import GetOrderHistoryUseCase
+from src.application.use_cases.get_order_stats import GetOrderStatsUseCase
+from src.application.use_cases.list_orders_by_product import ListOrdersByProductUseCase
 from src.application.use_cases.update_order_status import UpdateOrderStatusUseCase
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.order_status import OrderStatus
@@ -34,31 +53,151 @@ async def create_order(
     """
     order = await create_order_use_case.execute(
         customer_id=request.customer_id,
-        items=request.items,
+        items=[item.model_dump() for item in request.items],
         total_amount=request.total_amount,
     )
     return OrderResponse(**order.to_dict())
 
 
-@router.get("/{order_id}", response_model=OrderResponse)
+@router.get("", response_model=OrderPageResponse)
+async def list_orders_by_product(
+    product_id: str = Query(..., min_length=1, description="ID do produto contido no pedido"),
+    status_filter: list[str] | None = Query(
+        default=None, alias="status", description="Status aceitos (pode repetir)"
+    ),
+    limit: int = Query(default=100, description="Tamanho da página (1 a 1000)"),
+    cursor: str | None = Query(default=None, description="Cursor devolvido pela página anterior"),
+    list_orders_by_product_use_case: ListOrdersByProductUseCase = Depends(
+        get_list_orders_by_product_use_case
+    ),
+) -> OrderPageResponse:
+    """
+    Lista os pedidos que contêm um produto (ex.: recall ou incidente de estoque).
+
+    A consulta usa o índice multikey `items.product_id` e pagina por chave
+    (created_at, id), então cada página custa o mesmo independentemente da posição.
+
+    Args:
+        product_id: ID do produto
+        status_filter: Status aceitos (padrão: todos)
+        limit: Tamanho da página
+        cursor: Cursor da página anterior
+        list_orders_by_product_use_case: Caso de uso de pedidos por produto
+
+    Returns:
+        Página de pedidos e o cursor da próxima
+    """
+    statuses = [OrderStatus(value) for value in status_filter] if status_filter else None
+    after = decode_order_cursor(cursor) if cursor else None
+    orders, next_key = await list_orders_by_product_use_case.execute(
+        product_id,
+        statuses,
+        limit,
+        (after[0], OrderId(after[1])) if after else None,
+    )
+    return OrderPageResponse(
+        items=[OrderResponse(**order.to_dict()) for order in orders],
+        next_cursor=encode_order_cursor(next_key) if next_key else None,
+    )
+
+
+# Registrada antes de /{order_id} para que "stats" não seja tratado como ID
+@router.get("/stats", response_model=OrderStatsResponse)
+async def get_order_stats(
+    days: int = Query(default=0, description="Dias de contadores diários a incluir (0 a 90)"),
+    get_order_stats_use_case: GetOrderStatsUseCase = Depends(get_get_order_stats_use_case),
+) -> OrderStatsResponse:
+    """
+    Obtém os contadores de pedidos por status (e, opcionalmente, por dia).
+
+    Os contadores são mantidos incrementalmente, então o custo não depende do
+    tamanho da coleção de pedidos.
+
+    Args:
+        days: Número de dias de contadores diários
+        get_order_stats_use_case: Caso de uso de contadores
+
+    Returns:
+        Contadores de pedidos
+    """
+    return OrderStatsResponse(**await get_order_stats_use_case.execute(days))
+
+
+@router.get(
+    "/{order_id}",
+    # A resposta com `fields` é montada aqui; a OpenAPI descreve os dois formatos
+    response_model=None,
+    responses={
+        200: {
+            "model": OrderResponse | PartialOrderResponse,
+            "description": "Pedido completo ou, com `fields`, apenas os campos pedidos",
+        }
+    },
+)
 async def get_order(
     order_id: str,
+    fields: str | None = Query(
+        default=None,
+        description="Campos a retornar, separados por vírgula (ex.: id,status,updated_at)",
+    ),
     get_order_use_case: GetOrderUseCase = Depends(get_get_order_use_case),
-) -> OrderResponse:
+) -> OrderResponse | Response:
     """
     Obtém um pedido por ID.
 
+    Com `fields`, apenas os campos pedidos são lidos do MongoDB (projeção) e
+    devolvidos na resposta.
+
     Args:
         order_id: ID do pedido
+        fields: Campos a retornar (opcional)
         get_order_use_case: Caso de uso de busca
 
     Returns:
         Pedido encontrado
     """
+    requested_fields = parse_order_fields(fields)
+    if requested_fields is not None:
+        document = await get_order_use_case.execute_fields(OrderId(order_id), requested_fields)
+        model = partial_order_response_model(requested_fields)
+        return Response(
+            content=model.model_validate(document).model_dump_json(),
+            media_type="application/json",
+        )
+
     order = await get_order_use_case.execute(OrderId(order_id))
     return OrderResponse(**order.to_dict())
 
 
+@router.get("/{order_id}/history", response_model=OrderHistoryResponse)
+async def get_order_history(
+    order_id: str,
+    get_order_history_use_case: GetOrderHistoryUseCase = Depends(get_get_order_history_use_case),
+) -> OrderHistoryResponse:
+    """
+    Obtém o histórico de status de um pedido.
+
+    Args:
+        order_id: ID do pedido
+        get_order_history_use_case: Caso de uso de histórico
+
+    Returns:
+        Transições de status em ordem cronológica
+    """
+    changes = await get_order_history_use_case.execute(OrderId(order_id))
+    return OrderHistoryResponse(
+        order_id=order_id,
+        history=[
+            StatusChangeSchema(
+                from_status=change.from_status.value if change.from_status else None,
+                to_status=change.to_status.value,
+                changed_at=change.changed_at,
+            )
+            for change in changes
+        ],
+    )
+
+
 @router.patch("/{order_id}/status", response_model=OrderResponse)
 async def update_order_status(
     order_id: str,
@@ -1,9 +1,17 @@
 """Schemas Pydantic para entrada/saída da API."""
 
+import base64
+import binascii
+import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from src.domain.services.order_pricing import MAX_ITEM_PRICE, MAX_ITEM_QUANTITY
+
+MAX_ORDER_ITEMS = 500
 
 
 class MoneySchema(BaseModel):
@@ -16,17 +24,28 @@ class MoneySchema(BaseModel):
 class OrderItemSchema(BaseModel):
     """Schema para item do pedido."""
 
-    product_id: str = Field(..., description="ID do produto")
-    quantity: int = Field(..., gt=0, description="Quantidade")
-    price: float = Field(..., gt=0, description="Preço unitário")
+    model_config = ConfigDict(extra="forbid")
+
+    product_id: str = Field(..., min_length=1, max_length=128, description="ID do produto")
+    quantity: int = Field(..., gt=0, le=MAX_ITEM_QUANTITY, description="Quantidade")
+    price: float = Field(
+        ..., gt=0, le=MAX_ITEM_PRICE, allow_inf_nan=False, description="Preço unitário"
+    )
 
 
 class CreateOrderRequest(BaseModel):
     """Schema para criação de pedido."""
 
-    customer_id: str = Field(..., description="ID do cliente")
-    items: list[dict[str, Any]] = Field(..., description="Lista de itens do pedido")
-    total_amount: float = Field(..., gt=0, description="Valor total do pedido")
+    customer_id: str = Field(..., min_length=1, max_length=128, description="ID do cliente")
+    items: list[OrderItemSchema] = Field(
+        ..., min_length=1, max_length=MAX_ORDER_ITEMS, description="Lista de itens do pedido"
+    )
+    total_amount: float | None = Field(
+        default=None,
+        gt=0,
+        allow_inf_nan=False,
+        description="Valor total do pedido; se informado, deve bater com o total dos itens",
+    )
 
 
 class UpdateOrderStatusRequest(BaseModel):
@@ -60,3 +79,158 @@ class OrderResponse(BaseModel):
                 "updated_at": "2024-01-01T12:00:00",
             }
         }
+
+
+class StatusChangeSchema(BaseModel):
+    """Schema de uma transição de status."""
+
+    from_status: str | None = Field(..., description="Status anterior (nulo na criação)")
+    to_status: str = Field(..., description="Novo status")
+    changed_at: datetime = Field(..., description="Data da transição")
+
+
+class OrderHistoryResponse(BaseModel):
+    """Schema de resposta do histórico de status."""
+
+    order_id: str = Field(..., description="ID do pedido")
+    history: list[StatusChangeSchema] = Field(..., description="Transições em ordem cronológica")
+
+
+class DailyOrderStatsSchema(BaseModel):
+    """Schema dos contadores de um dia."""
+
+    date: str = Field(..., description="Dia (UTC), no formato YYYY-MM-DD")
+    created: int = Field(..., description="Pedidos criados no dia")
+    transitions: dict[str, int] = Field(..., description="Transições do dia por novo status")
+
+
+class OrderStatsResponse(BaseModel):
+    """Schema de resposta dos contadores de pedidos."""
+
+    total: int = Field(..., description="Total de pedidos")
+    counts: dict[str, int] = Field(..., description="Pedidos em cada status")
+    daily: list[DailyOrderStatsSchema] = Field(..., description="Contadores diários")
+
+
+class LastOrderSchema(BaseModel):
+    """Schema do último pedido de um cliente."""
+
+    order_id: str = Field(..., description="ID do pedido")
+    status: str = Field(..., description="Status atual do pedido")
+    created_at: datetime = Field(..., description="Data de criação")
+
+
+class CustomerSummaryResponse(BaseModel):
+    """Schema de resposta do resumo de pedidos de um cliente."""
+
+    customer_id: str = Field(..., description="ID do cliente")
+    order_count: int = Field(..., description="Quantidade de pedidos")
+    lifetime_spend: list[MoneySchema] = Field(
+        ..., description="Gasto acumulado por moeda (sem pedidos cancelados)"
+    )
+    last_order: LastOrderSchema | None = Field(..., description="Pedido mais recente")
+    updated_at: datetime | None = Field(..., description="Data da última atualização do resumo")
+
+
+class OrderPageResponse(BaseModel):
+    """Schema de resposta de uma página de pedidos."""
+
+    items: list[OrderResponse] = Field(..., description="Pedidos da página")
+    next_cursor: str | None = Field(
+        ..., description="Cursor da próxima página (nulo na última página)"
+    )
+
+
+def encode_order_cursor(key: tuple[datetime, str]) -> str:
+    """
+    Codifica a chave (created_at, id) de paginação em um cursor opaco.
+
+    Args:
+        key: Chave do último pedido da página
+
+    Returns:
+        Cursor em base64 (seguro para URL)
+    """
+    created_at, order_id = key
+    payload = json.dumps([created_at.isoformat(), str(order_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_order_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decodifica um cursor gerado por `encode_order_cursor`.
+
+    Args:
+        cursor: Cursor recebido na requisição
+
+    Returns:
+        Chave (created_at, id)
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, order_id = json.loads(payload)
+        return datetime.fromisoformat(created_at), str(order_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Cursor inválido") from e
+
+
+ORDER_FIELDS = tuple(OrderResponse.model_fields)
+
+# Documenta na OpenAPI a resposta com `fields`: os mesmos campos, todos opcionais
+PartialOrderResponse = create_model(
+    "PartialOrderResponse",
+    __doc__="Pedido com apenas os campos pedidos em `fields`.",
+    **{
+        name: (field.annotation, Field(default=None, description=field.description))
+        for name, field in OrderResponse.model_fields.items()
+    },
+)
+
+
+def parse_order_fields(raw_fields: str | None) -> tuple[str, ...] | None:
+    """
+    Interpreta o parâmetro `fields` (lista separada por vírgulas).
+
+    O `id` é sempre incluído e a ordem é normalizada, para que combinações
+    equivalentes compartilhem o mesmo modelo de resposta em cache.
+
+    Args:
+        raw_fields: Valor do parâmetro `fields`
+
+    Returns:
+        Campos pedidos, ou None para o pedido completo
+
+    Raises:
+        ValueError: Se algum campo não existir
+    """
+    if not raw_fields:
+        return None
+
+    requested = {field.strip() for field in raw_fields.split(",") if field.strip()}
+    unknown = requested.difference(ORDER_FIELDS)
+    if unknown:
+        raise ValueError(f"Campos desconhecidos: {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return tuple(field for field in ORDER_FIELDS if field in requested)
+
+
+@lru_cache(maxsize=128)
+def partial_order_response_model(fields: tuple[str, ...]) -> type[BaseModel]:
+    """
+    Cria (e mantém em cache) um modelo de resposta com apenas os campos pedidos.
+
+    Args:
+        fields: Campos normalizados por `parse_order_fields`
+
+    Returns:
+        Subclasse de BaseModel com o subconjunto de campos de OrderResponse
+    """
+    definitions = {
+        name: (OrderResponse.model_fields[name].annotation, OrderResponse.model_fields[name])
+        for name in fields
+    }
+    return create_model(f"OrderResponse_{'_'.join(fields)}", **definitions)
@@ -0,0 +1,15 @@
+"""Adapters de geração de identificadores."""
+
+from src.adapters.identifiers.order_id_generators import (
+    ObjectIdOrderIdGenerator,
+    UUID4OrderIdGenerator,
+    UUID7OrderIdGenerator,
+    build_order_id_generator,
+)
+
+__all__ = [
+    "ObjectIdOrderIdGenerator",
+    "UUID4OrderIdGenerator",
+    "UUID7OrderIdGenerator",
+    "build_order_id_generator",
+]
@@ -0,0 +1,93 @@
+"""Geradores de IDs de pedido."""
+
+import os
+import threading
+import time
+import uuid
+
+from bson import ObjectId
+
+from src.domain.ports.id_generator_port import OrderIdGeneratorPort
+from src.domain.value_objects.order_id import OrderId
+
+
+class UUID4OrderIdGenerator(OrderIdGeneratorPort):
+    """IDs UUIDv4 aleatórios (comportamento original)."""
+
+    def new_id(self) -> OrderId:
+        """Gera um UUIDv4."""
+        return OrderId(str(uuid.uuid4()))
+
+
+class UUID7OrderIdGenerator(OrderIdGeneratorPort):
+    """
+    IDs UUIDv7 (RFC 9562): 48 bits de timestamp em milissegundos seguidos de bits aleatórios.
+
+    IDs gerados em sequência são crescentes, então inserções no índice único caem
+    sempre nas páginas mais à direita da B-tree. Dentro do mesmo milissegundo, os
+    12 bits de `rand_a` funcionam como contador para manter a ordem.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o gerador."""
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def new_id(self) -> OrderId:
+        """Gera um UUIDv7 monotônico."""
+        with self._lock:
+            timestamp_ms = time.time_ns() // 1_000_000
+            if timestamp_ms > self._last_ms:
+                self._last_ms = timestamp_ms
+                self._counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+            else:
+                self._counter += 1
+                if self._counter > 0xFFF:
+                    # Contador esgotado: avança o relógio lógico em 1 ms
+                    self._last_ms += 1
+                    self._counter = 0
+            timestamp_ms, counter = self._last_ms, self._counter
+
+        rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+        value = (
+            (timestamp_ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b
+        )
+        return OrderId(str(uuid.UUID(int=value)))
+
+
+class ObjectIdOrderIdGenerator(OrderIdGeneratorPort):
+    """IDs no formato ObjectId do MongoDB (24 caracteres hexadecimais, 12 bytes)."""
+
+    def new_id(self) -> OrderId:
+        """Gera um ObjectId."""
+        return OrderId(str(ObjectId()))
+
+
+ORDER_ID_STRATEGIES: dict[str, type[OrderIdGeneratorPort]] = {
+    "uuid4": UUID4OrderIdGenerator,
+    "uuid7": UUID7OrderIdGenerator,
+    "objectid": ObjectIdOrderIdGenerator,
+}
+
+
+def build_order_id_generator(strategy: str) -> OrderIdGeneratorPort:
+    """
+    Cria o gerador de IDs configurado.
+
+    Args:
+        strategy: Nome da estratégia (`uuid4`, `uuid7` ou `objectid`)
+
+    Returns:
+        Gerador de IDs
+
+    Raises:
+        ValueError: Se a estratégia for desconhecida
+    """
+    try:
+        return ORDER_ID_STRATEGIES[strategy]()
+    except KeyError:
+        raise ValueError(
+            f"Estratégia de ID desconhecida: {strategy}. "
+            f"Válidas: {', '.join(ORDER_ID_STRATEGIES)}"
+        ) from None
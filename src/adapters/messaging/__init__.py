@@ -1,5 +1,7 @@
 """Adapters de mensageria."""
 
+from src.adapters.messaging.order_event_hub import OrderEventHub
+from src.adapters.messaging.rabbitmq_event_consumer import RabbitMQOrderEventConsumer
 from src.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
 
-__all__ = ["RabbitMQPublisher"]
+__all__ = ["OrderEventHub", "RabbitMQOrderEventConsumer", "RabbitMQPublisher"]
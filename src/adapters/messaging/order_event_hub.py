@@ -0,0 +1,172 @@
+"""Hub em memória para fan-out de eventos de pedido a assinantes (SSE)."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SubscriberLimitError(Exception):
+    """Exceção lançada quando o hub atinge o limite de assinantes."""
+
+    pass
+
+
+class Subscription:
+    """Assinatura de um cliente com buffer limitado de frames SSE já serializados."""
+
+    __slots__ = ("key", "_queue", "evicted")
+
+    def __init__(self, key: tuple[str, str], buffer_size: int) -> None:
+        """
+        Inicializa a assinatura.
+
+        Args:
+            key: Chave de roteamento (`("order", id)` ou `("customer", id)`)
+            buffer_size: Número máximo de eventos pendentes antes da remoção
+        """
+        self.key = key
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=buffer_size)
+        self.evicted = False
+
+    def offer(self, frame: bytes) -> bool:
+        """
+        Enfileira um frame sem bloquear.
+
+        Args:
+            frame: Frame SSE serializado
+
+        Returns:
+            False se o buffer estiver cheio (consumidor lento)
+        """
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def frames(self, heartbeat_seconds: float) -> AsyncIterator[bytes]:
+        """
+        Itera sobre os frames, emitindo heartbeats quando não houver eventos.
+
+        Args:
+            heartbeat_seconds: Intervalo máximo sem enviar dados ao cliente
+
+        Yields:
+            Frames SSE prontos para envio
+        """
+        while not self.evicted:
+            try:
+                yield await asyncio.wait_for(self._queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+        # Consumidor lento: avisa para reconectar e reconsultar o estado atual
+        yield b"event: evicted\ndata: {}\n\n"
+
+
+class OrderEventHub:
+    """
+    Distribui eventos de mudança de status para assinaturas por pedido ou por cliente.
+
+    Cada evento é serializado uma única vez e o mesmo frame é entregue a todos os
+    assinantes. Assinantes cujo buffer enche são removidos em vez de bloquear o
+    publicador ou acumular memória.
+    """
+
+    def __init__(self, buffer_size: int = 64, max_subscribers: int = 10_000) -> None:
+        """
+        Inicializa o hub.
+
+        Args:
+            buffer_size: Tamanho do buffer de cada assinante
+            max_subscribers: Número máximo de assinaturas simultâneas
+        """
+        self._buffer_size = buffer_size
+        self._max_subscribers = max_subscribers
+        self._subscribers: dict[tuple[str, str], set[Subscription]] = {}
+        self._count = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Retorna o número de assinaturas ativas."""
+        return self._count
+
+    def subscribe(
+        self, *, order_id: str | None = None, customer_id: str | None = None
+    ) -> Subscription:
+        """
+        Cria uma assinatura para um pedido ou para os pedidos de um cliente.
+
+        Args:
+            order_id: ID do pedido
+            customer_id: ID do cliente
+
+        Returns:
+            Nova assinatura
+
+        Raises:
+            SubscriberLimitError: Se o limite de assinantes foi atingido
+        """
+        if (order_id is None) == (customer_id is None):
+            raise ValueError("Informe exatamente um entre order_id e customer_id")
+        if self._count >= self._max_subscribers:
+            raise SubscriberLimitError("Limite de assinantes de eventos atingido")
+
+        key = ("order", order_id) if order_id is not None else ("customer", customer_id)
+        subscription = Subscription(key, self._buffer_size)
+        self._subscribers.setdefault(key, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove uma assinatura (idempotente).
+
+        Args:
+            subscription: Assinatura a remover
+        """
+        subscribers = self._subscribers.get(subscription.key)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.key]
+        self._count -= 1
+
+    def publish(self, event: dict[str, Any]) -> int:
+        """
+        Entrega um evento aos assinantes do pedido e do cliente.
+
+        Args:
+            event: Evento com `order_id` e opcionalmente `customer_id`
+
+        Returns:
+            Número de assinantes que receberam o evento
+        """
+        targets: list[Subscription] = []
+        for key in (("order", event.get("order_id")), ("customer", event.get("customer_id"))):
+            subscribers = self._subscribers.get(key)
+            if subscribers:
+                targets.extend(subscribers)
+
+        if not targets:
+            return 0
+
+        frame = (
+            f"event: {event.get('event_type', 'message')}\ndata: {json.dumps(event)}\n\n"
+        ).encode()
+
+        delivered = 0
+        for subscription in targets:
+            if subscription.offer(frame):
+                delivered += 1
+            else:
+                subscription.evicted = True
+                self.unsubscribe(subscription)
+                logger.warning("Assinante SSE lento removido", key=subscription.key)
+
+        return delivered
@@ -0,0 +1,68 @@
+"""Consumidor RabbitMQ que alimenta o hub de eventos em memória."""
+
+import json
+
+import structlog
+from aio_pika import Connection, ExchangeType
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueue
+
+from src.adapters.messaging.order_event_hub import OrderEventHub
+
+logger = structlog.get_logger()
+
+
+class RabbitMQOrderEventConsumer:
+    """
+    Acompanha os eventos de status publicados no exchange e os repassa ao hub local.
+
+    Cada instância da aplicação declara uma fila exclusiva e temporária ligada ao
+    exchange, então assinantes SSE recebem transições feitas em qualquer réplica.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        event_hub: OrderEventHub,
+        exchange_name: str = "order_events",
+        routing_key: str = "order.status_updated",
+    ) -> None:
+        """
+        Inicializa o consumidor.
+
+        Args:
+            connection: Conexão RabbitMQ
+            event_hub: Hub que distribui os eventos aos assinantes
+            exchange_name: Nome do exchange
+            routing_key: Chave de roteamento dos eventos de status
+        """
+        self._connection = connection
+        self._event_hub = event_hub
+        self._exchange_name = exchange_name
+        self._routing_key = routing_key
+        self._queue: AbstractQueue | None = None
+
+    async def start(self) -> None:
+        """Declara a fila exclusiva, faz o bind e começa a consumir."""
+        channel = await self._connection.channel()
+        exchange = await channel.declare_exchange(
+            self._exchange_name, ExchangeType.TOPIC, durable=True
+        )
+        self._queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await self._queue.bind(exchange, routing_key=self._routing_key)
+        # Sem ack: a fila é efêmera e serve apenas para notificação em tempo real
+        await self._queue.consume(self._on_message, no_ack=True)
+        logger.info("Consumidor de eventos para SSE iniciado", exchange=self._exchange_name)
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        """
+        Repassa a mensagem recebida ao hub.
+
+        Args:
+            message: Mensagem do RabbitMQ
+        """
+        try:
+            event = json.loads(message.body)
+        except ValueError:
+            logger.warning("Evento inválido ignorado", message_id=message.message_id)
+            return
+        self._event_hub.publish(event)
@@ -1,12 +1,19 @@
 """Adapter RabbitMQ para publicação de eventos."""
 
+import asyncio
 import json
+from collections.abc import Sequence
 from datetime import datetime
+from typing import Any
 
 import aio_pika
 import structlog
 from aio_pika import Connection, Exchange, ExchangeType
 
+from src.application.deadline import DeadlineExceededError, remaining_seconds
+from src.application.metrics import PUBLISH_SECONDS, timed
+from src.application.tracing import inject_context, traced
+from src.domain.events.status_change import StatusChange
 from src.domain.ports.message_broker_port import MessageBrokerPort
 
 logger = structlog.get_logger()
@@ -20,6 +27,7 @@ class RabbitMQPublisher(MessageBrokerPort):
         connection: Connection,
         exchange_name: str = "order_events",
         routing_key: str = "order.status_updated",
+        publish_timeout: float | None = 5.0,
     ) -> None:
         """
         Inicializa o publisher RabbitMQ.
@@ -28,11 +36,24 @@ class RabbitMQPublisher(MessageBrokerPort):
             connection: Conexão RabbitMQ
             exchange_name: Nome do exchange
             routing_key: Chave de roteamento padrão
+            publish_timeout: Timeout padrão de publicação em segundos
         """
         self._connection = connection
         self._exchange_name = exchange_name
         self._routing_key = routing_key
+        self._publish_timeout = publish_timeout
         self._exchange: Exchange | None = None
+        self._in_flight = 0
+
+    @property
+    def is_connected(self) -> bool:
+        """Indica se a conexão com o RabbitMQ está aberta."""
+        return not self._connection.is_closed
+
+    @property
+    def queue_depth(self) -> int:
+        """Retorna o número de publicações em andamento aguardando confirmação."""
+        return self._in_flight
 
     async def connect(self) -> None:
         """Estabelece conexão e cria exchange."""
@@ -42,42 +63,146 @@ class RabbitMQPublisher(MessageBrokerPort):
         )
         logger.info("Conectado ao RabbitMQ", exchange=self._exchange_name)
 
-    async def publish_order_status_updated(
-        self, order_id: str, old_status: str, new_status: str
-    ) -> None:
+    @staticmethod
+    def _build_message(
+        order_id: str,
+        customer_id: str | None,
+        old_status: str,
+        new_status: str,
+        timestamp: datetime,
+    ) -> aio_pika.Message:
         """
-        Publica evento de atualização de status do pedido.
+        Monta a mensagem persistente do evento `order.status_updated`.
+
+        Com tracing ativo, o contexto do span corrente vai nos headers AMQP.
 
         Args:
             order_id: ID do pedido
+            customer_id: ID do cliente dono do pedido
             old_status: Status anterior
             new_status: Novo status
-        """
-        if not self._exchange:
-            await self.connect()
+            timestamp: Momento da transição
 
-        event = {
+        Returns:
+            Mensagem AMQP
+        """
+        event: dict[str, Any] = {
             "order_id": order_id,
+            "customer_id": customer_id,
             "old_status": old_status,
             "new_status": new_status,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp.isoformat(),
             "event_type": "order.status_updated",
         }
+        return aio_pika.Message(
+            json.dumps(event).encode(),
+            # traceparent/tracestate para o consumidor continuar o trace
+            headers=inject_context({}),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        )
 
-        message_body = json.dumps(event).encode()
+    def _resolve_timeout(self) -> float | None:
+        """
+        Combina o timeout padrão de publicação com o deadline da requisição.
+
+        O evento é publicado depois que o pedido já foi gravado, então um deadline
+        já expirado não cancela a publicação: nesse caso vale o timeout padrão.
+
+        Returns:
+            Timeout em segundos ou None se não houver limite
+        """
+        remaining = remaining_seconds()
+        if remaining is None or remaining <= 0:
+            return self._publish_timeout
+        if self._publish_timeout is None:
+            return remaining
+        return min(remaining, self._publish_timeout)
+
+    @traced("rabbitmq.publish_order_status_updated", "producer", {"messaging.system": "rabbitmq"})
+    @timed(PUBLISH_SECONDS, "publish_order_status_updated")
+    async def publish_order_status_updated(
+        self,
+        order_id: str,
+        old_status: str,
+        new_status: str,
+        customer_id: str | None = None,
+    ) -> None:
+        """
+        Publica evento de atualização de status do pedido.
 
-        await self._exchange.publish(
-            aio_pika.Message(
-                message_body,
-                content_type="application/json",
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            ),
-            routing_key=self._routing_key,
+        Args:
+            order_id: ID do pedido
+            old_status: Status anterior
+            new_status: Novo status
+            customer_id: ID do cliente dono do pedido
+        """
+        if not self._exchange:
+            await self.connect()
+
+        message = self._build_message(
+            order_id, customer_id, old_status, new_status, datetime.utcnow()
         )
 
+        timeout = self._resolve_timeout()
+        self._in_flight += 1
+        try:
+            await self._exchange.publish(message, routing_key=self._routing_key, timeout=timeout)
+        except asyncio.TimeoutError as e:
+            if timeout != self._publish_timeout:
+                # O limite efetivo veio do deadline da requisição
+                raise DeadlineExceededError(
+                    "Deadline expirado durante publish_order_status_updated"
+                ) from e
+            raise
+        finally:
+            self._in_flight -= 1
+
         logger.info(
             "Evento publicado no RabbitMQ",
             order_id=order_id,
             old_status=old_status,
             new_status=new_status,
         )
+
+    @traced("rabbitmq.publish_order_status_updates", "producer", {"messaging.system": "rabbitmq"})
+    @timed(PUBLISH_SECONDS, "publish_order_status_updates")
+    async def publish_order_status_updates(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Publica os eventos de um lote de transições.
+
+        As mensagens são enviadas todas no mesmo canal e as confirmações do broker
+        aguardadas em conjunto, em vez de uma ida e volta por evento.
+
+        Args:
+            changes: Transições já gravadas
+        """
+        if not changes:
+            return
+        if not self._exchange:
+            await self.connect()
+
+        messages = [
+            self._build_message(
+                str(change.order_id),
+                change.customer_id,
+                change.from_status.value if change.from_status else "",
+                change.to_status.value,
+                change.changed_at,
+            )
+            for change in changes
+        ]
+
+        timeout = self._resolve_timeout()
+        self._in_flight += len(messages)
+        try:
+            await asyncio.gather(
+                *(
+                    self._exchange.publish(message, routing_key=self._routing_key, timeout=timeout)
+                    for message in messages
+                )
+            )
+        finally:
+            self._in_flight -= len(messages)
+
+        logger.info("Eventos publicados no RabbitMQ", count=len(messages))
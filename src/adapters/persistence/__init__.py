@@ -1,5 +1,17 @@
 """Adapters de persistência."""
 
+from src.adapters.persistence.mongo_customer_summary_projection import (
+    MongoCustomerSummaryProjection,
+)
+from src.adapters.persistence.mongo_order_history_repository import MongoOrderHistoryRepository
 from src.adapters.persistence.mongo_order_repository import MongoOrderRepository
+from src.adapters.persistence.mongo_order_stats_projection import MongoOrderStatsProjection
+from src.adapters.persistence.pool_monitor import MongoPoolMonitor
 
-__all__ = ["MongoOrderRepository"]
+__all__ = [
+    "MongoCustomerSummaryProjection",
+    "MongoOrderHistoryRepository",
+    "MongoOrderRepository",
+    "MongoOrderStatsProjection",
+    "MongoPoolMonitor",
+]
@@ -0,0 +1,345 @@
+"""Resumo de pedidos por cliente (quantidade, gasto acumulado e último pedido)."""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+import structlog
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne, UpdateOne
+
+from src.adapters.persistence.mongo_support import deadline_timeout, decode_order_id
+from src.application.metrics import MONGO_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.customer_summary_port import CustomerSummaryPort
+from src.domain.ports.order_projection_port import OrderProjectionPort
+from src.domain.value_objects.money import CURRENCY_EXPONENTS, DEFAULT_EXPONENT, Money
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+# Fator de conversão de `amount` (float) para unidades menores, pela moeda do documento
+_MINOR_FACTOR_EXPRESSION = {
+    "$switch": {
+        "branches": [
+            {"case": {"$eq": ["$total_amount.currency", currency]}, "then": 10**exponent}
+            for currency, exponent in CURRENCY_EXPONENTS.items()
+            if exponent != DEFAULT_EXPONENT
+        ],
+        "default": 10**DEFAULT_EXPONENT,
+    }
+}
+
+# Valor em unidades menores, aceitando documentos antigos com `amount` float
+_AMOUNT_MINOR_EXPRESSION = {
+    "$ifNull": [
+        "$total_amount.amount_minor",
+        {
+            "$round": [
+                {
+                    "$multiply": [
+                        {"$ifNull": ["$total_amount.amount", 0]},
+                        _MINOR_FACTOR_EXPRESSION,
+                    ]
+                },
+                0,
+            ]
+        },
+    ]
+}
+
+
+class MongoCustomerSummaryProjection(OrderProjectionPort, CustomerSummaryPort):
+    """
+    Mantém um documento de resumo por cliente na coleção `customer_order_summaries`.
+
+    `{_id: customer_id, order_count, spend: {<moeda>: unidades_menores},
+    last_order: {order_id, status, created_at}, updated_at}`
+
+    O gasto acumulado desconsidera pedidos cancelados: o valor é somado na criação
+    e subtraído quando o pedido é cancelado.
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "customer_order_summaries",
+        orders_collection_name: str = "orders",
+        archive_collection_name: str | None = "orders_archive",
+    ) -> None:
+        """
+        Inicializa a projeção.
+
+        Args:
+            database: Instância do banco de dados MongoDB
+            collection_name: Nome da coleção de resumos
+            orders_collection_name: Coleção de pedidos (usada na reconstrução)
+            archive_collection_name: Coleção de pedidos arquivados, também lida na
+                reconstrução (None desativa)
+        """
+        self._collection = database[collection_name]
+        self._orders = database[orders_collection_name]
+        self._archive_collection_name = archive_collection_name
+
+    @traced(
+        "mongo.apply_customer_summaries",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "apply_customer_summaries"},
+    )
+    @timed(MONGO_SECONDS, "apply_customer_summaries")
+    async def apply(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Aplica um lote de transições aos resumos.
+
+        As operações de cada cliente são agrupadas: um `$inc` com contagem e gasto,
+        a troca condicional do último pedido e a atualização do status dele.
+
+        Args:
+            changes: Transições em ordem cronológica
+        """
+        increments: dict[str, dict[str, int]] = {}
+        newest: dict[str, StatusChange] = {}
+        final_status: dict[tuple[str, str], StatusChange] = {}
+
+        for change in changes:
+            customer_inc = increments.setdefault(change.customer_id, {})
+            spend_key = f"spend.{change.total_amount.currency}"
+            if change.from_status is None:
+                customer_inc["order_count"] = customer_inc.get("order_count", 0) + 1
+                # Pedidos importados já cancelados não contam no gasto, como no rebuild
+                if change.to_status != OrderStatus.CANCELLED:
+                    customer_inc[spend_key] = (
+                        customer_inc.get(spend_key, 0) + change.total_amount.minor_units
+                    )
+                current = newest.get(change.customer_id)
+                if current is None or change.changed_at >= current.changed_at:
+                    newest[change.customer_id] = change
+            elif (
+                change.to_status == OrderStatus.CANCELLED
+                and change.from_status != OrderStatus.CANCELLED
+            ):
+                # Um cancelamento repetido ou reprocessado não desconta o valor de novo
+                customer_inc[spend_key] = (
+                    customer_inc.get(spend_key, 0) - change.total_amount.minor_units
+                )
+            final_status[(change.customer_id, change.order_id)] = change
+
+        now = datetime.utcnow()
+        operations: list[UpdateOne] = []
+        for customer_id, customer_inc in increments.items():
+            update: dict[str, Any] = {"$set": {"updated_at": now}}
+            customer_inc = {key: value for key, value in customer_inc.items() if value}
+            if customer_inc:
+                update["$inc"] = customer_inc
+            operations.append(UpdateOne({"_id": customer_id}, update, upsert=True))
+
+            created = newest.get(customer_id)
+            if created is not None:
+                latest = final_status[(customer_id, created.order_id)]
+                operations.append(
+                    UpdateOne(
+                        {
+                            "_id": customer_id,
+                            "$or": [
+                                {"last_order": {"$exists": False}},
+                                {"last_order.created_at": {"$lte": created.changed_at}},
+                            ],
+                        },
+                        {
+                            "$set": {
+                                "last_order": {
+                                    "order_id": created.order_id,
+                                    "status": latest.to_status.value,
+                                    "created_at": created.changed_at,
+                                }
+                            }
+                        },
+                    )
+                )
+
+        for (customer_id, order_id), change in final_status.items():
+            created = newest.get(customer_id)
+            if change.from_status is None or (created and created.order_id == order_id):
+                continue
+            operations.append(
+                UpdateOne(
+                    {"_id": customer_id, "last_order.order_id": order_id},
+                    {"$set": {"last_order.status": change.to_status.value}},
+                )
+            )
+
+        if operations:
+            # Ordenado: o documento precisa existir antes das atualizações condicionais
+            await self._collection.bulk_write(operations, ordered=True)
+
+    async def reset(self) -> None:
+        """Apaga todos os resumos."""
+        await self._collection.delete_many({})
+
+    async def get_summary(self, customer_id: str) -> dict[str, Any] | None:
+        """
+        Busca o resumo de um cliente.
+
+        Args:
+            customer_id: ID do cliente
+
+        Returns:
+            Resumo do cliente ou None
+        """
+        with deadline_timeout("get_customer_summary"):
+            document = await self._collection.find_one({"_id": customer_id})
+
+        if not document:
+            return None
+
+        return {
+            "customer_id": customer_id,
+            "order_count": int(document.get("order_count", 0)),
+            "lifetime_spend": [
+                Money.from_minor(max(int(minor), 0), currency)
+                for currency, minor in sorted(document.get("spend", {}).items())
+            ],
+            "last_order": document.get("last_order"),
+            "updated_at": document.get("updated_at"),
+        }
+
+    async def rebuild(self, batch_size: int = 500, concurrency: int = 4) -> dict[str, Any]:
+        """
+        Reconstrói todos os resumos a partir dos pedidos, incluindo os arquivados.
+
+        Os IDs de cliente são lidos em streaming e agrupados em lotes; até
+        `concurrency` lotes são agregados (usando o índice `customer_id`) e gravados
+        ao mesmo tempo, enquanto o próximo lote é montado.
+
+        Args:
+            batch_size: Clientes por lote
+            concurrency: Lotes processados em paralelo
+
+        Returns:
+            Clientes processados, lotes e duração
+        """
+        started = time.perf_counter()
+        await self.reset()
+
+        pending: set[asyncio.Task[int]] = set()
+        customers = 0
+        batches = 0
+
+        async def submit(customer_ids: list[str]) -> None:
+            nonlocal customers
+            if len(pending) >= concurrency:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    customers += task.result()
+            pending.add(asyncio.create_task(self._rebuild_batch(customer_ids)))
+
+        cursor = self._orders.aggregate(
+            [*self._union_archive(), {"$group": {"_id": "$customer_id"}}], allowDiskUse=True
+        )
+        batch: list[str] = []
+        async for group in cursor:
+            batch.append(group["_id"])
+            if len(batch) >= batch_size:
+                await submit(batch)
+                batches += 1
+                batch = []
+        if batch:
+            await submit(batch)
+            batches += 1
+
+        customers += sum(await asyncio.gather(*pending))
+        result = {
+            "customers": customers,
+            "batches": batches,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+        logger.info("Resumos de clientes reconstruídos", **result)
+        return result
+
+    def _union_archive(self, pipeline: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
+        """
+        Estágio `$unionWith` que acrescenta os pedidos arquivados.
+
+        Args:
+            pipeline: Estágios aplicados à coleção de arquivo antes da união
+
+        Returns:
+            Lista com o estágio (vazia sem coleção de arquivo)
+        """
+        if not self._archive_collection_name:
+            return []
+        return [{"$unionWith": {"coll": self._archive_collection_name, "pipeline": pipeline or []}}]
+
+    async def _rebuild_batch(self, customer_ids: list[str]) -> int:
+        """
+        Recalcula e grava os resumos de um lote de clientes.
+
+        Args:
+            customer_ids: IDs dos clientes do lote
+
+        Returns:
+            Número de resumos gravados
+        """
+        customers_match = {"$match": {"customer_id": {"$in": customer_ids}}}
+        groups = await self._orders.aggregate(
+            [
+                customers_match,
+                *self._union_archive([customers_match]),
+                {"$sort": {"created_at": 1}},
+                {
+                    "$group": {
+                        "_id": {
+                            "customer_id": "$customer_id",
+                            "currency": {"$ifNull": ["$total_amount.currency", "BRL"]},
+                        },
+                        "order_count": {"$sum": 1},
+                        "spend": {
+                            "$sum": {
+                                "$cond": [
+                                    {"$eq": ["$status", OrderStatus.CANCELLED.value]},
+                                    0,
+                                    _AMOUNT_MINOR_EXPRESSION,
+                                ]
+                            }
+                        },
+                        "last_order": {
+                            "$last": {
+                                "order_id": "$id",
+                                "status": "$status",
+                                "created_at": "$created_at",
+                            }
+                        },
+                    }
+                },
+            ]
+        ).to_list(length=None)
+
+        now = datetime.utcnow()
+        summaries: dict[str, dict[str, Any]] = {}
+        for group in groups:
+            customer_id = group["_id"]["customer_id"]
+            summary = summaries.setdefault(
+                customer_id,
+                {"order_count": 0, "spend": {}, "last_order": None, "updated_at": now},
+            )
+            summary["order_count"] += group["order_count"]
+            summary["spend"][group["_id"]["currency"]] = int(group["spend"])
+            last_order = dict(group["last_order"])
+            last_order["order_id"] = decode_order_id(last_order["order_id"])
+            current = summary["last_order"]
+            if current is None or last_order["created_at"] >= current["created_at"]:
+                summary["last_order"] = last_order
+
+        if summaries:
+            await self._collection.bulk_write(
+                [
+                    ReplaceOne({"_id": customer_id}, summary, upsert=True)
+                    for customer_id, summary in summaries.items()
+                ],
+                ordered=False,
+            )
+        return len(summaries)
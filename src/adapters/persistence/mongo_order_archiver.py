@@ -0,0 +1,101 @@
+"""Arquivamento de pedidos encerrados em uma coleção separada."""
+
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any
+
+import structlog
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne
+
+from src.domain.ports.order_archive_port import OrderArchivePort
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+
+class MongoOrderArchiver(OrderArchivePort):
+    """
+    Move pedidos de `orders` para `orders_archive`, em lotes.
+
+    Cada lote é copiado com upserts pelo `_id` e só então removido da coleção
+    principal; se o processo cair entre os dois passos, o próximo lote copia os
+    mesmos documentos de novo sem duplicá-los.
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "orders",
+        archive_collection_name: str = "orders_archive",
+    ) -> None:
+        """
+        Inicializa o arquivador.
+
+        Args:
+            database: Instância do banco de dados MongoDB
+            collection_name: Coleção principal de pedidos
+            archive_collection_name: Coleção de arquivo
+        """
+        self._collection = database[collection_name]
+        self._archive = database[archive_collection_name]
+
+    async def _ensure_indexes(self) -> None:
+        """Cria os índices da coleção de arquivo (busca por ID e por cliente)."""
+        try:
+            await self._archive.create_index("id", unique=True)
+            await self._archive.create_index("customer_id")
+        except Exception as e:
+            logger.warning("Erro ao criar índices do arquivo de pedidos", error=str(e))
+
+    @staticmethod
+    def _query(statuses: Collection[OrderStatus], updated_before: datetime) -> dict[str, Any]:
+        """Filtro dos pedidos arquiváveis (usa o índice `status + updated_at`)."""
+        return {
+            "status": {"$in": sorted(status.value for status in statuses)},
+            "updated_at": {"$lt": updated_before},
+        }
+
+    async def count_archivable(
+        self, statuses: Collection[OrderStatus], updated_before: datetime
+    ) -> int:
+        """
+        Conta os pedidos que podem ser arquivados.
+
+        Args:
+            statuses: Status arquiváveis
+            updated_before: Última atualização anterior a esta data
+
+        Returns:
+            Quantidade de pedidos
+        """
+        return await self._collection.count_documents(self._query(statuses, updated_before))
+
+    async def archive_batch(
+        self, statuses: Collection[OrderStatus], updated_before: datetime, batch_size: int
+    ) -> int:
+        """
+        Copia um lote para o arquivo e o remove da coleção principal.
+
+        Args:
+            statuses: Status arquiváveis
+            updated_before: Última atualização anterior a esta data
+            batch_size: Número máximo de pedidos movidos
+
+        Returns:
+            Quantidade de pedidos removidos da coleção principal
+        """
+        query = self._query(statuses, updated_before)
+        documents = await self._collection.find(query).limit(batch_size).to_list(length=batch_size)
+        if not documents:
+            return 0
+
+        await self._archive.bulk_write(
+            [ReplaceOne({"_id": document["_id"]}, document, upsert=True) for document in documents],
+            ordered=False,
+        )
+        # Repete o filtro: só remove o que ainda é arquivável
+        result = await self._collection.delete_many(
+            {"_id": {"$in": [document["_id"] for document in documents]}, **query}
+        )
+        return result.deleted_count
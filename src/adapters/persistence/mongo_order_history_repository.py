@@ -0,0 +1,238 @@
+"""Adapter MongoDB para o histórico de status dos pedidos."""
+
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+import structlog
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from src.adapters.persistence.mongo_support import (
+    deadline_timeout,
+    money_from_document,
+    money_to_document,
+)
+from src.application.metrics import MONGO_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.order_history_port import OrderHistoryPort
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+LOG_ORDER = [("changed_at", 1), ("_id", 1)]
+
+
+class MongoOrderHistoryRepository(OrderHistoryPort):
+    """
+    Log append-only de transições de status em uma coleção própria.
+
+    O documento do pedido continua sendo o snapshot do estado atual; o log guarda
+    apenas as transições. A ordem do log é `(changed_at, _id)`: o ObjectId é gerado
+    no cliente e não acompanha o horário da transição entre processos, então serve
+    só de desempate. A posição de um checkpoint é esse par (`<changed_at>|<_id>`).
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "order_status_history",
+        checkpoints_collection_name: str = "order_history_checkpoints",
+    ) -> None:
+        """
+        Inicializa o repositório.
+
+        Args:
+            database: Instância do banco de dados MongoDB
+            collection_name: Nome da coleção do log
+            checkpoints_collection_name: Nome da coleção de checkpoints de leitura
+        """
+        self._collection = database[collection_name]
+        self._checkpoints = database[checkpoints_collection_name]
+
+    async def _ensure_indexes(self) -> None:
+        """Cria os índices do histórico de um pedido e da leitura do log em ordem."""
+        try:
+            await self._collection.create_index([("order_id", 1), ("changed_at", 1), ("_id", 1)])
+            await self._collection.create_index([("changed_at", 1), ("_id", 1)])
+            logger.info("Índices do histórico de status criados com sucesso")
+        except Exception as e:
+            logger.warning("Erro ao criar índices do histórico de status", error=str(e))
+
+    @traced(
+        "mongo.append_history",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "append_history"},
+    )
+    @timed(MONGO_SECONDS, "append_history")
+    async def append(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Acrescenta transições ao log.
+
+        Não usa o deadline da requisição: a transição já foi salva no pedido e o
+        histórico não deve perder a entrada por causa de um cliente impaciente.
+
+        Args:
+            changes: Transições em ordem cronológica
+        """
+        if not changes:
+            return
+        await self._collection.insert_many(
+            [self._change_to_document(change) for change in changes], ordered=True
+        )
+
+    async def find_by_order_id(self, order_id: OrderId) -> list[StatusChange]:
+        """
+        Busca o histórico de um pedido.
+
+        Args:
+            order_id: ID do pedido
+
+        Returns:
+            Transições do pedido em ordem cronológica
+        """
+        with deadline_timeout("find_history_by_order_id"):
+            documents = (
+                await self._collection.find({"order_id": order_id})
+                .sort(LOG_ORDER)
+                .to_list(length=None)
+            )
+        return [self._document_to_change(document) for document in documents]
+
+    async def iter_batches(
+        self, batch_size: int, after: str | None = None
+    ) -> AsyncIterator[tuple[str, list[StatusChange]]]:
+        """
+        Percorre o log inteiro em lotes, na ordem de `(changed_at, _id)`.
+
+        Args:
+            batch_size: Número de transições por lote
+            after: Posição a partir da qual continuar (exclusiva)
+
+        Yields:
+            Posição da última transição do lote e as transições do lote
+        """
+        query: dict[str, Any] = {}
+        if after:
+            changed_at, last_id = _parse_position(after)
+            query = {
+                "$or": [
+                    {"changed_at": {"$gt": changed_at}},
+                    {"changed_at": changed_at, "_id": {"$gt": last_id}},
+                ]
+            }
+        cursor = self._collection.find(query).sort(LOG_ORDER).batch_size(batch_size)
+
+        batch: list[StatusChange] = []
+        last_document: dict[str, Any] | None = None
+        async for document in cursor:
+            batch.append(self._document_to_change(document))
+            last_document = document
+            if len(batch) >= batch_size:
+                yield _format_position(last_document), batch
+                batch = []
+        if batch and last_document is not None:
+            yield _format_position(last_document), batch
+
+    async def load_checkpoint(self, name: str) -> str | None:
+        """
+        Lê a última posição processada por um consumidor do log.
+
+        Args:
+            name: Nome do consumidor
+
+        Returns:
+            Posição salva ou None
+        """
+        document = await self._checkpoints.find_one({"_id": name})
+        return document["position"] if document else None
+
+    async def save_checkpoint(self, name: str, position: str) -> None:
+        """
+        Salva a última posição processada por um consumidor do log.
+
+        Args:
+            name: Nome do consumidor
+            position: Posição da última transição processada
+        """
+        await self._checkpoints.update_one(
+            {"_id": name},
+            {"$set": {"position": position, "updated_at": datetime.utcnow()}},
+            upsert=True,
+        )
+
+    @staticmethod
+    def _change_to_document(change: StatusChange) -> dict[str, Any]:
+        """
+        Converte uma transição para documento MongoDB.
+
+        Args:
+            change: Transição de status
+
+        Returns:
+            Documento para MongoDB
+        """
+        return {
+            "order_id": change.order_id,
+            "customer_id": change.customer_id,
+            "from_status": change.from_status.value if change.from_status else None,
+            "to_status": change.to_status.value,
+            "changed_at": change.changed_at,
+            "total_amount": money_to_document(change.total_amount),
+        }
+
+    @staticmethod
+    def _document_to_change(document: dict[str, Any]) -> StatusChange:
+        """
+        Converte documento MongoDB para transição.
+
+        Args:
+            document: Documento do MongoDB
+
+        Returns:
+            Transição de status
+        """
+        from_status = document.get("from_status")
+        return StatusChange(
+            order_id=OrderId(document["order_id"]),
+            customer_id=document["customer_id"],
+            from_status=OrderStatus(from_status) if from_status else None,
+            to_status=OrderStatus(document["to_status"]),
+            changed_at=document["changed_at"],
+            total_amount=money_from_document(document.get("total_amount", {})),
+        )
+
+
+def _format_position(document: dict[str, Any]) -> str:
+    """
+    Posição de uma entrada do log.
+
+    Args:
+        document: Documento do histórico
+
+    Returns:
+        `<changed_at ISO>|<_id>`
+    """
+    return f"{document['changed_at'].isoformat()}|{document['_id']}"
+
+
+def _parse_position(position: str) -> tuple[datetime, ObjectId]:
+    """
+    Interpreta uma posição do log.
+
+    Checkpoints antigos guardam só o `_id`; o horário de geração do ObjectId
+    substitui o `changed_at` nesse caso.
+
+    Args:
+        position: Posição salva
+
+    Returns:
+        `changed_at` e `_id` da última entrada processada
+    """
+    changed_at, separator, object_id = position.rpartition("|")
+    if not separator:
+        last_id = ObjectId(object_id)
+        return last_id.generation_time.replace(tzinfo=None), last_id
+    return datetime.fromisoformat(changed_at), ObjectId(object_id)
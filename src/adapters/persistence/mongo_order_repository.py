@@ -1,33 +1,91 @@
 """Adapter MongoDB para repositório de pedidos."""
 
+import heapq
+import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import Any
 
 import structlog
+from bson import Binary, ObjectId
+from bson.binary import UuidRepresentation
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
 from pymongo.errors import DuplicateKeyError
 
+from src.adapters.persistence.mongo_support import (
+    deadline_timeout,
+    decode_order_id,
+    money_from_document,
+    money_to_document,
+)
+from src.application.metrics import MONGO_SECONDS, timed
+from src.application.tracing import traced
 from src.domain.entities.order import Order
-from src.domain.ports.repository_port import OrderRepositoryPort
+from src.domain.ports.repository_port import OrderRepositoryPort, SaveManyResult
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.order_status import OrderStatus
 
 logger = structlog.get_logger()
 
+PRODUCT_STATUS_INDEX = "items_product_id_status_created_at_id"
+PRODUCT_QUERY_SORT = [("created_at", 1), ("id", 1)]
+
+
+def winning_plan_stages(explain: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Lista os estágios do plano vencedor de um `explain`, do topo até as folhas.
+
+    Aceita tanto o formato clássico quanto o do SBE (`winningPlan.queryPlan`).
+
+    Args:
+        explain: Resultado de `cursor.explain()`
+
+    Returns:
+        Estágios com `stage` e, quando houver, `indexName`
+    """
+    plan = explain["queryPlanner"]["winningPlan"]
+    plan = plan.get("queryPlan", plan)
+    stages = []
+    pending = [plan]
+    while pending:
+        node = pending.pop(0)
+        stages.append({key: node[key] for key in ("stage", "indexName") if key in node})
+        if "inputStage" in node:
+            pending.append(node["inputStage"])
+        pending.extend(node.get("inputStages", []))
+    return stages
+
+
+def _to_millis(value: datetime) -> datetime:
+    """Trunca um datetime para a precisão gravada pelo MongoDB (milissegundos)."""
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
 
 class MongoOrderRepository(OrderRepositoryPort):
     """Implementação do repositório usando MongoDB."""
 
-    def __init__(self, database: AsyncIOMotorDatabase, collection_name: str = "orders") -> None:
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "orders",
+        binary_ids: bool = False,
+        archive_collection_name: str | None = "orders_archive",
+    ) -> None:
         """
         Inicializa o repositório MongoDB.
 
         Args:
             database: Instância do banco de dados MongoDB
             collection_name: Nome da coleção
+            binary_ids: Grava IDs UUID/ObjectId em formato binário BSON (16/12 bytes)
+            archive_collection_name: Coleção de pedidos arquivados consultada quando o
+                pedido não está na coleção principal (None desativa)
         """
         self._collection = database[collection_name]
+        self._archive = database[archive_collection_name] if archive_collection_name else None
+        self._binary_ids = binary_ids
         # Nota: _ensure_indexes() é chamado assincronamente no container.initialize()
 
     async def _ensure_indexes(self) -> None:
@@ -38,17 +96,33 @@ class MongoOrderRepository(OrderRepositoryPort):
 
             # Índices para consultas comuns
             await self._collection.create_index("customer_id")
-            await self._collection.create_index("status")
             await self._collection.create_index("created_at")
+            await self._collection.create_index("updated_at")
 
             # Índice composto para consultas por cliente e status
             await self._collection.create_index([("customer_id", 1), ("status", 1)])
 
+            # Status + criação: pedidos pendentes há muito tempo (cancelamento automático)
+            await self._collection.create_index([("status", 1), ("created_at", 1)])
+
+            # Status + última atualização: arquivamento de pedidos encerrados antigos
+            # (também atende consultas só por status, que usam o prefixo)
+            await self._collection.create_index([("status", 1), ("updated_at", 1)])
+
+            # Índice multikey para "pedidos que contêm o produto X" (recall/estoque),
+            # já na ordem de paginação por (created_at, id)
+            await self._collection.create_index(
+                [("items.product_id", 1), ("status", 1), *PRODUCT_QUERY_SORT],
+                name=PRODUCT_STATUS_INDEX,
+            )
+
             logger.info("Índices MongoDB criados com sucesso")
         except Exception as e:
             logger.warning("Erro ao criar índices MongoDB", error=str(e))
             # Não falha a inicialização se os índices já existirem
 
+    @traced("mongo.save", "client", {"db.system": "mongodb", "db.operation.name": "save"})
+    @timed(MONGO_SECONDS, "save")
     async def save(self, order: Order) -> Order:
         """
         Salva ou atualiza um pedido no MongoDB.
@@ -62,11 +136,12 @@ class MongoOrderRepository(OrderRepositoryPort):
         order_dict = self._order_to_dict(order)
 
         try:
-            await self._collection.update_one(
-                {"id": order.id},
-                {"$set": order_dict},
-                upsert=True,
-            )
+            with deadline_timeout("save"):
+                await self._collection.update_one(
+                    self._id_filter(order.id),
+                    {"$set": order_dict},
+                    upsert=True,
+                )
             logger.debug("Pedido salvo no MongoDB", order_id=str(order.id))
         except DuplicateKeyError as e:
             logger.error("Erro ao salvar pedido", order_id=str(order.id), error=str(e))
@@ -74,9 +149,127 @@ class MongoOrderRepository(OrderRepositoryPort):
 
         return order
 
+    @traced("mongo.save_many", "client", {"db.system": "mongodb", "db.operation.name": "save_many"})
+    @timed(MONGO_SECONDS, "save_many")
+    async def save_many(self, orders: Sequence[Order]) -> SaveManyResult:
+        """
+        Grava pedidos importados com um único `bulk_write` não ordenado.
+
+        As versões gravadas são lidas antes, em uma consulta por lote (e outra no
+        arquivo). Pedidos novos viram upserts com `$setOnInsert`, que não
+        sobrescrevem um pedido criado nesse meio tempo; existentes só são
+        atualizados se o `updated_at` recebido for mais novo, com filtro no
+        `updated_at` lido. Assim reimportar uma exportação antiga não regride
+        pedidos, e pedidos arquivados não ganham uma segunda cópia em `orders`.
+
+        Args:
+            orders: Pedidos a serem gravados
+
+        Returns:
+            Pedidos inseridos, atualizados (com o status anterior) e ignorados
+        """
+        result = SaveManyResult()
+        if not orders:
+            return result
+
+        stored_ids = [stored for order in orders for stored in self._id_filter_values(order.id)]
+        projection = {"_id": 0, "id": 1, "status": 1, "updated_at": 1}
+        existing = {
+            self._decode_id(document["id"]): document
+            async for document in self._collection.find({"id": {"$in": stored_ids}}, projection)
+        }
+        archived: set[str] = set()
+        if self._archive is not None:
+            archived = {
+                self._decode_id(document["id"])
+                async for document in self._archive.find(
+                    {"id": {"$in": stored_ids}}, {"_id": 0, "id": 1}
+                )
+            }
+
+        inserts: list[Order] = []
+        updates: list[tuple[Order, OrderStatus, Any]] = []
+        for order in orders:
+            if order.id in archived:
+                continue
+            stored = existing.get(order.id)
+            if stored is None:
+                inserts.append(order)
+                continue
+            stored_updated_at = self._parse_datetime(stored.get("updated_at"))
+            # O MongoDB guarda milissegundos: compara na mesma precisão
+            if stored_updated_at is not None and stored_updated_at >= _to_millis(order.updated_at):
+                continue
+            updates.append((order, OrderStatus(stored["status"]), stored.get("updated_at")))
+
+        operations = [
+            UpdateOne(
+                self._id_filter(order.id),
+                {"$setOnInsert": self._order_to_dict(order)},
+                upsert=True,
+            )
+            for order in inserts
+        ]
+        operations.extend(
+            UpdateOne(
+                {**self._id_filter(order.id), "updated_at": stored_updated_at},
+                {"$set": self._order_to_dict(order)},
+            )
+            for order, _, stored_updated_at in updates
+        )
+        if operations:
+            write = await self._collection.bulk_write(operations, ordered=False)
+            # Os inserts vêm primeiro; um upsert só aparece aqui se de fato inseriu
+            result.inserted = [inserts[index] for index in sorted(write.upserted_ids)]
+            result.updated = await self._confirm_updates(
+                [(order, status) for order, status, _ in updates], write.modified_count
+            )
+
+        result.skipped = len(orders) - len(result.inserted) - len(result.updated)
+        return result
+
+    async def _confirm_updates(
+        self, updates: list[tuple[Order, OrderStatus]], modified_count: int
+    ) -> list[tuple[Order, OrderStatus]]:
+        """
+        Identifica as atualizações condicionais de `save_many` que casaram.
+
+        Quando nem todas casam (outra operação mudou o pedido depois da leitura),
+        as gravadas são as que ficaram com o `updated_at` recebido.
+
+        Args:
+            updates: Pedidos enviados e o status lido antes da gravação
+            modified_count: Documentos alterados pelo `bulk_write`
+
+        Returns:
+            Atualizações efetivamente gravadas
+        """
+        if modified_count == len(updates):
+            return updates
+        if modified_count == 0:
+            return []
+
+        stored_ids = [stored for order, _ in updates for stored in self._id_filter_values(order.id)]
+        documents = await self._collection.find(
+            {"id": {"$in": stored_ids}}, {"_id": 0, "id": 1, "updated_at": 1}
+        ).to_list(length=None)
+        written = {
+            (self._decode_id(document["id"]), self._parse_datetime(document.get("updated_at")))
+            for document in documents
+        }
+        return [
+            (order, status)
+            for order, status in updates
+            if (order.id, _to_millis(order.updated_at)) in written
+        ]
+
+    @traced(
+        "mongo.find_by_id", "client", {"db.system": "mongodb", "db.operation.name": "find_by_id"}
+    )
+    @timed(MONGO_SECONDS, "find_by_id")
     async def find_by_id(self, order_id: OrderId) -> Order | None:
         """
-        Busca um pedido por ID no MongoDB.
+        Busca um pedido por ID no MongoDB, recorrendo ao arquivo se necessário.
 
         Args:
             order_id: ID do pedido
@@ -84,13 +277,497 @@ class MongoOrderRepository(OrderRepositoryPort):
         Returns:
             Pedido encontrado ou None
         """
-        document = await self._collection.find_one({"id": order_id})
+        id_filter = self._id_filter(order_id)
+        with deadline_timeout("find_by_id"):
+            document = await self._collection.find_one(id_filter)
+            if not document and self._archive is not None:
+                document = await self._archive.find_one(id_filter)
 
         if not document:
             return None
 
         return self._dict_to_order(document)
 
+    @traced(
+        "mongo.find_fields_by_id",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "find_fields_by_id"},
+    )
+    @timed(MONGO_SECONDS, "find_fields_by_id")
+    async def find_fields_by_id(
+        self, order_id: OrderId, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """
+        Busca apenas alguns campos de um pedido, usando projeção no MongoDB.
+
+        Args:
+            order_id: ID do pedido
+            fields: Campos a retornar
+
+        Returns:
+            Dicionário com os campos pedidos ou None
+        """
+        projection = {field: 1 for field in fields}
+        projection["_id"] = 0
+
+        id_filter = self._id_filter(order_id)
+        with deadline_timeout("find_fields_by_id"):
+            document = await self._collection.find_one(id_filter, projection)
+            if not document and self._archive is not None:
+                document = await self._archive.find_one(id_filter, projection)
+
+        if not document:
+            return None
+
+        if "id" in document:
+            document["id"] = self._decode_id(document["id"])
+        for field in ("created_at", "updated_at"):
+            if field in document:
+                document[field] = self._parse_datetime(document[field])
+        if "total_amount" in document:
+            money = money_from_document(document["total_amount"])
+            document["total_amount"] = {"amount": float(money.amount), "currency": money.currency}
+
+        return document
+
+    @traced(
+        "mongo.find_by_product",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "find_by_product"},
+    )
+    @timed(MONGO_SECONDS, "find_by_product")
+    async def find_by_product(
+        self,
+        product_id: str,
+        statuses: Sequence[OrderStatus] | None = None,
+        limit: int = 100,
+        after: tuple[datetime, OrderId] | None = None,
+    ) -> list[Order]:
+        """
+        Busca pedidos que contêm um produto, com paginação por chave (created_at, id).
+
+        Args:
+            product_id: ID do produto
+            statuses: Status aceitos (padrão: todos)
+            limit: Número máximo de pedidos
+            after: Chave (created_at, id) do último pedido da página anterior
+
+        Returns:
+            Pedidos encontrados
+        """
+        query = self._product_query(product_id, statuses, after)
+
+        with deadline_timeout("find_by_product"):
+            documents = (
+                await self._collection.find(query)
+                .sort(PRODUCT_QUERY_SORT)
+                .limit(limit)
+                .to_list(length=limit)
+            )
+
+        return [self._dict_to_order(document) for document in documents]
+
+    async def explain_find_by_product(
+        self, product_id: str, statuses: Sequence[OrderStatus] | None = None
+    ) -> dict[str, Any]:
+        """
+        Retorna o `explain` da consulta de `find_by_product`.
+
+        Args:
+            product_id: ID do produto
+            statuses: Status aceitos (padrão: todos)
+
+        Returns:
+            Resultado do explain (use `winning_plan_stages` para inspecionar)
+        """
+        query = self._product_query(product_id, statuses, None)
+        return await self._collection.find(query).sort(PRODUCT_QUERY_SORT).limit(1).explain()
+
+    def _product_query(
+        self,
+        product_id: str,
+        statuses: Sequence[OrderStatus] | None,
+        after: tuple[datetime, OrderId] | None,
+    ) -> dict[str, Any]:
+        """
+        Monta o filtro da busca por produto.
+
+        O status é sempre restrito por igualdade ou `$in` (todos os status quando
+        nenhum é informado): assim o MongoDB combina as faixas do índice com
+        SORT_MERGE em vez de ordenar em memória.
+
+        Args:
+            product_id: ID do produto
+            statuses: Status aceitos
+            after: Chave (created_at, id) a partir da qual continuar
+
+        Returns:
+            Filtro MongoDB
+        """
+        values = sorted({status.value for status in (statuses or OrderStatus)})
+        query: dict[str, Any] = {
+            "items.product_id": product_id,
+            "status": values[0] if len(values) == 1 else {"$in": values},
+        }
+        if after is not None:
+            created_at, order_id = after
+            encoded_id = self._encode_id(order_id)
+            query["$or"] = [
+                {"created_at": {"$gt": created_at}},
+                {"created_at": created_at, "id": {"$gt": encoded_id}},
+            ]
+        return query
+
+    @traced(
+        "mongo.find_stale", "client", {"db.system": "mongodb", "db.operation.name": "find_stale"}
+    )
+    @timed(MONGO_SECONDS, "find_stale")
+    async def find_stale(
+        self, status: OrderStatus, created_before: datetime, limit: int = 100
+    ) -> list[Order]:
+        """
+        Busca os pedidos mais antigos em um status (índice `status + created_at`).
+
+        Args:
+            status: Status atual dos pedidos
+            created_before: Criados antes desta data
+            limit: Número máximo de pedidos
+
+        Returns:
+            Pedidos em ordem de criação
+        """
+        cursor = (
+            self._collection.find({"status": status.value, "created_at": {"$lt": created_before}})
+            .sort("created_at", 1)
+            .limit(limit)
+        )
+        documents = await cursor.to_list(length=limit)
+        return [self._dict_to_order(document) for document in documents]
+
+    @traced(
+        "mongo.transition", "client", {"db.system": "mongodb", "db.operation.name": "transition"}
+    )
+    @timed(MONGO_SECONDS, "transition")
+    async def transition(
+        self,
+        order_id: OrderId,
+        from_status: OrderStatus,
+        to_status: OrderStatus,
+        changed_at: datetime,
+    ) -> bool:
+        """
+        Muda o status com uma atualização condicional ao status lido.
+
+        Se outra operação (ex.: o cancelamento automático) mudou o status depois
+        da leitura, nada é gravado e o chamador decide se relê e tenta de novo.
+
+        Args:
+            order_id: ID do pedido
+            from_status: Status lido antes da mudança
+            to_status: Novo status
+            changed_at: Momento da transição (gravado em `updated_at`)
+
+        Returns:
+            True se o pedido foi alterado
+        """
+        with deadline_timeout("transition"):
+            result = await self._collection.update_one(
+                {**self._id_filter(order_id), "status": from_status.value},
+                {"$set": {"status": to_status.value, "updated_at": changed_at}},
+            )
+        return result.modified_count == 1
+
+    @traced(
+        "mongo.transition_many",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "transition_many"},
+    )
+    @timed(MONGO_SECONDS, "transition_many")
+    async def transition_many(
+        self,
+        order_ids: Sequence[OrderId],
+        from_status: OrderStatus,
+        to_status: OrderStatus,
+        changed_at: datetime,
+    ) -> list[OrderId]:
+        """
+        Muda o status com um `bulk_write` de atualizações condicionais.
+
+        Cada atualização só casa se o pedido ainda estiver em `from_status`, então
+        um pedido alterado por outra requisição nesse meio tempo não é sobrescrito.
+        Quando nem todos casam, os alterados são identificados pelo `updated_at`.
+
+        Args:
+            order_ids: IDs dos pedidos
+            from_status: Status esperado
+            to_status: Novo status
+            changed_at: Momento da transição (gravado em `updated_at`)
+
+        Returns:
+            IDs dos pedidos efetivamente alterados
+        """
+        if not order_ids:
+            return []
+
+        update = {"$set": {"status": to_status.value, "updated_at": changed_at}}
+        operations = [
+            UpdateOne({**self._id_filter(order_id), "status": from_status.value}, update)
+            for order_id in order_ids
+        ]
+        result = await self._collection.bulk_write(operations, ordered=False)
+        if result.modified_count == len(order_ids):
+            return list(order_ids)
+        if result.modified_count == 0:
+            return []
+
+        stored_ids = [
+            stored for order_id in order_ids for stored in self._id_filter_values(order_id)
+        ]
+        documents = await self._collection.find(
+            {"id": {"$in": stored_ids}, "status": to_status.value, "updated_at": changed_at},
+            {"id": 1, "_id": 0},
+        ).to_list(length=len(order_ids))
+        return [self._decode_id(document["id"]) for document in documents]
+
+    async def iter_orders(
+        self,
+        created_from: datetime,
+        created_to: datetime,
+        statuses: Sequence[OrderStatus] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Order]]:
+        """
+        Percorre os pedidos criados em um intervalo, em lotes e em ordem de criação.
+
+        Inclui os pedidos arquivados: as duas coleções são lidas em paralelo, cada
+        uma já ordenada, e intercaladas por `created_at`. O cursor busca
+        `batch_size` documentos por ida ao servidor e cada lote só é lido depois
+        que o anterior foi consumido, então a memória usada não depende do
+        tamanho do intervalo. Não usa o deadline da requisição: exportações
+        longas são limitadas pelo consumo do cliente.
+
+        Args:
+            created_from: Início do intervalo (inclusivo)
+            created_to: Fim do intervalo (exclusivo)
+            statuses: Status aceitos (padrão: todos)
+            batch_size: Número de pedidos por lote
+
+        Yields:
+            Lotes de pedidos
+        """
+        query: dict[str, Any] = {"created_at": {"$gte": created_from, "$lt": created_to}}
+        if statuses:
+            query["status"] = {"$in": [status.value for status in statuses]}
+
+        async for batch in self._iter_batches(
+            self._merged_find(query, "created_at", batch_size), batch_size
+        ):
+            yield batch
+
+    async def iter_changed_orders(
+        self,
+        updated_from: datetime | None,
+        updated_to: datetime,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Order]]:
+        """
+        Percorre, em lotes, os pedidos alterados em um intervalo de `updated_at`.
+
+        Sem `updated_from` (carga completa) a leitura segue `created_at`, para que
+        pedidos do mesmo dia venham juntos; no modo incremental segue `updated_at`.
+        Pedidos arquivados são incluídos, como em `iter_orders`.
+
+        Args:
+            updated_from: Início do intervalo (inclusivo); None percorre desde o início
+            updated_to: Fim do intervalo (exclusivo)
+            batch_size: Número de pedidos por lote
+
+        Yields:
+            Lotes de pedidos
+        """
+        updated_range: dict[str, Any] = {"$lt": updated_to}
+        if updated_from is not None:
+            updated_range["$gte"] = updated_from
+        sort_field = "created_at" if updated_from is None else "updated_at"
+
+        async for batch in self._iter_batches(
+            self._merged_find({"updated_at": updated_range}, sort_field, batch_size), batch_size
+        ):
+            yield batch
+
+    async def _merged_find(
+        self, query: dict[str, Any], sort_field: str, batch_size: int
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Busca em `orders` e no arquivo, intercalando os documentos por `sort_field`.
+
+        Cada coleção é lida pelo seu próprio cursor ordenado; a memória usada é a
+        de um lote por cursor.
+
+        Args:
+            query: Filtro aplicado às duas coleções
+            sort_field: Campo de ordenação (crescente)
+            batch_size: Documentos por ida ao servidor
+
+        Yields:
+            Documentos em ordem de `sort_field`
+        """
+        collections = [self._collection]
+        if self._archive is not None:
+            collections.append(self._archive)
+        cursors = [
+            collection.find(query).sort(sort_field, 1).batch_size(batch_size).__aiter__()
+            for collection in collections
+        ]
+
+        # (chave, índice do cursor, documento); o índice desempata chaves iguais
+        heads: list[tuple[Any, int, dict[str, Any]]] = []
+        for index, cursor in enumerate(cursors):
+            document = await anext(cursor, None)
+            if document is not None:
+                heads.append((self._parse_datetime(document.get(sort_field)), index, document))
+        heapq.heapify(heads)
+
+        while heads:
+            _, index, document = heapq.heappop(heads)
+            yield document
+            document = await anext(cursors[index], None)
+            if document is not None:
+                heapq.heappush(
+                    heads, (self._parse_datetime(document.get(sort_field)), index, document)
+                )
+
+    async def _iter_batches(self, cursor: Any, batch_size: int) -> AsyncIterator[list[Order]]:
+        """
+        Agrupa os documentos de um cursor em lotes de pedidos.
+
+        Args:
+            cursor: Cursor do Motor
+            batch_size: Número de pedidos por lote
+
+        Yields:
+            Lotes de pedidos
+        """
+        batch: list[Order] = []
+        async for document in cursor:
+            batch.append(self._dict_to_order(document))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @traced(
+        "mongo.sum_total_amounts",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "sum_total_amounts"},
+    )
+    @timed(MONGO_SECONDS, "sum_total_amounts")
+    async def sum_total_amounts(self, status: OrderStatus | None = None) -> dict[str, Money]:
+        """
+        Soma o valor total dos pedidos no próprio MongoDB, agrupado por moeda.
+
+        A soma é feita sobre inteiros (unidades menores), portanto é exata.
+
+        Args:
+            status: Considera apenas pedidos neste status (opcional)
+
+        Returns:
+            Total de cada moeda
+        """
+        pipeline: list[dict[str, Any]] = []
+        if status is not None:
+            pipeline.append({"$match": {"status": status.value}})
+        pipeline.append(
+            {
+                "$group": {
+                    "_id": "$total_amount.currency",
+                    "amount_minor": {"$sum": "$total_amount.amount_minor"},
+                }
+            }
+        )
+
+        with deadline_timeout("sum_total_amounts"):
+            groups = await self._collection.aggregate(pipeline).to_list(length=None)
+
+        return {
+            group["_id"]: Money.from_minor(int(group["amount_minor"]), group["_id"])
+            for group in groups
+            if group["_id"] is not None
+        }
+
+    def _encode_id(self, order_id: str) -> Any:
+        """
+        Converte o ID para o formato de armazenamento.
+
+        Com `binary_ids`, UUIDs viram Binary subtipo 4 e ObjectIds viram ObjectId;
+        outros formatos continuam como string.
+
+        Args:
+            order_id: ID do pedido
+
+        Returns:
+            Valor gravado no campo `id`
+        """
+        if not self._binary_ids:
+            return order_id
+        if ObjectId.is_valid(order_id) and len(order_id) == 24:
+            return ObjectId(order_id)
+        try:
+            return Binary.from_uuid(uuid.UUID(order_id), UuidRepresentation.STANDARD)
+        except ValueError:
+            return order_id
+
+    _decode_id = staticmethod(decode_order_id)
+
+    def _id_filter(self, order_id: str) -> dict[str, Any]:
+        """
+        Monta o filtro por ID aceitando os dois formatos de armazenamento.
+
+        Durante a migração para IDs binários, documentos antigos ainda guardam o ID
+        como string; o filtro casa com ambos e o próximo `save` regrava em binário.
+
+        Args:
+            order_id: ID do pedido
+
+        Returns:
+            Filtro MongoDB
+        """
+        values = self._id_filter_values(order_id)
+        if len(values) == 1:
+            return {"id": order_id}
+        return {"id": {"$in": values}}
+
+    def _id_filter_values(self, order_id: str) -> list[Any]:
+        """
+        Retorna os valores com que um ID pode estar gravado.
+
+        Args:
+            order_id: ID do pedido
+
+        Returns:
+            Formato binário (se houver) e string
+        """
+        encoded = self._encode_id(order_id)
+        if encoded is order_id:
+            return [order_id]
+        return [encoded, order_id]
+
+    @staticmethod
+    def _parse_datetime(value: Any) -> Any:
+        """
+        Converte datetime serializado como string ISO.
+
+        Args:
+            value: Valor armazenado
+
+        Returns:
+            datetime (ou o valor original se não for string)
+        """
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return value
+
     def _order_to_dict(self, order: Order) -> dict[str, Any]:
         """
         Converte entidade Order para dicionário MongoDB.
@@ -102,13 +779,10 @@ class MongoOrderRepository(OrderRepositoryPort):
             Dicionário para MongoDB
         """
         return {
-            "id": order.id,
+            "id": self._encode_id(order.id),
             "customer_id": order.customer_id,
             "items": order.items,
-            "total_amount": {
-                "amount": float(order.total_amount.amount),
-                "currency": order.total_amount.currency,
-            },
+            "total_amount": money_to_document(order.total_amount),
             "status": order.status.value,
             "created_at": order.created_at,
             "updated_at": order.updated_at,
@@ -125,22 +799,13 @@ class MongoOrderRepository(OrderRepositoryPort):
             Entidade Order
         """
         # Converte datetime se vier como string
-        created_at = document.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-
-        updated_at = document.get("updated_at")
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-
-        total_amount_dict = document.get("total_amount", {})
-        money = Money(
-            amount=total_amount_dict.get("amount", 0),
-            currency=total_amount_dict.get("currency", "BRL"),
-        )
+        created_at = self._parse_datetime(document.get("created_at"))
+        updated_at = self._parse_datetime(document.get("updated_at"))
+
+        money = money_from_document(document.get("total_amount", {}))
 
         return Order(
-            order_id=OrderId(document["id"]),
+            order_id=self._decode_id(document["id"]),
             customer_id=document["customer_id"],
             items=document.get("items", []),
             total_amount=money,
@@ -0,0 +1,272 @@
+"""Contadores de pedidos por status e por dia, mantidos com `$inc`."""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+import structlog
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from src.adapters.persistence.mongo_support import deadline_timeout
+from src.application.metrics import MONGO_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.order_projection_port import OrderProjectionPort
+from src.domain.ports.order_stats_port import OrderStatsPort
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+GLOBAL_ID = "global"
+DAY_FORMAT = "%Y-%m-%d"
+
+
+def _day_id(day: str) -> str:
+    """Monta o `_id` do documento de contadores de um dia."""
+    return f"day:{day}"
+
+
+class MongoOrderStatsProjection(OrderProjectionPort, OrderStatsPort):
+    """
+    Mantém contadores pré-agregados na coleção `order_stats`.
+
+    - `{_id: "global", counts: {<status>: n}}`: pedidos em cada status
+    - `{_id: "day:YYYY-MM-DD", created: n, transitions: {<status>: n}}`: atividade do dia
+
+    Os incrementos de um lote são somados em memória e gravados com um único
+    `bulk_write`, então ler as contagens custa uma busca por `_id`, independente
+    do tamanho da coleção de pedidos.
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        collection_name: str = "order_stats",
+        orders_collection_name: str = "orders",
+        history_collection_name: str = "order_status_history",
+        archive_collection_name: str | None = "orders_archive",
+    ) -> None:
+        """
+        Inicializa a projeção.
+
+        Args:
+            database: Instância do banco de dados MongoDB
+            collection_name: Nome da coleção de contadores
+            orders_collection_name: Coleção de pedidos (usada na reconciliação)
+            history_collection_name: Coleção do histórico (usada na reconciliação)
+            archive_collection_name: Coleção de pedidos arquivados, somada aos pedidos
+                na reconciliação (None desativa)
+        """
+        self._collection = database[collection_name]
+        self._orders = database[orders_collection_name]
+        self._history = database[history_collection_name]
+        self._archive_collection_name = archive_collection_name
+
+    @traced(
+        "mongo.apply_order_stats",
+        "client",
+        {"db.system": "mongodb", "db.operation.name": "apply_order_stats"},
+    )
+    @timed(MONGO_SECONDS, "apply_order_stats")
+    async def apply(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Aplica um lote de transições aos contadores.
+
+        Args:
+            changes: Transições em ordem cronológica
+        """
+        global_inc: dict[str, int] = {}
+        daily_inc: dict[str, dict[str, int]] = {}
+
+        for change in changes:
+            to_key = f"counts.{change.to_status.value}"
+            global_inc[to_key] = global_inc.get(to_key, 0) + 1
+
+            day = daily_inc.setdefault(change.changed_at.strftime(DAY_FORMAT), {})
+            if change.from_status is None:
+                day["created"] = day.get("created", 0) + 1
+            else:
+                from_key = f"counts.{change.from_status.value}"
+                global_inc[from_key] = global_inc.get(from_key, 0) - 1
+                transition_key = f"transitions.{change.to_status.value}"
+                day[transition_key] = day.get(transition_key, 0) + 1
+
+        operations = []
+        global_inc = {key: value for key, value in global_inc.items() if value}
+        if global_inc:
+            operations.append(UpdateOne({"_id": GLOBAL_ID}, {"$inc": global_inc}, upsert=True))
+        operations.extend(
+            UpdateOne({"_id": _day_id(day)}, {"$inc": increments}, upsert=True)
+            for day, increments in daily_inc.items()
+        )
+
+        if operations:
+            await self._collection.bulk_write(operations, ordered=False)
+
+    async def reset(self) -> None:
+        """Apaga todos os contadores."""
+        await self._collection.delete_many({})
+
+    async def get_status_counts(self) -> dict[str, int]:
+        """
+        Retorna a quantidade de pedidos em cada status.
+
+        Returns:
+            Contagem por status (todos os status presentes, mesmo com zero)
+        """
+        with deadline_timeout("get_status_counts"):
+            document = await self._collection.find_one({"_id": GLOBAL_ID})
+        counts = (document or {}).get("counts", {})
+        return {status.value: max(int(counts.get(status.value, 0)), 0) for status in OrderStatus}
+
+    async def get_daily_counts(self, days: int) -> list[dict[str, Any]]:
+        """
+        Retorna os contadores diários mais recentes.
+
+        Args:
+            days: Número de dias (a partir de hoje, para trás)
+
+        Returns:
+            Um item por dia, do mais recente ao mais antigo
+        """
+        today = datetime.utcnow().date()
+        dates = [(today - timedelta(days=offset)).strftime(DAY_FORMAT) for offset in range(days)]
+        if not dates:
+            return []
+
+        with deadline_timeout("get_daily_counts"):
+            documents = await self._collection.find(
+                {"_id": {"$in": [_day_id(day) for day in dates]}}
+            ).to_list(length=None)
+
+        by_id = {document["_id"]: document for document in documents}
+        result = []
+        for day in dates:
+            document = by_id.get(_day_id(day), {})
+            result.append(
+                {
+                    "date": day,
+                    "created": int(document.get("created", 0)),
+                    "transitions": {
+                        status: int(count)
+                        for status, count in document.get("transitions", {}).items()
+                    },
+                }
+            )
+        return result
+
+    async def reconcile(self, days: int = 30) -> dict[str, Any]:
+        """
+        Recalcula os contadores a partir de `orders` e do histórico.
+
+        As contagens por status vêm de um `$group` na coleção de pedidos, somada
+        aos pedidos arquivados (que continuam contando como entregues/cancelados); os
+        contadores diários da janela pedida vêm de `created_at` dos pedidos e das
+        transições do histórico. Escritas concorrentes durante a execução podem
+        deixar uma diferença residual, corrigida na próxima reconciliação.
+
+        Args:
+            days: Janela de dias dos contadores diários a recalcular
+
+        Returns:
+            Contagens recalculadas e o desvio corrigido por status
+        """
+        previous = await self.get_status_counts()
+
+        groups = await self._orders.aggregate(
+            [*self._union_archive(), {"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        ).to_list(length=None)
+        actual = {group["_id"]: group["count"] for group in groups}
+        counts = {status.value: int(actual.get(status.value, 0)) for status in OrderStatus}
+
+        await self._collection.update_one(
+            {"_id": GLOBAL_ID},
+            {"$set": {"counts": counts, "reconciled_at": datetime.utcnow()}},
+            upsert=True,
+        )
+
+        reconciled_days = await self._reconcile_daily(days) if days > 0 else 0
+
+        drift = {status: counts[status] - previous[status] for status in counts}
+        logger.info(
+            "Contadores de pedidos reconciliados",
+            drift={status: value for status, value in drift.items() if value},
+            days=reconciled_days,
+        )
+        return {"counts": counts, "drift": drift, "days": reconciled_days}
+
+    def _union_archive(self, pipeline: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
+        """
+        Estágio `$unionWith` que acrescenta os pedidos arquivados.
+
+        Args:
+            pipeline: Estágios aplicados à coleção de arquivo antes da união
+
+        Returns:
+            Lista com o estágio (vazia sem coleção de arquivo)
+        """
+        if not self._archive_collection_name:
+            return []
+        return [{"$unionWith": {"coll": self._archive_collection_name, "pipeline": pipeline or []}}]
+
+    async def _reconcile_daily(self, days: int) -> int:
+        """
+        Recalcula os contadores diários dos últimos `days` dias.
+
+        Args:
+            days: Janela de dias
+
+        Returns:
+            Número de dias gravados
+        """
+        since = datetime.combine(
+            datetime.utcnow().date() - timedelta(days=days - 1), datetime.min.time()
+        )
+        day_expression = {"$dateToString": {"format": DAY_FORMAT, "date": "$created_at"}}
+        created_match = {"$match": {"created_at": {"$gte": since}}}
+        created = await self._orders.aggregate(
+            [
+                created_match,
+                *self._union_archive([created_match]),
+                {"$group": {"_id": day_expression, "count": {"$sum": 1}}},
+            ]
+        ).to_list(length=None)
+
+        transitions = await self._history.aggregate(
+            [
+                {"$match": {"changed_at": {"$gte": since}, "from_status": {"$ne": None}}},
+                {
+                    "$group": {
+                        "_id": {
+                            "day": {"$dateToString": {"format": DAY_FORMAT, "date": "$changed_at"}},
+                            "status": "$to_status",
+                        },
+                        "count": {"$sum": 1},
+                    }
+                },
+            ]
+        ).to_list(length=None)
+
+        daily: dict[str, dict[str, Any]] = {}
+        for group in created:
+            daily.setdefault(group["_id"], {"created": 0, "transitions": {}})["created"] = group[
+                "count"
+            ]
+        for group in transitions:
+            day = daily.setdefault(group["_id"]["day"], {"created": 0, "transitions": {}})
+            day["transitions"][group["_id"]["status"]] = group["count"]
+
+        # Dias da janela sem atividade também são zerados
+        for offset in range(days):
+            day = (since.date() + timedelta(days=offset)).strftime(DAY_FORMAT)
+            daily.setdefault(day, {"created": 0, "transitions": {}})
+
+        await self._collection.bulk_write(
+            [
+                UpdateOne({"_id": _day_id(day)}, {"$set": values}, upsert=True)
+                for day, values in daily.items()
+            ],
+            ordered=False,
+        )
+        return len(daily)
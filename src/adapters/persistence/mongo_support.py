@@ -0,0 +1,95 @@
+"""Funções compartilhadas pelos adapters MongoDB."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pymongo
+from bson import Binary
+from bson.binary import UuidRepresentation
+from bson.int64 import Int64
+from pymongo.errors import PyMongoError
+
+from src.application.deadline import DeadlineExceededError, check_deadline, remaining_seconds
+from src.domain.value_objects.money import Money, currency_exponent
+from src.domain.value_objects.order_id import OrderId
+
+
+@contextmanager
+def deadline_timeout(operation: str) -> Iterator[None]:
+    """
+    Aplica o deadline da requisição à operação MongoDB.
+
+    O `pymongo.timeout` converte o tempo restante em `maxTimeMS` e em timeouts
+    de socket/seleção de servidor para todas as operações do bloco.
+
+    Args:
+        operation: Nome da operação (usado nas mensagens de erro)
+
+    Raises:
+        DeadlineExceededError: Se o deadline expirou antes ou durante a operação
+    """
+    remaining = remaining_seconds()
+    if remaining is None:
+        yield
+        return
+
+    check_deadline(operation)
+    try:
+        with pymongo.timeout(remaining):
+            yield
+    except PyMongoError as e:
+        if e.timeout:
+            raise DeadlineExceededError(f"Deadline expirado durante {operation}") from e
+        raise
+
+
+def money_to_document(money: Money) -> dict[str, Any]:
+    """
+    Converte um valor monetário para o subdocumento armazenado.
+
+    Args:
+        money: Valor monetário
+
+    Returns:
+        Subdocumento com `amount_minor` (int64), `currency` e `exponent`
+    """
+    return {
+        "amount_minor": Int64(money.minor_units),
+        "currency": money.currency,
+        "exponent": currency_exponent(money.currency),
+    }
+
+
+def money_from_document(value: dict[str, Any]) -> Money:
+    """
+    Converte o valor monetário armazenado.
+
+    Documentos antigos guardam `amount` como float; os novos guardam
+    `amount_minor` como inteiro de 64 bits.
+
+    Args:
+        value: Subdocumento monetário
+
+    Returns:
+        Valor monetário
+    """
+    currency = value.get("currency", "BRL")
+    if "amount_minor" in value:
+        return Money.from_minor(int(value["amount_minor"]), currency)
+    return Money(value.get("amount", 0), currency)
+
+
+def decode_order_id(value: Any) -> OrderId:
+    """
+    Converte o ID armazenado (string, Binary ou ObjectId) para OrderId.
+
+    Args:
+        value: Valor do campo `id`
+
+    Returns:
+        ID do pedido como string
+    """
+    if isinstance(value, Binary):
+        return OrderId(str(value.as_uuid(UuidRepresentation.STANDARD)))
+    return OrderId(str(value))
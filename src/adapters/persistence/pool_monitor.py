@@ -0,0 +1,85 @@
+"""Monitor de pool de conexões do MongoDB."""
+
+from pymongo import monitoring
+
+
+class MongoPoolMonitor(monitoring.ConnectionPoolListener):
+    """Listener CMAP que acompanha a ocupação do pool de conexões do MongoDB."""
+
+    def __init__(self, default_max_pool_size: int = 100) -> None:
+        """
+        Inicializa o monitor.
+
+        Args:
+            default_max_pool_size: Tamanho máximo assumido até o pool ser criado
+        """
+        self._checked_out = 0
+        self._open = 0
+        self._max_pool_size = default_max_pool_size
+
+    @property
+    def checked_out(self) -> int:
+        """Retorna o número de conexões em uso."""
+        return self._checked_out
+
+    @property
+    def open_connections(self) -> int:
+        """Retorna o número de conexões abertas."""
+        return self._open
+
+    @property
+    def max_pool_size(self) -> int:
+        """Retorna o tamanho máximo do pool."""
+        return self._max_pool_size
+
+    @property
+    def saturation(self) -> float:
+        """Retorna a fração do pool em uso (0.0 a 1.0)."""
+        if self._max_pool_size <= 0:
+            return 0.0
+        return self._checked_out / self._max_pool_size
+
+    # Os contadores são alterados apenas com += / -= de inteiros, que sob o GIL
+    # são suficientes para métricas aproximadas vindas das threads do Motor.
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        """Registra o tamanho máximo configurado do pool."""
+        max_pool_size = event.options.get("maxPoolSize")
+        if max_pool_size:
+            self._max_pool_size = max_pool_size
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        """Ignorado."""
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        """Ignorado."""
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        """Ignorado."""
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        """Contabiliza conexão aberta."""
+        self._open += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        """Ignorado."""
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        """Contabiliza conexão fechada."""
+        self._open -= 1
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        """Ignorado."""
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        """Ignorado."""
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        """Contabiliza conexão em uso."""
+        self._checked_out += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        """Contabiliza conexão devolvida ao pool."""
+        self._checked_out -= 1
@@ -0,0 +1,307 @@
+"""
+Comandos de manutenção executadas fora do servidor HTTP.
+
+Uso:
+    python -m src.app.cli replay [--batch-size N] [--resume]
+    python -m src.app.cli reconcile-stats [--days N]
+    python -m src.app.cli rebuild-customer-summaries [--batch-size N] [--concurrency N]
+    python -m src.app.cli import-orders ARQUIVO [--format ndjson|csv] [--batch-size N]
+        [--concurrency N] [--checkpoint ARQUIVO] [--restart]
+    python -m src.app.cli archive-orders [--older-than-days N] [--batch-size N]
+        [--pause-seconds S] [--max-batches N]
+    python -m src.app.cli export-parquet DIRETORIO [--incremental] [--batch-size N]
+        [--row-group-size N] [--lag-seconds N]
+"""
+
+import argparse
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from src.adapters.analytics.parquet_order_writer import (
+    ParquetOrderWriter,
+    load_watermark,
+    save_watermark,
+)
+from src.adapters.files.order_files import (
+    detect_format,
+    load_import_checkpoint,
+    read_order_records,
+    save_import_checkpoint,
+)
+from src.adapters.persistence.mongo_customer_summary_projection import (
+    MongoCustomerSummaryProjection,
+)
+from src.adapters.persistence.mongo_order_archiver import MongoOrderArchiver
+from src.adapters.persistence.mongo_order_history_repository import MongoOrderHistoryRepository
+from src.adapters.persistence.mongo_order_repository import MongoOrderRepository
+from src.adapters.persistence.mongo_order_stats_projection import MongoOrderStatsProjection
+from src.app.config import settings
+from src.app.container import build_order_projections
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.application.use_cases.archive_orders import ArchiveOrdersUseCase
+from src.application.use_cases.import_orders import ImportOrdersUseCase
+from src.application.use_cases.replay_history import ReplayHistoryUseCase
+
+
+@asynccontextmanager
+async def open_database() -> AsyncIterator[AsyncIOMotorDatabase]:
+    """Abre a conexão com o MongoDB configurado e a fecha ao final."""
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    try:
+        yield client[settings.mongodb_db_name]
+    finally:
+        client.close()
+
+
+async def replay(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Reconstrói os modelos de leitura a partir do histórico de status.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Estatísticas da execução
+    """
+    async with open_database() as database:
+        use_case = ReplayHistoryUseCase(
+            MongoOrderHistoryRepository(database), build_order_projections(database)
+        )
+        return await use_case.execute(batch_size=args.batch_size, resume=args.resume)
+
+
+async def reconcile_stats(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Recalcula os contadores de pedidos, corrigindo desvios.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Contagens recalculadas e desvio corrigido
+    """
+    async with open_database() as database:
+        return await MongoOrderStatsProjection(database).reconcile(days=args.days)
+
+
+async def rebuild_customer_summaries(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Reconstrói os resumos de pedidos por cliente a partir da coleção de pedidos.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Estatísticas da execução
+    """
+    async with open_database() as database:
+        return await MongoCustomerSummaryProjection(database).rebuild(
+            batch_size=args.batch_size, concurrency=args.concurrency
+        )
+
+
+async def import_orders(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Importa pedidos de um arquivo NDJSON/CSV, retomando do checkpoint se houver.
+
+    O que for gravado entra no histórico de status e nos modelos de leitura
+    (contadores e resumos por cliente), como no caminho HTTP.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Estatísticas da execução
+    """
+    file_format = args.format or detect_format(args.file)
+    checkpoint_path = args.checkpoint or f"{args.file}.checkpoint"
+    start_after = 0 if args.restart else load_import_checkpoint(checkpoint_path, args.file)
+
+    async with open_database() as database:
+        repository = MongoOrderRepository(database, binary_ids=settings.mongodb_binary_ids)
+        recorder = OrderChangeRecorder(
+            MongoOrderHistoryRepository(database), build_order_projections(database)
+        )
+        result = await ImportOrdersUseCase(repository, recorder).execute(
+            read_order_records(args.file, file_format, start_after),
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            on_checkpoint=lambda line: save_import_checkpoint(checkpoint_path, args.file, line),
+        )
+    return {"resumed_after": start_after, **result}
+
+
+async def archive_orders(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Arquiva pedidos encerrados antigos (mesmo job agendado pelo servidor).
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Estatísticas da execução
+    """
+    async with open_database() as database:
+        archiver = MongoOrderArchiver(database)
+        await archiver._ensure_indexes()
+        return await ArchiveOrdersUseCase(archiver).execute(
+            timedelta(days=args.older_than_days),
+            batch_size=args.batch_size,
+            pause_seconds=args.pause_seconds,
+            max_batches=args.max_batches,
+        )
+
+
+async def export_parquet(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Exporta os pedidos para Parquet particionado por dia de criação e status.
+
+    No modo incremental exporta apenas os pedidos com `updated_at` desde a última
+    execução concluída (marca d'água no diretório de saída). O fim do intervalo
+    fica `--lag-seconds` no passado para não perder gravações em andamento.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Intervalo exportado e estatísticas da execução
+    """
+    updated_from = load_watermark(args.output) if args.incremental else None
+    updated_to = datetime.utcnow() - timedelta(seconds=args.lag_seconds)
+    writer = ParquetOrderWriter(
+        args.output,
+        run_id=updated_to.strftime("%Y%m%dT%H%M%S"),
+        row_group_size=args.row_group_size,
+    )
+
+    async with open_database() as database:
+        repository = MongoOrderRepository(database, binary_ids=settings.mongodb_binary_ids)
+        result = await writer.write_batches(
+            repository.iter_changed_orders(updated_from, updated_to, args.batch_size)
+        )
+
+    save_watermark(args.output, updated_to)
+    return {"updated_from": updated_from, "updated_to": updated_to, **result}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser de argumentos com todos os subcomandos."""
+    parser = argparse.ArgumentParser(prog="python -m src.app.cli")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    replay_parser = subcommands.add_parser(
+        "replay",
+        help=(
+            "Reconstrói os modelos de leitura a partir do histórico de status "
+            "(pedidos anteriores ao histórico exigem reconcile-stats e "
+            "rebuild-customer-summaries)"
+        ),
+    )
+    replay_parser.add_argument("--batch-size", type=int, default=5000)
+    replay_parser.add_argument(
+        "--resume", action="store_true", help="Continua do último checkpoint"
+    )
+    replay_parser.set_defaults(handler=replay)
+
+    reconcile_parser = subcommands.add_parser(
+        "reconcile-stats", help="Recalcula os contadores de pedidos a partir dos dados de origem"
+    )
+    reconcile_parser.add_argument(
+        "--days", type=int, default=30, help="Janela de contadores diários a recalcular"
+    )
+    reconcile_parser.set_defaults(handler=reconcile_stats)
+
+    summaries_parser = subcommands.add_parser(
+        "rebuild-customer-summaries",
+        help="Reconstrói os resumos de pedidos por cliente em lotes paralelos",
+    )
+    summaries_parser.add_argument("--batch-size", type=int, default=500, help="Clientes por lote")
+    summaries_parser.add_argument(
+        "--concurrency", type=int, default=4, help="Lotes processados em paralelo"
+    )
+    summaries_parser.set_defaults(handler=rebuild_customer_summaries)
+
+    import_parser = subcommands.add_parser(
+        "import-orders", help="Importa pedidos de um arquivo NDJSON ou CSV em lotes paralelos"
+    )
+    import_parser.add_argument("file", help="Arquivo .ndjson/.jsonl/.csv (opcionalmente .gz)")
+    import_parser.add_argument(
+        "--format", choices=["ndjson", "csv"], help="Formato (padrão: pela extensão)"
+    )
+    import_parser.add_argument("--batch-size", type=int, default=1000, help="Linhas por lote")
+    import_parser.add_argument(
+        "--concurrency", type=int, default=4, help="Lotes gravados em paralelo"
+    )
+    import_parser.add_argument(
+        "--checkpoint", help="Arquivo de checkpoint (padrão: ARQUIVO.checkpoint)"
+    )
+    import_parser.add_argument(
+        "--restart", action="store_true", help="Ignora o checkpoint e começa do início"
+    )
+    import_parser.set_defaults(handler=import_orders)
+
+    archive_parser = subcommands.add_parser(
+        "archive-orders", help="Move pedidos entregues/cancelados antigos para o arquivo"
+    )
+    archive_parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.archive_after_days,
+        help="Dias desde a última atualização",
+    )
+    archive_parser.add_argument(
+        "--batch-size", type=int, default=settings.archive_batch_size, help="Pedidos por lote"
+    )
+    archive_parser.add_argument(
+        "--pause-seconds",
+        type=float,
+        default=settings.archive_pause_seconds,
+        help="Pausa entre lotes",
+    )
+    archive_parser.add_argument("--max-batches", type=int, help="Limite de lotes nesta execução")
+    archive_parser.set_defaults(handler=archive_orders)
+
+    parquet_parser = subcommands.add_parser(
+        "export-parquet", help="Exporta pedidos e itens para Parquet particionado"
+    )
+    parquet_parser.add_argument("output", help="Diretório do dataset")
+    parquet_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Exporta só o que mudou desde a última execução (por updated_at)",
+    )
+    parquet_parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Pedidos por lote lido do MongoDB"
+    )
+    parquet_parser.add_argument(
+        "--row-group-size", type=int, default=50_000, help="Pedidos por row group"
+    )
+    parquet_parser.add_argument(
+        "--lag-seconds", type=int, default=60, help="Atraso do fim do intervalo exportado"
+    )
+    parquet_parser.set_defaults(handler=export_parquet)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Executa o subcomando escolhido e imprime o resultado em JSON.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv)
+    """
+    args = build_parser().parse_args(argv)
+    handler: Callable[[argparse.Namespace], Awaitable[dict[str, Any]]] = args.handler
+    result = asyncio.run(handler(args))
+    print(json.dumps(result, default=str))
+
+
+if __name__ == "__main__":
+    main()
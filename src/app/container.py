@@ -1,18 +1,73 @@
 """Container de dependency injection."""
 
+from datetime import timedelta
+from typing import Any, TypeVar
+
 import structlog
 from aio_pika import Connection, connect_robust
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
+from src.adapters.http.schemas import partial_order_response_model
+from src.adapters.identifiers.order_id_generators import build_order_id_generator
+from src.adapters.messaging.order_event_hub import OrderEventHub
+from src.adapters.messaging.rabbitmq_event_consumer import RabbitMQOrderEventConsumer
 from src.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
+from src.adapters.persistence.mongo_customer_summary_projection import (
+    MongoCustomerSummaryProjection,
+)
+from src.adapters.persistence.mongo_order_archiver import MongoOrderArchiver
+from src.adapters.persistence.mongo_order_history_repository import MongoOrderHistoryRepository
 from src.adapters.persistence.mongo_order_repository import MongoOrderRepository
+from src.adapters.persistence.mongo_order_stats_projection import MongoOrderStatsProjection
+from src.adapters.persistence.pool_monitor import MongoPoolMonitor
 from src.app.config import settings
+from src.app.memory_diagnostics import MemoryDiagnostics
+from src.app.readiness import ReadinessProber
+from src.app.scheduler import JobScheduler
+from src.application.metrics import (
+    MONGO_POOL_CHECKED_OUT,
+    MONGO_POOL_MAX,
+    MONGO_POOL_OPEN,
+    EventLoopLagMonitor,
+)
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.application.use_cases.archive_orders import ArchiveOrdersUseCase
+from src.application.use_cases.cancel_stale_orders import CancelStaleOrdersUseCase
 from src.application.use_cases.create_order import CreateOrderUseCase
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.application.use_cases.get_customer_summary import GetCustomerSummaryUseCase
 from src.application.use_cases.get_order import GetOrderUseCase
+from src.application.use_cases.get_order_history import GetOrderHistoryUseCase
+from src.application.use_cases.get_order_stats import GetOrderStatsUseCase
+from src.application.use_cases.list_orders_by_product import ListOrdersByProductUseCase
 from src.application.use_cases.update_order_status import UpdateOrderStatusUseCase
+from src.domain.entities.order import Order
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.customer_summary_port import CustomerSummaryPort
+from src.domain.ports.order_projection_port import OrderProjectionPort
+from src.domain.ports.order_stats_port import OrderStatsPort
+from src.domain.value_objects.money import Money
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
+
+def build_order_projections(database: AsyncIOMotorDatabase) -> list[OrderProjectionPort]:
+    """
+    Cria os modelos de leitura alimentados pelas transições de status.
+
+    Usado pelo container e pela CLI de replay, para que ambos mantenham o mesmo
+    conjunto de modelos.
+
+    Args:
+        database: Banco de dados MongoDB
+
+    Returns:
+        Modelos de leitura
+    """
+    return [MongoOrderStatsProjection(database), MongoCustomerSummaryProjection(database)]
+
 
 class Container:
     """Container para dependency injection."""
@@ -22,19 +77,66 @@ class Container:
         self._mongo_client: AsyncIOMotorClient | None = None
         self._rabbitmq_connection: Connection | None = None
         self._repository: MongoOrderRepository | None = None
+        self._history: MongoOrderHistoryRepository | None = None
+        self._projections: list[OrderProjectionPort] = []
+        self._stats: OrderStatsPort | None = None
+        self._customer_summaries: CustomerSummaryPort | None = None
         self._message_broker: RabbitMQPublisher | None = None
+        self._pool_monitor = MongoPoolMonitor()
+        # Lidos do monitor no momento da coleta (/metrics)
+        MONGO_POOL_CHECKED_OUT.set_function(lambda: self._pool_monitor.checked_out)
+        MONGO_POOL_OPEN.set_function(lambda: self._pool_monitor.open_connections)
+        MONGO_POOL_MAX.set_function(lambda: self._pool_monitor.max_pool_size)
+        self._loop_lag = EventLoopLagMonitor(settings.event_loop_lag_interval_seconds)
+        self._event_hub = OrderEventHub(
+            buffer_size=settings.sse_buffer_size,
+            max_subscribers=settings.sse_max_subscribers,
+        )
+        self._event_consumer: RabbitMQOrderEventConsumer | None = None
+        self._readiness: ReadinessProber | None = None
+        self._archiver: MongoOrderArchiver | None = None
+        self._scheduler = JobScheduler(
+            profile_jobs=settings.profiling_jobs if settings.profiling_enabled else (),
+            profile_dir=settings.profiling_output_dir,
+            profile_format=settings.profiling_format,
+        )
+        self._memory = MemoryDiagnostics(
+            tracked_types=(Order, Money, StatusChange),
+            caches={"partial_order_response_model": partial_order_response_model},
+        )
+        self._recorder: OrderChangeRecorder | None = None
+        self._create_order_use_case: CreateOrderUseCase | None = None
+        self._get_order_use_case: GetOrderUseCase | None = None
+        self._get_order_history_use_case: GetOrderHistoryUseCase | None = None
+        self._get_order_stats_use_case: GetOrderStatsUseCase | None = None
+        self._get_customer_summary_use_case: GetCustomerSummaryUseCase | None = None
+        self._list_orders_by_product_use_case: ListOrdersByProductUseCase | None = None
+        self._export_orders_use_case: ExportOrdersUseCase | None = None
+        self._update_order_status_use_case: UpdateOrderStatusUseCase | None = None
 
     async def initialize(self) -> None:
         """Inicializa conexões e dependências."""
         try:
             # MongoDB
             logger.info("Conectando ao MongoDB", url=settings.mongodb_url)
-            self._mongo_client = AsyncIOMotorClient(settings.mongodb_url)
+            self._mongo_client = AsyncIOMotorClient(
+                settings.mongodb_url, event_listeners=[self._pool_monitor]
+            )
             database = self._mongo_client[settings.mongodb_db_name]
-            self._repository = MongoOrderRepository(database)
+            self._repository = MongoOrderRepository(
+                database, binary_ids=settings.mongodb_binary_ids
+            )
+
+            self._history = MongoOrderHistoryRepository(database)
+            self._archiver = MongoOrderArchiver(database)
+            self._projections = build_order_projections(database)
+            self._stats = self._find_projection(OrderStatsPort)
+            self._customer_summaries = self._find_projection(CustomerSummaryPort)
 
             # Garantir que os índices sejam criados
             await self._repository._ensure_indexes()
+            await self._history._ensure_indexes()
+            await self._archiver._ensure_indexes()
             logger.info("MongoDB conectado e índices verificados")
         except Exception as e:
             logger.error("Erro ao conectar ao MongoDB", error=str(e), error_type=type(e).__name__)
@@ -48,8 +150,17 @@ class Container:
                 self._rabbitmq_connection,
                 exchange_name=settings.rabbitmq_exchange,
                 routing_key=settings.rabbitmq_routing_key,
+                publish_timeout=settings.rabbitmq_publish_timeout_seconds,
             )
             await self._message_broker.connect()
+
+            self._event_consumer = RabbitMQOrderEventConsumer(
+                self._rabbitmq_connection,
+                self._event_hub,
+                exchange_name=settings.rabbitmq_exchange,
+                routing_key=settings.rabbitmq_routing_key,
+            )
+            await self._event_consumer.start()
             logger.info("RabbitMQ conectado")
         except Exception as e:
             logger.error("Erro ao conectar ao RabbitMQ", error=str(e), error_type=type(e).__name__)
@@ -58,10 +169,31 @@ class Container:
                 self._mongo_client.close()
             raise
 
+        self._build_use_cases()
+
+        self._readiness = ReadinessProber(
+            self._mongo_client,
+            self._message_broker,
+            self._pool_monitor,
+            interval_seconds=settings.readiness_probe_interval_seconds,
+            timeout_seconds=settings.readiness_probe_timeout_seconds,
+        )
+        self._readiness.start()
+        self._loop_lag.start()
+
+        self._schedule_jobs()
+        self._scheduler.start()
+
         logger.info("Container inicializado com sucesso")
 
     async def shutdown(self) -> None:
         """Fecha conexões."""
+        await self._scheduler.stop()
+        await self._loop_lag.stop()
+
+        if self._readiness:
+            await self._readiness.stop()
+
         try:
             if self._mongo_client:
                 self._mongo_client.close()
@@ -78,23 +210,136 @@ class Container:
 
         logger.info("Container finalizado")
 
+    def _build_use_cases(self) -> None:
+        """Constrói os casos de uso uma única vez; são stateless e compartilhados entre requisições."""
+        if (
+            not self._repository
+            or not self._message_broker
+            or not self._history
+            or not self._stats
+            or not self._customer_summaries
+        ):
+            raise RuntimeError("Container não inicializado")
+        recorder = OrderChangeRecorder(self._history, self._projections)
+        self._recorder = recorder
+        self._create_order_use_case = CreateOrderUseCase(
+            self._repository, build_order_id_generator(settings.order_id_strategy), recorder
+        )
+        self._get_order_use_case = GetOrderUseCase(self._repository)
+        self._get_order_history_use_case = GetOrderHistoryUseCase(self._repository, self._history)
+        self._get_order_stats_use_case = GetOrderStatsUseCase(self._stats)
+        self._get_customer_summary_use_case = GetCustomerSummaryUseCase(self._customer_summaries)
+        self._list_orders_by_product_use_case = ListOrdersByProductUseCase(self._repository)
+        self._export_orders_use_case = ExportOrdersUseCase(self._repository)
+        self._update_order_status_use_case = UpdateOrderStatusUseCase(
+            self._repository, self._message_broker, recorder
+        )
+
+    def _schedule_jobs(self) -> None:
+        """Registra os jobs periódicos habilitados na configuração."""
+        if settings.archive_enabled and self._archiver is not None:
+            archive_orders = ArchiveOrdersUseCase(self._archiver)
+            self._scheduler.add_job(
+                "archive_orders",
+                settings.archive_interval_seconds,
+                lambda: archive_orders.execute(
+                    timedelta(days=settings.archive_after_days),
+                    batch_size=settings.archive_batch_size,
+                    pause_seconds=settings.archive_pause_seconds,
+                ),
+            )
+        if settings.auto_cancel_enabled and self._repository and self._message_broker:
+            cancel_stale_orders = CancelStaleOrdersUseCase(
+                self._repository, self._message_broker, self._recorder
+            )
+            self._scheduler.add_job(
+                "cancel_stale_orders",
+                settings.auto_cancel_interval_seconds,
+                lambda: cancel_stale_orders.execute(
+                    timedelta(hours=settings.auto_cancel_after_hours),
+                    batch_size=settings.auto_cancel_batch_size,
+                    pause_seconds=settings.auto_cancel_pause_seconds,
+                    max_batches=settings.auto_cancel_max_batches,
+                ),
+            )
+
+    def _find_projection(self, port: type[T]) -> T:
+        """
+        Localiza o modelo de leitura que implementa uma interface.
+
+        Args:
+            port: Interface desejada
+
+        Returns:
+            Modelo de leitura registrado em `build_order_projections`
+        """
+        return next(projection for projection in self._projections if isinstance(projection, port))
+
+    def get_readiness_snapshot(self) -> dict[str, Any]:
+        """Retorna o último resultado dos probes de prontidão."""
+        if not self._readiness:
+            return {"status": "not_ready", "reason": "Container não inicializado"}
+        return self._readiness.snapshot()
+
+    def get_jobs_snapshot(self) -> dict[str, Any]:
+        """Retorna o estado dos jobs periódicos."""
+        return self._scheduler.snapshot()
+
+    def get_memory_diagnostics(self) -> MemoryDiagnostics:
+        """Retorna o diagnóstico de memória."""
+        return self._memory
+
+    def get_event_hub(self) -> OrderEventHub:
+        """Retorna o hub de eventos de pedidos."""
+        return self._event_hub
+
     def get_create_order_use_case(self) -> CreateOrderUseCase:
-        """Retorna instância do caso de uso de criação."""
-        if not self._repository:
+        """Retorna a instância única do caso de uso de criação."""
+        if self._create_order_use_case is None:
             raise RuntimeError("Container não inicializado")
-        return CreateOrderUseCase(self._repository)
+        return self._create_order_use_case
 
     def get_get_order_use_case(self) -> GetOrderUseCase:
-        """Retorna instância do caso de uso de busca."""
-        if not self._repository:
+        """Retorna a instância única do caso de uso de busca."""
+        if self._get_order_use_case is None:
+            raise RuntimeError("Container não inicializado")
+        return self._get_order_use_case
+
+    def get_get_order_history_use_case(self) -> GetOrderHistoryUseCase:
+        """Retorna a instância única do caso de uso de histórico."""
+        if self._get_order_history_use_case is None:
+            raise RuntimeError("Container não inicializado")
+        return self._get_order_history_use_case
+
+    def get_get_order_stats_use_case(self) -> GetOrderStatsUseCase:
+        """Retorna a instância única do caso de uso de contadores."""
+        if self._get_order_stats_use_case is None:
+            raise RuntimeError("Container não inicializado")
+        return self._get_order_stats_use_case
+
+    def get_get_customer_summary_use_case(self) -> GetCustomerSummaryUseCase:
+        """Retorna a instância única do caso de uso de resumo do cliente."""
+        if self._get_customer_summary_use_case is None:
+            raise RuntimeError("Container não inicializado")
+        return self._get_customer_summary_use_case
+
+    def get_list_orders_by_product_use_case(self) -> ListOrdersByProductUseCase:
+        """Retorna a instância única do caso de uso de pedidos por produto."""
+        if self._list_orders_by_product_use_case is None:
+            raise RuntimeError("Container não inicializado")
+        return self._list_orders_by_product_use_case
+
+    def get_export_orders_use_case(self) -> ExportOrdersUseCase:
+        """Retorna a instância única do caso de uso de exportação."""
+        if self._export_orders_use_case is None:
             raise RuntimeError("Container não inicializado")
-        return GetOrderUseCase(self._repository)
+        return self._export_orders_use_case
 
     def get_update_order_status_use_case(self) -> UpdateOrderStatusUseCase:
-        """Retorna instância do caso de uso de atualização."""
-        if not self._repository or not self._message_broker:
+        """Retorna a instância única do caso de uso de atualização."""
+        if self._update_order_status_use_case is None:
             raise RuntimeError("Container não inicializado")
-        return UpdateOrderStatusUseCase(self._repository, self._message_broker)
+        return self._update_order_status_use_case
 
 
 container = Container()
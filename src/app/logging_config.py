@@ -0,0 +1,283 @@
+"""
+Configuração do structlog com escrita assíncrona e amostragem de eventos.
+
+Os eventos são montados no event loop, mas a serialização JSON e a escrita no
+stdout acontecem em uma thread, em lotes. A fila é limitada: se a thread não
+acompanhar, novos eventos informativos são descartados (e contados) em vez de
+bloquear as requisições; avisos e erros são escritos na hora.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, TextIO
+
+import structlog
+
+from src.application.metrics import LOG_EVENTS_DROPPED
+
+# Níveis do caminho de sucesso, sujeitos à amostragem; avisos e erros nunca são amostrados
+SAMPLED_LEVELS = frozenset({"debug", "info"})
+
+_STOP = object()
+
+
+class EventSampler:
+    """
+    Processor que mantém só uma fração de eventos informativos frequentes.
+
+    Os eventos mantidos recebem `sample_rate`, para que contagens feitas a partir
+    dos logs possam ser corrigidas (cada linha representa 1/`sample_rate` eventos).
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        """
+        Inicializa o sampler.
+
+        Args:
+            rates: Fração mantida (0.0 a 1.0) por mensagem do evento
+        """
+        self._rates = dict(rates)
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict[str, Any]) -> Any:
+        """
+        Descarta o evento conforme a taxa configurada para a mensagem.
+
+        Args:
+            logger: Logger de origem
+            method_name: Nível chamado (info, warning, ...)
+            event_dict: Evento
+
+        Returns:
+            Evento mantido
+
+        Raises:
+            structlog.DropEvent: Se o evento não foi amostrado
+        """
+        if method_name not in SAMPLED_LEVELS:
+            return event_dict
+        rate = self._rates.get(event_dict.get("event"))
+        if rate is None or rate >= 1.0:
+            return event_dict
+        if random.random() >= rate:
+            raise structlog.DropEvent
+        event_dict["sample_rate"] = rate
+        return event_dict
+
+
+class QueueLogSink:
+    """Fila limitada de eventos escritos em lotes por uma thread."""
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+    ) -> None:
+        """
+        Inicializa a fila e inicia a thread de escrita.
+
+        Args:
+            stream: Destino das linhas (padrão: stdout)
+            max_queue_size: Eventos pendentes antes do descarte
+            batch_size: Máximo de linhas por escrita
+        """
+        self._stream = stream
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self.dropped = 0
+        # Avisos e erros com a fila cheia são escritos pela thread chamadora
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, event_dict: dict[str, Any]) -> None:
+        """
+        Enfileira um evento sem bloquear.
+
+        Com a fila cheia, eventos informativos são descartados; avisos e erros são
+        escritos na hora, pela thread chamadora.
+
+        Args:
+            event_dict: Evento já processado
+        """
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            if event_dict.get("level") in SAMPLED_LEVELS:
+                self.dropped += 1
+                LOG_EVENTS_DROPPED.inc()
+            else:
+                self._write([event_dict])
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Escreve os eventos pendentes e encerra a thread.
+
+        Args:
+            timeout: Espera máxima pela thread
+        """
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """Loop da thread: espera um evento e escreve tudo o que já estiver na fila."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _STOP for item in batch)
+            self._write([item for item in batch if item is not _STOP])
+            if stop:
+                return
+
+    def _write(self, events: list[dict[str, Any]]) -> None:
+        """
+        Serializa e escreve eventos, uma linha JSON por evento.
+
+        Nunca propaga exceções: a thread de log não pode morrer por um evento
+        não serializável nem por um erro de escrita.
+
+        Args:
+            events: Eventos a escrever
+        """
+        if not events:
+            return
+        lines = [_serialize(event) for event in events]
+        with self._write_lock:
+            stream = self._stream or sys.stdout
+            try:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except Exception:
+                pass
+
+
+def _serialize(event_dict: dict[str, Any]) -> str:
+    """
+    Serializa um evento em JSON, recorrendo ao `repr` se não for serializável.
+
+    Args:
+        event_dict: Evento
+
+    Returns:
+        Linha JSON
+    """
+    try:
+        return json.dumps(event_dict, default=str, ensure_ascii=False)
+    except Exception as e:
+        try:
+            representation = repr(event_dict)
+        except Exception:
+            representation = "<evento não representável>"
+        return json.dumps(
+            {
+                "event": "Evento de log não serializável",
+                "level": str(event_dict.get("level", "error")),
+                "error": f"{type(e).__name__}: {e}",
+                "repr": representation,
+            },
+            ensure_ascii=False,
+        )
+
+
+class QueueLogger:
+    """Logger do structlog que entrega o evento (ainda como dict) à fila."""
+
+    def __init__(self, sink: QueueLogSink) -> None:
+        """
+        Inicializa o logger.
+
+        Args:
+            sink: Fila de escrita
+        """
+        self._sink = sink
+
+    def msg(self, **event_dict: Any) -> None:
+        """Enfileira o evento."""
+        self._sink.put(event_dict)
+
+    log = debug = info = warn = warning = err = error = critical = exception = fatal = msg
+
+
+class QueueLoggerFactory:
+    """Fábrica de loggers que compartilham a mesma fila."""
+
+    def __init__(self, sink: QueueLogSink) -> None:
+        """
+        Inicializa a fábrica.
+
+        Args:
+            sink: Fila de escrita
+        """
+        self._logger = QueueLogger(sink)
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        """Retorna o logger (o mesmo para qualquer nome)."""
+        return self._logger
+
+
+def configure_logging(
+    level: str = "INFO",
+    sampling: Mapping[str, float] | None = None,
+    async_sink: bool = True,
+    max_queue_size: int = 10_000,
+) -> QueueLogSink | None:
+    """
+    Configura o structlog.
+
+    Args:
+        level: Nível mínimo (DEBUG, INFO, WARNING, ...)
+        sampling: Fração mantida por mensagem de evento informativo
+        async_sink: Escreve por uma thread em vez de no event loop
+        max_queue_size: Eventos pendentes antes do descarte (modo assíncrono)
+
+    Returns:
+        Fila de escrita (None no modo síncrono)
+
+    Raises:
+        ValueError: Se o nível for desconhecido
+    """
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        raise ValueError(f"Nível de log desconhecido: {level}")
+
+    processors: list[Any] = [structlog.contextvars.merge_contextvars]
+    if sampling:
+        processors.append(EventSampler(sampling))
+    processors += [
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        # A exceção corrente só existe nesta thread: o traceback vira texto antes da fila
+        structlog.processors.format_exc_info,
+    ]
+
+    sink: QueueLogSink | None = None
+    if async_sink:
+        sink = QueueLogSink(max_queue_size=max_queue_size)
+        atexit.register(sink.close)
+        # O último processor devolve o dict; a serialização é feita pela thread
+        logger_factory: Any = QueueLoggerFactory(sink)
+    else:
+        processors.append(structlog.processors.JSONRenderer())
+        logger_factory = structlog.PrintLoggerFactory()
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
+        context_class=dict,
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
+    return sink
@@ -1,40 +1,97 @@
 """Aplicação principal FastAPI."""
 
-import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.adapters.http.customers import router as customers_router
+from src.adapters.http.diagnostics import router as diagnostics_router
 from src.adapters.http.exception_handlers import register_exception_handlers
+from src.adapters.http.exports import router as exports_router
 from src.adapters.http.health import router as health_router
-from src.adapters.http.middleware import CorrelationIDMiddleware
+from src.adapters.http.metrics import router as metrics_router
+from src.adapters.http.middleware import (
+    CorrelationIDMiddleware,
+    DeadlineMiddleware,
+    ProfilingMiddleware,
+    TracingMiddleware,
+)
+from src.adapters.http.order_events import router as order_events_router
 from src.adapters.http.routers import router as orders_router
+from src.app.config import settings
 from src.app.container import container
+from src.app.logging_config import configure_logging
 
 # Configurar logging estruturado
-structlog.configure(
-    processors=[
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=True,
+configure_logging(
+    settings.log_level,
+    sampling=settings.log_sampling,
+    async_sink=settings.log_async,
+    max_queue_size=settings.log_queue_size,
 )
 
 logger = structlog.get_logger()
 
+# Tracing opcional: o OpenTelemetry só é importado quando há um exportador
+tracer_provider: Any = None
+if settings.tracing_exporter != "none":
+    from src.app.tracing import configure_tracing
+
+    tracer_provider = configure_tracing(
+        settings.tracing_exporter,
+        service_name=settings.tracing_service_name,
+        sample_ratio=settings.tracing_sample_ratio,
+        file_path=settings.tracing_file_path,
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Inicializa dependências na startup e as finaliza no shutdown."""
+    logger.info("Iniciando aplicação")
+    await container.initialize()
+    try:
+        yield
+    finally:
+        logger.info("Finalizando aplicação")
+        await container.shutdown()
+        if tracer_provider is not None:
+            from src.app.tracing import shutdown_tracing
+
+            shutdown_tracing(tracer_provider)
+
+
 app = FastAPI(
     title="Order Management Service",
     description="Serviço de gerenciamento de pedidos de e-commerce",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Middlewares (ordem importa: primeiro adicionado é o último executado)
+# Profiling só é registrado quando habilitado: desativado, não há custo por requisição
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        admin_token=settings.admin_token,
+        sample_rate=settings.profiling_sample_rate,
+        output_dir=settings.profiling_output_dir,
+        output_format=settings.profiling_format,
+        interval_seconds=settings.profiling_interval_seconds,
+    )
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout_ms=settings.request_timeout_ms,
+    max_timeout_ms=settings.request_timeout_max_ms,
+    route_timeouts_ms=settings.request_route_timeouts_ms,
+)
+# Dentro do CorrelationIDMiddleware, para que os spans recebam o correlation ID
+if tracer_provider is not None:
+    app.add_middleware(TracingMiddleware)
 app.add_middleware(CorrelationIDMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -49,18 +106,10 @@ register_exception_handlers(app)
 
 # Routers
 app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(diagnostics_router)
+# Antes de orders_router para que "export" não seja tratado como ID de pedido
+app.include_router(exports_router)
 app.include_router(orders_router)
-
-
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Inicializa dependências na startup."""
-    logger.info("Iniciando aplicação")
-    await container.initialize()
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Finaliza dependências no shutdown."""
-    logger.info("Finalizando aplicação")
-    await container.shutdown()
+app.include_router(order_events_router)
+app.include_router(customers_router)
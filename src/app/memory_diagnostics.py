@@ -0,0 +1,306 @@
+"""
+Diagnóstico de memória em produção com tracemalloc.
+
+O tracemalloc só é ligado sob demanda (ele deixa as alocações mais lentas e
+consome memória própria) e os snapshots mantidos são limitados.
+"""
+
+import gc
+import threading
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+KEY_TYPES = ("lineno", "filename", "traceback")
+
+# Alocações do próprio diagnóstico e do carregamento de módulos não interessam
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class SnapshotNotFoundError(LookupError):
+    """Snapshot inexistente (nunca tirado ou já descartado)."""
+
+
+@dataclass(slots=True)
+class MemorySnapshot:
+    """Snapshot do tracemalloc com identificação."""
+
+    id: int
+    taken_at: datetime
+    snapshot: tracemalloc.Snapshot
+    total_bytes: int
+
+    def summary(self) -> dict[str, Any]:
+        """Identificação e tamanho total do snapshot."""
+        return {
+            "id": self.id,
+            "taken_at": self.taken_at.isoformat(),
+            "total_bytes": self.total_bytes,
+        }
+
+
+class MemoryDiagnostics:
+    """Controla o tracemalloc, guarda snapshots e conta objetos do domínio."""
+
+    def __init__(
+        self,
+        tracked_types: Sequence[type] = (),
+        caches: Mapping[str, Callable[..., Any]] | None = None,
+        max_snapshots: int = 10,
+    ) -> None:
+        """
+        Inicializa o diagnóstico.
+
+        Args:
+            tracked_types: Classes cujas instâncias vivas são contadas
+            caches: Funções com `functools.lru_cache`, por nome
+            max_snapshots: Snapshots mantidos (os mais antigos são descartados)
+        """
+        self._tracked_types = tuple(tracked_types)
+        self._caches = dict(caches or {})
+        self._max_snapshots = max_snapshots
+        self._snapshots: dict[int, MemorySnapshot] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def start(self, frames: int = 1) -> dict[str, Any]:
+        """
+        Liga o tracemalloc (sem efeito se já estiver ligado).
+
+        Args:
+            frames: Frames guardados por alocação (mais frames, mais memória)
+
+        Returns:
+            Estado atual
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info("tracemalloc iniciado", frames=frames)
+        return self.status()
+
+    def stop(self) -> dict[str, Any]:
+        """
+        Desliga o tracemalloc e descarta os snapshots.
+
+        Returns:
+            Estado atual
+        """
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc interrompido")
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def status(self) -> dict[str, Any]:
+        """
+        Estado do tracemalloc e snapshots disponíveis.
+
+        Returns:
+            Memória rastreada (atual e pico), overhead do tracemalloc e snapshots
+        """
+        tracing = tracemalloc.is_tracing()
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            snapshots = [snapshot.summary() for snapshot in self._snapshots.values()]
+        return {
+            "tracing": tracing,
+            "frames": tracemalloc.get_traceback_limit() if tracing else 0,
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "snapshots": snapshots,
+        }
+
+    def take_snapshot(self) -> MemorySnapshot:
+        """
+        Tira e guarda um snapshot.
+
+        Returns:
+            Snapshot guardado
+
+        Raises:
+            ValueError: Se o tracemalloc não estiver ligado
+        """
+        if not tracemalloc.is_tracing():
+            raise ValueError("tracemalloc não está ativo; inicie o rastreamento antes")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        total_bytes = sum(stat.size for stat in snapshot.statistics("filename"))
+
+        with self._lock:
+            memory_snapshot = MemorySnapshot(
+                id=self._next_id,
+                taken_at=datetime.utcnow(),
+                snapshot=snapshot,
+                total_bytes=total_bytes,
+            )
+            self._next_id += 1
+            self._snapshots[memory_snapshot.id] = memory_snapshot
+            while len(self._snapshots) > self._max_snapshots:
+                del self._snapshots[next(iter(self._snapshots))]
+
+        logger.info("Snapshot de memória", snapshot_id=memory_snapshot.id, total_bytes=total_bytes)
+        return memory_snapshot
+
+    def get_snapshot(self, snapshot_id: int) -> MemorySnapshot:
+        """
+        Busca um snapshot guardado.
+
+        Args:
+            snapshot_id: ID do snapshot
+
+        Returns:
+            Snapshot
+
+        Raises:
+            SnapshotNotFoundError: Se o snapshot não existir
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise SnapshotNotFoundError(f"Snapshot {snapshot_id} não encontrado")
+        return snapshot
+
+    def top(self, snapshot_id: int, limit: int = 20, key_type: str = "lineno") -> dict[str, Any]:
+        """
+        Maiores pontos de alocação de um snapshot.
+
+        Args:
+            snapshot_id: ID do snapshot
+            limit: Quantidade de pontos retornados
+            key_type: Agrupamento: `lineno`, `filename` ou `traceback`
+
+        Returns:
+            Resumo do snapshot e os pontos de alocação, do maior para o menor
+
+        Raises:
+            SnapshotNotFoundError: Se o snapshot não existir
+            ValueError: Se o agrupamento for desconhecido
+        """
+        _check_key_type(key_type)
+        memory_snapshot = self.get_snapshot(snapshot_id)
+        statistics = memory_snapshot.snapshot.statistics(key_type)
+        return {
+            **memory_snapshot.summary(),
+            "top": [_format_stat(stat, key_type) for stat in statistics[:limit]],
+        }
+
+    def diff(
+        self, snapshot_id: int, base_id: int, limit: int = 20, key_type: str = "lineno"
+    ) -> dict[str, Any]:
+        """
+        Pontos de alocação que mais cresceram entre dois snapshots.
+
+        Args:
+            snapshot_id: ID do snapshot mais recente
+            base_id: ID do snapshot de referência
+            limit: Quantidade de pontos retornados
+            key_type: Agrupamento: `lineno`, `filename` ou `traceback`
+
+        Returns:
+            Diferença total e por ponto de alocação, da maior para a menor
+
+        Raises:
+            SnapshotNotFoundError: Se algum dos snapshots não existir
+            ValueError: Se o agrupamento for desconhecido
+        """
+        _check_key_type(key_type)
+        current = self.get_snapshot(snapshot_id)
+        base = self.get_snapshot(base_id)
+        statistics = current.snapshot.compare_to(base.snapshot, key_type)
+        return {
+            "snapshot": current.summary(),
+            "base": base.summary(),
+            "size_diff_bytes": current.total_bytes - base.total_bytes,
+            "top": [
+                {
+                    **_format_stat(stat, key_type),
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in statistics[:limit]
+            ],
+        }
+
+    def object_counts(self) -> dict[str, Any]:
+        """
+        Conta instâncias vivas dos tipos rastreados e entradas dos caches.
+
+        Percorre todos os objetos do coletor de lixo: custa alguns milissegundos
+        por milhão de objetos, sem depender do tracemalloc.
+
+        Returns:
+            Contagem por tipo e estatísticas de cada cache
+        """
+        counts = dict.fromkeys(self._tracked_types, 0)
+        objects = gc.get_objects()
+        for obj in objects:
+            obj_type = type(obj)
+            if obj_type in counts:
+                counts[obj_type] += 1
+
+        caches = {}
+        for name, cached_function in self._caches.items():
+            info = cached_function.cache_info()
+            caches[name] = {
+                "entries": info.currsize,
+                "max_size": info.maxsize,
+                "hits": info.hits,
+                "misses": info.misses,
+            }
+
+        return {
+            "objects": {obj_type.__name__: count for obj_type, count in counts.items()},
+            "caches": caches,
+            "gc_objects": len(objects),
+        }
+
+
+def _check_key_type(key_type: str) -> None:
+    """
+    Valida o agrupamento das estatísticas.
+
+    Args:
+        key_type: Agrupamento pedido
+
+    Raises:
+        ValueError: Se o agrupamento for desconhecido
+    """
+    if key_type not in KEY_TYPES:
+        raise ValueError(f"Agrupamento desconhecido: {key_type} (use {', '.join(KEY_TYPES)})")
+
+
+def _format_stat(stat: tracemalloc.Statistic | tracemalloc.StatisticDiff, key_type: str) -> dict:
+    """
+    Converte uma estatística do tracemalloc em dict.
+
+    Args:
+        stat: Estatística de um snapshot ou de uma comparação
+        key_type: Agrupamento usado
+
+    Returns:
+        Local, bytes e quantidade de blocos (e a pilha, no agrupamento `traceback`)
+    """
+    # A pilha vai da chamada mais antiga à alocação; o local é o último frame
+    frame = stat.traceback[-1]
+    result: dict[str, Any] = {
+        "location": (
+            frame.filename if key_type == "filename" else f"{frame.filename}:{frame.lineno}"
+        ),
+        "size_bytes": stat.size,
+        "count": stat.count,
+    }
+    if key_type == "traceback":
+        result["traceback"] = [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback]
+    return result
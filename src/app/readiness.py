@@ -0,0 +1,151 @@
+"""Prober de prontidão (readiness) das dependências externas."""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any
+
+import pymongo
+import structlog
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from src.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
+from src.adapters.persistence.pool_monitor import MongoPoolMonitor
+
+logger = structlog.get_logger()
+
+
+class ReadinessProber:
+    """
+    Executa probes das dependências em background e mantém o último resultado em cache.
+
+    O endpoint `/ready` apenas lê o snapshot em memória, então a frequência de probes
+    do load balancer não gera carga adicional no MongoDB nem no RabbitMQ.
+    """
+
+    def __init__(
+        self,
+        mongo_client: AsyncIOMotorClient,
+        publisher: RabbitMQPublisher,
+        pool_monitor: MongoPoolMonitor,
+        interval_seconds: float = 5.0,
+        timeout_seconds: float = 2.0,
+    ) -> None:
+        """
+        Inicializa o prober.
+
+        Args:
+            mongo_client: Cliente MongoDB
+            publisher: Publisher RabbitMQ
+            pool_monitor: Monitor do pool de conexões do MongoDB
+            interval_seconds: Intervalo entre probes
+            timeout_seconds: Timeout de cada probe
+        """
+        self._mongo_client = mongo_client
+        self._publisher = publisher
+        self._pool_monitor = pool_monitor
+        self._interval_seconds = interval_seconds
+        self._timeout_seconds = timeout_seconds
+        self._snapshot: dict[str, Any] | None = None
+        self._snapshot_monotonic = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Inicia o loop de probes em background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="readiness-prober")
+
+    async def stop(self) -> None:
+        """Interrompe o loop de probes."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Retorna o último resultado dos probes.
+
+        Um snapshot mais antigo que três intervalos é tratado como não pronto, pois
+        indica que o próprio loop de probes parou.
+
+        Returns:
+            Resultado dos probes com status geral `ready` ou `not_ready`
+        """
+        if self._snapshot is None:
+            return {"status": "not_ready", "reason": "probes ainda não executados"}
+
+        age = time.monotonic() - self._snapshot_monotonic
+        if age > self._interval_seconds * 3:
+            return {**self._snapshot, "status": "not_ready", "reason": "snapshot expirado"}
+
+        return self._snapshot
+
+    async def _run(self) -> None:
+        """Loop que executa os probes periodicamente."""
+        while True:
+            await self.probe()
+            await asyncio.sleep(self._interval_seconds)
+
+    async def probe(self) -> dict[str, Any]:
+        """
+        Executa todos os probes uma vez e atualiza o snapshot.
+
+        Returns:
+            Novo snapshot
+        """
+        mongodb = await self._probe_mongodb()
+        rabbitmq = self._probe_rabbitmq()
+
+        ready = mongodb["status"] == "up" and rabbitmq["status"] == "up"
+        snapshot = {
+            "status": "ready" if ready else "not_ready",
+            "checked_at": datetime.utcnow().isoformat(),
+            "mongodb": mongodb,
+            "mongodb_pool": {
+                "checked_out": self._pool_monitor.checked_out,
+                "open_connections": self._pool_monitor.open_connections,
+                "max_size": self._pool_monitor.max_pool_size,
+                "saturation": round(self._pool_monitor.saturation, 4),
+            },
+            "rabbitmq": rabbitmq,
+        }
+
+        if not ready and (self._snapshot is None or self._snapshot["status"] == "ready"):
+            logger.warning("Dependências não prontas", mongodb=mongodb, rabbitmq=rabbitmq)
+
+        self._snapshot = snapshot
+        self._snapshot_monotonic = time.monotonic()
+        return snapshot
+
+    async def _probe_mongodb(self) -> dict[str, Any]:
+        """
+        Executa ping no MongoDB medindo a latência.
+
+        O limite vai pelo `pymongo.timeout` (seleção de servidor, socket e
+        `maxTimeMS`), como no `deadline_timeout`: com `asyncio.wait_for` só a
+        espera seria cancelada e o ping seguiria ocupando a thread do Motor.
+        """
+        started = time.perf_counter()
+        try:
+            with pymongo.timeout(self._timeout_seconds):
+                await self._mongo_client.admin.command("ping")
+        except Exception as e:
+            return {"status": "down", "error": str(e) or type(e).__name__}
+        latency_ms = (time.perf_counter() - started) * 1000
+        return {"status": "up", "latency_ms": round(latency_ms, 3)}
+
+    def _probe_rabbitmq(self) -> dict[str, Any]:
+        """Verifica o estado da conexão RabbitMQ e a fila de publicações."""
+        try:
+            connected = self._publisher.is_connected
+        except Exception as e:
+            return {"status": "down", "error": str(e) or type(e).__name__}
+        return {
+            "status": "up" if connected else "down",
+            "queue_depth": self._publisher.queue_depth,
+        }
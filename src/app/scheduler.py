@@ -0,0 +1,161 @@
+"""Agendador de jobs periódicos executados dentro do processo da aplicação."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import structlog
+
+from src.application.profiling import profiled
+
+logger = structlog.get_logger()
+
+
+@dataclass(slots=True)
+class ScheduledJob:
+    """Job periódico e o resultado da última execução."""
+
+    name: str
+    interval_seconds: float
+    run: Callable[[], Awaitable[dict[str, Any]]]
+    initial_delay_seconds: float = 0.0
+    running: bool = False
+    runs: int = 0
+    last_started_at: datetime | None = None
+    last_finished_at: datetime | None = None
+    last_duration_seconds: float | None = None
+    last_result: dict[str, Any] | None = None
+    last_error: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Retorna o estado do job para exposição em endpoints e logs."""
+        return {
+            "interval_seconds": self.interval_seconds,
+            "running": self.running,
+            "runs": self.runs,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+        }
+
+
+class JobScheduler:
+    """
+    Executa jobs em intervalos fixos, cada um em sua própria task.
+
+    Uma execução nunca se sobrepõe à anterior do mesmo job: o intervalo é contado a
+    partir do fim da execução. Erros são registrados e o job segue agendado.
+    """
+
+    def __init__(
+        self,
+        profile_jobs: Collection[str] = (),
+        profile_dir: str = "profiles",
+        profile_format: str = "html",
+    ) -> None:
+        """
+        Inicializa o agendador sem jobs.
+
+        Args:
+            profile_jobs: Jobs executados sob o profiler (um arquivo por execução)
+            profile_dir: Diretório dos profiles
+            profile_format: Formato dos profiles (`html` ou `speedscope`)
+        """
+        self._jobs: dict[str, ScheduledJob] = {}
+        self._profile_jobs = frozenset(profile_jobs)
+        self._profile_dir = profile_dir
+        self._profile_format = profile_format
+
+    def add_job(
+        self,
+        name: str,
+        interval_seconds: float,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        initial_delay_seconds: float = 0.0,
+    ) -> None:
+        """
+        Registra um job.
+
+        Args:
+            name: Nome único do job
+            interval_seconds: Intervalo entre o fim de uma execução e o início da próxima
+            run: Corrotina do job, que retorna um resumo da execução
+            initial_delay_seconds: Espera antes da primeira execução
+
+        Raises:
+            ValueError: Se já existir um job com o mesmo nome
+        """
+        if name in self._jobs:
+            raise ValueError(f"Job {name} já registrado")
+        self._jobs[name] = ScheduledJob(name, interval_seconds, run, initial_delay_seconds)
+
+    def start(self) -> None:
+        """Inicia as tasks dos jobs registrados."""
+        for job in self._jobs.values():
+            if job.task is None:
+                job.task = asyncio.create_task(self._loop(job), name=f"job-{job.name}")
+
+    async def stop(self) -> None:
+        """Cancela os jobs e aguarda o encerramento."""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            job.task = None
+            job.running = False
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Retorna o estado de todos os jobs.
+
+        Returns:
+            Estado de cada job, pelo nome
+        """
+        return {name: job.snapshot() for name, job in self._jobs.items()}
+
+    async def run_once(self, name: str) -> dict[str, Any] | None:
+        """
+        Executa um job imediatamente, registrando o resultado.
+
+        Args:
+            name: Nome do job
+
+        Returns:
+            Resultado da execução (None em caso de erro)
+        """
+        job = self._jobs[name]
+        job.running = True
+        job.last_started_at = datetime.utcnow()
+        started = time.perf_counter()
+        try:
+            if name in self._profile_jobs:
+                with profiled(f"job-{name}", self._profile_dir, self._profile_format):
+                    job.last_result = await job.run()
+            else:
+                job.last_result = await job.run()
+            job.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.last_error = str(e) or type(e).__name__
+            logger.error("Erro ao executar job", job=name, error=job.last_error)
+        finally:
+            job.running = False
+            job.runs += 1
+            job.last_finished_at = datetime.utcnow()
+            job.last_duration_seconds = round(time.perf_counter() - started, 3)
+        return job.last_result if job.last_error is None else None
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        """Loop de execução periódica de um job."""
+        await asyncio.sleep(job.initial_delay_seconds)
+        while True:
+            await self.run_once(job.name)
+            await asyncio.sleep(job.interval_seconds)
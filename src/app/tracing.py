@@ -0,0 +1,132 @@
+"""
+Configuração do OpenTelemetry (provider, amostragem e exportador).
+
+Requer `requirements-tracing.txt`; só é importado quando `TRACING_EXPORTER` não
+é `none`.
+"""
+
+import importlib
+import os
+from typing import Any
+
+import structlog
+from opentelemetry import propagate
+from opentelemetry.context import Context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind
+
+from src.application import tracing
+
+logger = structlog.get_logger()
+
+SPAN_KINDS = {
+    "internal": SpanKind.INTERNAL,
+    "server": SpanKind.SERVER,
+    "client": SpanKind.CLIENT,
+    "producer": SpanKind.PRODUCER,
+}
+
+
+class CorrelationIdSpanProcessor(SpanProcessor):
+    """Copia o correlation ID da requisição (contexto do structlog) para cada span."""
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        """
+        Adiciona o atributo `correlation_id` quando houver.
+
+        Args:
+            span: Span iniciado
+            parent_context: Contexto pai
+        """
+        correlation_id = structlog.contextvars.get_contextvars().get("correlation_id")
+        if correlation_id:
+            span.set_attribute("correlation_id", correlation_id)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Ignorado."""
+
+
+def build_span_exporter(name: str, file_path: str = "traces.jsonl") -> SpanExporter:
+    """
+    Cria o exportador de spans.
+
+    Args:
+        name: `console` (stdout), `file` (JSON por linha em `file_path`), `otlp`
+            (coletor em `OTEL_EXPORTER_OTLP_ENDPOINT`) ou `modulo:fabrica` para um
+            exportador próprio
+        file_path: Arquivo do exportador `file`
+
+    Returns:
+        Exportador de spans
+
+    Raises:
+        ValueError: Se o exportador for desconhecido
+    """
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return ConsoleSpanExporter(
+            # Aberto durante toda a vida do processo
+            out=open(file_path, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    if name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter()
+    if ":" in name:
+        module_name, factory_name = name.split(":", 1)
+        return getattr(importlib.import_module(module_name), factory_name)()
+    raise ValueError(f"Exportador de tracing desconhecido: {name}")
+
+
+def configure_tracing(
+    exporter: str,
+    service_name: str = "order-service",
+    sample_ratio: float = 1.0,
+    file_path: str = "traces.jsonl",
+) -> TracerProvider:
+    """
+    Cria o provider, registra o exportador e ativa os spans da aplicação.
+
+    A amostragem respeita a decisão do chamador (`traceparent`) e, na raiz do
+    trace, amostra `sample_ratio` das requisições.
+
+    Args:
+        exporter: Nome do exportador (ver `build_span_exporter`)
+        service_name: Nome do serviço nos spans
+        sample_ratio: Fração de traces amostrados na raiz
+        file_path: Arquivo do exportador `file`
+
+    Returns:
+        Provider configurado (encerrado por `shutdown_tracing`)
+    """
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    provider.add_span_processor(CorrelationIdSpanProcessor())
+    provider.add_span_processor(BatchSpanProcessor(build_span_exporter(exporter, file_path)))
+
+    tracing.set_tracer(
+        provider.get_tracer("order-service"),
+        inject=propagate.inject,
+        extract=propagate.extract,
+        span_kinds=SPAN_KINDS,
+    )
+    logger.info("Tracing ativado", exporter=exporter, sample_ratio=sample_ratio)
+    return provider
+
+
+def shutdown_tracing(provider: Any) -> None:
+    """
+    Exporta os spans pendentes e desativa o tracing.
+
+    Args:
+        provider: Provider retornado por `configure_tracing`
+    """
+    tracing.set_tracer(None)
+    provider.shutdown()
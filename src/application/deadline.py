@@ -0,0 +1,75 @@
+"""Deadline por requisição propagado via contextvar."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """Exceção lançada quando o prazo da requisição já expirou."""
+
+    pass
+
+
+def get_deadline() -> float | None:
+    """
+    Retorna o deadline corrente (relógio monotônico) ou None se não houver.
+
+    Returns:
+        Instante limite em segundos de `time.monotonic()`
+    """
+    return _deadline.get()
+
+
+def remaining_seconds() -> float | None:
+    """
+    Retorna quanto tempo resta até o deadline corrente.
+
+    Returns:
+        Segundos restantes (pode ser negativo) ou None se não houver deadline
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline(operation: str) -> None:
+    """
+    Aborta a operação se o deadline corrente já expirou.
+
+    Args:
+        operation: Nome da operação (usado na mensagem de erro)
+
+    Raises:
+        DeadlineExceededError: Se o deadline já passou
+    """
+    remaining = remaining_seconds()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError(f"Deadline expirado antes de {operation}")
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: float | None) -> Iterator[None]:
+    """
+    Define um deadline para o bloco, sem nunca estender um deadline mais curto já ativo.
+
+    Args:
+        timeout_seconds: Tempo máximo do bloco em segundos (None mantém o atual)
+    """
+    current = _deadline.get()
+    if timeout_seconds is None:
+        new_deadline = current
+    else:
+        new_deadline = time.monotonic() + timeout_seconds
+        if current is not None:
+            new_deadline = min(current, new_deadline)
+
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,190 @@
+"""Métricas Prometheus (latência de casos de uso e adapters, erros e event loop)."""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from contextlib import aclosing
+from typing import Any, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# De 0,5 ms a 10 s: cobre leituras por índice e publicações com confirmação
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    10.0,
+)
+
+USE_CASE_SECONDS = Histogram(
+    "order_service_use_case_duration_seconds",
+    "Duração do execute de cada caso de uso",
+    ["use_case", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+MONGO_SECONDS = Histogram(
+    "order_service_mongo_operation_duration_seconds",
+    "Duração de cada operação do repositório MongoDB",
+    ["operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+PUBLISH_SECONDS = Histogram(
+    "order_service_publish_duration_seconds",
+    "Duração da publicação de eventos no RabbitMQ",
+    ["operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_ERRORS = Counter(
+    "order_service_http_errors_total",
+    "Erros tratados pelos exception handlers, por tipo",
+    ["error_type", "status_code"],
+)
+MONGO_POOL_CHECKED_OUT = Gauge(
+    "order_service_mongo_pool_checked_out_connections", "Conexões do pool MongoDB em uso"
+)
+MONGO_POOL_OPEN = Gauge(
+    "order_service_mongo_pool_open_connections", "Conexões do pool MongoDB abertas"
+)
+MONGO_POOL_MAX = Gauge("order_service_mongo_pool_max_size", "Tamanho máximo do pool MongoDB")
+LOG_EVENTS_DROPPED = Counter(
+    "order_service_log_events_dropped_total",
+    "Eventos de log descartados com a fila de escrita cheia",
+)
+EVENT_LOOP_LAG = Histogram(
+    "order_service_event_loop_lag_seconds",
+    "Atraso do event loop em relação ao agendado",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+
+def timed(histogram: Histogram, name: str) -> Callable[[F], F]:
+    """
+    Decorator que observa a duração de uma função no histograma.
+
+    Os labels são resolvidos uma única vez, na decoração: por chamada o custo é
+    de duas leituras de relógio e um `observe`. Funciona com funções síncronas,
+    coroutines e geradores assíncronos (mede o stream inteiro, até o gerador
+    terminar ou ser fechado); o label `outcome` é `success` ou `error`.
+
+    Args:
+        histogram: Histograma com labels (nome, outcome)
+        name: Valor do primeiro label (nome fixo, nunca dados da requisição)
+
+    Returns:
+        Decorator
+    """
+    success = histogram.labels(name, "success")
+    error = histogram.labels(name, "error")
+
+    def decorator(function: F) -> F:
+        if inspect.isasyncgenfunction(function):
+
+            @functools.wraps(function)
+            async def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    async with aclosing(function(*args, **kwargs)) as generator:
+                        async for item in generator:
+                            yield item
+                except BaseException:
+                    error.observe(time.perf_counter() - started)
+                    raise
+                success.observe(time.perf_counter() - started)
+
+            return async_gen_wrapper  # type: ignore[return-value]
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    result = await function(*args, **kwargs)
+                except BaseException:
+                    error.observe(time.perf_counter() - started)
+                    raise
+                success.observe(time.perf_counter() - started)
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                error.observe(time.perf_counter() - started)
+                raise
+            success.observe(time.perf_counter() - started)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def count_error(exc: BaseException, status_code: int) -> None:
+    """
+    Conta um erro tratado por um exception handler.
+
+    Args:
+        exc: Exceção tratada (o label é o nome da classe)
+        status_code: Status HTTP devolvido
+    """
+    HTTP_ERRORS.labels(type(exc).__name__, str(status_code)).inc()
+
+
+class EventLoopLagMonitor:
+    """
+    Mede periodicamente quanto o event loop atrasa para retomar um `sleep`.
+
+    Um atraso alto indica código bloqueando o loop (CPU ou I/O síncrono).
+    """
+
+    def __init__(self, interval_seconds: float = 0.5) -> None:
+        """
+        Inicializa o monitor.
+
+        Args:
+            interval_seconds: Intervalo entre medições
+        """
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Inicia as medições em background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-loop-lag-monitor")
+
+    async def stop(self) -> None:
+        """Interrompe as medições."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Loop de medição."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_seconds
+            await asyncio.sleep(self._interval_seconds)
+            EVENT_LOOP_LAG.observe(max(loop.time() - expected, 0.0))
@@ -0,0 +1,71 @@
+"""Registro de transições de status no histórico e nos modelos de leitura."""
+
+from collections.abc import Sequence
+
+import structlog
+
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.order_history_port import OrderHistoryPort
+from src.domain.ports.order_projection_port import OrderProjectionPort
+
+logger = structlog.get_logger()
+
+
+class OrderChangeRecorder:
+    """
+    Grava as transições no histórico e as aplica aos modelos de leitura.
+
+    É chamado depois que o pedido já foi salvo: falhas aqui são registradas em log
+    e não desfazem a operação. Modelos de leitura que divergirem podem ser
+    reconstruídos a partir do histórico.
+    """
+
+    __slots__ = ("_history", "_projections")
+
+    def __init__(
+        self,
+        history: OrderHistoryPort | None = None,
+        projections: Sequence[OrderProjectionPort] = (),
+    ) -> None:
+        """
+        Inicializa o registrador.
+
+        Args:
+            history: Log de transições (opcional)
+            projections: Modelos de leitura atualizados a cada transição
+        """
+        self._history = history
+        self._projections = tuple(projections)
+
+    async def record(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Registra um lote de transições.
+
+        Args:
+            changes: Transições em ordem cronológica
+        """
+        if not changes:
+            return
+
+        if self._history is not None:
+            try:
+                await self._history.append(changes)
+            except Exception as e:
+                logger.error(
+                    "Erro ao gravar histórico de status",
+                    count=len(changes),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        for projection in self._projections:
+            try:
+                await projection.apply(changes)
+            except Exception as e:
+                logger.error(
+                    "Erro ao atualizar modelo de leitura",
+                    projection=type(projection).__name__,
+                    count=len(changes),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
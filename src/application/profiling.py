@@ -0,0 +1,132 @@
+"""
+Profiling sob demanda com um profiler por amostragem (pyinstrument).
+
+Requer `requirements-profiling.txt`, importado só quando um profile é de fato
+coletado; com o profiling desativado nada deste módulo roda.
+"""
+
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Extensão e content type de cada formato de saída
+FORMATS = {
+    "html": (".html", "text/html; charset=utf-8"),
+    "speedscope": (".speedscope.json", "application/json"),
+}
+
+
+def _load_pyinstrument() -> Any:
+    """
+    Importa o pyinstrument sob demanda.
+
+    Returns:
+        Módulo `pyinstrument`
+
+    Raises:
+        ImportError: Se o pyinstrument não estiver instalado
+    """
+    try:
+        import pyinstrument
+        import pyinstrument.renderers
+    except ImportError as e:
+        raise ImportError(
+            "Profiling requer pyinstrument: pip install -r requirements-profiling.txt"
+        ) from e
+    return pyinstrument
+
+
+@dataclass(slots=True)
+class ProfileResult:
+    """Resultado de um profile, preenchido quando o bloco termina."""
+
+    name: str
+    output_format: str
+    content: str = ""
+    path: Path | None = None
+    duration_seconds: float = 0.0
+
+    @property
+    def media_type(self) -> str:
+        """Content type do conteúdo."""
+        return FORMATS[self.output_format][1]
+
+
+@contextmanager
+def profiled(
+    name: str,
+    output_dir: str | Path | None = None,
+    output_format: str = "html",
+    interval_seconds: float = 0.001,
+) -> Iterator[ProfileResult]:
+    """
+    Executa o bloco sob o profiler e renderiza o resultado.
+
+    Em código assíncrono o profiler acompanha apenas o contexto corrente (a
+    requisição ou o job), não as outras tasks do event loop.
+
+    Args:
+        name: Identificação do profile (vira parte do nome do arquivo)
+        output_dir: Diretório onde gravar o profile (None: só em memória)
+        output_format: `html` (visualização interativa) ou `speedscope` (flame graph)
+        interval_seconds: Intervalo de amostragem
+
+    Yields:
+        Resultado, com conteúdo e caminho disponíveis após o bloco
+
+    Raises:
+        ValueError: Se o formato for desconhecido
+    """
+    if output_format not in FORMATS:
+        raise ValueError(f"Formato de profile desconhecido: {output_format}")
+
+    pyinstrument = _load_pyinstrument()
+    result = ProfileResult(name=name, output_format=output_format)
+    profiler = pyinstrument.Profiler(interval=interval_seconds, async_mode="enabled")
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield result
+    finally:
+        profiler.stop()
+        result.duration_seconds = round(time.perf_counter() - started, 4)
+        if output_format == "speedscope":
+            result.content = profiler.output(pyinstrument.renderers.SpeedscopeRenderer())
+        else:
+            result.content = profiler.output_html()
+        if output_dir is not None:
+            result.path = _save(result, Path(output_dir))
+            logger.info(
+                "Profile gravado",
+                name=name,
+                path=str(result.path),
+                duration_seconds=result.duration_seconds,
+            )
+
+
+def _save(result: ProfileResult, output_dir: Path) -> Path:
+    """
+    Grava o profile em `<diretório>/<data>-<nome><extensão>`.
+
+    Args:
+        result: Profile renderizado
+        output_dir: Diretório de destino
+
+    Returns:
+        Caminho do arquivo
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", result.name).strip("_") or "profile"
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    path = output_dir / f"{stamp}-{slug}{FORMATS[result.output_format][0]}"
+    path.write_text(result.content, encoding="utf-8")
+    return path
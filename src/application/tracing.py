@@ -0,0 +1,150 @@
+"""
+Spans de tracing distribuído, ativos apenas quando um tracer é configurado.
+
+Sem tracer (padrão) os decorators chamam a função diretamente e nada do
+OpenTelemetry é importado; a configuração fica em `src/app/tracing.py`.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import aclosing, contextmanager
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_tracer: Any = None
+_inject: Callable[[dict[str, Any]], None] | None = None
+_extract: Callable[[Mapping[str, str]], Any] | None = None
+_span_kinds: dict[str, Any] = {}
+
+
+def set_tracer(
+    tracer: Any,
+    inject: Callable[[dict[str, Any]], None] | None = None,
+    extract: Callable[[Mapping[str, str]], Any] | None = None,
+    span_kinds: Mapping[str, Any] | None = None,
+) -> None:
+    """
+    Ativa (ou, com None, desativa) o tracing.
+
+    Args:
+        tracer: Tracer do OpenTelemetry
+        inject: Grava o contexto corrente em um carrier (headers)
+        extract: Lê o contexto de um carrier
+        span_kinds: `SpanKind` por nome ("server", "client", "producer", "internal")
+    """
+    global _tracer, _inject, _extract, _span_kinds
+    _tracer = tracer
+    _inject = inject
+    _extract = extract
+    _span_kinds = dict(span_kinds or {})
+
+
+def tracing_enabled() -> bool:
+    """Indica se há um tracer configurado."""
+    return _tracer is not None
+
+
+def traced(
+    name: str, kind: str = "internal", attributes: Mapping[str, Any] | None = None
+) -> Callable[[F], F]:
+    """
+    Decorator que executa a função dentro de um span.
+
+    Exceções são registradas no span, que é marcado com erro, e propagadas. Em
+    geradores assíncronos o span cobre o stream inteiro, até o gerador terminar
+    ou ser fechado.
+
+    Args:
+        name: Nome do span (fixo, nunca dados da requisição)
+        kind: Tipo do span ("internal", "client", "producer" ou "server")
+        attributes: Atributos fixos do span
+
+    Returns:
+        Decorator
+    """
+    fixed = dict(attributes or {})
+
+    def decorator(function: F) -> F:
+        if inspect.isasyncgenfunction(function):
+
+            @functools.wraps(function)
+            async def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    async with aclosing(function(*args, **kwargs)) as generator:
+                        async for item in generator:
+                            yield item
+                    return
+                with _tracer.start_as_current_span(
+                    name, kind=_span_kinds.get(kind), attributes=fixed
+                ):
+                    async with aclosing(function(*args, **kwargs)) as generator:
+                        async for item in generator:
+                            yield item
+
+            return async_gen_wrapper  # type: ignore[return-value]
+
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await function(*args, **kwargs)
+                with _tracer.start_as_current_span(
+                    name, kind=_span_kinds.get(kind), attributes=fixed
+                ):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return function(*args, **kwargs)
+            with _tracer.start_as_current_span(name, kind=_span_kinds.get(kind), attributes=fixed):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def server_span(
+    name: str, headers: Mapping[str, str], attributes: Mapping[str, Any] | None = None
+) -> Iterator[Any]:
+    """
+    Abre o span de entrada de uma requisição, continuando o trace do chamador.
+
+    Args:
+        name: Nome inicial do span
+        headers: Headers da requisição (lidos `traceparent`/`tracestate`)
+        attributes: Atributos iniciais
+
+    Yields:
+        Span aberto, ou None se o tracing estiver desativado
+    """
+    if _tracer is None:
+        yield None
+        return
+    context = _extract(headers) if _extract is not None else None
+    with _tracer.start_as_current_span(
+        name, context=context, kind=_span_kinds.get("server"), attributes=dict(attributes or {})
+    ) as span:
+        yield span
+
+
+def inject_context(headers: dict[str, Any]) -> dict[str, Any]:
+    """
+    Grava o contexto do trace corrente nos headers de uma mensagem.
+
+    Args:
+        headers: Headers a completar
+
+    Returns:
+        Os mesmos headers (inalterados se o tracing estiver desativado)
+    """
+    if _inject is not None:
+        _inject(headers)
+    return headers
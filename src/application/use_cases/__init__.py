@@ -1,7 +1,29 @@
 """Casos de uso da aplicação."""
 
+from src.application.use_cases.archive_orders import ArchiveOrdersUseCase
+from src.application.use_cases.cancel_stale_orders import CancelStaleOrdersUseCase
 from src.application.use_cases.create_order import CreateOrderUseCase
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.application.use_cases.get_customer_summary import GetCustomerSummaryUseCase
 from src.application.use_cases.get_order import GetOrderUseCase
+from src.application.use_cases.get_order_history import GetOrderHistoryUseCase
+from src.application.use_cases.get_order_stats import GetOrderStatsUseCase
+from src.application.use_cases.import_orders import ImportOrdersUseCase
+from src.application.use_cases.list_orders_by_product import ListOrdersByProductUseCase
+from src.application.use_cases.replay_history import ReplayHistoryUseCase
 from src.application.use_cases.update_order_status import UpdateOrderStatusUseCase
 
-__all__ = ["CreateOrderUseCase", "GetOrderUseCase", "UpdateOrderStatusUseCase"]
+__all__ = [
+    "ArchiveOrdersUseCase",
+    "CancelStaleOrdersUseCase",
+    "CreateOrderUseCase",
+    "ExportOrdersUseCase",
+    "GetCustomerSummaryUseCase",
+    "GetOrderHistoryUseCase",
+    "GetOrderStatsUseCase",
+    "GetOrderUseCase",
+    "ImportOrdersUseCase",
+    "ListOrdersByProductUseCase",
+    "ReplayHistoryUseCase",
+    "UpdateOrderStatusUseCase",
+]
@@ -0,0 +1,99 @@
+"""Caso de uso para arquivar pedidos encerrados antigos."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+import structlog
+
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.ports.order_archive_port import OrderArchivePort
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+
+class ArchiveOrdersUseCase:
+    """Caso de uso para mover pedidos em status terminal para o arquivo, em lotes espaçados."""
+
+    __slots__ = ("_archive",)
+
+    def __init__(self, archive: OrderArchivePort) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            archive: Arquivo de pedidos
+        """
+        self._archive = archive
+
+    @traced("use_case.archive_orders")
+    @timed(USE_CASE_SECONDS, "archive_orders")
+    async def execute(
+        self,
+        older_than: timedelta,
+        batch_size: int = 500,
+        pause_seconds: float = 0.2,
+        max_batches: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Arquiva pedidos entregues ou cancelados sem alterações há mais de `older_than`.
+
+        Entre um lote e outro o job espera `pause_seconds`, limitando a carga sobre
+        o MongoDB enquanto o tráfego normal continua.
+
+        Args:
+            older_than: Idade mínima desde a última atualização
+            batch_size: Pedidos por lote
+            pause_seconds: Pausa entre lotes
+            max_batches: Limite de lotes nesta execução (None: até esgotar)
+
+        Returns:
+            Pedidos arquivados, lotes, restantes estimados e duração
+
+        Raises:
+            ValueError: Se `batch_size` não for positivo
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser positivo")
+
+        statuses = OrderStatus.terminal_states()
+        updated_before = datetime.utcnow() - older_than
+        started = time.perf_counter()
+
+        pending = await self._archive.count_archivable(statuses, updated_before)
+        logger.info(
+            "Arquivamento iniciado",
+            updated_before=updated_before.isoformat(),
+            archivable=pending,
+        )
+
+        archived = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = await self._archive.archive_batch(statuses, updated_before, batch_size)
+            if moved == 0:
+                break
+            archived += moved
+            batches += 1
+            logger.info(
+                "Arquivamento em andamento",
+                archived=archived,
+                remaining=max(pending - archived, 0),
+                batches=batches,
+            )
+            if moved < batch_size:
+                break
+            await asyncio.sleep(pause_seconds)
+
+        result = {
+            "archived": archived,
+            "batches": batches,
+            "remaining": max(pending - archived, 0),
+            "updated_before": updated_before.isoformat(),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+        logger.info("Arquivamento concluído", **result)
+        return result
@@ -0,0 +1,146 @@
+"""Caso de uso para cancelar pedidos pendentes abandonados."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+import structlog
+
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.application.tracing import traced
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.message_broker_port import MessageBrokerPort
+from src.domain.ports.repository_port import OrderRepositoryPort
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+
+class CancelStaleOrdersUseCase:
+    """Caso de uso para cancelar, em lotes espaçados, pedidos pendentes há muito tempo."""
+
+    __slots__ = ("_repository", "_message_broker", "_recorder")
+
+    def __init__(
+        self,
+        repository: OrderRepositoryPort,
+        message_broker: MessageBrokerPort,
+        recorder: OrderChangeRecorder | None = None,
+    ) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            repository: Repositório de pedidos
+            message_broker: Broker de mensagens para publicar eventos
+            recorder: Registro das transições no histórico de status (opcional)
+        """
+        self._repository = repository
+        self._message_broker = message_broker
+        self._recorder = recorder
+
+    @traced("use_case.cancel_stale_orders")
+    @timed(USE_CASE_SECONDS, "cancel_stale_orders")
+    async def execute(
+        self,
+        older_than: timedelta,
+        batch_size: int = 200,
+        pause_seconds: float = 0.5,
+        max_batches: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Cancela pedidos criados há mais de `older_than` que continuam pendentes.
+
+        Cada lote é cancelado com atualizações condicionais (pedidos confirmados
+        nesse meio tempo ficam de fora), registrado no histórico e publicado como
+        um lote de eventos. Entre lotes o job espera `pause_seconds`.
+
+        Args:
+            older_than: Idade mínima do pedido
+            batch_size: Pedidos por lote
+            pause_seconds: Pausa entre lotes
+            max_batches: Limite de lotes nesta execução (None: até esgotar)
+
+        Returns:
+            Pedidos cancelados, ignorados (alterados por outra operação), lotes e duração
+
+        Raises:
+            ValueError: Se `batch_size` não for positivo
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser positivo")
+
+        created_before = datetime.utcnow() - older_than
+        started = time.perf_counter()
+        cancelled = 0
+        skipped = 0
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            orders = await self._repository.find_stale(
+                OrderStatus.PENDING, created_before, limit=batch_size
+            )
+            if not orders:
+                break
+            batches += 1
+
+            changed_at = datetime.utcnow()
+            updated = set(
+                await self._repository.transition_many(
+                    [order.id for order in orders],
+                    OrderStatus.PENDING,
+                    OrderStatus.CANCELLED,
+                    changed_at,
+                )
+            )
+            changes = [
+                StatusChange(
+                    order_id=order.id,
+                    customer_id=order.customer_id,
+                    from_status=OrderStatus.PENDING,
+                    to_status=OrderStatus.CANCELLED,
+                    changed_at=changed_at,
+                    total_amount=order.total_amount,
+                )
+                for order in orders
+                if order.id in updated
+            ]
+            cancelled += len(changes)
+            skipped += len(orders) - len(changes)
+
+            if self._recorder is not None:
+                await self._recorder.record(changes)
+            # O lote já está cancelado e no histórico: se o broker falhar os eventos
+            # não são reenviados. Os IDs vão para o log de erro (para republicar) e o
+            # job para, em vez de seguir cancelando pedidos sem aviso
+            try:
+                await self._message_broker.publish_order_status_updates(changes)
+            except Exception as e:
+                logger.error(
+                    "Eventos de cancelamento automático não publicados",
+                    order_ids=[change.order_id for change in changes],
+                    error=str(e),
+                )
+                raise
+
+            logger.info(
+                "Cancelamento automático em andamento",
+                cancelled=cancelled,
+                skipped=skipped,
+                batches=batches,
+            )
+            if len(orders) < batch_size:
+                break
+            await asyncio.sleep(pause_seconds)
+
+        result = {
+            "cancelled": cancelled,
+            "skipped": skipped,
+            "batches": batches,
+            "created_before": created_before.isoformat(),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+        logger.info("Cancelamento automático concluído", **result)
+        return result
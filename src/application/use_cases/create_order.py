@@ -5,8 +5,15 @@ from typing import Any
 
 import structlog
 
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.application.tracing import traced
 from src.domain.entities.order import Order
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.id_generator_port import OrderIdGeneratorPort
 from src.domain.ports.repository_port import OrderRepositoryPort
+from src.domain.services.order_pricing import reconcile_total, validate_items
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.order_status import OrderStatus
@@ -17,29 +24,51 @@ logger = structlog.get_logger()
 class CreateOrderUseCase:
     """Caso de uso para criar um novo pedido."""
 
-    def __init__(self, repository: OrderRepositoryPort) -> None:
+    __slots__ = ("_repository", "_id_generator", "_recorder")
+
+    def __init__(
+        self,
+        repository: OrderRepositoryPort,
+        id_generator: OrderIdGeneratorPort | None = None,
+        recorder: OrderChangeRecorder | None = None,
+    ) -> None:
         """
         Inicializa o caso de uso.
 
         Args:
             repository: Repositório de pedidos
+            id_generator: Gerador de IDs (padrão: UUIDv4 aleatório)
+            recorder: Registro da criação no histórico de status (opcional)
         """
         self._repository = repository
+        self._id_generator = id_generator
+        self._recorder = recorder
 
+    @traced("use_case.create_order")
+    @timed(USE_CASE_SECONDS, "create_order")
     async def execute(
-        self, customer_id: str, items: list[dict[str, Any]], total_amount: float
+        self,
+        customer_id: str,
+        items: list[dict[str, Any]],
+        total_amount: float | None = None,
     ) -> Order:
         """
-        Cria um novo pedido.
+        Cria um novo pedido com o valor total calculado a partir dos itens.
 
         Args:
             customer_id: ID do cliente
             items: Lista de itens do pedido
-            total_amount: Valor total do pedido
+            total_amount: Valor total informado pelo cliente (conferido com os itens)
 
         Returns:
             Pedido criado
+
+        Raises:
+            InvalidOrderItemError: Se algum item for inválido
+            OrderTotalMismatchError: Se o total informado divergir do total dos itens
         """
+        check_deadline("criar pedido")
+
         logger.info(
             "Criando pedido",
             customer_id=customer_id,
@@ -47,18 +76,26 @@ class CreateOrderUseCase:
             total_amount=total_amount,
         )
 
-        order_id = OrderId(str(uuid.uuid4()))
-        money = Money(total_amount)
+        validated_items = validate_items(items)
+        money = Money(reconcile_total(validated_items, total_amount))
+
+        if self._id_generator is not None:
+            order_id = self._id_generator.new_id()
+        else:
+            order_id = OrderId(str(uuid.uuid4()))
         order = Order(
             order_id=order_id,
             customer_id=customer_id,
-            items=items,
+            items=validated_items,
             total_amount=money,
             status=OrderStatus.PENDING,
         )
 
         saved_order = await self._repository.save(order)
 
+        if self._recorder is not None:
+            await self._recorder.record([StatusChange.from_order(saved_order, None)])
+
         logger.info("Pedido criado com sucesso", order_id=str(saved_order.id))
 
         return saved_order
@@ -0,0 +1,92 @@
+"""Caso de uso para exportar pedidos de um intervalo de criação."""
+
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
+from datetime import datetime
+
+import structlog
+
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.entities.order import Order
+from src.domain.ports.repository_port import OrderRepositoryPort
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+MAX_EXPORT_BATCH_SIZE = 10_000
+
+
+class ExportOrdersUseCase:
+    """Caso de uso para exportar, em streaming, os pedidos criados em um intervalo."""
+
+    __slots__ = ("_repository",)
+
+    def __init__(self, repository: OrderRepositoryPort) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            repository: Repositório de pedidos
+        """
+        self._repository = repository
+
+    def execute(
+        self,
+        created_from: datetime,
+        created_to: datetime,
+        statuses: Sequence[OrderStatus] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Order]]:
+        """
+        Valida o pedido de exportação e devolve os lotes a serem enviados.
+
+        A validação acontece antes do primeiro lote, para que erros ainda possam
+        ser respondidos com status HTTP; a leitura só começa quando o iterador é
+        consumido, e o span e a duração cobrem o stream inteiro.
+
+        Args:
+            created_from: Início do intervalo (inclusivo)
+            created_to: Fim do intervalo (exclusivo)
+            statuses: Status aceitos (padrão: todos)
+            batch_size: Pedidos por lote (1 a 10000)
+
+        Returns:
+            Iterador assíncrono de lotes de pedidos
+
+        Raises:
+            ValueError: Se o intervalo ou o tamanho do lote forem inválidos
+        """
+        if created_from >= created_to:
+            raise ValueError("created_from deve ser anterior a created_to")
+        if not 1 <= batch_size <= MAX_EXPORT_BATCH_SIZE:
+            raise ValueError(f"batch_size deve estar entre 1 e {MAX_EXPORT_BATCH_SIZE}")
+
+        check_deadline("exportar pedidos")
+
+        logger.info(
+            "Exportação de pedidos iniciada",
+            created_from=created_from.isoformat(),
+            created_to=created_to.isoformat(),
+            statuses=[status.value for status in statuses or ()],
+        )
+        return self._stream(
+            self._repository.iter_orders(created_from, created_to, statuses, batch_size)
+        )
+
+    @traced("use_case.export_orders")
+    @timed(USE_CASE_SECONDS, "export_orders")
+    async def _stream(self, batches: AsyncIterator[list[Order]]) -> AsyncIterator[list[Order]]:
+        """
+        Repassa os lotes do repositório.
+
+        Args:
+            batches: Lotes lidos do repositório
+
+        Yields:
+            Lotes de pedidos
+        """
+        async with aclosing(batches) as source:
+            async for batch in source:
+                yield batch
@@ -0,0 +1,55 @@
+"""Caso de uso para obter o resumo de pedidos de um cliente."""
+
+from typing import Any
+
+import structlog
+
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.exceptions import CustomerNotFoundError
+from src.domain.ports.customer_summary_port import CustomerSummaryPort
+
+logger = structlog.get_logger()
+
+
+class GetCustomerSummaryUseCase:
+    """Caso de uso para obter o resumo de pedidos de um cliente."""
+
+    __slots__ = ("_summaries",)
+
+    def __init__(self, summaries: CustomerSummaryPort) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            summaries: Resumos de pedidos por cliente
+        """
+        self._summaries = summaries
+
+    @traced("use_case.get_customer_summary")
+    @timed(USE_CASE_SECONDS, "get_customer_summary")
+    async def execute(self, customer_id: str) -> dict[str, Any]:
+        """
+        Obtém o resumo de pedidos de um cliente.
+
+        Args:
+            customer_id: ID do cliente
+
+        Returns:
+            Quantidade de pedidos, gasto acumulado e último pedido
+
+        Raises:
+            CustomerNotFoundError: Se o cliente não tiver pedidos
+        """
+        check_deadline("buscar resumo do cliente")
+
+        logger.info("Buscando resumo do cliente", customer_id=customer_id)
+
+        summary = await self._summaries.get_summary(customer_id)
+
+        if summary is None:
+            logger.warning("Cliente sem pedidos", customer_id=customer_id)
+            raise CustomerNotFoundError(f"Nenhum pedido encontrado para o cliente {customer_id}")
+
+        return summary
@@ -1,7 +1,13 @@
 """Caso de uso para obter um pedido por ID."""
 
+from collections.abc import Sequence
+from typing import Any
+
 import structlog
 
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
 from src.domain.entities.order import Order
 from src.domain.exceptions import OrderNotFoundError
 from src.domain.ports.repository_port import OrderRepositoryPort
@@ -13,6 +19,8 @@ logger = structlog.get_logger()
 class GetOrderUseCase:
     """Caso de uso para obter um pedido por ID."""
 
+    __slots__ = ("_repository",)
+
     def __init__(self, repository: OrderRepositoryPort) -> None:
         """
         Inicializa o caso de uso.
@@ -22,6 +30,8 @@ class GetOrderUseCase:
         """
         self._repository = repository
 
+    @traced("use_case.get_order")
+    @timed(USE_CASE_SECONDS, "get_order")
     async def execute(self, order_id: OrderId) -> Order:
         """
         Obtém um pedido por ID.
@@ -35,6 +45,8 @@ class GetOrderUseCase:
         Raises:
             OrderNotFoundError: Se o pedido não for encontrado
         """
+        check_deadline("buscar pedido")
+
         logger.info("Buscando pedido", order_id=str(order_id))
 
         order = await self._repository.find_by_id(order_id)
@@ -46,3 +58,31 @@ class GetOrderUseCase:
         logger.info("Pedido encontrado", order_id=str(order_id))
 
         return order
+
+    @traced("use_case.get_order_fields")
+    @timed(USE_CASE_SECONDS, "get_order_fields")
+    async def execute_fields(self, order_id: OrderId, fields: Sequence[str]) -> dict[str, Any]:
+        """
+        Obtém apenas alguns campos de um pedido.
+
+        Args:
+            order_id: ID do pedido
+            fields: Campos a retornar
+
+        Returns:
+            Dicionário com os campos pedidos
+
+        Raises:
+            OrderNotFoundError: Se o pedido não for encontrado
+        """
+        check_deadline("buscar pedido")
+
+        logger.info("Buscando campos do pedido", order_id=str(order_id), fields=list(fields))
+
+        document = await self._repository.find_fields_by_id(order_id, fields)
+
+        if not document:
+            logger.warning("Pedido não encontrado", order_id=str(order_id))
+            raise OrderNotFoundError(f"Pedido {order_id} não encontrado")
+
+        return document
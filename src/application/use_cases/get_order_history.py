@@ -0,0 +1,61 @@
+"""Caso de uso para obter o histórico de status de um pedido."""
+
+import structlog
+
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.events.status_change import StatusChange
+from src.domain.exceptions import OrderNotFoundError
+from src.domain.ports.order_history_port import OrderHistoryPort
+from src.domain.ports.repository_port import OrderRepositoryPort
+from src.domain.value_objects.order_id import OrderId
+
+logger = structlog.get_logger()
+
+
+class GetOrderHistoryUseCase:
+    """Caso de uso para obter o histórico de status de um pedido."""
+
+    __slots__ = ("_repository", "_history")
+
+    def __init__(self, repository: OrderRepositoryPort, history: OrderHistoryPort) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            repository: Repositório de pedidos
+            history: Log de transições de status
+        """
+        self._repository = repository
+        self._history = history
+
+    @traced("use_case.get_order_history")
+    @timed(USE_CASE_SECONDS, "get_order_history")
+    async def execute(self, order_id: OrderId) -> list[StatusChange]:
+        """
+        Obtém as transições de status de um pedido.
+
+        Args:
+            order_id: ID do pedido
+
+        Returns:
+            Transições em ordem cronológica (vazia para pedidos anteriores ao histórico)
+
+        Raises:
+            OrderNotFoundError: Se o pedido não for encontrado
+        """
+        check_deadline("buscar histórico do pedido")
+
+        logger.info("Buscando histórico do pedido", order_id=str(order_id))
+
+        changes = await self._history.find_by_order_id(order_id)
+        if changes:
+            return changes
+
+        # Sem histórico: distingue pedido inexistente de pedido antigo
+        if await self._repository.find_fields_by_id(order_id, ("id",)) is None:
+            logger.warning("Pedido não encontrado", order_id=str(order_id))
+            raise OrderNotFoundError(f"Pedido {order_id} não encontrado")
+
+        return []
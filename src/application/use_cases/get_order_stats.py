@@ -0,0 +1,54 @@
+"""Caso de uso para obter os contadores de pedidos."""
+
+from typing import Any
+
+import structlog
+
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.ports.order_stats_port import OrderStatsPort
+
+logger = structlog.get_logger()
+
+MAX_STATS_DAYS = 90
+
+
+class GetOrderStatsUseCase:
+    """Caso de uso para obter os contadores de pedidos por status e por dia."""
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, stats: OrderStatsPort) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            stats: Contadores de pedidos
+        """
+        self._stats = stats
+
+    @traced("use_case.get_order_stats")
+    @timed(USE_CASE_SECONDS, "get_order_stats")
+    async def execute(self, days: int = 0) -> dict[str, Any]:
+        """
+        Obtém os contadores pré-agregados.
+
+        Args:
+            days: Número de dias de contadores diários a incluir (0 a 90)
+
+        Returns:
+            Total, contagem por status e, se pedido, contadores diários
+
+        Raises:
+            ValueError: Se `days` estiver fora do intervalo permitido
+        """
+        if not 0 <= days <= MAX_STATS_DAYS:
+            raise ValueError(f"days deve estar entre 0 e {MAX_STATS_DAYS}")
+
+        check_deadline("buscar contadores de pedidos")
+
+        counts = await self._stats.get_status_counts()
+        daily = await self._stats.get_daily_counts(days) if days else []
+
+        return {"total": sum(counts.values()), "counts": counts, "daily": daily}
@@ -0,0 +1,374 @@
+"""Caso de uso para importar pedidos em lote (migrações e backfills)."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import structlog
+
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.application.tracing import traced
+from src.domain.entities.order import Order
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.repository_port import OrderRepositoryPort, SaveManyResult
+from src.domain.services.order_pricing import (
+    calculate_items_total,
+    calculate_totals_bulk,
+    check_total,
+    validate_items,
+)
+from src.domain.value_objects.money import Money, currency_exponent
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+# Quantidade de erros de validação devolvidos no resultado
+MAX_REPORTED_ERRORS = 20
+
+
+def _parse_datetime(value: Any, field: str) -> datetime | None:
+    """
+    Converte uma data ISO 8601 para datetime UTC sem fuso (formato gravado no MongoDB).
+
+    Args:
+        value: Valor do registro
+        field: Nome do campo (para a mensagem de erro)
+
+    Returns:
+        datetime ou None se ausente
+
+    Raises:
+        ValueError: Se o valor não for uma data válida
+    """
+    if value in (None, ""):
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"{field} deve ser uma data ISO 8601")
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+@dataclass(slots=True)
+class _ParsedRecord:
+    """Campos de um registro importado, com os itens validados e o total ainda não conferido."""
+
+    order_id: str
+    customer_id: str
+    items: list[dict[str, Any]]
+    informed_total: Any
+    currency: str
+    exponent: int
+    status: OrderStatus
+    created_at: datetime | None
+    updated_at: datetime | None
+
+    def to_order(self, total: Decimal) -> Order:
+        """
+        Monta o pedido com o total calculado dos itens.
+
+        Args:
+            total: Total dos itens, na moeda do registro
+
+        Returns:
+            Pedido validado
+
+        Raises:
+            ValueError: Se o total for inválido ou divergir do informado
+        """
+        return Order(
+            order_id=OrderId(self.order_id),
+            customer_id=self.customer_id,
+            items=self.items,
+            total_amount=Money(
+                check_total(total, self.informed_total, self.exponent), self.currency
+            ),
+            status=self.status,
+            created_at=self.created_at,
+            updated_at=self.updated_at or self.created_at,
+        )
+
+
+def _parse_record(record: dict[str, Any]) -> _ParsedRecord:
+    """
+    Lê e valida os campos de um registro importado, exceto o total.
+
+    Args:
+        record: Registro lido do arquivo
+
+    Returns:
+        Campos do registro
+
+    Raises:
+        ValueError: Se o registro for inválido
+    """
+    order_id = record.get("id")
+    customer_id = record.get("customer_id")
+    if not isinstance(order_id, str) or not order_id:
+        raise ValueError("id é obrigatório")
+    if not isinstance(customer_id, str) or not customer_id:
+        raise ValueError("customer_id é obrigatório")
+
+    total = record.get("total_amount")
+    currency = record.get("currency") or "BRL"
+    if isinstance(total, dict):
+        currency = total.get("currency") or currency
+        total = total.get("amount")
+    exponent = currency_exponent(currency)
+    return _ParsedRecord(
+        order_id=order_id,
+        customer_id=customer_id,
+        items=validate_items(record.get("items") or [], exponent),
+        informed_total=total,
+        currency=currency,
+        exponent=exponent,
+        status=OrderStatus(record.get("status") or OrderStatus.PENDING.value),
+        created_at=_parse_datetime(record.get("created_at"), "created_at"),
+        updated_at=_parse_datetime(record.get("updated_at"), "updated_at"),
+    )
+
+
+def order_from_record(record: dict[str, Any]) -> Order:
+    """
+    Monta um pedido a partir de um registro importado, aplicando as regras do domínio.
+
+    O formato é o mesmo da exportação NDJSON; `total_amount` também pode ser um
+    número, com a moeda no campo `currency`.
+
+    Args:
+        record: Registro lido do arquivo
+
+    Returns:
+        Pedido validado
+
+    Raises:
+        ValueError: Se o registro for inválido
+    """
+    parsed = _parse_record(record)
+    return parsed.to_order(calculate_items_total(parsed.items, parsed.exponent))
+
+
+def orders_from_records(
+    records: Sequence[tuple[int, dict[str, Any] | None]],
+) -> tuple[list[Order], list[dict[str, Any]]]:
+    """
+    Valida um lote de registros como `order_from_record`.
+
+    Os totais de todos os registros válidos são somados em uma única passada
+    com `calculate_totals_bulk` e só então conferidos um a um.
+
+    Args:
+        records: Pares (número da linha, registro); registro None indica linha malformada
+
+    Returns:
+        Pedidos válidos e os erros (linha e mensagem) dos rejeitados, em ordem de linha
+    """
+    parsed: list[tuple[int, _ParsedRecord]] = []
+    errors: list[dict[str, Any]] = []
+    for line, record in records:
+        try:
+            if record is None:
+                raise ValueError("linha malformada")
+            parsed.append((line, _parse_record(record)))
+        except (ValueError, TypeError, KeyError) as e:
+            errors.append({"line": line, "error": str(e)})
+
+    totals = calculate_totals_bulk(
+        [fields.items for _, fields in parsed], [fields.exponent for _, fields in parsed]
+    )
+    orders: list[Order] = []
+    for (line, fields), total in zip(parsed, totals, strict=True):
+        try:
+            orders.append(fields.to_order(total))
+        except (ValueError, TypeError) as e:
+            errors.append({"line": line, "error": str(e)})
+    errors.sort(key=lambda error: error["line"])
+    return orders, errors
+
+
+def import_changes(result: SaveManyResult) -> list[StatusChange]:
+    """
+    Transições a registrar para um lote gravado pela importação.
+
+    Pedidos novos entram como criação já no status importado, na data de criação;
+    pedidos atualizados geram uma transição só se o status mudou.
+
+    Args:
+        result: Resultado da gravação do lote
+
+    Returns:
+        Transições do lote
+    """
+    changes = [
+        StatusChange(
+            order_id=order.id,
+            customer_id=order.customer_id,
+            from_status=None,
+            to_status=order.status,
+            changed_at=order.created_at,
+            total_amount=order.total_amount,
+        )
+        for order in result.inserted
+    ]
+    changes.extend(
+        StatusChange.from_order(order, previous_status)
+        for order, previous_status in result.updated
+        if previous_status != order.status
+    )
+    return changes
+
+
+class ImportOrdersUseCase:
+    """Caso de uso para importar pedidos em lotes gravados em paralelo."""
+
+    __slots__ = ("_repository", "_recorder")
+
+    def __init__(
+        self, repository: OrderRepositoryPort, recorder: OrderChangeRecorder | None = None
+    ) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            repository: Repositório de pedidos
+            recorder: Registro das criações e transições no histórico e nos modelos de leitura
+        """
+        self._repository = repository
+        self._recorder = recorder
+
+    @traced("use_case.import_orders")
+    @timed(USE_CASE_SECONDS, "import_orders")
+    async def execute(
+        self,
+        records: Iterable[tuple[int, dict[str, Any] | None]],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        on_checkpoint: Callable[[int], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Valida e grava os registros, com até `concurrency` lotes em andamento.
+
+        Cada lote de `batch_size` linhas é validado de uma vez (`orders_from_records`)
+        e só os pedidos válidos são gravados.
+
+        Os lotes são confirmados na ordem de leitura: o checkpoint só avança até
+        a última linha cujo lote, e todos os anteriores, já foram gravados. A
+        gravação não duplica nem regride pedidos (ver `save_many`), então retomar a
+        partir do checkpoint é seguro. O que foi de fato gravado passa pelo
+        `recorder`, mantendo histórico, contadores e resumos por cliente.
+
+        Args:
+            records: Pares (número da linha, registro); registro None indica linha malformada
+            batch_size: Linhas por lote
+            concurrency: Lotes gravados em paralelo
+            on_checkpoint: Chamado com o número da última linha confirmada
+
+        Returns:
+            Linhas lidas, pedidos gravados, ignorados (arquivados ou com versão mais
+            nova no banco), rejeitados, lotes, duração e linhas por segundo
+
+        Raises:
+            ValueError: Se `batch_size` ou `concurrency` forem inválidos
+        """
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size e concurrency devem ser positivos")
+
+        started = time.perf_counter()
+        pending: deque[tuple[int, asyncio.Task[SaveManyResult]]] = deque()
+        rows = imported = skipped = rejected = batches = 0
+        errors: list[dict[str, Any]] = []
+
+        async def confirm_oldest() -> None:
+            nonlocal imported, skipped
+            line, task = pending.popleft()
+            saved = await task
+            imported += len(saved.inserted) + len(saved.updated)
+            skipped += saved.skipped
+            if on_checkpoint is not None:
+                on_checkpoint(line)
+            logger.info(
+                "Importação em andamento",
+                line=line,
+                imported=imported,
+                rows_per_second=round(rows / max(time.perf_counter() - started, 1e-6), 1),
+            )
+
+        async def submit(orders: list[Order], last_line: int) -> None:
+            nonlocal batches
+            while len(pending) >= concurrency:
+                await confirm_oldest()
+            pending.append((last_line, asyncio.create_task(self._write(orders))))
+            batches += 1
+
+        chunk: list[tuple[int, dict[str, Any] | None]] = []
+
+        async def flush() -> None:
+            nonlocal rejected
+            orders, chunk_errors = orders_from_records(chunk)
+            rejected += len(chunk_errors)
+            errors.extend(chunk_errors[: MAX_REPORTED_ERRORS - len(errors)])
+            if orders:
+                await submit(orders, chunk[-1][0])
+            chunk.clear()
+
+        last_line = 0
+        try:
+            for line, record in records:
+                rows += 1
+                last_line = line
+                chunk.append((line, record))
+                if len(chunk) >= batch_size:
+                    await flush()
+            if chunk:
+                await flush()
+            while pending:
+                await confirm_oldest()
+        except BaseException:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+            raise
+
+        # Linhas rejeitadas no fim do arquivo também contam como processadas
+        if on_checkpoint is not None and rows:
+            on_checkpoint(last_line)
+
+        seconds = max(time.perf_counter() - started, 1e-6)
+        result = {
+            "rows": rows,
+            "imported": imported,
+            "skipped": skipped,
+            "rejected": rejected,
+            "batches": batches,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(rows / seconds, 1),
+            "errors": errors,
+        }
+        logger.info(
+            "Importação de pedidos finalizada",
+            **{key: value for key, value in result.items() if key != "errors"},
+        )
+        return result
+
+    async def _write(self, orders: list[Order]) -> SaveManyResult:
+        """
+        Grava um lote e registra as criações e transições resultantes.
+
+        Args:
+            orders: Pedidos do lote
+
+        Returns:
+            Resultado da gravação
+        """
+        result = await self._repository.save_many(orders)
+        if self._recorder is not None:
+            await self._recorder.record(import_changes(result))
+        return result
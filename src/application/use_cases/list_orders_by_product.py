@@ -0,0 +1,78 @@
+"""Caso de uso para listar os pedidos que contêm um produto."""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import structlog
+
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.entities.order import Order
+from src.domain.ports.repository_port import OrderRepositoryPort
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+logger = structlog.get_logger()
+
+MAX_PAGE_SIZE = 1000
+
+
+class ListOrdersByProductUseCase:
+    """Caso de uso para listar, página a página, os pedidos que contêm um produto."""
+
+    __slots__ = ("_repository",)
+
+    def __init__(self, repository: OrderRepositoryPort) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            repository: Repositório de pedidos
+        """
+        self._repository = repository
+
+    @traced("use_case.list_orders_by_product")
+    @timed(USE_CASE_SECONDS, "list_orders_by_product")
+    async def execute(
+        self,
+        product_id: str,
+        statuses: Sequence[OrderStatus] | None = None,
+        limit: int = 100,
+        after: tuple[datetime, OrderId] | None = None,
+    ) -> tuple[list[Order], tuple[datetime, OrderId] | None]:
+        """
+        Busca uma página de pedidos que contêm o produto.
+
+        Args:
+            product_id: ID do produto
+            statuses: Status aceitos (padrão: todos)
+            limit: Tamanho da página (1 a 1000)
+            after: Chave (created_at, id) devolvida pela página anterior
+
+        Returns:
+            Pedidos da página e a chave da próxima página (None na última)
+
+        Raises:
+            ValueError: Se `limit` estiver fora do intervalo permitido
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit deve estar entre 1 e {MAX_PAGE_SIZE}")
+
+        check_deadline("listar pedidos por produto")
+
+        # Um pedido a mais indica se existe próxima página sem um count()
+        orders = await self._repository.find_by_product(product_id, statuses, limit + 1, after)
+
+        next_key = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_key = (orders[-1].created_at, orders[-1].id)
+
+        logger.debug(
+            "Pedidos por produto listados",
+            product_id=product_id,
+            count=len(orders),
+            has_more=next_key is not None,
+        )
+        return orders, next_key
@@ -0,0 +1,105 @@
+"""Caso de uso para reconstruir modelos de leitura a partir do histórico de status."""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import structlog
+
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.tracing import traced
+from src.domain.events.status_change import StatusChange
+from src.domain.ports.order_history_port import OrderHistoryPort
+from src.domain.ports.order_projection_port import OrderProjectionPort
+
+logger = structlog.get_logger()
+
+CHECKPOINT_NAME = "replay"
+
+
+class ReplayHistoryUseCase:
+    """
+    Reaplica o log de transições aos modelos de leitura.
+
+    A leitura do próximo lote acontece enquanto o lote anterior é aplicado, e os
+    modelos de leitura recebem cada lote em paralelo. A posição é salva após cada
+    lote, então uma reconstrução interrompida pode ser retomada com `resume`.
+
+    Só o que está no log é reaplicado: pedidos criados antes do histórico existir
+    não têm transições e somem dos modelos de leitura após a reconstrução. Nesse
+    caso, recalcule-os a partir de `orders` (`reconcile-stats` e
+    `rebuild-customer-summaries`).
+    """
+
+    __slots__ = ("_history", "_projections")
+
+    def __init__(
+        self, history: OrderHistoryPort, projections: Sequence[OrderProjectionPort]
+    ) -> None:
+        """
+        Inicializa o caso de uso.
+
+        Args:
+            history: Log de transições de status
+            projections: Modelos de leitura a reconstruir
+        """
+        self._history = history
+        self._projections = tuple(projections)
+
+    @traced("use_case.replay_history")
+    @timed(USE_CASE_SECONDS, "replay_history")
+    async def execute(self, batch_size: int = 5000, resume: bool = False) -> dict[str, Any]:
+        """
+        Reconstrói os modelos de leitura.
+
+        Args:
+            batch_size: Número de transições por lote
+            resume: Continua do último checkpoint em vez de apagar e recomeçar
+
+        Returns:
+            Estatísticas da execução (transições, lotes, segundos e taxa)
+        """
+        after = await self._history.load_checkpoint(CHECKPOINT_NAME) if resume else None
+        if after is None:
+            await asyncio.gather(*(projection.reset() for projection in self._projections))
+
+        logger.info("Iniciando replay do histórico", resume=after is not None)
+
+        started = time.perf_counter()
+        total = 0
+        batches = 0
+        pending: asyncio.Task[None] | None = None
+        try:
+            async for position, changes in self._history.iter_batches(batch_size, after):
+                if pending is not None:
+                    await pending
+                pending = asyncio.create_task(self._apply(position, changes))
+                total += len(changes)
+                batches += 1
+            if pending is not None:
+                await pending
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+        elapsed = time.perf_counter() - started
+        result = {
+            "changes": total,
+            "batches": batches,
+            "seconds": round(elapsed, 3),
+            "changes_per_second": round(total / elapsed) if elapsed > 0 else 0,
+        }
+        logger.info("Replay do histórico concluído", **result)
+        return result
+
+    async def _apply(self, position: str, changes: list[StatusChange]) -> None:
+        """
+        Aplica um lote a todos os modelos de leitura e salva o checkpoint.
+
+        Args:
+            position: Posição da última transição do lote
+            changes: Transições do lote
+        """
+        await asyncio.gather(*(projection.apply(changes) for projection in self._projections))
+        await self._history.save_checkpoint(CHECKPOINT_NAME, position)
@@ -2,8 +2,13 @@
 
 import structlog
 
+from src.application.deadline import check_deadline
+from src.application.metrics import USE_CASE_SECONDS, timed
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.application.tracing import traced
 from src.domain.entities.order import Order
-from src.domain.exceptions import OrderNotFoundError
+from src.domain.events.status_change import StatusChange
+from src.domain.exceptions import OrderNotFoundError, OrderStatusConflictError
 from src.domain.ports.message_broker_port import MessageBrokerPort
 from src.domain.ports.repository_port import OrderRepositoryPort
 from src.domain.value_objects.order_id import OrderId
@@ -11,14 +16,20 @@ from src.domain.value_objects.order_status import OrderStatus
 
 logger = structlog.get_logger()
 
+# Releituras quando outra operação muda o status entre a leitura e a gravação
+MAX_UPDATE_ATTEMPTS = 3
+
 
 class UpdateOrderStatusUseCase:
     """Caso de uso para atualizar o status de um pedido."""
 
+    __slots__ = ("_repository", "_message_broker", "_recorder")
+
     def __init__(
         self,
         repository: OrderRepositoryPort,
         message_broker: MessageBrokerPort,
+        recorder: OrderChangeRecorder | None = None,
     ) -> None:
         """
         Inicializa o caso de uso.
@@ -26,14 +37,22 @@ class UpdateOrderStatusUseCase:
         Args:
             repository: Repositório de pedidos
             message_broker: Broker de mensagens para publicar eventos
+            recorder: Registro da transição no histórico de status (opcional)
         """
         self._repository = repository
         self._message_broker = message_broker
+        self._recorder = recorder
 
+    @traced("use_case.update_order_status")
+    @timed(USE_CASE_SECONDS, "update_order_status")
     async def execute(self, order_id: OrderId, new_status: OrderStatus) -> Order:
         """
         Atualiza o status de um pedido e publica evento.
 
+        A gravação é condicional ao status lido: se outra operação (ex.: o
+        cancelamento automático) mudar o pedido nesse meio tempo, ele é relido e a
+        transição validada de novo sobre o status atual.
+
         Args:
             order_id: ID do pedido
             new_status: Novo status
@@ -44,27 +63,57 @@ class UpdateOrderStatusUseCase:
         Raises:
             OrderNotFoundError: Se o pedido não for encontrado
             InvalidStatusTransitionError: Se a transição de status for inválida
+            OrderStatusConflictError: Se o status mudar a cada tentativa
         """
+        check_deadline("atualizar status do pedido")
+
         logger.info(
             "Atualizando status do pedido",
             order_id=str(order_id),
             new_status=new_status.value,
         )
 
-        order = await self._repository.find_by_id(order_id)
-
-        if not order:
-            logger.warning("Pedido não encontrado", order_id=str(order_id))
-            raise OrderNotFoundError(f"Pedido {order_id} não encontrado")
-
-        old_status = order.update_status(new_status)
-        updated_order = await self._repository.save(order)
+        for attempt in range(1, MAX_UPDATE_ATTEMPTS + 1):
+            order = await self._repository.find_by_id(order_id)
+
+            if not order:
+                logger.warning("Pedido não encontrado", order_id=str(order_id))
+                raise OrderNotFoundError(f"Pedido {order_id} não encontrado")
+
+            old_status = order.update_status(new_status)
+            if old_status == new_status:
+                # Sem transição: nada a gravar no histórico, nos modelos de leitura ou no broker
+                logger.info(
+                    "Pedido já está no status pedido",
+                    order_id=str(order_id),
+                    status=new_status.value,
+                )
+                return order
+
+            if await self._repository.transition(
+                order.id, old_status, new_status, order.updated_at
+            ):
+                break
+            logger.info(
+                "Status do pedido alterado por outra operação",
+                order_id=str(order_id),
+                expected_status=old_status.value,
+                attempt=attempt,
+            )
+        else:
+            raise OrderStatusConflictError(
+                f"Status do pedido {order_id} alterado por outra operação; tente novamente"
+            )
+
+        if self._recorder is not None:
+            await self._recorder.record([StatusChange.from_order(order, old_status)])
 
         # Publica evento de mudança de status
         await self._message_broker.publish_order_status_updated(
             order_id=str(order_id),
             old_status=old_status.value,
             new_status=new_status.value,
+            customer_id=order.customer_id,
         )
 
         logger.info(
@@ -74,4 +123,4 @@ class UpdateOrderStatusUseCase:
             new_status=new_status.value,
         )
 
-        return updated_order
+        return order
@@ -1,5 +1,6 @@
 """Entidade Order - representa um pedido no domínio."""
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -12,11 +13,21 @@ from src.domain.value_objects.order_status import OrderStatus
 class Order:
     """Entidade que representa um pedido."""
 
+    __slots__ = (
+        "_id",
+        "_customer_id",
+        "_items",
+        "_total_amount",
+        "_status",
+        "_created_at",
+        "_updated_at",
+    )
+
     def __init__(
         self,
         order_id: OrderId,
         customer_id: str,
-        items: list[dict[str, Any]],
+        items: Sequence[dict[str, Any]],
         total_amount: Money,
         status: OrderStatus = OrderStatus.PENDING,
         created_at: datetime | None = None,
@@ -34,13 +45,19 @@ class Order:
             created_at: Data de criação
             updated_at: Data de atualização
         """
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+
         self._id = order_id
         self._customer_id = customer_id
-        self._items = items
+        # Tupla: uma única cópia na construção e leitura sem cópias depois
+        self._items = items if type(items) is tuple else tuple(items)
         self._total_amount = total_amount
         self._status = status
-        self._created_at = created_at or datetime.utcnow()
-        self._updated_at = updated_at or datetime.utcnow()
+        self._created_at = created_at
+        self._updated_at = updated_at
 
     @property
     def id(self) -> OrderId:
@@ -53,9 +70,9 @@ class Order:
         return self._customer_id
 
     @property
-    def items(self) -> list[dict[str, Any]]:
-        """Retorna os itens do pedido."""
-        return self._items.copy()
+    def items(self) -> tuple[dict[str, Any], ...]:
+        """Retorna os itens do pedido (sequência imutável, sem cópia)."""
+        return self._items
 
     @property
     def total_amount(self) -> Money:
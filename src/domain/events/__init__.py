@@ -0,0 +1,5 @@
+"""Eventos do domínio."""
+
+from src.domain.events.status_change import StatusChange
+
+__all__ = ["StatusChange"]
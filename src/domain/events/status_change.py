@@ -0,0 +1,48 @@
+"""Evento de domínio para uma transição de status de pedido."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class StatusChange:
+    """
+    Transição de status de um pedido, registrada no histórico.
+
+    A criação do pedido é registrada como transição sem status anterior. Cada
+    entrada carrega o cliente e o valor do pedido, então o histórico é suficiente
+    para reconstruir os modelos de leitura sem consultar a coleção de pedidos.
+    """
+
+    order_id: OrderId
+    customer_id: str
+    from_status: OrderStatus | None
+    to_status: OrderStatus
+    changed_at: datetime
+    total_amount: Money
+
+    @classmethod
+    def from_order(cls, order: Order, previous_status: OrderStatus | None) -> "StatusChange":
+        """
+        Cria a transição a partir do estado atual do pedido.
+
+        Args:
+            order: Pedido já com o novo status
+            previous_status: Status anterior (None na criação)
+
+        Returns:
+            Transição de status
+        """
+        return cls(
+            order_id=order.id,
+            customer_id=order.customer_id,
+            from_status=previous_status,
+            to_status=order.status,
+            changed_at=order.updated_at,
+            total_amount=order.total_amount,
+        )
@@ -1,5 +1,19 @@
 """Exceções do domínio."""
 
-from src.domain.exceptions.order_exceptions import InvalidStatusTransitionError, OrderNotFoundError
+from src.domain.exceptions.customer_exceptions import CustomerNotFoundError
+from src.domain.exceptions.order_exceptions import (
+    InvalidOrderItemError,
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderStatusConflictError,
+    OrderTotalMismatchError,
+)
 
-__all__ = ["InvalidStatusTransitionError", "OrderNotFoundError"]
+__all__ = [
+    "CustomerNotFoundError",
+    "InvalidOrderItemError",
+    "InvalidStatusTransitionError",
+    "OrderNotFoundError",
+    "OrderStatusConflictError",
+    "OrderTotalMismatchError",
+]
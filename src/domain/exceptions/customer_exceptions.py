@@ -0,0 +1,7 @@
+"""Exceções relacionadas a clientes."""
+
+
+class CustomerNotFoundError(Exception):
+    """Exceção lançada quando não há pedidos registrados para um cliente."""
+
+    pass
@@ -11,3 +11,21 @@ class InvalidStatusTransitionError(Exception):
     """Exceção lançada quando uma transição de status é inválida."""
 
     pass
+
+
+class OrderStatusConflictError(Exception):
+    """Exceção lançada quando o status muda repetidamente durante uma atualização."""
+
+    pass
+
+
+class InvalidOrderItemError(ValueError):
+    """Exceção lançada quando um item do pedido é inválido."""
+
+    pass
+
+
+class OrderTotalMismatchError(ValueError):
+    """Exceção lançada quando o total informado diverge do total calculado dos itens."""
+
+    pass
@@ -1,6 +1,21 @@
 """Ports (interfaces) da arquitetura hexagonal."""
 
+from src.domain.ports.customer_summary_port import CustomerSummaryPort
+from src.domain.ports.id_generator_port import OrderIdGeneratorPort
 from src.domain.ports.message_broker_port import MessageBrokerPort
+from src.domain.ports.order_archive_port import OrderArchivePort
+from src.domain.ports.order_history_port import OrderHistoryPort
+from src.domain.ports.order_projection_port import OrderProjectionPort
+from src.domain.ports.order_stats_port import OrderStatsPort
 from src.domain.ports.repository_port import OrderRepositoryPort
 
-__all__ = ["OrderRepositoryPort", "MessageBrokerPort"]
+__all__ = [
+    "OrderRepositoryPort",
+    "MessageBrokerPort",
+    "OrderIdGeneratorPort",
+    "OrderHistoryPort",
+    "OrderProjectionPort",
+    "OrderStatsPort",
+    "CustomerSummaryPort",
+    "OrderArchivePort",
+]
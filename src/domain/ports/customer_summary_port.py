@@ -0,0 +1,36 @@
+"""Port (interface) para o resumo de pedidos por cliente."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class CustomerSummaryPort(ABC):
+    """Interface para leitura e reconstrução do resumo de pedidos de cada cliente."""
+
+    @abstractmethod
+    async def get_summary(self, customer_id: str) -> dict[str, Any] | None:
+        """
+        Busca o resumo de um cliente.
+
+        Args:
+            customer_id: ID do cliente
+
+        Returns:
+            Resumo com `order_count`, `lifetime_spend` (Money por moeda) e
+            `last_order`, ou None se o cliente não tiver pedidos
+        """
+        pass
+
+    @abstractmethod
+    async def rebuild(self, batch_size: int = 500, concurrency: int = 4) -> dict[str, Any]:
+        """
+        Reconstrói todos os resumos a partir da coleção de pedidos.
+
+        Args:
+            batch_size: Clientes por lote
+            concurrency: Lotes processados em paralelo
+
+        Returns:
+            Estatísticas da execução
+        """
+        pass
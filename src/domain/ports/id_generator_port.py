@@ -0,0 +1,19 @@
+"""Port (interface) para geração de IDs de pedido."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.value_objects.order_id import OrderId
+
+
+class OrderIdGeneratorPort(ABC):
+    """Interface para geração de identificadores de pedido."""
+
+    @abstractmethod
+    def new_id(self) -> OrderId:
+        """
+        Gera um novo ID de pedido.
+
+        Returns:
+            ID único do pedido
+        """
+        pass
@@ -1,6 +1,9 @@
 """Port (interface) para broker de mensagens."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.events.status_change import StatusChange
 
 
 class MessageBrokerPort(ABC):
@@ -8,7 +11,11 @@ class MessageBrokerPort(ABC):
 
     @abstractmethod
     async def publish_order_status_updated(
-        self, order_id: str, old_status: str, new_status: str
+        self,
+        order_id: str,
+        old_status: str,
+        new_status: str,
+        customer_id: str | None = None,
     ) -> None:
         """
         Publica evento de atualização de status do pedido.
@@ -17,5 +24,16 @@ class MessageBrokerPort(ABC):
             order_id: ID do pedido
             old_status: Status anterior
             new_status: Novo status
+            customer_id: ID do cliente dono do pedido
+        """
+        pass
+
+    @abstractmethod
+    async def publish_order_status_updates(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Publica de uma vez os eventos de várias transições de status.
+
+        Args:
+            changes: Transições já gravadas
         """
         pass
@@ -0,0 +1,44 @@
+"""Port (interface) para o arquivamento de pedidos."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from datetime import datetime
+
+from src.domain.value_objects.order_status import OrderStatus
+
+
+class OrderArchivePort(ABC):
+    """Interface para mover pedidos encerrados do armazenamento principal para o arquivo."""
+
+    @abstractmethod
+    async def count_archivable(
+        self, statuses: Collection[OrderStatus], updated_before: datetime
+    ) -> int:
+        """
+        Conta os pedidos que podem ser arquivados.
+
+        Args:
+            statuses: Status arquiváveis
+            updated_before: Última atualização anterior a esta data
+
+        Returns:
+            Quantidade de pedidos
+        """
+        pass
+
+    @abstractmethod
+    async def archive_batch(
+        self, statuses: Collection[OrderStatus], updated_before: datetime, batch_size: int
+    ) -> int:
+        """
+        Move um lote de pedidos para o arquivo.
+
+        Args:
+            statuses: Status arquiváveis
+            updated_before: Última atualização anterior a esta data
+            batch_size: Número máximo de pedidos movidos
+
+        Returns:
+            Quantidade de pedidos movidos (0 quando não há mais o que arquivar)
+        """
+        pass
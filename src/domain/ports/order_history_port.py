@@ -0,0 +1,74 @@
+"""Port (interface) para o histórico de status dos pedidos."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+
+from src.domain.events.status_change import StatusChange
+from src.domain.value_objects.order_id import OrderId
+
+
+class OrderHistoryPort(ABC):
+    """Interface para o log append-only de transições de status."""
+
+    @abstractmethod
+    async def append(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Acrescenta transições ao log.
+
+        Args:
+            changes: Transições em ordem cronológica
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_order_id(self, order_id: OrderId) -> list[StatusChange]:
+        """
+        Busca o histórico de um pedido.
+
+        Args:
+            order_id: ID do pedido
+
+        Returns:
+            Transições do pedido em ordem cronológica
+        """
+        pass
+
+    @abstractmethod
+    def iter_batches(
+        self, batch_size: int, after: str | None = None
+    ) -> AsyncIterator[tuple[str, list[StatusChange]]]:
+        """
+        Percorre o log inteiro em lotes, em ordem cronológica.
+
+        Args:
+            batch_size: Número de transições por lote
+            after: Posição a partir da qual continuar (exclusiva)
+
+        Yields:
+            Posição da última transição do lote e as transições do lote
+        """
+        pass
+
+    @abstractmethod
+    async def load_checkpoint(self, name: str) -> str | None:
+        """
+        Lê a última posição processada por um consumidor do log.
+
+        Args:
+            name: Nome do consumidor
+
+        Returns:
+            Posição salva ou None
+        """
+        pass
+
+    @abstractmethod
+    async def save_checkpoint(self, name: str, position: str) -> None:
+        """
+        Salva a última posição processada por um consumidor do log.
+
+        Args:
+            name: Nome do consumidor
+            position: Posição da última transição processada
+        """
+        pass
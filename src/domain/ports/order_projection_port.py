@@ -0,0 +1,25 @@
+"""Port (interface) para modelos de leitura derivados das transições de status."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.events.status_change import StatusChange
+
+
+class OrderProjectionPort(ABC):
+    """Interface para modelos de leitura mantidos incrementalmente."""
+
+    @abstractmethod
+    async def apply(self, changes: Sequence[StatusChange]) -> None:
+        """
+        Aplica um lote de transições ao modelo de leitura.
+
+        Args:
+            changes: Transições em ordem cronológica
+        """
+        pass
+
+    @abstractmethod
+    async def reset(self) -> None:
+        """Apaga o modelo de leitura para reconstrução a partir do histórico."""
+        pass
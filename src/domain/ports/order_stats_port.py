@@ -0,0 +1,44 @@
+"""Port (interface) para os contadores de pedidos."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class OrderStatsPort(ABC):
+    """Interface para leitura e reconciliação dos contadores de pedidos."""
+
+    @abstractmethod
+    async def get_status_counts(self) -> dict[str, int]:
+        """
+        Retorna a quantidade de pedidos em cada status.
+
+        Returns:
+            Contagem por status
+        """
+        pass
+
+    @abstractmethod
+    async def get_daily_counts(self, days: int) -> list[dict[str, Any]]:
+        """
+        Retorna os contadores diários mais recentes.
+
+        Args:
+            days: Número de dias (a partir de hoje, para trás)
+
+        Returns:
+            Um item por dia com pedidos criados e transições por status
+        """
+        pass
+
+    @abstractmethod
+    async def reconcile(self, days: int = 30) -> dict[str, Any]:
+        """
+        Recalcula os contadores a partir dos dados de origem, corrigindo desvios.
+
+        Args:
+            days: Janela de dias dos contadores diários a recalcular
+
+        Returns:
+            Contagens recalculadas e o desvio corrigido por status
+        """
+        pass
@@ -1,9 +1,24 @@
 """Port (interface) para repositório de pedidos."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
 
 from src.domain.entities.order import Order
 from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@dataclass(slots=True)
+class SaveManyResult:
+    """Resultado de uma gravação em lote de pedidos importados."""
+
+    inserted: list[Order] = field(default_factory=list)
+    # Pedidos atualizados e o status que tinham antes da gravação
+    updated: list[tuple[Order, OrderStatus]] = field(default_factory=list)
+    skipped: int = 0
 
 
 class OrderRepositoryPort(ABC):
@@ -22,6 +37,23 @@ class OrderRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, orders: Sequence[Order]) -> SaveManyResult:
+        """
+        Grava vários pedidos importados em uma única operação em lote.
+
+        Pedidos novos são inseridos; existentes só são atualizados se o
+        `updated_at` recebido for mais recente que o gravado. Pedidos arquivados
+        ou com versão gravada igual ou mais nova são ignorados.
+
+        Args:
+            orders: Pedidos a serem gravados
+
+        Returns:
+            Pedidos inseridos, atualizados (com o status anterior) e ignorados
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, order_id: OrderId) -> Order | None:
         """
@@ -34,3 +66,144 @@ class OrderRepositoryPort(ABC):
             Pedido encontrado ou None
         """
         pass
+
+    @abstractmethod
+    async def find_fields_by_id(
+        self, order_id: OrderId, fields: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """
+        Busca apenas alguns campos de um pedido por ID.
+
+        Args:
+            order_id: ID do pedido
+            fields: Campos a retornar (nomes da representação pública do pedido)
+
+        Returns:
+            Dicionário com os campos pedidos ou None
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_product(
+        self,
+        product_id: str,
+        statuses: Sequence[OrderStatus] | None = None,
+        limit: int = 100,
+        after: tuple[datetime, OrderId] | None = None,
+    ) -> list[Order]:
+        """
+        Busca pedidos que contêm um produto, ordenados por (created_at, id).
+
+        Args:
+            product_id: ID do produto
+            statuses: Status aceitos (padrão: todos)
+            limit: Número máximo de pedidos
+            after: Chave (created_at, id) do último pedido da página anterior
+
+        Returns:
+            Pedidos encontrados
+        """
+        pass
+
+    @abstractmethod
+    async def find_stale(
+        self, status: OrderStatus, created_before: datetime, limit: int = 100
+    ) -> list[Order]:
+        """
+        Busca os pedidos mais antigos que continuam em um status.
+
+        Args:
+            status: Status atual dos pedidos
+            created_before: Criados antes desta data
+            limit: Número máximo de pedidos
+
+        Returns:
+            Pedidos em ordem de criação
+        """
+        pass
+
+    @abstractmethod
+    async def transition(
+        self,
+        order_id: OrderId,
+        from_status: OrderStatus,
+        to_status: OrderStatus,
+        changed_at: datetime,
+    ) -> bool:
+        """
+        Muda o status de um pedido, apenas se ele ainda estiver em `from_status`.
+
+        Args:
+            order_id: ID do pedido
+            from_status: Status lido antes da mudança
+            to_status: Novo status
+            changed_at: Momento da transição (gravado em `updated_at`)
+
+        Returns:
+            True se o pedido foi alterado
+        """
+        pass
+
+    @abstractmethod
+    async def transition_many(
+        self,
+        order_ids: Sequence[OrderId],
+        from_status: OrderStatus,
+        to_status: OrderStatus,
+        changed_at: datetime,
+    ) -> list[OrderId]:
+        """
+        Muda o status de vários pedidos, apenas dos que ainda estão em `from_status`.
+
+        Args:
+            order_ids: IDs dos pedidos
+            from_status: Status esperado
+            to_status: Novo status
+            changed_at: Momento da transição (gravado em `updated_at`)
+
+        Returns:
+            IDs dos pedidos efetivamente alterados
+        """
+        pass
+
+    @abstractmethod
+    def iter_orders(
+        self,
+        created_from: datetime,
+        created_to: datetime,
+        statuses: Sequence[OrderStatus] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Order]]:
+        """
+        Percorre os pedidos criados em um intervalo, em lotes e em ordem de criação.
+
+        Args:
+            created_from: Início do intervalo (inclusivo)
+            created_to: Fim do intervalo (exclusivo)
+            statuses: Status aceitos (padrão: todos)
+            batch_size: Número de pedidos por lote
+
+        Yields:
+            Lotes de pedidos
+        """
+        pass
+
+    @abstractmethod
+    def iter_changed_orders(
+        self,
+        updated_from: datetime | None,
+        updated_to: datetime,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[Order]]:
+        """
+        Percorre, em lotes, os pedidos alterados em um intervalo de `updated_at`.
+
+        Args:
+            updated_from: Início do intervalo (inclusivo); None percorre desde o início
+            updated_to: Fim do intervalo (exclusivo)
+            batch_size: Número de pedidos por lote
+
+        Yields:
+            Lotes de pedidos
+        """
+        pass
@@ -0,0 +1,17 @@
+"""Serviços de domínio."""
+
+from src.domain.services.order_pricing import (
+    calculate_items_total,
+    calculate_totals_bulk,
+    check_total,
+    reconcile_total,
+    validate_items,
+)
+
+__all__ = [
+    "calculate_items_total",
+    "calculate_totals_bulk",
+    "check_total",
+    "reconcile_total",
+    "validate_items",
+]
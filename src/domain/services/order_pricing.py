@@ -0,0 +1,181 @@
+"""Validação de itens e cálculo do valor total de pedidos."""
+
+import math
+from array import array
+from collections.abc import Sequence
+from decimal import Decimal
+from itertools import accumulate
+from typing import Any
+
+from src.domain.exceptions import InvalidOrderItemError, OrderTotalMismatchError
+from src.domain.value_objects.money import DEFAULT_EXPONENT, to_minor_units
+
+# Limites por item: com 500 itens no teto, o total em centavos ainda cabe em int64
+MAX_ITEM_QUANTITY = 100_000
+MAX_ITEM_PRICE = 1_000_000_000
+# Moedas com mais casas decimais podem passar do int64 gravado no MongoDB
+MAX_TOTAL_MINOR = 2**63 - 1
+
+
+def validate_items(
+    items: Sequence[dict[str, Any]], exponent: int = DEFAULT_EXPONENT
+) -> list[dict[str, Any]]:
+    """
+    Valida os itens do pedido e descarta campos desconhecidos.
+
+    Args:
+        items: Itens com `product_id`, `quantity` e `price`
+        exponent: Casas decimais da unidade menor da moeda do pedido
+
+    Returns:
+        Itens normalizados
+
+    Raises:
+        InvalidOrderItemError: Se algum item for inválido
+    """
+    if not items:
+        raise InvalidOrderItemError("Pedido deve conter ao menos um item")
+
+    normalized = []
+    for position, item in enumerate(items):
+        try:
+            product_id = item["product_id"]
+            quantity = item["quantity"]
+            price = item["price"]
+        except (KeyError, TypeError) as e:
+            raise InvalidOrderItemError(f"Item {position} incompleto: campo {e} ausente") from e
+
+        if not isinstance(product_id, str) or not product_id:
+            raise InvalidOrderItemError(f"Item {position}: product_id inválido")
+        if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+            raise InvalidOrderItemError(f"Item {position}: quantity deve ser inteiro positivo")
+        if quantity > MAX_ITEM_QUANTITY:
+            raise InvalidOrderItemError(
+                f"Item {position}: quantity deve ser no máximo {MAX_ITEM_QUANTITY}"
+            )
+        if (
+            isinstance(price, bool)
+            or not isinstance(price, int | float | Decimal)
+            or not math.isfinite(price)
+            or price <= 0
+        ):
+            raise InvalidOrderItemError(f"Item {position}: price deve ser positivo")
+        if price > MAX_ITEM_PRICE:
+            raise InvalidOrderItemError(
+                f"Item {position}: price deve ser no máximo {MAX_ITEM_PRICE}"
+            )
+        if to_minor_units(price, exponent) == 0:
+            raise InvalidOrderItemError(f"Item {position}: price abaixo da unidade menor da moeda")
+
+        normalized.append({"product_id": product_id, "quantity": quantity, "price": float(price)})
+
+    return normalized
+
+
+def calculate_items_total(
+    items: Sequence[dict[str, Any]], exponent: int = DEFAULT_EXPONENT
+) -> Decimal:
+    """
+    Calcula o valor total dos itens (quantidade x preço unitário).
+
+    Args:
+        items: Itens já validados
+        exponent: Casas decimais da unidade menor da moeda do pedido
+
+    Returns:
+        Valor total com `exponent` casas decimais
+
+    Raises:
+        InvalidOrderItemError: Se o total arredondado for zero ou passar do limite
+    """
+    minor = sum(to_minor_units(item["price"], exponent) * item["quantity"] for item in items)
+    return check_total(Decimal(minor).scaleb(-exponent), exponent=exponent)
+
+
+def calculate_totals_bulk(
+    orders_items: Sequence[Sequence[dict[str, Any]]], exponents: Sequence[int] | None = None
+) -> list[Decimal]:
+    """
+    Calcula o valor total de muitos pedidos de uma vez.
+
+    Os valores de todas as linhas são achatados em um único `array` de inteiros
+    (unidades menores) e cada pedido é somado pela sua fatia, evitando objetos
+    Decimal intermediários por item. Os totais não passam pelos limites de
+    `check_total`.
+
+    Args:
+        orders_items: Lista com os itens (já validados) de cada pedido
+        exponents: Casas decimais da moeda de cada pedido (padrão: 2 para todos)
+
+    Returns:
+        Valor total de cada pedido, na mesma ordem
+    """
+    if exponents is None:
+        exponents = [DEFAULT_EXPONENT] * len(orders_items)
+    line_amounts = array(
+        "q",
+        (
+            to_minor_units(item["price"], exponent) * item["quantity"]
+            for items, exponent in zip(orders_items, exponents, strict=True)
+            for item in items
+        ),
+    )
+    bounds = list(accumulate((len(items) for items in orders_items), initial=0))
+    return [
+        Decimal(sum(line_amounts[start:end])).scaleb(-exponent)
+        for start, end, exponent in zip(bounds, bounds[1:], exponents, strict=False)
+    ]
+
+
+def check_total(
+    total: Decimal,
+    informed_total: Decimal | float | None = None,
+    exponent: int = DEFAULT_EXPONENT,
+) -> Decimal:
+    """
+    Confere um total calculado: limites e o total informado pelo cliente.
+
+    Args:
+        total: Total calculado a partir dos itens
+        informed_total: Total enviado pelo cliente (opcional)
+        exponent: Casas decimais da unidade menor da moeda do pedido
+
+    Returns:
+        O próprio total
+
+    Raises:
+        InvalidOrderItemError: Se o total for zero ou passar do limite
+        OrderTotalMismatchError: Se o total informado divergir do calculado
+    """
+    minor = int(total.scaleb(exponent))
+    if minor <= 0:
+        raise InvalidOrderItemError("Total do pedido deve ser maior que zero")
+    if minor > MAX_TOTAL_MINOR:
+        raise InvalidOrderItemError("Total do pedido excede o limite")
+    if informed_total is not None and to_minor_units(informed_total, exponent) != minor:
+        raise OrderTotalMismatchError(
+            f"Total informado {informed_total} difere do total dos itens {total}"
+        )
+    return total
+
+
+def reconcile_total(
+    items: Sequence[dict[str, Any]],
+    informed_total: Decimal | float | None = None,
+    exponent: int = DEFAULT_EXPONENT,
+) -> Decimal:
+    """
+    Calcula o total dos itens e confere com o total informado pelo cliente.
+
+    Args:
+        items: Itens já validados
+        informed_total: Total enviado pelo cliente (opcional)
+        exponent: Casas decimais da unidade menor da moeda do pedido
+
+    Returns:
+        Total calculado no servidor
+
+    Raises:
+        OrderTotalMismatchError: Se o total informado divergir do calculado
+    """
+    return check_total(calculate_items_total(items, exponent), informed_total, exponent)
@@ -1,7 +1,7 @@
 """Value objects do domínio."""
 
-from src.domain.value_objects.money import Money
+from src.domain.value_objects.money import Money, totals_by_currency
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.order_status import OrderStatus
 
-__all__ = ["Money", "OrderId", "OrderStatus"]
+__all__ = ["Money", "OrderId", "OrderStatus", "totals_by_currency"]
@@ -1,10 +1,58 @@
 """Value object para valores monetários."""
 
-from decimal import Decimal
+from collections.abc import Iterable
+from decimal import ROUND_HALF_UP, Decimal
+from types import MappingProxyType
+
+# Casas decimais da unidade menor de cada moeda (ISO 4217)
+CURRENCY_EXPONENTS = MappingProxyType(
+    {"BRL": 2, "USD": 2, "EUR": 2, "GBP": 2, "ARS": 2, "JPY": 0, "CLP": 0, "KWD": 3, "BHD": 3}
+)
+DEFAULT_EXPONENT = 2
+
+
+def currency_exponent(currency: str) -> int:
+    """
+    Retorna o número de casas decimais da unidade menor da moeda.
+
+    Args:
+        currency: Código da moeda
+
+    Returns:
+        Expoente da unidade menor (ex.: 2 para centavos)
+    """
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
+
+def to_minor_units(amount: Decimal | float | int, exponent: int = DEFAULT_EXPONENT) -> int:
+    """
+    Converte um valor em unidades da moeda para unidades menores (ex.: centavos).
+
+    Frações abaixo da unidade menor são arredondadas (ROUND_HALF_UP).
+
+    Args:
+        amount: Valor em unidades da moeda
+        exponent: Casas decimais da unidade menor
+
+    Returns:
+        Valor inteiro em unidades menores
+    """
+    amount_type = type(amount)
+    if amount_type is int:
+        return amount * 10**exponent
+    if amount_type is float:
+        # repr() dá o decimal mais curto que representa o float (19.99, não
+        # 19.989999...), que então segue o mesmo arredondamento do Decimal
+        amount = Decimal(repr(amount))
+    elif amount_type is not Decimal:
+        amount = Decimal(str(amount))
+    return int(amount.scaleb(exponent).to_integral_value(ROUND_HALF_UP))
 
 
 class Money:
-    """Representa um valor monetário."""
+    """Representa um valor monetário, armazenado como inteiro em unidades menores."""
+
+    __slots__ = ("_minor", "_currency")
 
     def __init__(self, amount: Decimal | float | int, currency: str = "BRL") -> None:
         """
@@ -14,15 +62,62 @@ class Money:
             amount: Valor numérico
             currency: Moeda (padrão: BRL)
         """
-        if amount < 0:
+        minor = to_minor_units(amount, currency_exponent(currency))
+        if minor < 0:
             raise ValueError("Valor monetário não pode ser negativo")
-        self._amount = Decimal(str(amount))
+        self._minor = minor
         self._currency = currency
 
+    @classmethod
+    def from_minor(cls, minor_units: int, currency: str = "BRL") -> "Money":
+        """
+        Cria um valor a partir de unidades menores, sem conversões.
+
+        Args:
+            minor_units: Valor inteiro em unidades menores
+            currency: Moeda (padrão: BRL)
+
+        Returns:
+            Novo valor monetário
+        """
+        if minor_units < 0:
+            raise ValueError("Valor monetário não pode ser negativo")
+        money = object.__new__(cls)
+        money._minor = minor_units
+        money._currency = currency
+        return money
+
+    @classmethod
+    def sum(cls, values: Iterable["Money"], currency: str = "BRL") -> "Money":
+        """
+        Soma muitos valores de uma vez, operando apenas sobre inteiros.
+
+        Args:
+            values: Valores monetários
+            currency: Moeda esperada de todos os valores
+
+        Returns:
+            Soma dos valores
+
+        Raises:
+            ValueError: Se algum valor estiver em outra moeda
+        """
+        total = 0
+        for value in values:
+            if value._currency != currency:
+                raise ValueError("Não é possível somar valores de moedas diferentes")
+            total += value._minor
+        return cls.from_minor(total, currency)
+
     @property
     def amount(self) -> Decimal:
         """Retorna o valor numérico."""
-        return self._amount
+        return Decimal(self._minor).scaleb(-currency_exponent(self._currency))
+
+    @property
+    def minor_units(self) -> int:
+        """Retorna o valor em unidades menores (ex.: centavos)."""
+        return self._minor
 
     @property
     def currency(self) -> str:
@@ -33,18 +128,42 @@ class Money:
         """Compara dois valores monetários."""
         if not isinstance(other, Money):
             return False
-        return self._amount == other._amount and self._currency == other._currency
+        return self._minor == other._minor and self._currency == other._currency
+
+    def __hash__(self) -> int:
+        """Hash consistente com a igualdade."""
+        return hash((self._minor, self._currency))
 
     def __repr__(self) -> str:
         """Representação string do objeto."""
-        return f"Money(amount={self._amount}, currency={self._currency})"
+        return f"Money(amount={self.amount}, currency={self._currency})"
 
     def __add__(self, other: "Money") -> "Money":
         """Soma dois valores monetários."""
         if self._currency != other._currency:
             raise ValueError("Não é possível somar valores de moedas diferentes")
-        return Money(self._amount + other._amount, self._currency)
+        return Money.from_minor(self._minor + other._minor, self._currency)
 
     def __mul__(self, factor: int | float) -> "Money":
         """Multiplica o valor por um fator."""
-        return Money(self._amount * Decimal(str(factor)), self._currency)
+        if isinstance(factor, int):
+            return Money.from_minor(self._minor * factor, self._currency)
+        product = Decimal(self._minor) * Decimal(str(factor))
+        return Money.from_minor(int(product.to_integral_value(ROUND_HALF_UP)), self._currency)
+
+
+def totals_by_currency(values: Iterable[Money]) -> dict[str, Money]:
+    """
+    Agrega valores de moedas variadas em um total por moeda.
+
+    Args:
+        values: Valores monetários
+
+    Returns:
+        Total de cada moeda
+    """
+    totals: dict[str, int] = {}
+    for value in values:
+        currency = value.currency
+        totals[currency] = totals.get(currency, 0) + value.minor_units
+    return {currency: Money.from_minor(minor, currency) for currency, minor in totals.items()}
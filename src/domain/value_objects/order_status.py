@@ -1,6 +1,8 @@
 """Value object para status do pedido."""
 
+from collections.abc import Iterable, Mapping
 from enum import Enum
+from types import MappingProxyType
 
 
 class OrderStatus(str, Enum):
@@ -24,15 +26,7 @@ class OrderStatus(str, Enum):
         Returns:
             Lista de status válidos para transição
         """
-        transitions = {
-            cls.PENDING: [cls.CONFIRMED, cls.CANCELLED],
-            cls.CONFIRMED: [cls.PROCESSING, cls.CANCELLED],
-            cls.PROCESSING: [cls.SHIPPED, cls.CANCELLED],
-            cls.SHIPPED: [cls.DELIVERED],
-            cls.DELIVERED: [],
-            cls.CANCELLED: [],
-        }
-        return transitions.get(current_status, [])
+        return list(_ORDERED_TRANSITIONS.get(current_status, ()))
 
     def can_transition_to(self, new_status: "OrderStatus") -> bool:
         """
@@ -44,4 +38,84 @@ class OrderStatus(str, Enum):
         Returns:
             True se a transição é válida, False caso contrário
         """
-        return new_status in self.get_valid_transitions(self)
+        return new_status in _TRANSITIONS[self]
+
+    @property
+    def is_terminal(self) -> bool:
+        """Indica se o status não admite novas transições."""
+        return self in _TERMINAL_STATES
+
+    @classmethod
+    def terminal_states(cls) -> frozenset["OrderStatus"]:
+        """
+        Retorna os status terminais.
+
+        Returns:
+            Conjunto de status sem transições de saída
+        """
+        return _TERMINAL_STATES
+
+    def reachable_terminal_states(self) -> frozenset["OrderStatus"]:
+        """
+        Retorna os status terminais alcançáveis a partir deste status.
+
+        Returns:
+            Conjunto de status terminais (o próprio status, se for terminal)
+        """
+        return _REACHABLE_TERMINALS[self]
+
+    @classmethod
+    def validate_transitions(
+        cls, transitions: Iterable[tuple["OrderStatus", "OrderStatus"]]
+    ) -> list[bool]:
+        """
+        Valida um lote de transições de uma vez.
+
+        Args:
+            transitions: Pares (status atual, novo status)
+
+        Returns:
+            Para cada par, True se a transição é válida
+        """
+        table = _TRANSITIONS
+        return [new in table[current] for current, new in transitions]
+
+
+# Máquina de estados compilada uma única vez no import: tuplas preservam a ordem
+# documentada e frozensets dão verificação O(1) no caminho quente.
+_ORDERED_TRANSITIONS: Mapping[OrderStatus, tuple[OrderStatus, ...]] = MappingProxyType(
+    {
+        OrderStatus.PENDING: (OrderStatus.CONFIRMED, OrderStatus.CANCELLED),
+        OrderStatus.CONFIRMED: (OrderStatus.PROCESSING, OrderStatus.CANCELLED),
+        OrderStatus.PROCESSING: (OrderStatus.SHIPPED, OrderStatus.CANCELLED),
+        OrderStatus.SHIPPED: (OrderStatus.DELIVERED,),
+        OrderStatus.DELIVERED: (),
+        OrderStatus.CANCELLED: (),
+    }
+)
+
+_TRANSITIONS: Mapping[OrderStatus, frozenset[OrderStatus]] = MappingProxyType(
+    {status: frozenset(targets) for status, targets in _ORDERED_TRANSITIONS.items()}
+)
+
+_TERMINAL_STATES: frozenset[OrderStatus] = frozenset(
+    status for status, targets in _TRANSITIONS.items() if not targets
+)
+
+
+def _compute_reachable_terminals(status: OrderStatus) -> frozenset[OrderStatus]:
+    """Percorre o grafo de transições a partir de um status."""
+    seen: set[OrderStatus] = set()
+    pending = [status]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        pending.extend(_TRANSITIONS[current])
+    return frozenset(seen & _TERMINAL_STATES)
+
+
+_REACHABLE_TERMINALS: Mapping[OrderStatus, frozenset[OrderStatus]] = MappingProxyType(
+    {status: _compute_reachable_terminals(status) for status in OrderStatus}
+)
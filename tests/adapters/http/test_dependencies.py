@@ -21,37 +21,66 @@ def mock_container():
     # Salvar valores originais
     original_repo = container._repository
     original_broker = container._message_broker
+    original_history = container._history
+    original_stats = container._stats
+    original_summaries = container._customer_summaries
 
     # Configurar mocks
     container._repository = mock_repo
     container._message_broker = mock_broker
+    container._history = MagicMock()
+    container._stats = MagicMock()
+    container._customer_summaries = MagicMock()
+    container._build_use_cases()
 
     yield container
 
     # Restaurar valores originais
     container._repository = original_repo
     container._message_broker = original_broker
-
-
-def test_get_create_order_use_case(mock_container):
+    container._history = original_history
+    container._stats = original_stats
+    container._customer_summaries = original_summaries
+    container._create_order_use_case = None
+    container._get_order_use_case = None
+    container._get_order_history_use_case = None
+    container._get_order_stats_use_case = None
+    container._get_customer_summary_use_case = None
+    container._list_orders_by_product_use_case = None
+    container._export_orders_use_case = None
+    container._update_order_status_use_case = None
+
+
+@pytest.mark.asyncio
+async def test_get_create_order_use_case(mock_container):
     """Testa get_create_order_use_case."""
-    use_case = get_create_order_use_case()
+    use_case = await get_create_order_use_case()
 
     assert use_case is not None
     assert hasattr(use_case, "execute")
 
 
-def test_get_get_order_use_case(mock_container):
+@pytest.mark.asyncio
+async def test_get_get_order_use_case(mock_container):
     """Testa get_get_order_use_case."""
-    use_case = get_get_order_use_case()
+    use_case = await get_get_order_use_case()
 
     assert use_case is not None
     assert hasattr(use_case, "execute")
 
 
-def test_get_update_order_status_use_case(mock_container):
+@pytest.mark.asyncio
+async def test_get_update_order_status_use_case(mock_container):
     """Testa get_update_order_status_use_case."""
-    use_case = get_update_order_status_use_case()
+    use_case = await get_update_order_status_use_case()
 
     assert use_case is not None
     assert hasattr(use_case, "execute")
+
+
+@pytest.mark.asyncio
+async def test_dependencies_return_singletons(mock_container):
+    """Testa que as dependências devolvem sempre a mesma instância."""
+    assert await get_create_order_use_case() is await get_create_order_use_case()
+    assert await get_get_order_use_case() is await get_get_order_use_case()
+    assert await get_update_order_status_use_case() is await get_update_order_status_use_case()
@@ -6,6 +6,7 @@ import pytest
 from pydantic import ValidationError
 
 from src.adapters.http.schemas import (
+    MAX_ORDER_ITEMS,
     CreateOrderRequest,
     MoneySchema,
     OrderResponse,
@@ -33,15 +34,48 @@ def test_create_order_request():
     """Testa CreateOrderRequest."""
     request = CreateOrderRequest(
         customer_id="customer-123",
-        items=[{"product_id": "prod-1", "quantity": 2}],
+        items=[{"product_id": "prod-1", "quantity": 2, "price": 50.0}],
         total_amount=100.0,
     )
 
     assert request.customer_id == "customer-123"
     assert len(request.items) == 1
+    assert request.items[0].quantity == 2
     assert request.total_amount == 100.0
 
 
+def test_create_order_request_total_optional():
+    """Testa CreateOrderRequest sem total informado."""
+    request = CreateOrderRequest(
+        customer_id="customer-123",
+        items=[{"product_id": "prod-1", "quantity": 2, "price": 50.0}],
+    )
+
+    assert request.total_amount is None
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"product_id": "prod-1", "quantity": 2},
+        {"product_id": "prod-1", "quantity": 0, "price": 50.0},
+        {"product_id": "", "quantity": 1, "price": 50.0},
+        {"product_id": "prod-1", "quantity": 1, "price": 50.0, "blob": "x" * 1000},
+    ],
+)
+def test_create_order_request_invalid_item(item):
+    """Testa que itens malformados são rejeitados."""
+    with pytest.raises(ValidationError):
+        CreateOrderRequest(customer_id="customer-123", items=[item])
+
+
+def test_create_order_request_too_many_items():
+    """Testa o limite de itens por pedido."""
+    item = {"product_id": "prod-1", "quantity": 1, "price": 1.0}
+    with pytest.raises(ValidationError):
+        CreateOrderRequest(customer_id="customer-123", items=[item] * (MAX_ORDER_ITEMS + 1))
+
+
 def test_create_order_request_validation():
     """Testa validação de CreateOrderRequest."""
     with pytest.raises(ValidationError):
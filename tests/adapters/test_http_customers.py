@@ -0,0 +1,72 @@
+"""Testes para os endpoints de clientes."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.http.customers import router
+from src.adapters.http.dependencies import get_get_customer_summary_use_case
+from src.adapters.http.exception_handlers import register_exception_handlers
+from src.domain.exceptions import CustomerNotFoundError
+from src.domain.value_objects.money import Money
+
+
+@pytest.fixture
+def use_case():
+    """Cria mock do caso de uso de resumo."""
+    return MagicMock()
+
+
+@pytest.fixture
+def client(use_case):
+    """Cria cliente de teste com dependências mockadas."""
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+    app.dependency_overrides[get_get_customer_summary_use_case] = lambda: use_case
+    return TestClient(app)
+
+
+def test_get_customer_summary(client, use_case):
+    """Testa resumo de cliente."""
+    use_case.execute = AsyncMock(
+        return_value={
+            "customer_id": "customer-1",
+            "order_count": 3,
+            "lifetime_spend": [Money.from_minor(15050)],
+            "last_order": {
+                "order_id": "order-3",
+                "status": "shipped",
+                "created_at": datetime(2024, 1, 2),
+            },
+            "updated_at": datetime(2024, 1, 3),
+        }
+    )
+
+    response = client.get("/customers/customer-1/summary")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "customer_id": "customer-1",
+        "order_count": 3,
+        "lifetime_spend": [{"amount": 150.5, "currency": "BRL"}],
+        "last_order": {
+            "order_id": "order-3",
+            "status": "shipped",
+            "created_at": "2024-01-02T00:00:00",
+        },
+        "updated_at": "2024-01-03T00:00:00",
+    }
+
+
+def test_get_customer_summary_not_found(client, use_case):
+    """Testa cliente sem pedidos."""
+    use_case.execute = AsyncMock(side_effect=CustomerNotFoundError("sem pedidos"))
+
+    response = client.get("/customers/customer-1/summary")
+
+    assert response.status_code == 404
+    assert response.json()["error_type"] == "CustomerNotFoundError"
@@ -0,0 +1,125 @@
+"""Testes para os endpoints de diagnóstico de memória."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.http.dependencies import get_memory_diagnostics
+from src.adapters.http.diagnostics import router
+from src.adapters.http.exception_handlers import register_exception_handlers
+from src.app.config import settings
+from src.app.memory_diagnostics import MemoryDiagnostics
+from src.domain.value_objects.money import Money
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def diagnostics():
+    """Diagnóstico isolado, com tracemalloc desligado ao final."""
+    diagnostics = MemoryDiagnostics(tracked_types=(Money,))
+    yield diagnostics
+    diagnostics.stop()
+
+
+@pytest.fixture
+def client(diagnostics):
+    """Cliente de teste com token administrativo configurado."""
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(router)
+    app.dependency_overrides[get_memory_diagnostics] = lambda: diagnostics
+    with patch.object(settings, "admin_token", "secret"):
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_requires_admin_token(client, headers):
+    """Testa que os endpoints exigem o token administrativo."""
+    response = client.get("/admin/memory", headers=headers)
+
+    assert response.status_code == 403
+
+
+def test_disabled_without_configured_token(diagnostics):
+    """Testa que sem ADMIN_TOKEN nenhum token é aceito."""
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).get("/admin/memory", headers=ADMIN)
+
+    assert response.status_code == 403
+
+
+def test_snapshot_flow(client):
+    """Testa início do rastreamento, snapshots, top e diff."""
+    assert client.post("/admin/memory/start", headers=ADMIN).json()["tracing"] is True
+
+    first = client.post("/admin/memory/snapshots", headers=ADMIN)
+    second = client.post("/admin/memory/snapshots?limit=3", headers=ADMIN)
+    assert first.status_code == 201
+    assert len(second.json()["top"]) <= 3
+
+    first_id, second_id = first.json()["id"], second.json()["id"]
+    top = client.get(f"/admin/memory/snapshots/{second_id}?key_type=filename", headers=ADMIN)
+    assert top.status_code == 200
+
+    diff = client.get(f"/admin/memory/snapshots/{second_id}/diff?base={first_id}", headers=ADMIN)
+    assert diff.json()["base"]["id"] == first_id
+
+    status = client.get("/admin/memory", headers=ADMIN).json()
+    assert [snapshot["id"] for snapshot in status["snapshots"]] == [first_id, second_id]
+
+    assert client.post("/admin/memory/stop", headers=ADMIN).json()["snapshots"] == []
+
+
+def test_snapshot_without_tracing(client):
+    """Testa snapshot sem tracemalloc ativo."""
+    response = client.post("/admin/memory/snapshots", headers=ADMIN)
+
+    assert response.status_code == 400
+
+
+def test_unknown_snapshot(client):
+    """Testa snapshot inexistente."""
+    response = client.get("/admin/memory/snapshots/99", headers=ADMIN)
+
+    assert response.status_code == 404
+    assert response.json()["error_type"] == "SnapshotNotFoundError"
+
+
+def test_invalid_key_type(client):
+    """Testa agrupamento inválido."""
+    response = client.get("/admin/memory/snapshots/1?key_type=module", headers=ADMIN)
+
+    assert response.status_code == 422
+
+
+def test_object_counts(client):
+    """Testa contagem de objetos."""
+    response = client.get("/admin/memory/objects", headers=ADMIN)
+
+    assert response.status_code == 200
+    assert "Money" in response.json()["objects"]
+
+
+def test_object_counts_runs_off_event_loop(client, diagnostics):
+    """Testa que a varredura do coletor de lixo não roda no event loop."""
+    loops = []
+    original = diagnostics.object_counts
+
+    def object_counts():
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return original()
+
+    with patch.object(diagnostics, "object_counts", object_counts):
+        response = client.get("/admin/memory/objects", headers=ADMIN)
+
+    assert response.status_code == 200
+    assert loops == [None]
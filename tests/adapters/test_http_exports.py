@@ -0,0 +1,114 @@
+"""Testes para o endpoint de exportação de pedidos."""
+
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.http.dependencies import get_export_orders_use_case
+from src.adapters.http.exception_handlers import register_exception_handlers
+from src.adapters.http.exports import ndjson_chunks, router
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+PARAMS = {"created_from": "2024-01-01T00:00:00", "created_to": "2024-01-02T00:00:00"}
+
+
+def _order(index):
+    """Cria um pedido de exemplo."""
+    return Order(
+        order_id=OrderId(f"order-{index}"),
+        customer_id="customer-1",
+        items=[{"product_id": "prod-1", "quantity": 1, "price": 10.0}],
+        total_amount=Money(10),
+        created_at=datetime(2024, 1, 1, 12, index),
+    )
+
+
+async def _batches(*batches):
+    """Gera os lotes informados."""
+    for batch in batches:
+        yield batch
+
+
+@pytest.fixture
+def repository():
+    """Cria mock do repositório com dois lotes."""
+    repository = MagicMock()
+    repository.iter_orders = MagicMock(
+        side_effect=lambda *args: _batches([_order(0), _order(1)], [_order(2)])
+    )
+    return repository
+
+
+@pytest.fixture
+def client(repository):
+    """Cria cliente de teste com o caso de uso real sobre o repositório mockado."""
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+    app.dependency_overrides[get_export_orders_use_case] = lambda: ExportOrdersUseCase(repository)
+    return TestClient(app)
+
+
+def test_export_orders_ndjson(client, repository):
+    """Testa exportação em NDJSON com filtro de status."""
+    response = client.get("/orders/export", params={**PARAMS, "status": "pending"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "attachment" in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["order-0", "order-1", "order-2"]
+    assert lines[0]["total_amount"] == {"amount": 10.0, "currency": "BRL"}
+    args = repository.iter_orders.call_args.args
+    assert args[2] == [OrderStatus.PENDING]
+    assert args[3] == 1000
+
+
+def test_export_orders_gzip(client):
+    """Testa exportação comprimida."""
+    response = client.get("/orders/export", params={**PARAMS, "gzip": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    # O cliente HTTP descomprime de forma transparente
+    assert len(response.text.splitlines()) == 3
+
+
+def test_export_orders_invalid_range(client, repository):
+    """Testa intervalo invertido."""
+    response = client.get(
+        "/orders/export",
+        params={"created_from": PARAMS["created_to"], "created_to": PARAMS["created_from"]},
+    )
+
+    assert response.status_code == 400
+    repository.iter_orders.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks_gzip_stream():
+    """Testa que o stream gzip é um arquivo válido, com um chunk por lote."""
+    chunks = [
+        chunk async for chunk in ndjson_chunks(_batches([_order(0)], [_order(1)]), compress=True)
+    ]
+
+    lines = gzip.decompress(b"".join(chunks)).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["order-0", "order-1"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks_plain_one_chunk_per_batch():
+    """Testa um chunk por lote sem compressão."""
+    chunks = [chunk async for chunk in ndjson_chunks(_batches([_order(0), _order(1)], [_order(2)]))]
+
+    assert len(chunks) == 2
+    assert chunks[0].count(b"\n") == 2
@@ -1,10 +1,13 @@
 """Testes para endpoint de healthcheck."""
 
+from unittest.mock import patch
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.adapters.http.health import router
+from src.app.container import container
 
 app = FastAPI()
 app.include_router(router)
@@ -22,3 +25,31 @@ def test_health_check(client):
 
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_readiness_not_initialized(client):
+    """Testa readiness sem container inicializado."""
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+
+
+def test_readiness_ready(client):
+    """Testa readiness com dependências disponíveis."""
+    snapshot = {"status": "ready", "mongodb": {"status": "up", "latency_ms": 1.0}}
+    with patch.object(container, "get_readiness_snapshot", return_value=snapshot):
+        response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == snapshot
+
+
+def test_jobs_status(client):
+    """Testa estado dos jobs periódicos."""
+    jobs = {"archive_orders": {"runs": 1, "last_error": None}}
+    with patch.object(container, "get_jobs_snapshot", return_value=jobs):
+        response = client.get("/jobs")
+
+    assert response.status_code == 200
+    assert response.json() == {"jobs": jobs}
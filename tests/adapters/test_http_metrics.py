@@ -0,0 +1,37 @@
+"""Testes para o endpoint de métricas."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.http.exception_handlers import register_exception_handlers
+from src.adapters.http.metrics import router
+from src.domain.exceptions import OrderNotFoundError
+
+app = FastAPI()
+app.include_router(router)
+register_exception_handlers(app)
+
+
+@app.get("/missing")
+async def missing() -> dict:
+    """Lança pedido não encontrado."""
+    raise OrderNotFoundError("Pedido x não encontrado")
+
+
+def test_metrics_exposition():
+    """Testa formato de exposição e métricas registradas."""
+    client = TestClient(app)
+    client.get("/missing")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "order_service_use_case_duration_seconds" in body
+    assert "order_service_mongo_operation_duration_seconds" in body
+    assert "order_service_publish_duration_seconds" in body
+    assert "order_service_mongo_pool_checked_out_connections" in body
+    assert (
+        'order_service_http_errors_total{error_type="OrderNotFoundError",status_code="404"}' in body
+    )
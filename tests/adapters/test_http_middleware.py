@@ -0,0 +1,101 @@
+"""Testes para middlewares HTTP."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.http.exception_handlers import register_exception_handlers
+from src.adapters.http.middleware import CorrelationIDMiddleware, DeadlineMiddleware
+from src.application.deadline import check_deadline, remaining_seconds
+
+app = FastAPI()
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout_ms=2000,
+    max_timeout_ms=5000,
+    route_timeouts_ms={"/slow": 4000, "/stream": 0},
+)
+app.add_middleware(CorrelationIDMiddleware)
+register_exception_handlers(app)
+
+
+@app.get("/remaining")
+async def remaining() -> dict:
+    """Retorna o tempo restante do deadline."""
+    return {"remaining": remaining_seconds()}
+
+
+@app.get("/slow/remaining")
+async def slow_remaining() -> dict:
+    """Retorna o tempo restante em rota com timeout próprio."""
+    return {"remaining": remaining_seconds()}
+
+
+@app.get("/stream/remaining")
+async def stream_remaining() -> dict:
+    """Retorna o tempo restante em rota sem deadline."""
+    return {"remaining": remaining_seconds()}
+
+
+@app.get("/expired")
+async def expired() -> dict:
+    """Simula uma operação após o deadline."""
+    await asyncio.sleep(0.01)
+    check_deadline("operacao lenta")
+    return {}
+
+
+@pytest.fixture
+def client():
+    """Cria cliente de teste."""
+    return TestClient(app)
+
+
+def test_correlation_id_is_propagated(client):
+    """Testa que o correlation ID do header é devolvido na resposta."""
+    response = client.get("/remaining", headers={"X-Correlation-ID": "abc-123"})
+
+    assert response.headers["X-Correlation-ID"] == "abc-123"
+
+
+def test_default_deadline(client):
+    """Testa que o deadline padrão é aplicado."""
+    remaining = client.get("/remaining").json()["remaining"]
+
+    assert 0 < remaining <= 2.0
+
+
+def test_route_deadline(client):
+    """Testa que o timeout por rota substitui o padrão."""
+    remaining = client.get("/slow/remaining").json()["remaining"]
+
+    assert 2.0 < remaining <= 4.0
+
+
+def test_route_without_deadline(client):
+    """Testa que timeout zero desativa o deadline da rota."""
+    assert client.get("/stream/remaining").json()["remaining"] is None
+
+
+def test_header_deadline_is_capped(client):
+    """Testa que o timeout pedido pelo cliente respeita o teto."""
+    response = client.get("/remaining", headers={"X-Request-Timeout-Ms": "60000"})
+
+    assert 2.0 < response.json()["remaining"] <= 5.0
+
+
+def test_invalid_header_falls_back_to_default(client):
+    """Testa que header inválido usa o timeout padrão."""
+    response = client.get("/remaining", headers={"X-Request-Timeout-Ms": "abc"})
+
+    assert 0 < response.json()["remaining"] <= 2.0
+
+
+def test_expired_deadline_returns_504(client):
+    """Testa que deadline expirado vira 504."""
+    response = client.get("/expired", headers={"X-Request-Timeout-Ms": "1"})
+
+    assert response.status_code == 504
+    assert response.json()["error_type"] == "DeadlineExceededError"
@@ -0,0 +1,64 @@
+"""Testes para endpoints SSE de eventos de pedidos."""
+
+import asyncio
+
+import pytest
+
+from src.adapters.http.order_events import stream_customer_order_events, stream_order_events
+from src.adapters.messaging.order_event_hub import OrderEventHub
+
+EVENT = {"order_id": "order-1", "customer_id": "customer-1", "event_type": "order.status_updated"}
+
+
+@pytest.mark.asyncio
+async def test_stream_order_events():
+    """Testa stream SSE de um pedido."""
+    hub = OrderEventHub()
+
+    response = await stream_order_events("order-1", hub)
+    body = response.body_iterator
+
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache"
+    assert await body.__anext__() == b"retry: 3000\n\n"
+
+    hub.publish(EVENT)
+    assert (await body.__anext__()).startswith(b"event: order.status_updated")
+
+    await body.aclose()
+    assert hub.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_customer_order_events():
+    """Testa stream SSE dos pedidos de um cliente."""
+    hub = OrderEventHub()
+
+    response = await stream_customer_order_events("customer-1", hub)
+    body = response.body_iterator
+    await body.__anext__()
+
+    hub.publish(EVENT)
+    assert b'"customer_id": "customer-1"' in await body.__anext__()
+
+    await body.aclose()
+    assert hub.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_unsubscribes_on_early_disconnect():
+    """Testa que a assinatura é removida quando o cliente sai antes do primeiro frame."""
+    hub = OrderEventHub()
+    response = await stream_order_events("order-1", hub)
+    assert hub.subscriber_count == 1
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        # O cliente sai enquanto os cabeçalhos ainda estão sendo enviados
+        await asyncio.Event().wait()
+
+    await response({"type": "http"}, receive, send)
+
+    assert hub.subscriber_count == 0
@@ -0,0 +1,77 @@
+"""Testes para o middleware de profiling."""
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pyinstrument")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.adapters.http.middleware import ProfilingMiddleware  # noqa: E402
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def _client(tmp_path, sample_rate: float = 0.0) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        ProfilingMiddleware,
+        admin_token="secret",
+        sample_rate=sample_rate,
+        output_dir=str(tmp_path),
+    )
+
+    @app.get("/orders/{order_id}")
+    async def get_order(order_id: str) -> dict:
+        return {"id": order_id}
+
+    return TestClient(app)
+
+
+def test_not_profiled_by_default(tmp_path):
+    """Testa que requisições comuns não são perfiladas."""
+    response = _client(tmp_path).get("/orders/1")
+
+    assert response.json() == {"id": "1"}
+    assert "X-Profile-File" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_profile_header_requires_admin_token(tmp_path, headers):
+    """Testa que X-Profile exige o token administrativo."""
+    response = _client(tmp_path).get("/orders/1", headers={"X-Profile": "1", **headers})
+
+    assert response.status_code == 403
+
+
+def test_profile_saved_to_directory(tmp_path):
+    """Testa profile gravado e informado no header."""
+    response = _client(tmp_path).get("/orders/1", headers={"X-Profile": "1", **ADMIN})
+
+    assert response.json() == {"id": "1"}
+    (profile,) = tmp_path.iterdir()
+    assert response.headers["X-Profile-File"] == profile.name
+
+
+def test_profile_returned_inline(tmp_path):
+    """Testa profile devolvido no lugar da resposta."""
+    response = _client(tmp_path).get(
+        "/orders/1", headers={"X-Profile": "1", "X-Profile-Output": "inline", **ADMIN}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["X-Profile-Status"] == "200"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sampled_requests_are_saved(tmp_path):
+    """Testa profile por amostragem, sem header na resposta."""
+    with patch("src.adapters.http.middleware.random.random", return_value=0.0):
+        response = _client(tmp_path, sample_rate=0.5).get("/orders/1")
+
+    assert "X-Profile-File" not in response.headers
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,258 @@
+"""Testes para routers de pedidos."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.http.dependencies import (
+    get_get_order_history_use_case,
+    get_get_order_stats_use_case,
+    get_get_order_use_case,
+    get_list_orders_by_product_use_case,
+)
+from src.adapters.http.exception_handlers import register_exception_handlers
+from src.adapters.http.routers import router
+from src.adapters.http.schemas import decode_order_cursor, encode_order_cursor
+from src.domain.events.status_change import StatusChange
+from src.domain.exceptions import OrderNotFoundError
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@pytest.fixture
+def get_order_use_case():
+    """Cria mock do caso de uso de busca."""
+    return MagicMock()
+
+
+@pytest.fixture
+def get_order_history_use_case():
+    """Cria mock do caso de uso de histórico."""
+    return MagicMock()
+
+
+@pytest.fixture
+def get_order_stats_use_case():
+    """Cria mock do caso de uso de contadores."""
+    return MagicMock()
+
+
+@pytest.fixture
+def list_orders_by_product_use_case():
+    """Cria mock do caso de uso de pedidos por produto."""
+    return MagicMock()
+
+
+@pytest.fixture
+def client(
+    get_order_use_case,
+    get_order_history_use_case,
+    get_order_stats_use_case,
+    list_orders_by_product_use_case,
+):
+    """Cria cliente de teste com dependências mockadas."""
+    app = FastAPI()
+    app.include_router(router)
+    register_exception_handlers(app)
+    app.dependency_overrides[get_get_order_use_case] = lambda: get_order_use_case
+    app.dependency_overrides[get_get_order_history_use_case] = lambda: get_order_history_use_case
+    app.dependency_overrides[get_get_order_stats_use_case] = lambda: get_order_stats_use_case
+    app.dependency_overrides[get_list_orders_by_product_use_case] = (
+        lambda: list_orders_by_product_use_case
+    )
+    return TestClient(app)
+
+
+def test_get_order(client, get_order_use_case, sample_order):
+    """Testa busca de pedido completo."""
+    get_order_use_case.execute = AsyncMock(return_value=sample_order)
+
+    response = client.get("/orders/test-order-123")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == "test-order-123"
+    assert body["items"] == [{"product_id": "prod-1", "quantity": 2, "price": 50.0}]
+
+
+def test_get_order_with_fields(client, get_order_use_case):
+    """Testa busca com sparse fieldset."""
+    updated_at = datetime(2024, 1, 1, 12, 0, 0)
+    get_order_use_case.execute_fields = AsyncMock(
+        return_value={"id": "order-1", "status": "pending", "updated_at": updated_at}
+    )
+
+    response = client.get("/orders/order-1", params={"fields": "status, updated_at"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": "order-1",
+        "status": "pending",
+        "updated_at": "2024-01-01T12:00:00",
+    }
+    get_order_use_case.execute_fields.assert_called_once_with(
+        "order-1", ("id", "status", "updated_at")
+    )
+
+
+def test_get_order_openapi_documents_full_and_partial_response(client):
+    """Testa que a OpenAPI descreve o pedido completo e a resposta com `fields`."""
+    spec = client.get("/openapi.json").json()
+
+    schema = spec["paths"]["/orders/{order_id}"]["get"]["responses"]["200"]["content"][
+        "application/json"
+    ]["schema"]
+    assert [option["$ref"] for option in schema["anyOf"]] == [
+        "#/components/schemas/OrderResponse",
+        "#/components/schemas/PartialOrderResponse",
+    ]
+    partial = spec["components"]["schemas"]["PartialOrderResponse"]
+    assert "required" not in partial
+    assert set(partial["properties"]) == set(
+        spec["components"]["schemas"]["OrderResponse"]["properties"]
+    )
+
+
+def test_get_order_with_unknown_field(client, get_order_use_case):
+    """Testa sparse fieldset com campo inexistente."""
+    response = client.get("/orders/order-1", params={"fields": "status,password"})
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+def test_get_order_with_fields_not_found(client, get_order_use_case):
+    """Testa sparse fieldset para pedido inexistente."""
+    get_order_use_case.execute_fields = AsyncMock(side_effect=OrderNotFoundError("não encontrado"))
+
+    response = client.get("/orders/order-1", params={"fields": "status"})
+
+    assert response.status_code == 404
+
+
+def test_get_order_history(client, get_order_history_use_case):
+    """Testa busca do histórico de status."""
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+    confirmed_at = datetime(2024, 1, 1, 12, 5, 0)
+    get_order_history_use_case.execute = AsyncMock(
+        return_value=[
+            StatusChange(
+                OrderId("order-1"), "customer-1", None, OrderStatus.PENDING, created_at, Money(10)
+            ),
+            StatusChange(
+                OrderId("order-1"),
+                "customer-1",
+                OrderStatus.PENDING,
+                OrderStatus.CONFIRMED,
+                confirmed_at,
+                Money(10),
+            ),
+        ]
+    )
+
+    response = client.get("/orders/order-1/history")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "order_id": "order-1",
+        "history": [
+            {"from_status": None, "to_status": "pending", "changed_at": "2024-01-01T12:00:00"},
+            {
+                "from_status": "pending",
+                "to_status": "confirmed",
+                "changed_at": "2024-01-01T12:05:00",
+            },
+        ],
+    }
+
+
+def test_get_order_history_not_found(client, get_order_history_use_case):
+    """Testa histórico de pedido inexistente."""
+    get_order_history_use_case.execute = AsyncMock(side_effect=OrderNotFoundError("x"))
+
+    response = client.get("/orders/missing/history")
+
+    assert response.status_code == 404
+
+
+def test_get_order_stats(client, get_order_stats_use_case, get_order_use_case):
+    """Testa que /orders/stats não é tratado como ID de pedido."""
+    get_order_stats_use_case.execute = AsyncMock(
+        return_value={"total": 2, "counts": {"pending": 2}, "daily": []}
+    )
+
+    response = client.get("/orders/stats", params={"days": 0})
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 2, "counts": {"pending": 2}, "daily": []}
+    get_order_use_case.execute.assert_not_called()
+
+
+def test_get_order_stats_invalid_days(client, get_order_stats_use_case):
+    """Testa janela de dias inválida."""
+    get_order_stats_use_case.execute = AsyncMock(side_effect=ValueError("days inválido"))
+
+    response = client.get("/orders/stats", params={"days": 999})
+
+    assert response.status_code == 400
+
+
+def test_list_orders_by_product(client, list_orders_by_product_use_case, sample_order):
+    """Testa página de pedidos por produto com cursor da próxima página."""
+    next_key = (datetime(2024, 1, 1, 12, 0, 0), "test-order-123")
+    list_orders_by_product_use_case.execute = AsyncMock(return_value=([sample_order], next_key))
+
+    response = client.get(
+        "/orders",
+        params=[("product_id", "prod-1"), ("status", "pending"), ("status", "confirmed")],
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == ["test-order-123"]
+    assert decode_order_cursor(body["next_cursor"]) == next_key
+    list_orders_by_product_use_case.execute.assert_awaited_once_with(
+        "prod-1", [OrderStatus.PENDING, OrderStatus.CONFIRMED], 100, None
+    )
+
+
+def test_list_orders_by_product_with_cursor(client, list_orders_by_product_use_case):
+    """Testa continuação a partir de um cursor."""
+    list_orders_by_product_use_case.execute = AsyncMock(return_value=([], None))
+    key = (datetime(2024, 1, 1, 12, 0, 0), "order-9")
+
+    response = client.get(
+        "/orders", params={"product_id": "prod-1", "cursor": encode_order_cursor(key)}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+    list_orders_by_product_use_case.execute.assert_awaited_once_with("prod-1", None, 100, key)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"product_id": "prod-1", "cursor": "não-é-cursor"},
+        {"product_id": "prod-1", "status": "unknown"},
+    ],
+)
+def test_list_orders_by_product_bad_request(client, list_orders_by_product_use_case, params):
+    """Testa cursor e status inválidos."""
+    list_orders_by_product_use_case.execute = AsyncMock(return_value=([], None))
+
+    response = client.get("/orders", params=params)
+
+    assert response.status_code == 400
+    list_orders_by_product_use_case.execute.assert_not_called()
+
+
+def test_list_orders_by_product_requires_product(client):
+    """Testa que o produto é obrigatório."""
+    response = client.get("/orders")
+
+    assert response.status_code == 422
@@ -6,10 +6,13 @@ import pytest
 from pydantic import ValidationError
 
 from src.adapters.http.schemas import (
+    MAX_ORDER_ITEMS,
     CreateOrderRequest,
     MoneySchema,
     OrderResponse,
     UpdateOrderStatusRequest,
+    parse_order_fields,
+    partial_order_response_model,
 )
 
 
@@ -33,15 +36,51 @@ def test_create_order_request():
     """Testa CreateOrderRequest."""
     request = CreateOrderRequest(
         customer_id="customer-123",
-        items=[{"product_id": "prod-1", "quantity": 2}],
+        items=[{"product_id": "prod-1", "quantity": 2, "price": 50.0}],
         total_amount=100.0,
     )
 
     assert request.customer_id == "customer-123"
     assert len(request.items) == 1
+    assert request.items[0].quantity == 2
     assert request.total_amount == 100.0
 
 
+def test_create_order_request_total_optional():
+    """Testa CreateOrderRequest sem total informado."""
+    request = CreateOrderRequest(
+        customer_id="customer-123",
+        items=[{"product_id": "prod-1", "quantity": 2, "price": 50.0}],
+    )
+
+    assert request.total_amount is None
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"product_id": "prod-1", "quantity": 2},
+        {"product_id": "prod-1", "quantity": 0, "price": 50.0},
+        {"product_id": "", "quantity": 1, "price": 50.0},
+        {"product_id": "prod-1", "quantity": 1, "price": 50.0, "blob": "x" * 1000},
+        {"product_id": "prod-1", "quantity": 1, "price": 1e300},
+        {"product_id": "prod-1", "quantity": 1, "price": float("inf")},
+        {"product_id": "prod-1", "quantity": 1_000_000, "price": 1.0},
+    ],
+)
+def test_create_order_request_invalid_item(item):
+    """Testa que itens malformados são rejeitados."""
+    with pytest.raises(ValidationError):
+        CreateOrderRequest(customer_id="customer-123", items=[item])
+
+
+def test_create_order_request_too_many_items():
+    """Testa o limite de itens por pedido."""
+    item = {"product_id": "prod-1", "quantity": 1, "price": 1.0}
+    with pytest.raises(ValidationError):
+        CreateOrderRequest(customer_id="customer-123", items=[item] * (MAX_ORDER_ITEMS + 1))
+
+
 def test_create_order_request_validation():
     """Testa validação de CreateOrderRequest."""
     with pytest.raises(ValidationError):
@@ -75,3 +114,28 @@ def test_order_response():
     assert response.customer_id == "customer-123"
     assert response.status == "pending"
     assert response.total_amount.amount == 100.0
+
+
+def test_parse_order_fields():
+    """Testa interpretação do parâmetro fields."""
+    assert parse_order_fields(None) is None
+    assert parse_order_fields("") is None
+    assert parse_order_fields("updated_at, status") == ("id", "status", "updated_at")
+
+
+def test_parse_order_fields_unknown():
+    """Testa rejeição de campos desconhecidos."""
+    with pytest.raises(ValueError, match="secret"):
+        parse_order_fields("status,secret")
+
+
+def test_partial_order_response_model_is_cached():
+    """Testa que o modelo parcial é reutilizado e só contém os campos pedidos."""
+    model = partial_order_response_model(("id", "status"))
+
+    assert model is partial_order_response_model(("id", "status"))
+    assert set(model.model_fields) == {"id", "status"}
+    assert model(id="order-1", status="pending").model_dump() == {
+        "id": "order-1",
+        "status": "pending",
+    }
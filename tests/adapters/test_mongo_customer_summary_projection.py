@@ -0,0 +1,212 @@
+"""Testes para MongoCustomerSummaryProjection."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.persistence.mongo_customer_summary_projection import (
+    _MINOR_FACTOR_EXPRESSION,
+    MongoCustomerSummaryProjection,
+)
+from src.domain.events.status_change import StatusChange
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+class FakeCursor:
+    """Cursor assíncrono sobre uma lista de documentos."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length=None):
+        return self.documents
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+@pytest.fixture
+def collections():
+    """Cria mocks das coleções de resumos e pedidos."""
+    summaries, orders = AsyncMock(), MagicMock()
+    by_name = {"customer_order_summaries": summaries, "orders": orders}
+    database = MagicMock()
+    database.__getitem__ = MagicMock(side_effect=by_name.__getitem__)
+    return database, summaries, orders
+
+
+def change(order_id, from_status, to_status, minute=0, customer_id="customer-1"):
+    """Cria uma transição de exemplo."""
+    return StatusChange(
+        OrderId(order_id),
+        customer_id,
+        from_status,
+        to_status,
+        datetime(2024, 1, 1, 10, minute),
+        Money(10),
+    )
+
+
+@pytest.mark.asyncio
+async def test_apply_creation_and_transitions(collections):
+    """Testa incrementos, último pedido e status do último pedido."""
+    database, summaries, _ = collections
+    projection = MongoCustomerSummaryProjection(database)
+
+    await projection.apply(
+        [
+            change("order-1", None, OrderStatus.PENDING, 0),
+            change("order-2", None, OrderStatus.PENDING, 1),
+            change("order-2", OrderStatus.PENDING, OrderStatus.CONFIRMED, 2),
+            change("order-1", OrderStatus.PENDING, OrderStatus.CANCELLED, 3),
+        ]
+    )
+
+    operations = summaries.bulk_write.call_args.args[0]
+    assert summaries.bulk_write.call_args.kwargs == {"ordered": True}
+    assert operations[0]._doc["$inc"] == {"order_count": 2, "spend.BRL": 1000}
+    assert operations[0]._upsert is True
+    last_order = operations[1]._doc["$set"]["last_order"]
+    assert last_order["order_id"] == "order-2"
+    assert last_order["status"] == "confirmed"
+    assert operations[2]._filter == {"_id": "customer-1", "last_order.order_id": "order-1"}
+    assert operations[2]._doc == {"$set": {"last_order.status": "cancelled"}}
+
+
+@pytest.mark.asyncio
+async def test_apply_creation_already_cancelled_adds_no_spend(collections):
+    """Testa que um pedido importado já cancelado conta como pedido, mas não como gasto."""
+    database, summaries, _ = collections
+    projection = MongoCustomerSummaryProjection(database)
+
+    await projection.apply([change("order-1", None, OrderStatus.CANCELLED)])
+
+    operations = summaries.bulk_write.call_args.args[0]
+    assert operations[0]._doc["$inc"] == {"order_count": 1}
+
+
+@pytest.mark.asyncio
+async def test_apply_transition_only(collections):
+    """Testa transição de pedido criado em lote anterior."""
+    database, summaries, _ = collections
+    projection = MongoCustomerSummaryProjection(database)
+
+    await projection.apply([change("order-1", OrderStatus.PENDING, OrderStatus.CONFIRMED)])
+
+    operations = summaries.bulk_write.call_args.args[0]
+    assert "$inc" not in operations[0]._doc
+    assert operations[1]._doc == {"$set": {"last_order.status": "confirmed"}}
+
+
+@pytest.mark.asyncio
+async def test_get_summary(collections):
+    """Testa leitura do resumo."""
+    database, summaries, _ = collections
+    summaries.find_one = AsyncMock(
+        return_value={
+            "_id": "customer-1",
+            "order_count": 2,
+            "spend": {"USD": 500, "BRL": 1999},
+            "last_order": {"order_id": "order-2", "status": "pending"},
+            "updated_at": datetime(2024, 1, 1),
+        }
+    )
+    projection = MongoCustomerSummaryProjection(database)
+
+    summary = await projection.get_summary("customer-1")
+
+    assert summary["order_count"] == 2
+    assert summary["lifetime_spend"] == [Money.from_minor(1999), Money.from_minor(500, "USD")]
+    assert summary["last_order"]["order_id"] == "order-2"
+
+
+@pytest.mark.asyncio
+async def test_get_summary_not_found(collections):
+    """Testa cliente sem resumo."""
+    database, summaries, _ = collections
+    summaries.find_one = AsyncMock(return_value=None)
+
+    assert await MongoCustomerSummaryProjection(database).get_summary("x") is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild(collections):
+    """Testa reconstrução em lotes a partir dos pedidos."""
+    database, summaries, orders = collections
+    customers = FakeCursor([{"_id": "customer-1"}, {"_id": "customer-2"}, {"_id": "customer-3"}])
+
+    def aggregate(pipeline, **kwargs):
+        if "$match" not in pipeline[0]:
+            return customers
+        customer_ids = pipeline[0]["$match"]["customer_id"]["$in"]
+        return FakeCursor(
+            [
+                {
+                    "_id": {"customer_id": customer_id, "currency": "BRL"},
+                    "order_count": 2,
+                    "spend": 3000,
+                    "last_order": {
+                        "order_id": "order-x",
+                        "status": "pending",
+                        "created_at": datetime(2024, 1, 1),
+                    },
+                }
+                for customer_id in customer_ids
+            ]
+        )
+
+    orders.aggregate = MagicMock(side_effect=aggregate)
+    projection = MongoCustomerSummaryProjection(database)
+
+    result = await projection.rebuild(batch_size=2, concurrency=1)
+
+    assert result["customers"] == 3
+    assert result["batches"] == 2
+    summaries.delete_many.assert_awaited_once_with({})
+    written = [op._doc for call in summaries.bulk_write.call_args_list for op in call.args[0]]
+    assert len(written) == 3
+    assert written[0]["spend"] == {"BRL": 3000}
+    assert written[0]["order_count"] == 2
+    # Pedidos arquivados entram tanto na lista de clientes quanto em cada lote
+    pipelines = [call.args[0] for call in orders.aggregate.call_args_list]
+    assert pipelines[0][0] == {"$unionWith": {"coll": "orders_archive", "pipeline": []}}
+    assert pipelines[1][1]["$unionWith"] == {
+        "coll": "orders_archive",
+        "pipeline": [pipelines[1][0]],
+    }
+
+
+@pytest.mark.asyncio
+async def test_apply_repeated_cancellation_subtracts_once(collections):
+    """Testa que um cancelamento repetido não desconta o gasto de novo."""
+    database, summaries, _ = collections
+    projection = MongoCustomerSummaryProjection(database)
+
+    await projection.apply(
+        [
+            change("order-1", OrderStatus.PENDING, OrderStatus.CANCELLED, 1),
+            change("order-1", OrderStatus.CANCELLED, OrderStatus.CANCELLED, 2),
+        ]
+    )
+
+    operations = summaries.bulk_write.call_args.args[0]
+    assert operations[0]._doc["$inc"] == {"spend.BRL": -1000}
+
+
+def test_legacy_amount_uses_currency_exponent():
+    """Testa conversão de `amount` float pelo expoente da moeda na reconstrução."""
+    factor = _MINOR_FACTOR_EXPRESSION["$switch"]
+    by_currency = {branch["case"]["$eq"][1]: branch["then"] for branch in factor["branches"]}
+
+    assert by_currency["JPY"] == 1
+    assert by_currency["CLP"] == 1
+    assert by_currency["KWD"] == 1000
+    assert by_currency["BHD"] == 1000
+    assert factor["default"] == 100
@@ -0,0 +1,82 @@
+"""Testes para MongoOrderArchiver."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.persistence.mongo_order_archiver import MongoOrderArchiver
+from src.domain.value_objects.order_status import OrderStatus
+
+TERMINAL = OrderStatus.terminal_states()
+CUTOFF = datetime(2024, 1, 1)
+QUERY = {"status": {"$in": ["cancelled", "delivered"]}, "updated_at": {"$lt": CUTOFF}}
+
+
+@pytest.fixture
+def collections():
+    """Cria mocks das coleções principal e de arquivo."""
+    orders = AsyncMock()
+    archive = AsyncMock()
+    database = MagicMock()
+    database.__getitem__ = MagicMock(
+        side_effect=lambda name: {"orders": orders, "orders_archive": archive}[name]
+    )
+    return database, orders, archive
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_copies_then_deletes(collections):
+    """Testa cópia com upsert e remoção condicional do lote."""
+    database, orders, archive = collections
+    documents = [{"_id": 1, "id": "order-1"}, {"_id": 2, "id": "order-2"}]
+    cursor = MagicMock()
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=documents)
+    orders.find = MagicMock(return_value=cursor)
+    orders.delete_many.return_value = MagicMock(deleted_count=2)
+
+    moved = await MongoOrderArchiver(database).archive_batch(TERMINAL, CUTOFF, 100)
+
+    assert moved == 2
+    orders.find.assert_called_once_with(QUERY)
+    cursor.limit.assert_called_once_with(100)
+    operations = archive.bulk_write.call_args.args[0]
+    assert [operation._filter for operation in operations] == [{"_id": 1}, {"_id": 2}]
+    assert all(operation._upsert for operation in operations)
+    orders.delete_many.assert_awaited_once_with({"_id": {"$in": [1, 2]}, **QUERY})
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_nothing_to_do(collections):
+    """Testa lote vazio."""
+    database, orders, archive = collections
+    cursor = MagicMock()
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=[])
+    orders.find = MagicMock(return_value=cursor)
+
+    assert await MongoOrderArchiver(database).archive_batch(TERMINAL, CUTOFF, 100) == 0
+    archive.bulk_write.assert_not_called()
+    orders.delete_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_count_archivable(collections):
+    """Testa contagem dos pedidos arquiváveis."""
+    database, orders, _ = collections
+    orders.count_documents.return_value = 7
+
+    assert await MongoOrderArchiver(database).count_archivable(TERMINAL, CUTOFF) == 7
+    orders.count_documents.assert_awaited_once_with(QUERY)
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes(collections):
+    """Testa índices do arquivo, tolerando falhas."""
+    database, _, archive = collections
+    archive.create_index.side_effect = [None, RuntimeError("sem permissão")]
+
+    await MongoOrderArchiver(database)._ensure_indexes()
+
+    archive.create_index.assert_any_await("id", unique=True)
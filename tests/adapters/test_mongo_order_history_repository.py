@@ -0,0 +1,178 @@
+"""Testes para MongoOrderHistoryRepository."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from prometheus_client import REGISTRY
+
+from src.adapters.persistence.mongo_order_history_repository import MongoOrderHistoryRepository
+from src.domain.events.status_change import StatusChange
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+class FakeCursor:
+    """Cursor assíncrono sobre uma lista de documentos."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, *args):
+        self.sort_args = args
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    async def to_list(self, length=None):
+        return self.documents
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+@pytest.fixture
+def collections():
+    """Cria mocks das coleções de histórico e checkpoints."""
+    history = AsyncMock()
+    checkpoints = AsyncMock()
+    database = MagicMock()
+    database.__getitem__ = MagicMock(
+        side_effect=lambda name: history if name == "order_status_history" else checkpoints
+    )
+    return database, history, checkpoints
+
+
+def make_document(order_id: str = "order-1", from_status: str | None = "pending") -> dict:
+    """Cria um documento de histórico."""
+    return {
+        "_id": ObjectId(),
+        "order_id": order_id,
+        "customer_id": "customer-1",
+        "from_status": from_status,
+        "to_status": "confirmed",
+        "changed_at": datetime(2024, 1, 1),
+        "total_amount": {"amount_minor": 1000, "currency": "BRL"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_append(collections):
+    """Testa gravação das transições."""
+    database, history, _ = collections
+    repository = MongoOrderHistoryRepository(database)
+    change = StatusChange(
+        OrderId("order-1"), "customer-1", None, OrderStatus.PENDING, datetime(2024, 1, 1), Money(10)
+    )
+
+    metric = "order_service_mongo_operation_duration_seconds_count"
+    labels = {"operation": "append_history", "outcome": "success"}
+    before = REGISTRY.get_sample_value(metric, labels) or 0.0
+
+    await repository.append([change])
+
+    assert REGISTRY.get_sample_value(metric, labels) == before + 1
+    (documents,) = history.insert_many.call_args.args
+    assert documents[0]["from_status"] is None
+    assert documents[0]["to_status"] == "pending"
+    assert documents[0]["total_amount"]["amount_minor"] == 1000
+
+
+@pytest.mark.asyncio
+async def test_find_by_order_id(collections):
+    """Testa leitura do histórico de um pedido."""
+    database, history, _ = collections
+    cursor = FakeCursor([make_document(from_status=None)])
+    history.find = MagicMock(return_value=cursor)
+    repository = MongoOrderHistoryRepository(database)
+
+    result = await repository.find_by_order_id(OrderId("order-1"))
+
+    history.find.assert_called_once_with({"order_id": "order-1"})
+    assert cursor.sort_args == ([("changed_at", 1), ("_id", 1)],)
+    assert result[0].from_status is None
+    assert result[0].to_status == OrderStatus.CONFIRMED
+    assert result[0].total_amount == Money(10)
+
+
+@pytest.mark.asyncio
+async def test_iter_batches(collections):
+    """Testa leitura do log em lotes a partir de uma posição."""
+    database, history, _ = collections
+    documents = [make_document(f"order-{i}") for i in range(5)]
+    cursor = FakeCursor(documents)
+    history.find = MagicMock(return_value=cursor)
+    repository = MongoOrderHistoryRepository(database)
+    last_id = ObjectId()
+    after = f"2024-01-01T00:00:00|{last_id}"
+
+    batches = [batch async for batch in repository.iter_batches(2, after=after)]
+
+    assert [len(changes) for _, changes in batches] == [2, 2, 1]
+    assert batches[-1][0] == f"2024-01-01T00:00:00|{documents[-1]['_id']}"
+    assert cursor.sort_args == ([("changed_at", 1), ("_id", 1)],)
+    history.find.assert_called_once_with(
+        {
+            "$or": [
+                {"changed_at": {"$gt": datetime(2024, 1, 1)}},
+                {"changed_at": datetime(2024, 1, 1), "_id": {"$gt": last_id}},
+            ]
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_resumes_from_position_returned(collections):
+    """Testa que a posição devolvida por um lote retoma logo após ele."""
+    database, history, _ = collections
+    document = make_document()
+    document["changed_at"] = datetime(2024, 1, 1, 12, 30, 0, 123000)
+    history.find = MagicMock(return_value=FakeCursor([document]))
+    repository = MongoOrderHistoryRepository(database)
+
+    [(position, _)] = [batch async for batch in repository.iter_batches(10)]
+    history.find = MagicMock(return_value=FakeCursor([]))
+    [batch async for batch in repository.iter_batches(10, after=position)]
+
+    (query,) = history.find.call_args.args
+    assert query["$or"][1] == {
+        "changed_at": document["changed_at"],
+        "_id": {"$gt": document["_id"]},
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_accepts_legacy_object_id_checkpoint(collections):
+    """Testa retomada a partir de checkpoint antigo, só com o `_id`."""
+    database, history, _ = collections
+    history.find = MagicMock(return_value=FakeCursor([]))
+    repository = MongoOrderHistoryRepository(database)
+    last_id = ObjectId.from_datetime(datetime(2024, 1, 1, 8, 0, 0))
+
+    [batch async for batch in repository.iter_batches(10, after=str(last_id))]
+
+    (query,) = history.find.call_args.args
+    assert query["$or"][0] == {"changed_at": {"$gt": datetime(2024, 1, 1, 8, 0, 0)}}
+    assert query["$or"][1]["_id"] == {"$gt": last_id}
+
+
+@pytest.mark.asyncio
+async def test_checkpoints(collections):
+    """Testa leitura e gravação de checkpoints."""
+    database, _, checkpoints = collections
+    checkpoints.find_one = AsyncMock(return_value={"_id": "replay", "position": "abc"})
+    repository = MongoOrderHistoryRepository(database)
+
+    assert await repository.load_checkpoint("replay") == "abc"
+    await repository.save_checkpoint("replay", "def")
+
+    filter_, update = checkpoints.update_one.call_args.args
+    assert filter_ == {"_id": "replay"}
+    assert update["$set"]["position"] == "def"
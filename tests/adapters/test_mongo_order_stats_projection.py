@@ -0,0 +1,193 @@
+"""Testes para MongoOrderStatsProjection."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.persistence.mongo_order_stats_projection import MongoOrderStatsProjection
+from src.domain.events.status_change import StatusChange
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@pytest.fixture
+def collections():
+    """Cria mocks das coleções de contadores, pedidos e histórico."""
+    stats, orders, history = AsyncMock(), MagicMock(), MagicMock()
+    by_name = {"order_stats": stats, "orders": orders, "order_status_history": history}
+    database = MagicMock()
+    database.__getitem__ = MagicMock(side_effect=by_name.__getitem__)
+    return database, stats, orders, history
+
+
+def aggregate_result(documents):
+    """Cria um cursor de agregação que devolve os documentos."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=documents)
+    return MagicMock(return_value=cursor)
+
+
+def change(from_status, to_status, when=datetime(2024, 1, 1, 10)):
+    """Cria uma transição de exemplo."""
+    return StatusChange(OrderId("order-1"), "customer-1", from_status, to_status, when, Money(1))
+
+
+@pytest.mark.asyncio
+async def test_apply_coalesces_increments(collections):
+    """Testa que um lote vira um único bulk_write com incrementos somados."""
+    database, stats, _, _ = collections
+    projection = MongoOrderStatsProjection(database)
+
+    await projection.apply(
+        [
+            change(None, OrderStatus.PENDING),
+            change(None, OrderStatus.PENDING),
+            change(OrderStatus.PENDING, OrderStatus.CONFIRMED),
+        ]
+    )
+
+    (operations,) = stats.bulk_write.call_args.args
+    documents = {op._filter["_id"]: op._doc["$inc"] for op in operations}
+    assert documents["global"] == {"counts.pending": 1, "counts.confirmed": 1}
+    assert documents["day:2024-01-01"] == {"created": 2, "transitions.confirmed": 1}
+
+
+@pytest.mark.asyncio
+async def test_apply_skips_zero_increments(collections):
+    """Testa que incrementos que se anulam não são gravados."""
+    database, stats, _, _ = collections
+    projection = MongoOrderStatsProjection(database)
+
+    await projection.apply(
+        [
+            change(OrderStatus.PENDING, OrderStatus.CONFIRMED),
+            change(OrderStatus.CONFIRMED, OrderStatus.PENDING),
+        ]
+    )
+
+    (operations,) = stats.bulk_write.call_args.args
+    assert [op._filter["_id"] for op in operations] == ["day:2024-01-01"]
+
+
+@pytest.mark.asyncio
+async def test_get_status_counts(collections):
+    """Testa leitura das contagens com status ausentes e negativos."""
+    database, stats, _, _ = collections
+    stats.find_one = AsyncMock(return_value={"counts": {"pending": 3, "cancelled": -1}})
+    projection = MongoOrderStatsProjection(database)
+
+    counts = await projection.get_status_counts()
+
+    assert counts["pending"] == 3
+    assert counts["cancelled"] == 0
+    assert set(counts) == {status.value for status in OrderStatus}
+
+
+@pytest.mark.asyncio
+async def test_get_daily_counts(collections):
+    """Testa leitura dos contadores diários com dias sem atividade."""
+    database, stats, _, _ = collections
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(
+        return_value=[{"_id": f"day:{today}", "created": 5, "transitions": {"shipped": 2}}]
+    )
+    stats.find = MagicMock(return_value=cursor)
+    projection = MongoOrderStatsProjection(database)
+
+    daily = await projection.get_daily_counts(2)
+
+    assert daily[0] == {"date": today, "created": 5, "transitions": {"shipped": 2}}
+    assert daily[1]["created"] == 0
+    assert await projection.get_daily_counts(0) == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile(collections):
+    """Testa recálculo das contagens e dos contadores diários."""
+    database, stats, orders, history = collections
+    today = datetime.utcnow().date()
+    yesterday = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+    stats.find_one = AsyncMock(return_value={"counts": {"pending": 5}})
+    orders.aggregate = MagicMock(
+        side_effect=[
+            aggregate_result([{"_id": "pending", "count": 3}, {"_id": "shipped", "count": 1}])(),
+            aggregate_result([{"_id": yesterday, "count": 4}])(),
+        ]
+    )
+    history.aggregate = aggregate_result(
+        [{"_id": {"day": yesterday, "status": "shipped"}, "count": 1}]
+    )
+    projection = MongoOrderStatsProjection(database)
+
+    result = await projection.reconcile(days=2)
+
+    assert result["counts"]["pending"] == 3
+    assert result["drift"]["pending"] == -2
+    assert result["drift"]["shipped"] == 1
+    assert result["days"] == 2
+    (operations,) = stats.bulk_write.call_args.args
+    daily = {op._filter["_id"]: op._doc["$set"] for op in operations}
+    assert daily[f"day:{yesterday}"] == {"created": 4, "transitions": {"shipped": 1}}
+    assert daily[f"day:{today.strftime('%Y-%m-%d')}"] == {"created": 0, "transitions": {}}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_after_archiving(collections):
+    """Testa que pedidos arquivados continuam nas contagens reconciliadas."""
+    database, stats, orders, history = collections
+    live = ["pending", "shipped"]
+    archived = ["delivered", "delivered", "cancelled"]
+
+    def aggregate(pipeline):
+        # Simula o servidor: o `$unionWith` acrescenta os pedidos do arquivo
+        statuses = list(live)
+        if any(stage.get("$unionWith", {}).get("coll") == "orders_archive" for stage in pipeline):
+            statuses += archived
+        groups = {}
+        for status in statuses:
+            groups[status] = groups.get(status, 0) + 1
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(
+            return_value=[{"_id": status, "count": count} for status, count in groups.items()]
+        )
+        return cursor
+
+    stats.find_one = AsyncMock(return_value={"counts": {"delivered": 2, "cancelled": 1}})
+    orders.aggregate = MagicMock(side_effect=aggregate)
+    projection = MongoOrderStatsProjection(database)
+
+    result = await projection.reconcile(days=0)
+
+    assert result["counts"]["delivered"] == 2
+    assert result["counts"]["cancelled"] == 1
+    assert result["counts"]["pending"] == 1
+    assert result["drift"]["delivered"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_daily_includes_archive(collections):
+    """Testa que os contadores diários também somam os pedidos arquivados."""
+    database, stats, orders, history = collections
+    stats.find_one = AsyncMock(return_value=None)
+    orders.aggregate = aggregate_result([])
+    history.aggregate = aggregate_result([])
+
+    await MongoOrderStatsProjection(database).reconcile(days=1)
+
+    daily_pipeline = orders.aggregate.call_args_list[1].args[0]
+    union = daily_pipeline[1]["$unionWith"]
+    assert union["coll"] == "orders_archive"
+    assert union["pipeline"] == [daily_pipeline[0]]
+
+
+@pytest.mark.asyncio
+async def test_reset(collections):
+    """Testa remoção dos contadores."""
+    database, stats, _, _ = collections
+
+    await MongoOrderStatsProjection(database).reset()
+
+    stats.delete_many.assert_awaited_once_with({})
@@ -0,0 +1,28 @@
+"""Testes para MongoPoolMonitor."""
+
+from unittest.mock import MagicMock
+
+from src.adapters.persistence.pool_monitor import MongoPoolMonitor
+
+
+def test_pool_saturation():
+    """Testa o cálculo de ocupação do pool."""
+    monitor = MongoPoolMonitor()
+    monitor.pool_created(MagicMock(options={"maxPoolSize": 10}))
+
+    for _ in range(3):
+        monitor.connection_created(MagicMock())
+        monitor.connection_checked_out(MagicMock())
+    monitor.connection_checked_in(MagicMock())
+
+    assert monitor.max_pool_size == 10
+    assert monitor.open_connections == 3
+    assert monitor.checked_out == 2
+    assert monitor.saturation == 0.2
+
+
+def test_pool_saturation_without_max_size():
+    """Testa ocupação com pool de tamanho zero."""
+    monitor = MongoPoolMonitor(default_max_pool_size=0)
+
+    assert monitor.saturation == 0.0
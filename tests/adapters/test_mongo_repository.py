@@ -1,11 +1,23 @@
 """Testes para MongoOrderRepository."""
 
+import uuid
 from datetime import datetime
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from bson import Binary, ObjectId
+from bson.binary import UuidRepresentation
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import ExecutionTimeout, PyMongoError
 
-from src.adapters.persistence.mongo_order_repository import MongoOrderRepository
+from src.adapters.persistence.mongo_order_repository import (
+    PRODUCT_STATUS_INDEX,
+    MongoOrderRepository,
+    winning_plan_stages,
+)
+from src.app.config import settings
+from src.application.deadline import DeadlineExceededError, deadline_scope
 from src.domain.entities.order import Order
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.order_id import OrderId
@@ -41,6 +53,8 @@ async def test_save_order(mock_database):
     # Assert
     assert result == order
     collection.update_one.assert_called_once()
+    stored = collection.update_one.call_args.args[1]["$set"]
+    assert stored["total_amount"] == {"amount_minor": 10000, "currency": "BRL", "exponent": 2}
 
 
 @pytest.mark.asyncio
@@ -84,3 +98,813 @@ async def test_find_by_id_not_found(mock_database):
 
     # Assert
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_deadline_expired(mock_database):
+    """Testa que a busca é abandonada quando o deadline já expirou."""
+    # Arrange
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+
+    # Act & Assert
+    with deadline_scope(-1):
+        with pytest.raises(DeadlineExceededError):
+            await repository.find_by_id(OrderId("order-123"))
+
+    collection.find_one.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_driver_timeout(mock_database):
+    """Testa que timeout do driver dentro do deadline vira DeadlineExceededError."""
+    # Arrange
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    collection.find_one = AsyncMock(side_effect=ExecutionTimeout("operation exceeded time limit"))
+
+    # Act & Assert
+    with deadline_scope(5):
+        with pytest.raises(DeadlineExceededError):
+            await repository.find_by_id(OrderId("order-123"))
+
+
+@pytest.mark.asyncio
+async def test_find_fields_by_id_uses_projection(mock_database):
+    """Testa que a busca parcial usa projeção no MongoDB."""
+    # Arrange
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    collection.find_one = AsyncMock(
+        return_value={"id": "order-123", "status": "pending", "updated_at": "2024-01-01T12:00:00Z"}
+    )
+
+    # Act
+    result = await repository.find_fields_by_id(
+        OrderId("order-123"), ("id", "status", "updated_at")
+    )
+
+    # Assert
+    collection.find_one.assert_called_once_with(
+        {"id": "order-123"}, {"id": 1, "status": 1, "updated_at": 1, "_id": 0}
+    )
+    assert result["status"] == "pending"
+    assert isinstance(result["updated_at"], datetime)
+
+
+@pytest.mark.asyncio
+async def test_find_fields_by_id_not_found(mock_database):
+    """Testa busca parcial de pedido inexistente."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    collection.find_one = AsyncMock(return_value=None)
+
+    assert await repository.find_fields_by_id(OrderId("order-123"), ("id",)) is None
+
+
+def test_dict_to_order_reads_minor_units(mock_database):
+    """Testa leitura do valor armazenado em unidades menores."""
+    database, _ = mock_database
+    repository = MongoOrderRepository(database)
+    document = {
+        "id": "order-123",
+        "customer_id": "customer-123",
+        "items": [],
+        "total_amount": {"amount_minor": 1999, "currency": "BRL"},
+        "status": "pending",
+    }
+
+    order = repository._dict_to_order(document)
+
+    assert order.total_amount == Money.from_minor(1999)
+
+
+@pytest.mark.asyncio
+async def test_find_fields_by_id_converts_total_amount(mock_database):
+    """Testa que a projeção devolve o valor no formato público."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    collection.find_one = AsyncMock(
+        return_value={"id": "order-123", "total_amount": {"amount_minor": 1999, "currency": "BRL"}}
+    )
+
+    result = await repository.find_fields_by_id(OrderId("order-123"), ("id", "total_amount"))
+
+    assert result["total_amount"] == {"amount": 19.99, "currency": "BRL"}
+
+
+@pytest.mark.asyncio
+async def test_sum_total_amounts(mock_database):
+    """Testa soma agregada no MongoDB."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(
+        return_value=[
+            {"_id": "BRL", "amount_minor": 150050},
+            {"_id": "JPY", "amount_minor": 300},
+        ]
+    )
+    collection.aggregate = MagicMock(return_value=cursor)
+
+    result = await repository.sum_total_amounts(OrderStatus.DELIVERED)
+
+    assert result == {"BRL": Money(Decimal("1500.50")), "JPY": Money(300, "JPY")}
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {"$match": {"status": "delivered"}}
+
+
+@pytest.mark.asyncio
+async def test_save_with_binary_ids(mock_database):
+    """Testa que IDs UUID são gravados como Binary e casam com o formato antigo."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database, binary_ids=True)
+    order_id = OrderId("0190a8f2-7b1c-7c3d-8e4f-123456789abc")
+    order = Order(order_id=order_id, customer_id="customer-123", items=[], total_amount=Money(1))
+
+    await repository.save(order)
+
+    id_filter, update = collection.update_one.call_args.args
+    encoded = Binary.from_uuid(uuid.UUID(order_id), UuidRepresentation.STANDARD)
+    assert id_filter == {"id": {"$in": [encoded, order_id]}}
+    assert update["$set"]["id"] == encoded
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_decodes_binary_id(mock_database):
+    """Testa leitura de documento com ID binário."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database, binary_ids=True)
+    order_id = "0190a8f2-7b1c-7c3d-8e4f-123456789abc"
+    collection.find_one = AsyncMock(
+        return_value={
+            "id": Binary.from_uuid(uuid.UUID(order_id), UuidRepresentation.STANDARD),
+            "customer_id": "customer-123",
+            "items": [],
+            "total_amount": {"amount_minor": 100, "currency": "BRL"},
+            "status": "pending",
+        }
+    )
+
+    result = await repository.find_by_id(OrderId(order_id))
+
+    assert result.id == order_id
+
+
+def test_encode_id_objectid_and_fallback(mock_database):
+    """Testa codificação de ObjectId e de IDs em formato livre."""
+    database, _ = mock_database
+    repository = MongoOrderRepository(database, binary_ids=True)
+
+    assert repository._encode_id("65f1c0ffee0000000000abcd") == ObjectId("65f1c0ffee0000000000abcd")
+    assert repository._encode_id("order-123") == "order-123"
+    assert repository._id_filter("order-123") == {"id": "order-123"}
+    assert repository._decode_id(ObjectId("65f1c0ffee0000000000abcd")) == (
+        "65f1c0ffee0000000000abcd"
+    )
+
+
+def _product_explain(statuses):
+    """Monta a saída de explain do MongoDB 7 (SBE) para a consulta por produto."""
+    scans = [
+        {
+            "stage": "IXSCAN",
+            "keyPattern": {"items.product_id": 1, "status": 1, "created_at": 1, "id": 1},
+            "indexName": PRODUCT_STATUS_INDEX,
+            "isMultiKey": True,
+            "indexBounds": {
+                "items.product_id": ['["prod-1", "prod-1"]'],
+                "status": [f'["{status}", "{status}"]'],
+                "created_at": ["[MinKey, MaxKey]"],
+                "id": ["[MinKey, MaxKey]"],
+            },
+        }
+        for status in statuses
+    ]
+    return {
+        "queryPlanner": {
+            "winningPlan": {
+                "queryPlan": {
+                    "stage": "LIMIT",
+                    "inputStage": {
+                        "stage": "FETCH",
+                        "inputStage": {"stage": "SORT_MERGE", "inputStages": scans},
+                    },
+                }
+            },
+            "rejectedPlans": [],
+        }
+    }
+
+
+def _product_cursor(collection, documents=(), explain=None):
+    """Configura `collection.find` com um cursor encadeável."""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=list(documents))
+    cursor.explain = AsyncMock(return_value=explain)
+    collection.find = MagicMock(return_value=cursor)
+    return cursor
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_creates_product_index(mock_database):
+    """Testa criação do índice multikey por produto."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+
+    await repository._ensure_indexes()
+
+    collection.create_index.assert_any_call(
+        [("items.product_id", 1), ("status", 1), ("created_at", 1), ("id", 1)],
+        name=PRODUCT_STATUS_INDEX,
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_by_product_query_shape(mock_database):
+    """Testa filtro, ordenação e limite da busca por produto."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    document = {
+        "id": "order-1",
+        "customer_id": "customer-1",
+        "items": [{"product_id": "prod-1", "quantity": 1, "price": 10.0}],
+        "total_amount": {"amount_minor": 1000, "currency": "BRL", "exponent": 2},
+        "status": "pending",
+        "created_at": datetime(2024, 1, 1),
+        "updated_at": datetime(2024, 1, 1),
+    }
+    cursor = _product_cursor(collection, [document])
+
+    orders = await repository.find_by_product(
+        "prod-1", [OrderStatus.PENDING, OrderStatus.CONFIRMED], limit=11
+    )
+
+    assert [order.id for order in orders] == ["order-1"]
+    collection.find.assert_called_once_with(
+        {"items.product_id": "prod-1", "status": {"$in": ["confirmed", "pending"]}}
+    )
+    cursor.sort.assert_called_once_with([("created_at", 1), ("id", 1)])
+    cursor.limit.assert_called_once_with(11)
+
+
+@pytest.mark.asyncio
+async def test_find_by_product_defaults_to_all_statuses_and_keyset(mock_database):
+    """Testa status padrão (todos) e continuação a partir da chave anterior."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database, binary_ids=True)
+    _product_cursor(collection)
+    order_id = "0192a0b4-7c3e-7d5a-8f00-1234567890ab"
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+
+    await repository.find_by_product("prod-1", after=(created_at, OrderId(order_id)))
+
+    query = collection.find.call_args.args[0]
+    assert query["status"] == {"$in": sorted(status.value for status in OrderStatus)}
+    encoded = Binary.from_uuid(uuid.UUID(order_id), UuidRepresentation.STANDARD)
+    assert query["$or"] == [
+        {"created_at": {"$gt": created_at}},
+        {"created_at": created_at, "id": {"$gt": encoded}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_find_by_product_single_status_uses_equality(mock_database):
+    """Testa filtro por igualdade quando há um único status."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    _product_cursor(collection)
+
+    await repository.find_by_product("prod-1", [OrderStatus.PENDING])
+
+    assert collection.find.call_args.args[0]["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_winning_plan_stages_reads_sbe_explain(mock_database):
+    """Testa leitura do explain do MongoDB 7 (SBE) com SORT_MERGE sobre o índice por produto."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database)
+    statuses = sorted(status.value for status in OrderStatus)
+    _product_cursor(collection, explain=_product_explain(statuses))
+
+    explain = await repository.explain_find_by_product("prod-1")
+    stages = winning_plan_stages(explain)
+
+    names = [stage["stage"] for stage in stages]
+    assert "COLLSCAN" not in names
+    assert "SORT" not in names
+    scans = [stage for stage in stages if stage["stage"] == "IXSCAN"]
+    assert len(scans) == len(statuses)
+    assert {stage["indexName"] for stage in scans} == {PRODUCT_STATUS_INDEX}
+
+
+@pytest.fixture
+async def mongo_database():
+    """Banco temporário no MongoDB de `MONGODB_URL`; pula o teste se não houver servidor."""
+    client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=500)
+    try:
+        await client.admin.command("ping")
+    except PyMongoError:
+        client.close()
+        pytest.skip(f"MongoDB indisponível em {settings.mongodb_url}")
+
+    name = f"test_orders_{uuid.uuid4().hex[:12]}"
+    try:
+        yield client[name]
+    finally:
+        await client.drop_database(name)
+        client.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_find_by_product_plan_uses_only_product_index(mongo_database):
+    """Testa, pelo explain de um mongod real, que a busca não faz COLLSCAN nem SORT."""
+    repository = MongoOrderRepository(mongo_database, archive_collection_name=None)
+    await repository._ensure_indexes()
+    statuses = list(OrderStatus)
+    await repository.save_many(
+        [
+            Order(
+                order_id=OrderId(f"order-{i}"),
+                customer_id="customer-1",
+                items=[{"product_id": f"prod-{i % 10}", "quantity": 1, "price": 10.0}],
+                total_amount=Money(10),
+                status=statuses[i % len(statuses)],
+                created_at=datetime(2024, 1, 1, i // 60, i % 60),
+            )
+            for i in range(200)
+        ]
+    )
+
+    stages = winning_plan_stages(await repository.explain_find_by_product("prod-1"))
+
+    names = [stage["stage"] for stage in stages]
+    assert "COLLSCAN" not in names
+    assert "SORT" not in names
+    scans = [stage for stage in stages if stage["stage"] == "IXSCAN"]
+    assert scans
+    assert {stage["indexName"] for stage in scans} == {PRODUCT_STATUS_INDEX}
+
+
+def test_winning_plan_stages_detects_collection_scan():
+    """Testa leitura do formato clássico de explain com COLLSCAN e SORT."""
+    explain = {
+        "queryPlanner": {
+            "winningPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}},
+        }
+    }
+
+    assert winning_plan_stages(explain) == [{"stage": "SORT"}, {"stage": "COLLSCAN"}]
+
+
+class _StreamCursor:
+    """Cursor assíncrono sobre uma lista de documentos, registrando o batch_size."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.batch = None
+
+    def sort(self, *args):
+        return self
+
+    def batch_size(self, size):
+        self.batch = size
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    async def to_list(self, length=None):
+        return list(self.documents)
+
+
+@pytest.mark.asyncio
+async def test_iter_orders_yields_batches(mock_database):
+    """Testa leitura em lotes do intervalo de criação."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+    documents = [
+        {
+            "id": f"order-{index}",
+            "customer_id": "customer-1",
+            "items": [],
+            "total_amount": {"amount_minor": 100, "currency": "BRL", "exponent": 2},
+            "status": "pending",
+            "created_at": datetime(2024, 1, 1, 0, index),
+            "updated_at": datetime(2024, 1, 1, 0, index),
+        }
+        for index in range(5)
+    ]
+    cursor = _StreamCursor(documents)
+    collection.find = MagicMock(return_value=cursor)
+    created_from, created_to = datetime(2024, 1, 1), datetime(2024, 1, 2)
+
+    batches = [
+        [order.id for order in batch]
+        async for batch in repository.iter_orders(
+            created_from, created_to, [OrderStatus.PENDING], batch_size=2
+        )
+    ]
+
+    assert batches == [["order-0", "order-1"], ["order-2", "order-3"], ["order-4"]]
+    assert cursor.batch == 2
+    collection.find.assert_called_once_with(
+        {"created_at": {"$gte": created_from, "$lt": created_to}, "status": {"$in": ["pending"]}}
+    )
+
+
+def _imported(index, status=OrderStatus.PENDING, updated_at=datetime(2024, 1, 2)):
+    """Cria um pedido importado com `updated_at` fixo."""
+    return Order(
+        order_id=OrderId(f"order-{index}"),
+        customer_id="customer-1",
+        items=[{"product_id": "prod-1", "quantity": 1, "price": 10.0}],
+        total_amount=Money(10),
+        status=status,
+        created_at=datetime(2024, 1, 1),
+        updated_at=updated_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_many_inserts_new_orders_only_on_insert(mock_database):
+    """Testa que pedidos novos viram upserts com `$setOnInsert`."""
+    database, collection = mock_database
+    collection.find = MagicMock(return_value=_StreamCursor([]))
+    collection.bulk_write.return_value = MagicMock(upserted_ids={0: "a", 1: "b"}, modified_count=0)
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+    orders = [_imported(0), _imported(1)]
+
+    result = await repository.save_many(orders)
+
+    assert result.inserted == orders
+    assert result.updated == []
+    assert result.skipped == 0
+    operations = collection.bulk_write.call_args.args[0]
+    assert [operation._filter for operation in operations] == [{"id": "order-0"}, {"id": "order-1"}]
+    assert all(operation._upsert for operation in operations)
+    assert all(list(operation._doc) == ["$setOnInsert"] for operation in operations)
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+
+
+@pytest.mark.asyncio
+async def test_save_many_insert_lost_to_concurrent_create(mock_database):
+    """Testa que um upsert que não inseriu não conta como pedido novo."""
+    database, collection = mock_database
+    collection.find = MagicMock(return_value=_StreamCursor([]))
+    collection.bulk_write.return_value = MagicMock(upserted_ids={1: "b"}, modified_count=0)
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+    orders = [_imported(0), _imported(1)]
+
+    result = await repository.save_many(orders)
+
+    assert result.inserted == [orders[1]]
+    assert result.skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_save_many_never_rolls_back_newer_orders(mock_database):
+    """Testa que só versões mais novas atualizam, com filtro no `updated_at` lido."""
+    database, collection = mock_database
+    stored_at = datetime(2024, 1, 2)
+    collection.find = MagicMock(
+        return_value=_StreamCursor(
+            [
+                {"id": "order-0", "status": "shipped", "updated_at": stored_at},
+                {"id": "order-1", "status": "pending", "updated_at": stored_at},
+            ]
+        )
+    )
+    collection.bulk_write.return_value = MagicMock(upserted_ids={}, modified_count=1)
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+    stale = _imported(0, OrderStatus.CONFIRMED, updated_at=datetime(2024, 1, 1))
+    newer = _imported(1, OrderStatus.CONFIRMED, updated_at=datetime(2024, 1, 3))
+
+    result = await repository.save_many([stale, newer])
+
+    assert result.inserted == []
+    assert result.updated == [(newer, OrderStatus.PENDING)]
+    assert result.skipped == 1
+    [operation] = collection.bulk_write.call_args.args[0]
+    assert operation._filter == {"id": "order-1", "updated_at": stored_at}
+    assert not operation._upsert
+    assert operation._doc["$set"]["status"] == "confirmed"
+
+
+@pytest.mark.asyncio
+async def test_save_many_same_version_is_skipped(mock_database):
+    """Testa que reimportar a mesma versão (na precisão do MongoDB) não grava nada."""
+    database, collection = mock_database
+    collection.find = MagicMock(
+        return_value=_StreamCursor(
+            [
+                {
+                    "id": "order-0",
+                    "status": "pending",
+                    "updated_at": datetime(2024, 1, 2, 0, 0, 0, 5000),
+                }
+            ]
+        )
+    )
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+
+    result = await repository.save_many(
+        [_imported(0, updated_at=datetime(2024, 1, 2, 0, 0, 0, 5999))]
+    )
+
+    assert result.skipped == 1
+    collection.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_save_many_skips_archived_orders(mock_database):
+    """Testa que pedidos já arquivados não ganham uma segunda cópia em `orders`."""
+    database, collection = mock_database
+    archive = AsyncMock()
+    archive.find = MagicMock(return_value=_StreamCursor([{"id": "order-0"}]))
+    database.__getitem__ = MagicMock(
+        side_effect=lambda name: archive if name == "orders_archive" else collection
+    )
+    collection.find = MagicMock(return_value=_StreamCursor([]))
+    collection.bulk_write.return_value = MagicMock(upserted_ids={0: "b"}, modified_count=0)
+    repository = MongoOrderRepository(database)
+    orders = [_imported(0), _imported(1)]
+
+    result = await repository.save_many(orders)
+
+    assert result.inserted == [orders[1]]
+    assert result.skipped == 1
+    [operation] = collection.bulk_write.call_args.args[0]
+    assert operation._filter == {"id": "order-1"}
+
+
+@pytest.mark.asyncio
+async def test_save_many_confirms_partial_updates(mock_database):
+    """Testa que, com atualizações perdidas para outra operação, só as gravadas contam."""
+    database, collection = mock_database
+    stored_at = datetime(2024, 1, 2)
+    newer_at = datetime(2024, 1, 3)
+    collection.find = MagicMock(
+        side_effect=[
+            _StreamCursor(
+                [
+                    {"id": "order-0", "status": "pending", "updated_at": stored_at},
+                    {"id": "order-1", "status": "pending", "updated_at": stored_at},
+                ]
+            ),
+            _StreamCursor(
+                [
+                    {"id": "order-0", "updated_at": newer_at},
+                    {"id": "order-1", "updated_at": datetime(2024, 1, 2, 6)},
+                ]
+            ),
+        ]
+    )
+    collection.bulk_write.return_value = MagicMock(upserted_ids={}, modified_count=1)
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+    orders = [_imported(index, OrderStatus.CONFIRMED, updated_at=newer_at) for index in range(2)]
+
+    result = await repository.save_many(orders)
+
+    assert result.updated == [(orders[0], OrderStatus.PENDING)]
+    assert result.skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_save_many_empty(mock_database):
+    """Testa lote vazio sem ida ao banco."""
+    database, collection = mock_database
+
+    result = await MongoOrderRepository(database).save_many([])
+
+    assert (result.inserted, result.updated, result.skipped) == ([], [], 0)
+    collection.bulk_write.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_iter_changed_orders_full_and_incremental(mock_database):
+    """Testa intervalo de updated_at e ordenação de cada modo."""
+    database, collection = mock_database
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+    cursor = _StreamCursor([])
+    cursor.sort = MagicMock(return_value=cursor)
+    collection.find = MagicMock(return_value=cursor)
+    updated_from, updated_to = datetime(2024, 1, 1), datetime(2024, 1, 2)
+
+    assert [batch async for batch in repository.iter_changed_orders(None, updated_to)] == []
+    assert [
+        batch async for batch in repository.iter_changed_orders(updated_from, updated_to, 10)
+    ] == []
+
+    assert [call.args[0] for call in collection.find.call_args_list] == [
+        {"updated_at": {"$lt": updated_to}},
+        {"updated_at": {"$lt": updated_to, "$gte": updated_from}},
+    ]
+    assert [call.args for call in cursor.sort.call_args_list] == [
+        ("created_at", 1),
+        ("updated_at", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_orders_merges_archived_orders():
+    """Testa que pedidos arquivados são intercalados por data de criação."""
+    orders, archive = MagicMock(), MagicMock()
+    database = MagicMock()
+    database.__getitem__ = MagicMock(
+        side_effect=lambda name: {"orders": orders, "orders_archive": archive}[name]
+    )
+
+    def document(index, status):
+        return {
+            "id": f"order-{index}",
+            "customer_id": "customer-1",
+            "items": [],
+            "total_amount": {"amount_minor": 100, "currency": "BRL", "exponent": 2},
+            "status": status,
+            "created_at": datetime(2024, 1, 1, 0, index),
+            "updated_at": datetime(2024, 1, 1, 0, index),
+        }
+
+    orders.find = MagicMock(
+        return_value=_StreamCursor([document(index, "pending") for index in (0, 3, 4)])
+    )
+    archive.find = MagicMock(
+        return_value=_StreamCursor([document(index, "delivered") for index in (1, 2, 5)])
+    )
+    repository = MongoOrderRepository(database)
+
+    batches = [
+        [order.id for order in batch]
+        async for batch in repository.iter_orders(
+            datetime(2024, 1, 1), datetime(2024, 1, 2), batch_size=4
+        )
+    ]
+
+    assert batches == [["order-0", "order-1", "order-2", "order-3"], ["order-4", "order-5"]]
+    assert archive.find.call_args == orders.find.call_args
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_falls_back_to_archive():
+    """Testa busca no arquivo quando o pedido não está na coleção principal."""
+    orders = AsyncMock()
+    archive = AsyncMock()
+    database = MagicMock()
+    database.__getitem__ = MagicMock(
+        side_effect=lambda name: {"orders": orders, "orders_archive": archive}[name]
+    )
+    orders.find_one.return_value = None
+    archive.find_one.return_value = {
+        "id": "order-1",
+        "customer_id": "customer-1",
+        "items": [],
+        "total_amount": {"amount_minor": 100, "currency": "BRL", "exponent": 2},
+        "status": "delivered",
+        "created_at": datetime(2023, 1, 1),
+        "updated_at": datetime(2023, 1, 2),
+    }
+    repository = MongoOrderRepository(database)
+
+    order = await repository.find_by_id(OrderId("order-1"))
+    fields = await repository.find_fields_by_id(OrderId("order-1"), ("status",))
+
+    assert order.status == OrderStatus.DELIVERED
+    assert fields["status"] == "delivered"
+    archive.find_one.assert_any_await({"id": "order-1"})
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_without_archive(mock_database):
+    """Testa que o arquivo pode ser desativado."""
+    database, collection = mock_database
+    collection.find_one.return_value = None
+
+    repository = MongoOrderRepository(database, archive_collection_name=None)
+
+    assert await repository.find_by_id(OrderId("order-1")) is None
+    assert collection.find_one.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_find_stale_uses_status_created_at(mock_database):
+    """Testa busca dos pedidos pendentes mais antigos."""
+    database, collection = mock_database
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(
+        return_value=[
+            {
+                "id": "order-1",
+                "customer_id": "customer-1",
+                "items": [],
+                "total_amount": {"amount_minor": 100, "currency": "BRL", "exponent": 2},
+                "status": "pending",
+                "created_at": datetime(2024, 1, 1),
+                "updated_at": datetime(2024, 1, 1),
+            }
+        ]
+    )
+    collection.find = MagicMock(return_value=cursor)
+    cutoff = datetime(2024, 1, 2)
+
+    orders = await MongoOrderRepository(database).find_stale(OrderStatus.PENDING, cutoff, 50)
+
+    assert [order.id for order in orders] == ["order-1"]
+    collection.find.assert_called_once_with({"status": "pending", "created_at": {"$lt": cutoff}})
+    cursor.sort.assert_called_once_with("created_at", 1)
+    cursor.limit.assert_called_once_with(50)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("modified", "expected"), [(1, True), (0, False)])
+async def test_transition_is_conditional_on_read_status(mock_database, modified, expected):
+    """Testa que a transição só grava se o pedido ainda estiver no status lido."""
+    database, collection = mock_database
+    collection.update_one.return_value = MagicMock(modified_count=modified)
+    changed_at = datetime(2024, 1, 2)
+
+    updated = await MongoOrderRepository(database).transition(
+        OrderId("order-1"), OrderStatus.PENDING, OrderStatus.CONFIRMED, changed_at
+    )
+
+    assert updated is expected
+    collection.update_one.assert_called_once_with(
+        {"id": "order-1", "status": "pending"},
+        {"$set": {"status": "confirmed", "updated_at": changed_at}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_transition_many_conditional_updates(mock_database):
+    """Testa atualizações condicionais ao status esperado."""
+    database, collection = mock_database
+    collection.bulk_write.return_value = MagicMock(modified_count=2)
+    changed_at = datetime(2024, 1, 2)
+    ids = [OrderId("order-1"), OrderId("order-2")]
+
+    updated = await MongoOrderRepository(database).transition_many(
+        ids, OrderStatus.PENDING, OrderStatus.CANCELLED, changed_at
+    )
+
+    assert updated == ids
+    operations = collection.bulk_write.call_args.args[0]
+    assert operations[0]._filter == {"id": "order-1", "status": "pending"}
+    assert operations[0]._doc == {"$set": {"status": "cancelled", "updated_at": changed_at}}
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+
+
+@pytest.mark.asyncio
+async def test_transition_many_partial_reads_back_updated(mock_database):
+    """Testa identificação dos pedidos alterados quando alguns já mudaram de status."""
+    database, collection = mock_database
+    collection.bulk_write.return_value = MagicMock(modified_count=1)
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[{"id": "order-2"}])
+    collection.find = MagicMock(return_value=cursor)
+    changed_at = datetime(2024, 1, 2)
+
+    updated = await MongoOrderRepository(database).transition_many(
+        [OrderId("order-1"), OrderId("order-2")],
+        OrderStatus.PENDING,
+        OrderStatus.CANCELLED,
+        changed_at,
+    )
+
+    assert updated == ["order-2"]
+    query = collection.find.call_args.args[0]
+    assert query == {
+        "id": {"$in": ["order-1", "order-2"]},
+        "status": "cancelled",
+        "updated_at": changed_at,
+    }
+
+
+@pytest.mark.asyncio
+async def test_transition_many_none_updated(mock_database):
+    """Testa lote em que nenhum pedido continuava no status esperado."""
+    database, collection = mock_database
+    collection.bulk_write.return_value = MagicMock(modified_count=0)
+    repository = MongoOrderRepository(database)
+
+    assert (
+        await repository.transition_many(
+            [OrderId("order-1")], OrderStatus.PENDING, OrderStatus.CANCELLED, datetime(2024, 1, 2)
+        )
+        == []
+    )
+    assert (
+        await repository.transition_many(
+            [], OrderStatus.PENDING, OrderStatus.CANCELLED, datetime(2024, 1, 2)
+        )
+        == []
+    )
@@ -0,0 +1,119 @@
+"""Testes para OrderEventHub."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.adapters.messaging.order_event_hub import OrderEventHub, SubscriberLimitError
+
+EVENT = {
+    "order_id": "order-1",
+    "customer_id": "customer-1",
+    "old_status": "pending",
+    "new_status": "confirmed",
+    "event_type": "order.status_updated",
+}
+
+
+async def next_frame(subscription, heartbeat_seconds=1.0):
+    """Lê o próximo frame de uma assinatura."""
+    frames = subscription.frames(heartbeat_seconds)
+    try:
+        return await frames.__anext__()
+    finally:
+        await frames.aclose()
+
+
+@pytest.mark.asyncio
+async def test_publish_to_order_and_customer_subscribers():
+    """Testa entrega para assinantes do pedido e do cliente."""
+    hub = OrderEventHub()
+    by_order = hub.subscribe(order_id="order-1")
+    by_customer = hub.subscribe(customer_id="customer-1")
+    other = hub.subscribe(order_id="order-2")
+
+    delivered = hub.publish(EVENT)
+
+    assert delivered == 2
+    frame = await next_frame(by_order)
+    assert frame.startswith(b"event: order.status_updated\ndata: ")
+    assert json.loads(frame.split(b"data: ")[1]) == EVENT
+    assert await next_frame(by_customer) == frame
+    assert await next_frame(other, heartbeat_seconds=0.01) == b": keep-alive\n\n"
+
+
+def test_publish_without_subscribers():
+    """Testa publicação sem assinantes."""
+    assert OrderEventHub().publish(EVENT) == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_evicted():
+    """Testa remoção de assinante cujo buffer encheu."""
+    hub = OrderEventHub(buffer_size=2)
+    subscription = hub.subscribe(order_id="order-1")
+
+    for _ in range(3):
+        hub.publish(EVENT)
+
+    assert subscription.evicted is True
+    assert hub.subscriber_count == 0
+    frames = [frame async for frame in subscription.frames(1.0)]
+    assert frames == [b"event: evicted\ndata: {}\n\n"]
+
+
+def test_unsubscribe_is_idempotent():
+    """Testa remoção repetida de assinatura."""
+    hub = OrderEventHub()
+    subscription = hub.subscribe(order_id="order-1")
+
+    hub.unsubscribe(subscription)
+    hub.unsubscribe(subscription)
+
+    assert hub.subscriber_count == 0
+
+
+def test_subscriber_limit():
+    """Testa limite de assinantes."""
+    hub = OrderEventHub(max_subscribers=1)
+    hub.subscribe(order_id="order-1")
+
+    with pytest.raises(SubscriberLimitError):
+        hub.subscribe(order_id="order-2")
+
+
+def test_subscribe_requires_single_key():
+    """Testa que a assinatura exige exatamente uma chave."""
+    hub = OrderEventHub()
+
+    with pytest.raises(ValueError):
+        hub.subscribe()
+    with pytest.raises(ValueError):
+        hub.subscribe(order_id="order-1", customer_id="customer-1")
+
+
+@pytest.mark.asyncio
+async def test_consumer_feeds_hub():
+    """Testa que o consumidor RabbitMQ repassa eventos ao hub."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.adapters.messaging.rabbitmq_event_consumer import RabbitMQOrderEventConsumer
+
+    connection = MagicMock()
+    channel = AsyncMock()
+    queue = AsyncMock()
+    connection.channel = AsyncMock(return_value=channel)
+    channel.declare_queue = AsyncMock(return_value=queue)
+    hub = OrderEventHub()
+    subscription = hub.subscribe(order_id="order-1")
+    consumer = RabbitMQOrderEventConsumer(connection, hub)
+
+    await consumer.start()
+    callback = queue.consume.call_args.args[0]
+    await callback(MagicMock(body=json.dumps(EVENT).encode()))
+    await callback(MagicMock(body=b"not-json"))
+
+    queue.bind.assert_called_once()
+    assert queue.consume.call_args.kwargs["no_ack"] is True
+    assert json.loads((await asyncio.wait_for(next_frame(subscription), 1)).split(b"data: ")[1])
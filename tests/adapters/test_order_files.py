@@ -0,0 +1,91 @@
+"""Testes para leitura de arquivos de pedidos e checkpoint da importação."""
+
+import gzip
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.adapters.files.order_files import (
+    detect_format,
+    load_import_checkpoint,
+    read_order_records,
+    save_import_checkpoint,
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("orders.ndjson", "ndjson"), ("orders.jsonl.gz", "ndjson"), ("orders.CSV", "csv")],
+)
+def test_detect_format(name, expected):
+    """Testa detecção do formato pela extensão."""
+    assert detect_format(name) == expected
+
+
+def test_detect_format_unknown():
+    """Testa extensão desconhecida."""
+    with pytest.raises(ValueError):
+        detect_format("orders.txt")
+
+
+def test_read_ndjson_skips_checkpoint_and_flags_malformed(tmp_path):
+    """Testa leitura NDJSON com linhas puladas, em branco e malformadas."""
+    path = tmp_path / "orders.ndjson"
+    path.write_text('{"id": "1"}\n{"id": "2"}\n\n{quebrado\n[1]\n{"id": "6"}\n')
+
+    records = list(read_order_records(path, "ndjson", start_after=1))
+
+    assert records == [(2, {"id": "2"}), (4, None), (5, None), (6, {"id": "6"})]
+
+
+def test_read_gzip_ndjson(tmp_path):
+    """Testa leitura de arquivo comprimido."""
+    path = tmp_path / "orders.ndjson.gz"
+    with gzip.open(path, "wt") as handle:
+        handle.write('{"id": "1"}\n')
+
+    assert list(read_order_records(path, "ndjson")) == [(1, {"id": "1"})]
+
+
+def test_read_csv(tmp_path):
+    """Testa leitura CSV com itens em JSON e total decimal."""
+    path = tmp_path / "orders.csv"
+    items = json.dumps([{"product_id": "p", "quantity": 1, "price": 9.9}]).replace('"', '""')
+    path.write_text(
+        "id,customer_id,items,total_amount,currency,status\n"
+        f'1,c1,"{items}",9.90,BRL,\n'
+        "2,c1,nao-json,1,BRL,pending\n"
+    )
+
+    records = list(read_order_records(path, "csv"))
+
+    assert records[0] == (
+        1,
+        {
+            "id": "1",
+            "customer_id": "c1",
+            "items": [{"product_id": "p", "quantity": 1, "price": 9.9}],
+            "total_amount": Decimal("9.90"),
+            "currency": "BRL",
+        },
+    )
+    assert records[1] == (2, None)
+
+
+def test_read_invalid_format(tmp_path):
+    """Testa formato não suportado."""
+    with pytest.raises(ValueError):
+        list(read_order_records(tmp_path / "x", "xml"))
+
+
+def test_checkpoint_roundtrip(tmp_path):
+    """Testa gravação e leitura do checkpoint do mesmo arquivo."""
+    source = tmp_path / "orders.ndjson"
+    checkpoint = tmp_path / "orders.checkpoint"
+
+    assert load_import_checkpoint(checkpoint, source) == 0
+    save_import_checkpoint(checkpoint, source, 42)
+
+    assert load_import_checkpoint(checkpoint, source) == 42
+    assert load_import_checkpoint(checkpoint, tmp_path / "outro.ndjson") == 0
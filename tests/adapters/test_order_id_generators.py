@@ -0,0 +1,76 @@
+"""Testes para os geradores de IDs de pedido."""
+
+import uuid
+
+import pytest
+from bson import ObjectId
+
+from src.adapters.identifiers.order_id_generators import (
+    ObjectIdOrderIdGenerator,
+    UUID4OrderIdGenerator,
+    UUID7OrderIdGenerator,
+    build_order_id_generator,
+)
+
+
+def test_uuid4_generator():
+    """Testa geração de UUIDv4."""
+    order_id = UUID4OrderIdGenerator().new_id()
+
+    assert uuid.UUID(order_id).version == 4
+
+
+def test_uuid7_generator_format():
+    """Testa versão e variante do UUIDv7."""
+    value = uuid.UUID(UUID7OrderIdGenerator().new_id())
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_generator_is_monotonic():
+    """Testa que IDs gerados em sequência são crescentes."""
+    generator = UUID7OrderIdGenerator()
+
+    ids = [generator.new_id() for _ in range(5000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_uuid7_generator_counter_overflow():
+    """Testa que o estouro do contador avança o relógio lógico."""
+    generator = UUID7OrderIdGenerator()
+    first = generator.new_id()
+    generator._counter = 0xFFF
+
+    second = generator.new_id()
+
+    assert second > first
+
+
+def test_objectid_generator():
+    """Testa geração de ObjectId."""
+    order_id = ObjectIdOrderIdGenerator().new_id()
+
+    assert ObjectId.is_valid(order_id)
+    assert len(order_id) == 24
+
+
+@pytest.mark.parametrize(
+    "strategy,expected",
+    [
+        ("uuid4", UUID4OrderIdGenerator),
+        ("uuid7", UUID7OrderIdGenerator),
+        ("objectid", ObjectIdOrderIdGenerator),
+    ],
+)
+def test_build_order_id_generator(strategy, expected):
+    """Testa seleção da estratégia de IDs."""
+    assert isinstance(build_order_id_generator(strategy), expected)
+
+
+def test_build_order_id_generator_unknown():
+    """Testa estratégia desconhecida."""
+    with pytest.raises(ValueError, match="desconhecida"):
+        build_order_id_generator("snowflake")
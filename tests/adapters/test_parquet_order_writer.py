@@ -0,0 +1,162 @@
+"""Testes para a exportação Parquet de pedidos."""
+
+from datetime import datetime
+
+import pytest
+
+from src.adapters.analytics.parquet_order_writer import (
+    ParquetOrderWriter,
+    load_watermark,
+    save_watermark,
+)
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _order(index, day=1, status=OrderStatus.PENDING, items=2):
+    """Cria um pedido com `items` itens."""
+    return Order(
+        order_id=OrderId(f"order-{index}"),
+        customer_id="customer-1",
+        items=[
+            {"product_id": f"prod-{line}", "quantity": 1, "price": 2.5} for line in range(items)
+        ],
+        total_amount=Money(2.5 * items),
+        status=status,
+        created_at=datetime(2024, 1, day, 12, 0),
+        updated_at=datetime(2024, 1, day, 13, 0),
+    )
+
+
+async def _batches(*batches):
+    """Gera os lotes informados."""
+    for batch in batches:
+        yield batch
+
+
+def _files(root):
+    """Lista os arquivos Parquet visíveis, relativos à raiz."""
+    return sorted(str(path.relative_to(root)) for path in root.rglob("*.parquet"))
+
+
+def test_writes_partitioned_orders_and_items(tmp_path):
+    """Testa partições por dia/status e itens achatados."""
+    writer = ParquetOrderWriter(tmp_path, run_id="r1")
+    writer.write([_order(1), _order(2, status=OrderStatus.DELIVERED), _order(3, day=2)])
+
+    # Nada fica visível antes do close
+    assert _files(tmp_path) == []
+    result = writer.close()
+
+    assert result == {"orders": 3, "items": 6, "files": 6}
+    assert "orders/date=2024-01-01/status=delivered/part-r1-00000.parquet" in _files(tmp_path)
+    orders = pq.read_table(tmp_path / "orders" / "date=2024-01-01" / "status=pending")
+    assert orders.column("id").to_pylist() == ["order-1"]
+    assert orders.column("total_amount_minor").to_pylist() == [500]
+    assert orders.column("currency_exponent").to_pylist() == [2]
+    items = pq.read_table(tmp_path / "order_items" / "date=2024-01-01" / "status=pending")
+    assert items.column("order_id").to_pylist() == ["order-1", "order-1"]
+    assert items.column("line").to_pylist() == [0, 1]
+    assert items.column("price_minor").to_pylist() == [250, 250]
+
+
+@pytest.mark.parametrize(
+    ("currency", "price", "price_minor", "exponent"),
+    [("JPY", 250, 250, 0), ("KWD", 1.234, 1234, 3)],
+)
+def test_item_price_minor_uses_currency_exponent(tmp_path, currency, price, price_minor, exponent):
+    """Testa que o preço dos itens usa o expoente da moeda do pedido."""
+    order = Order(
+        order_id=OrderId("order-1"),
+        customer_id="customer-1",
+        items=[{"product_id": "prod-1", "quantity": 1, "price": price}],
+        total_amount=Money(price, currency),
+        created_at=datetime(2024, 1, 1, 12, 0),
+    )
+    writer = ParquetOrderWriter(tmp_path, run_id="r1")
+    writer.write([order])
+    writer.close()
+
+    orders = pq.read_table(tmp_path / "orders" / "date=2024-01-01" / "status=pending")
+    assert orders.column("currency_exponent").to_pylist() == [exponent]
+    assert orders.column("total_amount_minor").to_pylist() == [price_minor]
+    items = pq.read_table(tmp_path / "order_items" / "date=2024-01-01" / "status=pending")
+    assert items.column("price_minor").to_pylist() == [price_minor]
+
+
+def test_row_groups_and_buffer_limit(tmp_path):
+    """Testa gravação de row groups ao encher a partição e ao atingir o limite global."""
+    writer = ParquetOrderWriter(tmp_path, run_id="r1", row_group_size=2, max_buffered_rows=2)
+    writer.write([_order(index) for index in range(3)])
+    writer.write([_order(10, day=2)])
+
+    # Partição cheia (2) gravada e o limite global (2) esvaziou o restante
+    assert writer._buffered == 0
+    writer.close()
+
+    metadata = pq.ParquetFile(
+        tmp_path / "orders" / "date=2024-01-01" / "status=pending" / "part-r1-00000.parquet"
+    ).metadata
+    assert metadata.num_row_groups == 2
+    assert metadata.num_rows == 3
+
+
+def test_max_open_writers_rotates_files(tmp_path):
+    """Testa que o arquivo menos usado é fechado e a partição ganha um novo arquivo."""
+    writer = ParquetOrderWriter(tmp_path, run_id="r1", row_group_size=1, max_open_writers=2)
+    writer.write(
+        [
+            _order(1, items=0),
+            _order(2, day=2, items=0),
+            _order(3, status=OrderStatus.DELIVERED, items=0),
+            _order(4, items=0),
+        ]
+    )
+    writer.close()
+
+    assert _files(tmp_path) == [
+        "orders/date=2024-01-01/status=delivered/part-r1-00000.parquet",
+        "orders/date=2024-01-01/status=pending/part-r1-00000.parquet",
+        "orders/date=2024-01-01/status=pending/part-r1-00001.parquet",
+        "orders/date=2024-01-02/status=pending/part-r1-00000.parquet",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_batches(tmp_path):
+    """Testa consumo dos lotes do repositório."""
+    writer = ParquetOrderWriter(tmp_path, run_id="r1")
+
+    result = await writer.write_batches(_batches([_order(1)], [_order(2)]))
+
+    assert result["orders"] == 2
+    assert pq.read_table(tmp_path / "orders").num_rows == 2
+
+
+@pytest.mark.asyncio
+async def test_write_batches_failure_discards_files(tmp_path):
+    """Testa que uma falha na leitura descarta os arquivos da execução."""
+
+    async def failing():
+        yield [_order(1)]
+        raise RuntimeError("cursor perdido")
+
+    writer = ParquetOrderWriter(tmp_path, run_id="r1", row_group_size=1)
+
+    with pytest.raises(RuntimeError):
+        await writer.write_batches(failing())
+
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+
+
+def test_watermark_roundtrip(tmp_path):
+    """Testa gravação e leitura da marca d'água."""
+    assert load_watermark(tmp_path) is None
+
+    save_watermark(tmp_path / "novo", datetime(2024, 1, 2, 3, 4, 5))
+
+    assert load_watermark(tmp_path / "novo") == datetime(2024, 1, 2, 3, 4, 5)
@@ -1,10 +1,18 @@
 """Testes para RabbitMQPublisher."""
 
+import asyncio
+import json
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.adapters.messaging.rabbitmq_publisher import RabbitMQPublisher
+from src.application.deadline import DeadlineExceededError, deadline_scope
+from src.domain.events.status_change import StatusChange
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
 
 
 @pytest.fixture
@@ -37,3 +45,81 @@ async def test_publish_order_status_updated(mock_connection):
     exchange.publish.assert_called_once()
     # Verifica que publish foi chamado (a estrutura exata pode variar)
     assert exchange.publish.called
+
+
+@pytest.mark.asyncio
+async def test_publish_uses_default_timeout(mock_connection):
+    """Testa que o timeout padrão é usado sem deadline de requisição."""
+    connection, exchange = mock_connection
+    publisher = RabbitMQPublisher(connection, publish_timeout=3.0)
+    await publisher.connect()
+
+    await publisher.publish_order_status_updated("order-123", "pending", "confirmed")
+
+    assert exchange.publish.call_args.kwargs["timeout"] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_publish_timeout_bounded_by_deadline(mock_connection):
+    """Testa que o timeout de publicação respeita o deadline da requisição."""
+    connection, exchange = mock_connection
+    publisher = RabbitMQPublisher(connection, publish_timeout=3.0)
+    await publisher.connect()
+
+    with deadline_scope(0.5):
+        await publisher.publish_order_status_updated("order-123", "pending", "confirmed")
+
+    assert exchange.publish.call_args.kwargs["timeout"] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_publish_timeout_from_deadline_raises(mock_connection):
+    """Testa que timeout causado pelo deadline vira DeadlineExceededError."""
+    connection, exchange = mock_connection
+    exchange.publish = AsyncMock(side_effect=asyncio.TimeoutError())
+    publisher = RabbitMQPublisher(connection, publish_timeout=3.0)
+    await publisher.connect()
+
+    with deadline_scope(0.5):
+        with pytest.raises(DeadlineExceededError):
+            await publisher.publish_order_status_updated("order-123", "pending", "confirmed")
+
+
+@pytest.mark.asyncio
+async def test_publish_order_status_updates_batch(mock_connection):
+    """Testa publicação de um lote de eventos."""
+    connection, exchange = mock_connection
+    publisher = RabbitMQPublisher(connection)
+    changed_at = datetime(2024, 1, 1, 12, 0)
+    changes = [
+        StatusChange(
+            order_id=OrderId(f"order-{index}"),
+            customer_id="customer-1",
+            from_status=OrderStatus.PENDING,
+            to_status=OrderStatus.CANCELLED,
+            changed_at=changed_at,
+            total_amount=Money(10),
+        )
+        for index in range(3)
+    ]
+
+    await publisher.publish_order_status_updates(changes)
+
+    assert exchange.publish.await_count == 3
+    event = json.loads(exchange.publish.call_args_list[0].args[0].body)
+    assert event["order_id"] == "order-0"
+    assert event["old_status"] == "pending"
+    assert event["new_status"] == "cancelled"
+    assert event["timestamp"] == changed_at.isoformat()
+    assert publisher.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_publish_order_status_updates_empty(mock_connection):
+    """Testa lote vazio sem conexão ao broker."""
+    connection, _ = mock_connection
+    publisher = RabbitMQPublisher(connection)
+
+    await publisher.publish_order_status_updates([])
+
+    connection.channel.assert_not_called()
@@ -0,0 +1,119 @@
+"""Testes para a CLI de manutenção."""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.adapters.analytics.parquet_order_writer import load_watermark, save_watermark
+from src.app.cli import build_parser, main
+
+
+def test_parser_replay_arguments():
+    """Testa argumentos do subcomando replay."""
+    args = build_parser().parse_args(["replay", "--batch-size", "100", "--resume"])
+
+    assert args.command == "replay"
+    assert args.batch_size == 100
+    assert args.resume is True
+
+
+def test_parser_requires_command():
+    """Testa que um subcomando é obrigatório."""
+    with pytest.raises(SystemExit):
+        build_parser().parse_args([])
+
+
+def test_main_prints_result(capsys):
+    """Testa que o resultado do subcomando é impresso em JSON."""
+    with (
+        patch("src.app.cli.ReplayHistoryUseCase") as use_case_class,
+        patch("src.app.cli.AsyncIOMotorClient"),
+    ):
+        use_case_class.return_value.execute = AsyncMock(return_value={"changes": 3})
+
+        main(["replay"])
+
+    assert json.loads(capsys.readouterr().out) == {"changes": 3}
+
+
+def test_main_reconcile_stats(capsys):
+    """Testa o subcomando reconcile-stats."""
+    with (
+        patch("src.app.cli.MongoOrderStatsProjection") as projection_class,
+        patch("src.app.cli.AsyncIOMotorClient"),
+    ):
+        projection_class.return_value.reconcile = AsyncMock(return_value={"days": 7})
+
+        main(["reconcile-stats", "--days", "7"])
+
+    projection_class.return_value.reconcile.assert_awaited_once_with(days=7)
+    assert json.loads(capsys.readouterr().out) == {"days": 7}
+
+
+def test_main_rebuild_customer_summaries(capsys):
+    """Testa o subcomando rebuild-customer-summaries."""
+    with (
+        patch("src.app.cli.MongoCustomerSummaryProjection") as projection_class,
+        patch("src.app.cli.AsyncIOMotorClient"),
+    ):
+        projection_class.return_value.rebuild = AsyncMock(return_value={"customers": 2})
+
+        main(["rebuild-customer-summaries", "--batch-size", "10", "--concurrency", "2"])
+
+    projection_class.return_value.rebuild.assert_awaited_once_with(batch_size=10, concurrency=2)
+    assert json.loads(capsys.readouterr().out) == {"customers": 2}
+
+
+def test_main_import_orders_uses_checkpoint(capsys, tmp_path):
+    """Testa o subcomando import-orders retomando do checkpoint."""
+    source = tmp_path / "orders.ndjson"
+    source.write_text('{"id": "1"}\n{"id": "2"}\n')
+    checkpoint = tmp_path / "import.checkpoint"
+    checkpoint.write_text(json.dumps({"source": str(source.resolve()), "line": 1}))
+    seen = []
+
+    async def execute(records, batch_size, concurrency, on_checkpoint):
+        seen.extend(records)
+        on_checkpoint(2)
+        return {"rows": 1}
+
+    with (
+        patch("src.app.cli.ImportOrdersUseCase") as use_case_class,
+        patch("src.app.cli.AsyncIOMotorClient"),
+    ):
+        use_case_class.return_value.execute = execute
+
+        main(["import-orders", str(source), "--checkpoint", str(checkpoint), "--batch-size", "5"])
+
+    assert seen == [(2, {"id": "2"})]
+    assert json.loads(checkpoint.read_text())["line"] == 2
+    assert json.loads(capsys.readouterr().out) == {"resumed_after": 1, "rows": 1}
+
+
+def test_main_export_parquet_incremental(capsys, tmp_path):
+    """Testa o subcomando export-parquet usando e avançando a marca d'água."""
+    pytest.importorskip("pyarrow")
+    save_watermark(tmp_path, datetime(2024, 1, 1))
+
+    async def batches(*args):
+        return
+        yield
+
+    with (
+        patch("src.app.cli.MongoOrderRepository") as repository_class,
+        patch("src.app.cli.AsyncIOMotorClient"),
+    ):
+        repository_class.return_value.iter_changed_orders = MagicMock(side_effect=batches)
+
+        main(["export-parquet", str(tmp_path), "--incremental", "--lag-seconds", "0"])
+
+    updated_from, updated_to, batch_size = (
+        repository_class.return_value.iter_changed_orders.call_args.args
+    )
+    assert updated_from == datetime(2024, 1, 1)
+    assert batch_size == 5000
+    assert load_watermark(tmp_path) == updated_to
+    output = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert output["orders"] == 0
@@ -34,6 +34,10 @@ async def test_container_initialization(container):
         assert container._message_broker is not None
         assert isinstance(container._repository, MongoOrderRepository)
         assert isinstance(container._message_broker, RabbitMQPublisher)
+        assert container._readiness is not None
+        assert container.get_create_order_use_case() is container.get_create_order_use_case()
+
+        await container.shutdown()
 
 
 @pytest.mark.asyncio
@@ -48,46 +52,151 @@ async def test_container_shutdown(container):
     assert container._rabbitmq_connection.close.called
 
 
-def test_get_create_order_use_case(container):
-    """Testa get_create_order_use_case."""
+@pytest.fixture
+def built_container(container):
+    """Container com dependências mockadas e casos de uso construídos."""
     container._repository = MagicMock()
+    container._message_broker = MagicMock()
+    container._history = MagicMock()
+    container._stats = MagicMock()
+    container._customer_summaries = MagicMock()
+    container._build_use_cases()
+    return container
 
-    use_case = container.get_create_order_use_case()
+
+def test_get_create_order_use_case(built_container):
+    """Testa get_create_order_use_case."""
+    use_case = built_container.get_create_order_use_case()
 
     assert use_case is not None
+    assert use_case is built_container.get_create_order_use_case()
 
 
 def test_get_create_order_use_case_not_initialized(container):
     """Testa get_create_order_use_case sem inicialização."""
-    container._repository = None
-
     with pytest.raises(RuntimeError, match="não inicializado"):
         container.get_create_order_use_case()
 
 
-def test_get_get_order_use_case(container):
+def test_get_get_order_use_case(built_container):
     """Testa get_get_order_use_case."""
-    container._repository = MagicMock()
-
-    use_case = container.get_get_order_use_case()
+    use_case = built_container.get_get_order_use_case()
 
     assert use_case is not None
+    assert use_case is built_container.get_get_order_use_case()
 
 
-def test_get_update_order_status_use_case(container):
+def test_get_update_order_status_use_case(built_container):
     """Testa get_update_order_status_use_case."""
-    container._repository = MagicMock()
-    container._message_broker = MagicMock()
-
-    use_case = container.get_update_order_status_use_case()
+    use_case = built_container.get_update_order_status_use_case()
 
     assert use_case is not None
+    assert use_case is built_container.get_update_order_status_use_case()
 
 
 def test_get_update_order_status_use_case_not_initialized(container):
     """Testa get_update_order_status_use_case sem inicialização."""
-    container._repository = None
-    container._message_broker = None
-
     with pytest.raises(RuntimeError, match="não inicializado"):
         container.get_update_order_status_use_case()
+
+
+def test_build_use_cases_not_initialized(container):
+    """Testa que os casos de uso exigem repositório e broker."""
+    with pytest.raises(RuntimeError, match="não inicializado"):
+        container._build_use_cases()
+
+
+def test_get_get_order_history_use_case(built_container):
+    """Testa get_get_order_history_use_case."""
+    use_case = built_container.get_get_order_history_use_case()
+
+    assert use_case is built_container.get_get_order_history_use_case()
+
+
+def test_get_get_order_history_use_case_not_initialized(container):
+    """Testa get_get_order_history_use_case sem inicialização."""
+    with pytest.raises(RuntimeError, match="não inicializado"):
+        container.get_get_order_history_use_case()
+
+
+def test_get_get_order_stats_use_case(built_container):
+    """Testa get_get_order_stats_use_case."""
+    use_case = built_container.get_get_order_stats_use_case()
+
+    assert use_case is built_container.get_get_order_stats_use_case()
+
+
+def test_get_get_order_stats_use_case_not_initialized(container):
+    """Testa get_get_order_stats_use_case sem inicialização."""
+    with pytest.raises(RuntimeError, match="não inicializado"):
+        container.get_get_order_stats_use_case()
+
+
+def test_get_get_customer_summary_use_case(built_container):
+    """Testa get_get_customer_summary_use_case."""
+    use_case = built_container.get_get_customer_summary_use_case()
+
+    assert use_case is built_container.get_get_customer_summary_use_case()
+
+
+def test_get_get_customer_summary_use_case_not_initialized(container):
+    """Testa get_get_customer_summary_use_case sem inicialização."""
+    with pytest.raises(RuntimeError, match="não inicializado"):
+        container.get_get_customer_summary_use_case()
+
+
+def test_get_list_orders_by_product_use_case(built_container):
+    """Testa get_list_orders_by_product_use_case."""
+    use_case = built_container.get_list_orders_by_product_use_case()
+
+    assert use_case is built_container.get_list_orders_by_product_use_case()
+
+
+def test_get_list_orders_by_product_use_case_not_initialized(container):
+    """Testa get_list_orders_by_product_use_case sem inicialização."""
+    with pytest.raises(RuntimeError, match="não inicializado"):
+        container.get_list_orders_by_product_use_case()
+
+
+def test_get_export_orders_use_case(built_container):
+    """Testa get_export_orders_use_case."""
+    use_case = built_container.get_export_orders_use_case()
+
+    assert use_case is built_container.get_export_orders_use_case()
+
+
+def test_get_export_orders_use_case_not_initialized(container):
+    """Testa get_export_orders_use_case sem inicialização."""
+    with pytest.raises(RuntimeError, match="não inicializado"):
+        container.get_export_orders_use_case()
+
+
+def test_schedule_jobs_archive_enabled(container):
+    """Testa registro do job de arquivamento quando habilitado."""
+    container._archiver = MagicMock()
+    with patch("src.app.container.settings") as settings:
+        settings.archive_enabled = True
+        settings.archive_interval_seconds = 60.0
+        settings.auto_cancel_enabled = False
+        container._schedule_jobs()
+
+    assert list(container.get_jobs_snapshot()) == ["archive_orders"]
+
+
+def test_schedule_jobs_archive_disabled(container):
+    """Testa que nenhum job é registrado por padrão."""
+    container._archiver = MagicMock()
+    container._schedule_jobs()
+
+    assert container.get_jobs_snapshot() == {}
+
+
+def test_schedule_jobs_auto_cancel_enabled(built_container):
+    """Testa registro do job de cancelamento automático quando habilitado."""
+    with patch("src.app.container.settings") as settings:
+        settings.archive_enabled = False
+        settings.auto_cancel_enabled = True
+        settings.auto_cancel_interval_seconds = 60.0
+        built_container._schedule_jobs()
+
+    assert list(built_container.get_jobs_snapshot()) == ["cancel_stale_orders"]
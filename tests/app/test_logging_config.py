@@ -0,0 +1,123 @@
+"""Testes para a configuração de logging."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from src.app.logging_config import EventSampler, QueueLogger, QueueLogSink, configure_logging
+
+
+@pytest.fixture(autouse=True)
+def reset_structlog():
+    """Restaura a configuração padrão do structlog após cada teste."""
+    yield
+    structlog.reset_defaults()
+
+
+def test_queue_sink_writes_json_lines_in_batches():
+    """Testa escrita pela thread, serializando os eventos."""
+    stream = io.StringIO()
+    sink = QueueLogSink(stream=stream)
+    logger = QueueLogger(sink)
+
+    for index in range(3):
+        logger.info(event="Pedido encontrado", order_id=f"order-{index}", amount=1.5)
+    sink.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["order_id"] for line in lines] == ["order-0", "order-1", "order-2"]
+    assert lines[0]["event"] == "Pedido encontrado"
+
+
+def test_queue_sink_drops_when_full():
+    """Testa descarte sem bloqueio quando a fila está cheia."""
+    sink = QueueLogSink(stream=io.StringIO(), max_queue_size=1)
+    sink.close()
+    sink.put({"event": "a", "level": "info"})
+    sink.put({"event": "b", "level": "info"})
+
+    assert sink.dropped == 1
+
+
+def test_queue_sink_writes_warnings_when_full():
+    """Testa que avisos e erros não são descartados com a fila cheia."""
+    stream = io.StringIO()
+    sink = QueueLogSink(stream=stream, max_queue_size=1)
+    sink.close()
+    sink.put({"event": "a", "level": "info"})
+    sink.put({"event": "b", "level": "warning"})
+    sink.put({"event": "c", "level": "error"})
+
+    assert sink.dropped == 0
+    assert [json.loads(line)["event"] for line in stream.getvalue().splitlines()] == ["b", "c"]
+
+
+def test_queue_sink_survives_unserializable_event():
+    """Testa que um evento não serializável não interrompe a thread de escrita."""
+    stream = io.StringIO()
+    sink = QueueLogSink(stream=stream)
+    circular: dict = {}
+    circular["self"] = circular
+
+    sink.put({"event": "Circular", "level": "info", "payload": circular})
+    sink.put({"event": "Depois", "level": "info"})
+    sink.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[0]["event"] == "Evento de log não serializável"
+    assert "Circular" in lines[0]["repr"]
+    assert lines[1]["event"] == "Depois"
+
+
+def test_event_sampler():
+    """Testa amostragem apenas de eventos informativos configurados."""
+    sampler = EventSampler({"Buscando pedido": 0.25})
+
+    with patch("src.app.logging_config.random.random", return_value=0.1):
+        kept = sampler(None, "info", {"event": "Buscando pedido"})
+    assert kept["sample_rate"] == 0.25
+
+    with patch("src.app.logging_config.random.random", return_value=0.9):
+        with pytest.raises(structlog.DropEvent):
+            sampler(None, "info", {"event": "Buscando pedido"})
+        assert sampler(None, "warning", {"event": "Buscando pedido"}) == {
+            "event": "Buscando pedido"
+        }
+        assert sampler(None, "info", {"event": "Outro"}) == {"event": "Outro"}
+
+
+def test_configure_logging_async_honours_level_and_sampling():
+    """Testa nível mínimo e amostragem no pipeline completo."""
+    stream = io.StringIO()
+    with patch("src.app.logging_config.QueueLogSink", lambda **kwargs: QueueLogSink(stream)):
+        sink = configure_logging("WARNING", sampling={"Descartado": 0.0})
+    logger = structlog.get_logger()
+
+    logger.info("Abaixo do nível")
+    logger.warning("Descartado", order_id="order-1")
+    logger.error("Erro ao salvar", order_id="order-2")
+    sink.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == ["Descartado", "Erro ao salvar"]
+    assert lines[1]["level"] == "error"
+    assert "timestamp" in lines[1]
+
+
+def test_configure_logging_sync(capsys):
+    """Testa escrita síncrona no stdout."""
+    assert configure_logging("debug", async_sink=False) is None
+
+    structlog.get_logger().debug("Criando pedido", customer_id="customer-1")
+
+    line = json.loads(capsys.readouterr().out)
+    assert line["event"] == "Criando pedido"
+
+
+def test_configure_logging_invalid_level():
+    """Testa nível desconhecido."""
+    with pytest.raises(ValueError):
+        configure_logging("VERBOSE", async_sink=False)
@@ -0,0 +1,115 @@
+"""Testes para o diagnóstico de memória."""
+
+import tracemalloc
+from functools import lru_cache
+
+import pytest
+
+from src.app.memory_diagnostics import MemoryDiagnostics, SnapshotNotFoundError
+from src.domain.value_objects.money import Money
+
+
+@pytest.fixture
+def diagnostics():
+    """Diagnóstico com tracemalloc desligado ao final."""
+    diagnostics = MemoryDiagnostics(tracked_types=(Money,), max_snapshots=2)
+    yield diagnostics
+    diagnostics.stop()
+
+
+def test_start_and_stop(diagnostics):
+    """Testa ligar e desligar o tracemalloc."""
+    status = diagnostics.start(frames=3)
+
+    assert status["tracing"] is True
+    assert status["frames"] == 3
+    assert diagnostics.stop()["tracing"] is False
+    assert not tracemalloc.is_tracing()
+
+
+def test_snapshot_requires_tracing(diagnostics):
+    """Testa snapshot sem tracemalloc ativo."""
+    with pytest.raises(ValueError):
+        diagnostics.take_snapshot()
+
+
+def test_top_and_diff(diagnostics):
+    """Testa top de alocações e diferença entre snapshots."""
+    diagnostics.start()
+    base = diagnostics.take_snapshot()
+    retained = [bytearray(1024) for _ in range(200)]
+    current = diagnostics.take_snapshot()
+
+    top = diagnostics.top(current.id, limit=5)
+    assert top["id"] == current.id
+    assert len(top["top"]) <= 5
+    assert top["top"][0]["size_bytes"] >= top["top"][-1]["size_bytes"]
+
+    diff = diagnostics.diff(current.id, base.id, limit=3)
+    assert diff["base"]["id"] == base.id
+    assert diff["size_diff_bytes"] > 200 * 1024
+    assert diff["top"][0]["location"].startswith(__file__)
+    assert diff["top"][0]["size_diff_bytes"] >= 200 * 1024
+    assert len(retained) == 200
+
+
+def test_traceback_grouping(diagnostics):
+    """Testa agrupamento por pilha."""
+    diagnostics.start(frames=5)
+    retained = bytearray(100_000)
+    snapshot = diagnostics.take_snapshot()
+
+    stat = diagnostics.top(snapshot.id, limit=1, key_type="traceback")["top"][0]
+    assert stat["location"] == stat["traceback"][-1]
+    assert len(retained) == 100_000
+
+
+def test_invalid_key_type(diagnostics):
+    """Testa agrupamento desconhecido."""
+    diagnostics.start()
+    snapshot = diagnostics.take_snapshot()
+
+    with pytest.raises(ValueError):
+        diagnostics.top(snapshot.id, key_type="module")
+
+
+def test_old_snapshots_are_discarded(diagnostics):
+    """Testa limite de snapshots mantidos."""
+    diagnostics.start()
+    first = diagnostics.take_snapshot()
+    diagnostics.take_snapshot()
+    diagnostics.take_snapshot()
+
+    assert [snapshot["id"] for snapshot in diagnostics.status()["snapshots"]] == [2, 3]
+    with pytest.raises(SnapshotNotFoundError):
+        diagnostics.top(first.id)
+
+
+def test_stop_discards_snapshots(diagnostics):
+    """Testa que desligar o tracemalloc descarta os snapshots."""
+    diagnostics.start()
+    snapshot = diagnostics.take_snapshot()
+    diagnostics.stop()
+
+    with pytest.raises(SnapshotNotFoundError):
+        diagnostics.get_snapshot(snapshot.id)
+
+
+def test_object_counts():
+    """Testa contagem de instâncias vivas e entradas de cache."""
+
+    @lru_cache(maxsize=8)
+    def cached(value: int) -> int:
+        return value
+
+    cached(1)
+    cached(1)
+    cached(2)
+    diagnostics = MemoryDiagnostics(tracked_types=(Money,), caches={"cached": cached})
+    before = diagnostics.object_counts()["objects"]["Money"]
+    values = [Money(i) for i in range(50)]
+
+    counts = diagnostics.object_counts()
+    assert counts["objects"]["Money"] - before == len(values)
+    assert counts["caches"]["cached"] == {"entries": 2, "max_size": 8, "hits": 1, "misses": 2}
+    assert counts["gc_objects"] > 0
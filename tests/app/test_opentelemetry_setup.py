@@ -0,0 +1,113 @@
+"""Testes para a configuração do OpenTelemetry."""
+
+import json
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+import structlog  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+from src.adapters.http.middleware import CorrelationIDMiddleware, TracingMiddleware  # noqa: E402
+from src.app import tracing as tracing_setup  # noqa: E402
+from src.application.tracing import inject_context, traced  # noqa: E402
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """Configura o tracing com um exportador em memória."""
+    memory = InMemorySpanExporter()
+    monkeypatch.setattr(tracing_setup, "build_span_exporter", lambda name, path: memory)
+    provider = tracing_setup.configure_tracing("memory")
+    yield memory, provider
+    tracing_setup.shutdown_tracing(provider)
+
+
+@pytest.mark.asyncio
+async def test_spans_are_nested_and_carry_correlation_id(exporter):
+    """Testa hierarquia de spans, correlation ID e injeção nos headers."""
+    memory, provider = exporter
+    headers: dict = {}
+
+    @traced("mongo.find_by_id", "client", {"db.system": "mongodb"})
+    async def find() -> None:
+        inject_context(headers)
+
+    @traced("use_case.get_order")
+    async def execute() -> None:
+        await find()
+
+    structlog.contextvars.bind_contextvars(correlation_id="corr-1")
+    try:
+        await execute()
+    finally:
+        structlog.contextvars.clear_contextvars()
+    provider.force_flush()
+
+    spans = {span.name: span for span in memory.get_finished_spans()}
+    child, parent = spans["mongo.find_by_id"], spans["use_case.get_order"]
+    assert child.parent.span_id == parent.context.span_id
+    assert child.attributes["db.system"] == "mongodb"
+    assert parent.attributes["correlation_id"] == "corr-1"
+    assert headers["traceparent"].split("-")[2] == format(child.context.span_id, "016x")
+
+
+def test_tracing_middleware_continues_trace(exporter):
+    """Testa span de servidor com template da rota e trace do chamador."""
+    memory, provider = exporter
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(CorrelationIDMiddleware)
+
+    @app.get("/orders/{order_id}")
+    async def get_order(order_id: str) -> dict:
+        return {"id": order_id}
+
+    response = TestClient(app).get(
+        "/orders/123",
+        headers={
+            "traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01",
+            "X-Correlation-ID": "corr-2",
+        },
+    )
+    provider.force_flush()
+
+    assert response.status_code == 200
+    (span,) = memory.get_finished_spans()
+    assert span.name == "GET /orders/{order_id}"
+    assert format(span.context.trace_id, "032x") == TRACE_ID
+    assert span.attributes["http.route"] == "/orders/{order_id}"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["correlation_id"] == "corr-2"
+
+
+def test_build_span_exporter(tmp_path):
+    """Testa exportadores por nome e por fábrica."""
+    factory = "opentelemetry.sdk.trace.export.in_memory_span_exporter:InMemorySpanExporter"
+    assert isinstance(tracing_setup.build_span_exporter(factory), InMemorySpanExporter)
+    assert tracing_setup.build_span_exporter("console") is not None
+    with pytest.raises(ValueError):
+        tracing_setup.build_span_exporter("zipkin")
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    """Testa exportador em arquivo, utilizável sem coletor."""
+    path = tmp_path / "traces.jsonl"
+    provider = tracing_setup.configure_tracing("file", file_path=str(path))
+
+    @traced("use_case.test")
+    def run() -> None:
+        pass
+
+    run()
+    tracing_setup.shutdown_tracing(provider)
+
+    (line,) = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["name"] == "use_case.test"
@@ -0,0 +1,113 @@
+"""Testes para ReadinessProber."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo import _csot
+
+from src.adapters.persistence.pool_monitor import MongoPoolMonitor
+from src.app.readiness import ReadinessProber
+
+
+def build_prober(ping=None, connected=True, interval=5.0):
+    """Cria um prober com dependências mockadas."""
+    mongo_client = MagicMock()
+    mongo_client.admin.command = ping or AsyncMock(return_value={"ok": 1})
+    publisher = MagicMock()
+    publisher.is_connected = connected
+    publisher.queue_depth = 3
+    return (
+        ReadinessProber(mongo_client, publisher, MongoPoolMonitor(), interval_seconds=interval),
+        mongo_client,
+    )
+
+
+def test_snapshot_before_first_probe():
+    """Testa que o serviço não está pronto antes do primeiro probe."""
+    prober, _ = build_prober()
+
+    assert prober.snapshot()["status"] == "not_ready"
+
+
+@pytest.mark.asyncio
+async def test_probe_ready():
+    """Testa snapshot com todas as dependências disponíveis."""
+    prober, mongo_client = build_prober()
+
+    await prober.probe()
+    snapshot = prober.snapshot()
+
+    assert snapshot["status"] == "ready"
+    assert snapshot["mongodb"]["status"] == "up"
+    assert snapshot["mongodb"]["latency_ms"] >= 0
+    assert snapshot["rabbitmq"] == {"status": "up", "queue_depth": 3}
+    assert snapshot["mongodb_pool"]["max_size"] == 100
+    mongo_client.admin.command.assert_called_once_with("ping")
+
+
+@pytest.mark.asyncio
+async def test_probe_mongodb_uses_pymongo_timeout():
+    """Testa que o ping roda sob `pymongo.timeout`, com o limite do prober."""
+    timeouts = []
+
+    async def ping(command):
+        timeouts.append(_csot.get_timeout())
+        return {"ok": 1}
+
+    prober, _ = build_prober(ping=AsyncMock(side_effect=ping))
+
+    await prober.probe()
+
+    assert timeouts == [prober._timeout_seconds]
+    assert _csot.get_timeout() is None
+
+
+@pytest.mark.asyncio
+async def test_probe_mongodb_down():
+    """Testa snapshot com MongoDB indisponível."""
+    prober, _ = build_prober(ping=AsyncMock(side_effect=ConnectionError("sem rota")))
+
+    await prober.probe()
+    snapshot = prober.snapshot()
+
+    assert snapshot["status"] == "not_ready"
+    assert snapshot["mongodb"] == {"status": "down", "error": "sem rota"}
+
+
+@pytest.mark.asyncio
+async def test_probe_rabbitmq_down():
+    """Testa snapshot com RabbitMQ desconectado."""
+    prober, _ = build_prober(connected=False)
+
+    await prober.probe()
+
+    assert prober.snapshot()["rabbitmq"]["status"] == "down"
+    assert prober.snapshot()["status"] == "not_ready"
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_not_ready():
+    """Testa que snapshot antigo é tratado como não pronto."""
+    prober, _ = build_prober(interval=0.001)
+
+    await prober.probe()
+    await asyncio.sleep(0.01)
+
+    assert prober.snapshot()["status"] == "not_ready"
+
+
+@pytest.mark.asyncio
+async def test_background_loop_caches_results():
+    """Testa que o loop em background executa probes e pode ser parado."""
+    prober, mongo_client = build_prober(interval=0.01)
+
+    prober.start()
+    await asyncio.sleep(0.05)
+    await prober.stop()
+
+    assert mongo_client.admin.command.call_count >= 2
+    calls = mongo_client.admin.command.call_count
+    prober.snapshot()
+    prober.snapshot()
+    assert mongo_client.admin.command.call_count == calls
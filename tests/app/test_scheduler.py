@@ -0,0 +1,80 @@
+"""Testes para o agendador de jobs."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.app.scheduler import JobScheduler
+
+
+@pytest.mark.asyncio
+async def test_run_once_records_result():
+    """Testa registro do resultado de uma execução."""
+    scheduler = JobScheduler()
+    scheduler.add_job("job", 60, AsyncMock(return_value={"archived": 3}))
+
+    assert await scheduler.run_once("job") == {"archived": 3}
+
+    snapshot = scheduler.snapshot()["job"]
+    assert snapshot["runs"] == 1
+    assert snapshot["running"] is False
+    assert snapshot["last_result"] == {"archived": 3}
+    assert snapshot["last_error"] is None
+    assert snapshot["last_duration_seconds"] is not None
+
+
+@pytest.mark.asyncio
+async def test_run_once_records_error():
+    """Testa que erros são registrados sem propagar."""
+    scheduler = JobScheduler()
+    scheduler.add_job("job", 60, AsyncMock(side_effect=RuntimeError("mongo fora")))
+
+    assert await scheduler.run_once("job") is None
+    assert scheduler.snapshot()["job"]["last_error"] == "mongo fora"
+
+
+def test_add_job_duplicate_name():
+    """Testa nome de job repetido."""
+    scheduler = JobScheduler()
+    scheduler.add_job("job", 60, AsyncMock())
+
+    with pytest.raises(ValueError):
+        scheduler.add_job("job", 60, AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_start_runs_periodically_and_stop():
+    """Testa execução periódica e cancelamento."""
+    scheduler = JobScheduler()
+    run = AsyncMock(return_value={})
+    scheduler.add_job("job", 0.01, run)
+
+    scheduler.start()
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert run.await_count >= 2
+    calls = run.await_count
+    await asyncio.sleep(0.03)
+    assert run.await_count == calls
+
+
+@pytest.mark.asyncio
+async def test_run_once_profiles_selected_jobs(tmp_path):
+    """Testa profile dos jobs configurados."""
+    pytest.importorskip("pyinstrument")
+    scheduler = JobScheduler(profile_jobs=["archive_orders"], profile_dir=str(tmp_path))
+
+    async def run() -> dict:
+        await asyncio.sleep(0.005)
+        return {"archived": 0}
+
+    scheduler.add_job("archive_orders", 60, run)
+    scheduler.add_job("cancel_stale_orders", 60, run)
+
+    assert await scheduler.run_once("archive_orders") == {"archived": 0}
+    assert await scheduler.run_once("cancel_stale_orders") == {"archived": 0}
+
+    (profile,) = tmp_path.iterdir()
+    assert profile.name.endswith("-job-archive_orders.html")
@@ -0,0 +1,66 @@
+"""Testes para ArchiveOrdersUseCase."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.archive_orders import ArchiveOrdersUseCase
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@pytest.fixture
+def archive():
+    """Cria mock do arquivo com 5 pedidos arquiváveis."""
+    archive = AsyncMock()
+    archive.count_archivable.return_value = 5
+    archive.archive_batch.side_effect = [2, 2, 1]
+    return archive
+
+
+@pytest.mark.asyncio
+async def test_archive_orders_until_exhausted(archive):
+    """Testa lotes até um lote incompleto, apenas com status terminais."""
+    result = await ArchiveOrdersUseCase(archive).execute(
+        timedelta(days=30), batch_size=2, pause_seconds=0
+    )
+
+    assert result["archived"] == 5
+    assert result["batches"] == 3
+    assert result["remaining"] == 0
+    statuses, updated_before, batch_size = archive.archive_batch.await_args.args
+    assert statuses == {OrderStatus.DELIVERED, OrderStatus.CANCELLED}
+    assert datetime.utcnow() - updated_before >= timedelta(days=30)
+    assert batch_size == 2
+
+
+@pytest.mark.asyncio
+async def test_archive_orders_max_batches(archive):
+    """Testa limite de lotes por execução."""
+    result = await ArchiveOrdersUseCase(archive).execute(
+        timedelta(days=30), batch_size=2, pause_seconds=0, max_batches=1
+    )
+
+    assert result["archived"] == 2
+    assert result["remaining"] == 3
+    assert archive.archive_batch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_archive_orders_nothing_to_archive():
+    """Testa execução sem pedidos arquiváveis."""
+    archive = AsyncMock()
+    archive.count_archivable.return_value = 0
+    archive.archive_batch.return_value = 0
+
+    result = await ArchiveOrdersUseCase(archive).execute(timedelta(days=1), pause_seconds=0)
+
+    assert result["archived"] == 0
+    assert result["batches"] == 0
+
+
+@pytest.mark.asyncio
+async def test_archive_orders_invalid_batch_size():
+    """Testa tamanho de lote inválido."""
+    with pytest.raises(ValueError):
+        await ArchiveOrdersUseCase(AsyncMock()).execute(timedelta(days=1), batch_size=0)
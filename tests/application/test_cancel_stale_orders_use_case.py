@@ -0,0 +1,117 @@
+"""Testes para CancelStaleOrdersUseCase."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from src.application.use_cases.cancel_stale_orders import CancelStaleOrdersUseCase
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+def _pending(index: int) -> Order:
+    return Order(
+        order_id=OrderId(f"order-{index}"),
+        customer_id="customer-1",
+        items=[{"product_id": "prod-1", "quantity": 1, "price": 10.0}],
+        total_amount=Money(10),
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def repository():
+    """Cria mock do repositório com dois lotes de pedidos pendentes."""
+    repository = AsyncMock()
+    first = [_pending(0), _pending(1)]
+    second = [_pending(2)]
+    repository.find_stale.side_effect = [first, second]
+    # order-1 foi confirmado por outra requisição antes do cancelamento
+    repository.transition_many.side_effect = [
+        [OrderId("order-0")],
+        [OrderId("order-2")],
+    ]
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_cancel_stale_orders_in_batches(repository):
+    """Testa cancelamento condicional, histórico e eventos em lote."""
+    broker = AsyncMock()
+    recorder = AsyncMock()
+
+    result = await CancelStaleOrdersUseCase(repository, broker, recorder).execute(
+        timedelta(hours=24), batch_size=2, pause_seconds=0
+    )
+
+    assert result["cancelled"] == 2
+    assert result["skipped"] == 1
+    assert result["batches"] == 2
+
+    status, created_before = repository.find_stale.await_args.args
+    assert status == OrderStatus.PENDING
+    assert datetime.utcnow() - created_before >= timedelta(hours=24)
+    ids, from_status, to_status, _ = repository.transition_many.await_args_list[0].args
+    assert ids == ["order-0", "order-1"]
+    assert (from_status, to_status) == (OrderStatus.PENDING, OrderStatus.CANCELLED)
+
+    first_changes = broker.publish_order_status_updates.await_args_list[0].args[0]
+    assert [change.order_id for change in first_changes] == ["order-0"]
+    assert first_changes[0].to_status == OrderStatus.CANCELLED
+    assert recorder.record.await_args_list[0].args[0] == first_changes
+    broker.publish_order_status_updated.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancel_stale_orders_max_batches(repository):
+    """Testa limite de lotes por execução."""
+    result = await CancelStaleOrdersUseCase(repository, AsyncMock()).execute(
+        timedelta(hours=1), batch_size=2, pause_seconds=0, max_batches=1
+    )
+
+    assert result["batches"] == 1
+    assert repository.find_stale.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_stale_orders_nothing_pending():
+    """Testa execução sem pedidos pendentes antigos."""
+    repository = AsyncMock()
+    repository.find_stale.return_value = []
+    broker = AsyncMock()
+
+    result = await CancelStaleOrdersUseCase(repository, broker).execute(timedelta(hours=1))
+
+    assert result["cancelled"] == 0
+    assert result["batches"] == 0
+    broker.publish_order_status_updates.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancel_stale_orders_broker_failure_stops_job(repository):
+    """Testa que uma falha do broker interrompe o job e registra os pedidos sem evento."""
+    broker = AsyncMock()
+    broker.publish_order_status_updates.side_effect = RuntimeError("broker fora")
+
+    with capture_logs() as logs, pytest.raises(RuntimeError):
+        await CancelStaleOrdersUseCase(repository, broker).execute(
+            timedelta(hours=1), batch_size=2, pause_seconds=0
+        )
+
+    assert repository.find_stale.await_count == 1
+    [error] = [log for log in logs if log["log_level"] == "error"]
+    assert error["order_ids"] == ["order-0"]
+    assert error["error"] == "broker fora"
+
+
+@pytest.mark.asyncio
+async def test_cancel_stale_orders_invalid_batch_size():
+    """Testa tamanho de lote inválido."""
+    with pytest.raises(ValueError):
+        await CancelStaleOrdersUseCase(AsyncMock(), AsyncMock()).execute(
+            timedelta(hours=1), batch_size=0
+        )
@@ -1,11 +1,13 @@
 """Testes para CreateOrderUseCase."""
 
-from unittest.mock import AsyncMock
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.application.use_cases.create_order import CreateOrderUseCase
 from src.domain.entities.order import Order
+from src.domain.exceptions import InvalidOrderItemError, OrderTotalMismatchError
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.order_status import OrderStatus
@@ -17,7 +19,7 @@ async def test_create_order_success(mock_repository):
     # Arrange
     use_case = CreateOrderUseCase(mock_repository)
     customer_id = "customer-123"
-    items = [{"product_id": "prod-1", "quantity": 2}]
+    items = [{"product_id": "prod-1", "quantity": 2, "price": 50.0}]
     total_amount = 100.0
 
     # Mock do repositório retornando o pedido salvo
@@ -52,10 +54,96 @@ async def test_create_order_generates_uuid(mock_repository):
     mock_repository.save = AsyncMock(return_value=saved_order)
 
     # Act
-    result = await use_case.execute("customer-123", [], 100.0)
+    result = await use_case.execute(
+        "customer-123", [{"product_id": "prod-1", "quantity": 1, "price": 100.0}], 100.0
+    )
 
     # Assert
     assert result is not None
     # Verifica que save foi chamado com um Order que tem ID
     call_args = mock_repository.save.call_args[0][0]
     assert call_args.id is not None
+
+
+@pytest.mark.asyncio
+async def test_create_order_computes_total_from_items(mock_repository):
+    """Testa que o total é calculado no servidor a partir dos itens."""
+    # Arrange
+    use_case = CreateOrderUseCase(mock_repository)
+    mock_repository.save = AsyncMock(side_effect=lambda order: order)
+    items = [
+        {"product_id": "prod-1", "quantity": 3, "price": 19.99},
+        {"product_id": "prod-2", "quantity": 1, "price": 0.03},
+    ]
+
+    # Act
+    result = await use_case.execute("customer-123", items)
+
+    # Assert
+    assert result.total_amount == Money(Decimal("60.00"))
+
+
+@pytest.mark.asyncio
+async def test_create_order_total_mismatch(mock_repository):
+    """Testa que total divergente dos itens é rejeitado."""
+    # Arrange
+    use_case = CreateOrderUseCase(mock_repository)
+    items = [{"product_id": "prod-1", "quantity": 2, "price": 50.0}]
+
+    # Act & Assert
+    with pytest.raises(OrderTotalMismatchError):
+        await use_case.execute("customer-123", items, 90.0)
+
+    mock_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_order_invalid_items(mock_repository):
+    """Testa que itens malformados são rejeitados antes de persistir."""
+    # Arrange
+    use_case = CreateOrderUseCase(mock_repository)
+
+    # Act & Assert
+    with pytest.raises(InvalidOrderItemError):
+        await use_case.execute("customer-123", [{"product_id": "prod-1", "quantity": 2}])
+
+    mock_repository.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_order_uses_id_generator(mock_repository):
+    """Testa que o gerador de IDs configurado é usado."""
+    # Arrange
+    id_generator = MagicMock()
+    id_generator.new_id.return_value = OrderId("0190a8f2-0000-7000-8000-000000000001")
+    use_case = CreateOrderUseCase(mock_repository, id_generator)
+    mock_repository.save = AsyncMock(side_effect=lambda order: order)
+
+    # Act
+    result = await use_case.execute(
+        "customer-123", [{"product_id": "prod-1", "quantity": 1, "price": 10.0}]
+    )
+
+    # Assert
+    assert result.id == "0190a8f2-0000-7000-8000-000000000001"
+    id_generator.new_id.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_order_records_creation(mock_repository):
+    """Testa que a criação é registrada no histórico sem status anterior."""
+    # Arrange
+    recorder = AsyncMock()
+    use_case = CreateOrderUseCase(mock_repository, recorder=recorder)
+    mock_repository.save = AsyncMock(side_effect=lambda order: order)
+
+    # Act
+    order = await use_case.execute(
+        "customer-123", [{"product_id": "prod-1", "quantity": 1, "price": 10.0}]
+    )
+
+    # Assert
+    (changes,) = recorder.record.call_args.args
+    assert changes[0].order_id == order.id
+    assert changes[0].from_status is None
+    assert changes[0].to_status == OrderStatus.PENDING
@@ -0,0 +1,70 @@
+"""Testes para propagação de deadline."""
+
+import time
+
+import pytest
+
+from src.application.deadline import (
+    DeadlineExceededError,
+    check_deadline,
+    deadline_scope,
+    get_deadline,
+    remaining_seconds,
+)
+
+
+def test_no_deadline_by_default():
+    """Testa que não há deadline fora de um escopo."""
+    assert get_deadline() is None
+    assert remaining_seconds() is None
+    check_deadline("operacao")  # Não deve lançar
+
+
+def test_deadline_scope_sets_and_resets():
+    """Testa que o escopo define e restaura o deadline."""
+    with deadline_scope(1.0):
+        remaining = remaining_seconds()
+        assert remaining is not None
+        assert 0 < remaining <= 1.0
+
+    assert get_deadline() is None
+
+
+def test_deadline_scope_never_extends_tighter_deadline():
+    """Testa que um escopo interno não estende o deadline externo."""
+    with deadline_scope(0.5):
+        outer = get_deadline()
+        with deadline_scope(10.0):
+            assert get_deadline() == outer
+
+
+def test_deadline_scope_none_keeps_current():
+    """Testa que timeout None mantém o deadline corrente."""
+    with deadline_scope(1.0):
+        outer = get_deadline()
+        with deadline_scope(None):
+            assert get_deadline() == outer
+
+
+def test_check_deadline_expired():
+    """Testa que check_deadline lança quando o prazo expirou."""
+    with deadline_scope(0.001):
+        time.sleep(0.005)
+        with pytest.raises(DeadlineExceededError, match="salvar"):
+            check_deadline("salvar")
+
+
+@pytest.mark.asyncio
+async def test_use_case_abandons_expired_deadline(mock_repository):
+    """Testa que o caso de uso é abandonado antes de acessar o repositório."""
+    from src.application.use_cases.get_order import GetOrderUseCase
+    from src.domain.value_objects.order_id import OrderId
+
+    use_case = GetOrderUseCase(mock_repository)
+
+    with deadline_scope(0.001):
+        time.sleep(0.005)
+        with pytest.raises(DeadlineExceededError):
+            await use_case.execute(OrderId("order-123"))
+
+    mock_repository.find_by_id.assert_not_called()
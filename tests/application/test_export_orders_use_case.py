@@ -0,0 +1,58 @@
+"""Testes para ExportOrdersUseCase."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.application.use_cases.export_orders import ExportOrdersUseCase
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@pytest.mark.asyncio
+async def test_export_orders_returns_repository_batches():
+    """Testa que os lotes vêm do repositório e que a duração cobre o stream inteiro."""
+    read = []
+
+    async def iter_orders(*args):
+        for batch in (["a"], ["b"]):
+            read.append(batch)
+            yield batch
+
+    repository = MagicMock()
+    repository.iter_orders = MagicMock(side_effect=iter_orders)
+    created_from, created_to = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    metric = "order_service_use_case_duration_seconds_count"
+    labels = {"use_case": "export_orders", "outcome": "success"}
+    before = REGISTRY.get_sample_value(metric, labels) or 0.0
+
+    batches = ExportOrdersUseCase(repository).execute(
+        created_from, created_to, [OrderStatus.DELIVERED], batch_size=500
+    )
+
+    repository.iter_orders.assert_called_once_with(
+        created_from, created_to, [OrderStatus.DELIVERED], 500
+    )
+    assert read == []
+    assert [batch async for batch in batches] == [["a"], ["b"]]
+    assert (REGISTRY.get_sample_value(metric, labels) or 0.0) == before + 1
+
+
+@pytest.mark.parametrize(
+    ("created_from", "created_to", "batch_size"),
+    [
+        (datetime(2024, 1, 2), datetime(2024, 1, 1), 1000),
+        (datetime(2024, 1, 1), datetime(2024, 1, 1), 1000),
+        (datetime(2024, 1, 1), datetime(2024, 1, 2), 0),
+        (datetime(2024, 1, 1), datetime(2024, 1, 2), 10_001),
+    ],
+)
+def test_export_orders_invalid_request(created_from, created_to, batch_size):
+    """Testa intervalo e tamanho de lote inválidos."""
+    repository = MagicMock()
+
+    with pytest.raises(ValueError):
+        ExportOrdersUseCase(repository).execute(created_from, created_to, batch_size=batch_size)
+
+    repository.iter_orders.assert_not_called()
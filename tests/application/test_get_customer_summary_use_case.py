@@ -0,0 +1,30 @@
+"""Testes para GetCustomerSummaryUseCase."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.get_customer_summary import GetCustomerSummaryUseCase
+from src.domain.exceptions import CustomerNotFoundError
+
+
+@pytest.mark.asyncio
+async def test_get_customer_summary():
+    """Testa busca de resumo existente."""
+    summaries = AsyncMock()
+    summaries.get_summary.return_value = {"customer_id": "customer-1", "order_count": 2}
+
+    result = await GetCustomerSummaryUseCase(summaries).execute("customer-1")
+
+    assert result["order_count"] == 2
+    summaries.get_summary.assert_awaited_once_with("customer-1")
+
+
+@pytest.mark.asyncio
+async def test_get_customer_summary_not_found():
+    """Testa cliente sem pedidos."""
+    summaries = AsyncMock()
+    summaries.get_summary.return_value = None
+
+    with pytest.raises(CustomerNotFoundError):
+        await GetCustomerSummaryUseCase(summaries).execute("customer-1")
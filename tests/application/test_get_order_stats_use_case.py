@@ -0,0 +1,41 @@
+"""Testes para GetOrderStatsUseCase."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.get_order_stats import GetOrderStatsUseCase
+
+
+@pytest.fixture
+def stats():
+    """Cria mock dos contadores."""
+    stats = AsyncMock()
+    stats.get_status_counts.return_value = {"pending": 2, "confirmed": 1}
+    stats.get_daily_counts.return_value = [{"date": "2024-01-01", "created": 3}]
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_get_order_stats(stats):
+    """Testa contagens sem contadores diários."""
+    result = await GetOrderStatsUseCase(stats).execute()
+
+    assert result == {"total": 3, "counts": {"pending": 2, "confirmed": 1}, "daily": []}
+    stats.get_daily_counts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_order_stats_with_days(stats):
+    """Testa inclusão dos contadores diários."""
+    result = await GetOrderStatsUseCase(stats).execute(days=7)
+
+    assert result["daily"] == [{"date": "2024-01-01", "created": 3}]
+    stats.get_daily_counts.assert_awaited_once_with(7)
+
+
+@pytest.mark.asyncio
+async def test_get_order_stats_invalid_days(stats):
+    """Testa janela de dias fora do limite."""
+    with pytest.raises(ValueError):
+        await GetOrderStatsUseCase(stats).execute(days=365)
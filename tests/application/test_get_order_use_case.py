@@ -44,3 +44,29 @@ async def test_get_order_not_found(mock_repository):
     # Act & Assert
     with pytest.raises(OrderNotFoundError):
         await use_case.execute(order_id)
+
+
+@pytest.mark.asyncio
+async def test_get_order_fields(mock_repository):
+    """Testa busca de campos do pedido."""
+    # Arrange
+    use_case = GetOrderUseCase(mock_repository)
+    order_id = OrderId("order-123")
+    mock_repository.find_fields_by_id = AsyncMock(return_value={"id": "order-123"})
+
+    # Act
+    result = await use_case.execute_fields(order_id, ("id",))
+
+    # Assert
+    assert result == {"id": "order-123"}
+    mock_repository.find_fields_by_id.assert_called_once_with(order_id, ("id",))
+
+
+@pytest.mark.asyncio
+async def test_get_order_fields_not_found(mock_repository):
+    """Testa busca de campos de pedido inexistente."""
+    use_case = GetOrderUseCase(mock_repository)
+    mock_repository.find_fields_by_id = AsyncMock(return_value=None)
+
+    with pytest.raises(OrderNotFoundError):
+        await use_case.execute_fields(OrderId("order-123"), ("id",))
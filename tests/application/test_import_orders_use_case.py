@@ -0,0 +1,237 @@
+"""Testes para ImportOrdersUseCase."""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.import_orders import (
+    ImportOrdersUseCase,
+    import_changes,
+    order_from_record,
+    orders_from_records,
+)
+from src.domain.exceptions import OrderTotalMismatchError
+from src.domain.ports.repository_port import SaveManyResult
+from src.domain.value_objects.order_status import OrderStatus
+
+
+def _record(index, **overrides):
+    """Cria um registro válido no formato da exportação."""
+    record = {
+        "id": f"order-{index}",
+        "customer_id": "customer-1",
+        "items": [{"product_id": "prod-1", "quantity": 2, "price": 5.0}],
+        "total_amount": {"amount": 10.0, "currency": "USD"},
+        "status": "delivered",
+        "created_at": "2024-01-01T12:00:00Z",
+        "updated_at": "2024-01-02T12:00:00",
+    }
+    record.update(overrides)
+    return record
+
+
+def test_order_from_record():
+    """Testa conversão de um registro exportado."""
+    order = order_from_record(_record(1))
+
+    assert order.id == "order-1"
+    assert order.status == OrderStatus.DELIVERED
+    assert order.total_amount.amount == Decimal("10.00")
+    assert order.total_amount.currency == "USD"
+    assert order.created_at == datetime(2024, 1, 1, 12, 0)
+    assert order.created_at.tzinfo is None
+    assert order.updated_at == datetime(2024, 1, 2, 12, 0)
+
+
+def test_order_from_record_numeric_total_and_defaults():
+    """Testa total numérico com moeda separada e campos opcionais ausentes."""
+    record = _record(1, total_amount=Decimal("10.00"), currency="EUR")
+    del record["status"], record["updated_at"]
+
+    order = order_from_record(record)
+
+    assert order.total_amount.currency == "EUR"
+    assert order.status == OrderStatus.PENDING
+    assert order.updated_at == order.created_at
+
+
+def test_order_from_record_three_decimal_currency():
+    """Testa que moedas com três casas (KWD) mantêm a precisão e a conferência do total."""
+    items = [{"product_id": "prod-1", "quantity": 1, "price": 1.234}]
+
+    order = order_from_record(
+        _record(1, items=items, total_amount={"amount": 1.234, "currency": "KWD"})
+    )
+
+    assert order.total_amount.minor_units == 1234
+    assert order.total_amount.amount == Decimal("1.234")
+    with pytest.raises(OrderTotalMismatchError):
+        order_from_record(_record(1, items=items, total_amount={"amount": 1.23, "currency": "KWD"}))
+
+
+@pytest.mark.parametrize(
+    ("overrides", "error"),
+    [
+        ({"id": ""}, ValueError),
+        ({"customer_id": None}, ValueError),
+        ({"items": []}, ValueError),
+        ({"total_amount": 11.0}, OrderTotalMismatchError),
+        ({"status": "lost"}, ValueError),
+        ({"created_at": "ontem"}, ValueError),
+    ],
+)
+def test_order_from_record_invalid(overrides, error):
+    """Testa registros que violam as regras do domínio."""
+    with pytest.raises(error):
+        order_from_record(_record(1, **overrides))
+
+
+def test_orders_from_records_matches_single_record():
+    """Testa que a validação em lote aceita e rejeita como a validação por registro."""
+    kwd_items = [{"product_id": "prod-1", "quantity": 1, "price": 1.234}]
+    records = [
+        (1, _record(1)),
+        (2, _record(2, total_amount=11.0)),
+        (3, None),
+        (4, _record(4, items=kwd_items, total_amount={"amount": 1.234, "currency": "KWD"})),
+        (5, _record(5, status="lost")),
+    ]
+
+    orders, errors = orders_from_records(records)
+
+    assert [order.id for order in orders] == ["order-1", "order-4"]
+    assert [order.total_amount for order in orders] == [
+        order_from_record(records[0][1]).total_amount,
+        order_from_record(records[3][1]).total_amount,
+    ]
+    assert [error["line"] for error in errors] == [2, 3, 5]
+    assert "difere" in errors[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_orders_batches_and_checkpoints():
+    """Testa lotes, rejeições e checkpoints em ordem."""
+    repository = AsyncMock()
+    repository.save_many.side_effect = lambda orders: SaveManyResult(inserted=list(orders))
+    records = [
+        (1, _record(1)),
+        (2, None),
+        (3, _record(3)),
+        (4, _record(4, items=[])),
+        (5, _record(5)),
+    ]
+    checkpoints = []
+
+    result = await ImportOrdersUseCase(repository).execute(
+        records, batch_size=2, concurrency=2, on_checkpoint=checkpoints.append
+    )
+
+    assert result["rows"] == 5
+    assert result["imported"] == 3
+    assert result["skipped"] == 0
+    assert result["rejected"] == 2
+    assert result["batches"] == 3
+    assert [error["line"] for error in result["errors"]] == [2, 4]
+    assert result["rows_per_second"] > 0
+    assert checkpoints == [2, 4, 5, 5]
+    saved = [[order.id for order in call.args[0]] for call in repository.save_many.await_args_list]
+    assert saved == [["order-1"], ["order-3"], ["order-5"]]
+
+
+@pytest.mark.asyncio
+async def test_import_orders_limits_batches_in_flight():
+    """Testa que no máximo `concurrency` lotes ficam em andamento."""
+    in_flight = 0
+    peak = 0
+
+    async def save_many(orders):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SaveManyResult(inserted=list(orders))
+
+    repository = AsyncMock()
+    repository.save_many.side_effect = save_many
+
+    result = await ImportOrdersUseCase(repository).execute(
+        ((index, _record(index)) for index in range(1, 21)), batch_size=2, concurrency=3
+    )
+
+    assert result["imported"] == 20
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_import_orders_failure_keeps_last_confirmed_checkpoint():
+    """Testa que uma falha de gravação não avança o checkpoint."""
+    repository = AsyncMock()
+    repository.save_many.side_effect = [
+        SaveManyResult(skipped=1),
+        RuntimeError("mongo fora"),
+        SaveManyResult(skipped=1),
+    ]
+    checkpoints = []
+
+    with pytest.raises(RuntimeError):
+        await ImportOrdersUseCase(repository).execute(
+            [(index, _record(index)) for index in range(1, 4)],
+            batch_size=1,
+            concurrency=1,
+            on_checkpoint=checkpoints.append,
+        )
+
+    assert checkpoints == [1]
+
+
+@pytest.mark.asyncio
+async def test_import_orders_invalid_arguments():
+    """Testa parâmetros inválidos."""
+    with pytest.raises(ValueError):
+        await ImportOrdersUseCase(AsyncMock()).execute([], batch_size=0)
+
+
+def test_import_changes_creations_and_status_changes():
+    """Testa transições geradas para pedidos inseridos e atualizados."""
+    created = order_from_record(_record(1))
+    moved = order_from_record(_record(2))
+    unchanged = order_from_record(_record(3))
+
+    changes = import_changes(
+        SaveManyResult(
+            inserted=[created],
+            updated=[(moved, OrderStatus.SHIPPED), (unchanged, OrderStatus.DELIVERED)],
+        )
+    )
+
+    assert [(change.order_id, change.from_status, change.to_status) for change in changes] == [
+        ("order-1", None, OrderStatus.DELIVERED),
+        ("order-2", OrderStatus.SHIPPED, OrderStatus.DELIVERED),
+    ]
+    assert changes[0].changed_at == created.created_at
+    assert changes[1].changed_at == moved.updated_at
+
+
+@pytest.mark.asyncio
+async def test_import_orders_records_written_batches():
+    """Testa que cada lote gravado passa pelo histórico e pelas projeções."""
+    repository = AsyncMock()
+    repository.save_many.side_effect = lambda orders: SaveManyResult(
+        inserted=list(orders[:1]), skipped=len(orders) - 1
+    )
+    recorder = AsyncMock()
+
+    result = await ImportOrdersUseCase(repository, recorder).execute(
+        [(index, _record(index)) for index in range(1, 5)], batch_size=2, concurrency=2
+    )
+
+    assert result["imported"] == 2
+    assert result["skipped"] == 2
+    recorded = [
+        [change.order_id for change in call.args[0]] for call in recorder.record.await_args_list
+    ]
+    assert recorded == [["order-1"], ["order-3"]]
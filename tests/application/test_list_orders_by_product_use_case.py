@@ -0,0 +1,66 @@
+"""Testes para ListOrdersByProductUseCase."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.list_orders_by_product import ListOrdersByProductUseCase
+from src.domain.entities.order import Order
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+def _order(index):
+    """Cria um pedido com data de criação crescente."""
+    return Order(
+        order_id=OrderId(f"order-{index}"),
+        customer_id="customer-1",
+        items=[{"product_id": "prod-1", "quantity": 1, "price": 10.0}],
+        total_amount=Money(10),
+        created_at=datetime(2024, 1, 1, 12, index),
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_orders_by_product_with_next_page():
+    """Testa que o pedido extra vira a chave da próxima página."""
+    repository = AsyncMock()
+    repository.find_by_product.return_value = [_order(1), _order(2), _order(3)]
+
+    orders, next_key = await ListOrdersByProductUseCase(repository).execute(
+        "prod-1", [OrderStatus.PENDING], limit=2
+    )
+
+    assert [order.id for order in orders] == ["order-1", "order-2"]
+    assert next_key == (datetime(2024, 1, 1, 12, 2), "order-2")
+    repository.find_by_product.assert_awaited_once_with("prod-1", [OrderStatus.PENDING], 3, None)
+
+
+@pytest.mark.asyncio
+async def test_list_orders_by_product_last_page():
+    """Testa última página sem cursor."""
+    repository = AsyncMock()
+    repository.find_by_product.return_value = [_order(1)]
+    after = (datetime(2024, 1, 1), OrderId("order-0"))
+
+    orders, next_key = await ListOrdersByProductUseCase(repository).execute(
+        "prod-1", limit=2, after=after
+    )
+
+    assert len(orders) == 1
+    assert next_key is None
+    repository.find_by_product.assert_awaited_once_with("prod-1", None, 3, after)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, 1001])
+async def test_list_orders_by_product_invalid_limit(limit):
+    """Testa tamanho de página fora do limite."""
+    repository = AsyncMock()
+
+    with pytest.raises(ValueError):
+        await ListOrdersByProductUseCase(repository).execute("prod-1", limit=limit)
+
+    repository.find_by_product.assert_not_called()
@@ -0,0 +1,104 @@
+"""Testes para as métricas Prometheus."""
+
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.application.metrics import USE_CASE_SECONDS, EventLoopLagMonitor, count_error, timed
+
+
+def _count(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_timed_async_success_and_error():
+    """Testa observação de coroutines com outcome success/error."""
+
+    @timed(USE_CASE_SECONDS, "test_async")
+    async def run(fail: bool) -> str:
+        if fail:
+            raise RuntimeError("falhou")
+        return "ok"
+
+    metric = "order_service_use_case_duration_seconds_count"
+    success = {"use_case": "test_async", "outcome": "success"}
+    error = {"use_case": "test_async", "outcome": "error"}
+    before_success = _count(metric, success)
+    before_error = _count(metric, error)
+
+    assert await run(False) == "ok"
+    with pytest.raises(RuntimeError):
+        await run(True)
+
+    assert _count(metric, success) == before_success + 1
+    assert _count(metric, error) == before_error + 1
+    assert run.__name__ == "run"
+
+
+def test_timed_sync():
+    """Testa observação de funções síncronas."""
+
+    @timed(USE_CASE_SECONDS, "test_sync")
+    def run() -> int:
+        return 42
+
+    metric = "order_service_use_case_duration_seconds_count"
+    labels = {"use_case": "test_sync", "outcome": "success"}
+    before = _count(metric, labels)
+
+    assert run() == 42
+    assert _count(metric, labels) == before + 1
+
+
+def test_count_error():
+    """Testa contador de erros por tipo e status."""
+    labels = {"error_type": "KeyError", "status_code": "500"}
+    before = _count("order_service_http_errors_total", labels)
+
+    count_error(KeyError("x"), 500)
+
+    assert _count("order_service_http_errors_total", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor():
+    """Testa medições periódicas do atraso do event loop."""
+    before = _count("order_service_event_loop_lag_seconds_count", {})
+    monitor = EventLoopLagMonitor(interval_seconds=0.01)
+
+    monitor.start()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    await monitor.stop()
+
+    assert _count("order_service_event_loop_lag_seconds_count", {}) > before
+
+
+@pytest.mark.asyncio
+async def test_timed_async_generator_measures_stream():
+    """Testa que geradores assíncronos são medidos ao final, inclusive quando fechados."""
+
+    @timed(USE_CASE_SECONDS, "test_async_gen")
+    async def stream():
+        yield 1
+        yield 2
+
+    metric = "order_service_use_case_duration_seconds_count"
+    success = {"use_case": "test_async_gen", "outcome": "success"}
+    error = {"use_case": "test_async_gen", "outcome": "error"}
+    before_success = _count(metric, success)
+    before_error = _count(metric, error)
+
+    generator = stream()
+    assert await generator.__anext__() == 1
+    assert _count(metric, success) == before_success
+
+    assert [item async for item in generator] == [2]
+    assert _count(metric, success) == before_success + 1
+
+    closed = stream()
+    await closed.__anext__()
+    await closed.aclose()
+    assert _count(metric, error) == before_error + 1
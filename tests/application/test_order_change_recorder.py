@@ -0,0 +1,59 @@
+"""Testes para OrderChangeRecorder."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.order_change_recorder import OrderChangeRecorder
+from src.domain.events.status_change import StatusChange
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+@pytest.fixture
+def change():
+    """Cria uma transição de exemplo."""
+    return StatusChange(
+        OrderId("order-1"), "customer-1", None, OrderStatus.PENDING, datetime.utcnow(), Money(10)
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_appends_and_applies(change):
+    """Testa gravação no histórico e nos modelos de leitura."""
+    history = AsyncMock()
+    projection = AsyncMock()
+    recorder = OrderChangeRecorder(history, [projection])
+
+    await recorder.record([change])
+
+    history.append.assert_awaited_once_with([change])
+    projection.apply.assert_awaited_once_with([change])
+
+
+@pytest.mark.asyncio
+async def test_record_ignores_empty_batch():
+    """Testa que lotes vazios não geram escrita."""
+    history = AsyncMock()
+    recorder = OrderChangeRecorder(history)
+
+    await recorder.record([])
+
+    history.append.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_record_swallows_failures(change):
+    """Testa que falhas no histórico não impedem os modelos de leitura."""
+    history = AsyncMock()
+    history.append.side_effect = RuntimeError("mongo fora")
+    failing = AsyncMock()
+    failing.apply.side_effect = RuntimeError("falhou")
+    projection = AsyncMock()
+    recorder = OrderChangeRecorder(history, [failing, projection])
+
+    await recorder.record([change])
+
+    projection.apply.assert_awaited_once_with([change])
@@ -0,0 +1,109 @@
+"""Testes para os casos de uso de histórico de status."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.get_order_history import GetOrderHistoryUseCase
+from src.application.use_cases.replay_history import CHECKPOINT_NAME, ReplayHistoryUseCase
+from src.domain.events.status_change import StatusChange
+from src.domain.exceptions import OrderNotFoundError
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_status import OrderStatus
+
+
+def make_change(order_id: str = "order-1") -> StatusChange:
+    """Cria uma transição de exemplo."""
+    return StatusChange(
+        OrderId(order_id), "customer-1", None, OrderStatus.PENDING, datetime.utcnow(), Money(10)
+    )
+
+
+class FakeHistory:
+    """Histórico em memória com lotes pré-definidos."""
+
+    def __init__(self, batches, checkpoint=None):
+        self.batches = batches
+        self.checkpoint = checkpoint
+        self.after = None
+        self.saved = []
+
+    async def iter_batches(self, batch_size, after=None):
+        self.after = after
+        for batch in self.batches:
+            yield batch
+
+    async def load_checkpoint(self, name):
+        return self.checkpoint
+
+    async def save_checkpoint(self, name, position):
+        self.saved.append((name, position))
+
+
+@pytest.mark.asyncio
+async def test_get_order_history(mock_repository):
+    """Testa busca de histórico existente."""
+    history = AsyncMock()
+    history.find_by_order_id.return_value = [make_change()]
+    use_case = GetOrderHistoryUseCase(mock_repository, history)
+
+    result = await use_case.execute(OrderId("order-1"))
+
+    assert len(result) == 1
+    mock_repository.find_fields_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_order_history_legacy_order(mock_repository):
+    """Testa pedido anterior ao histórico (sem entradas)."""
+    history = AsyncMock()
+    history.find_by_order_id.return_value = []
+    mock_repository.find_fields_by_id.return_value = {"id": "order-1"}
+    use_case = GetOrderHistoryUseCase(mock_repository, history)
+
+    assert await use_case.execute(OrderId("order-1")) == []
+
+
+@pytest.mark.asyncio
+async def test_get_order_history_not_found(mock_repository):
+    """Testa histórico de pedido inexistente."""
+    history = AsyncMock()
+    history.find_by_order_id.return_value = []
+    mock_repository.find_fields_by_id.return_value = None
+    use_case = GetOrderHistoryUseCase(mock_repository, history)
+
+    with pytest.raises(OrderNotFoundError):
+        await use_case.execute(OrderId("missing"))
+
+
+@pytest.mark.asyncio
+async def test_replay_history_resets_and_applies_batches():
+    """Testa replay completo com reset dos modelos de leitura."""
+    batches = [("p1", [make_change("a"), make_change("b")]), ("p2", [make_change("c")])]
+    history = FakeHistory(batches, checkpoint="p0")
+    projection = AsyncMock()
+    use_case = ReplayHistoryUseCase(history, [projection])
+
+    result = await use_case.execute(batch_size=2)
+
+    assert result["changes"] == 3
+    assert result["batches"] == 2
+    projection.reset.assert_awaited_once()
+    assert projection.apply.await_count == 2
+    assert history.after is None
+    assert history.saved == [(CHECKPOINT_NAME, "p1"), (CHECKPOINT_NAME, "p2")]
+
+
+@pytest.mark.asyncio
+async def test_replay_history_resume_from_checkpoint():
+    """Testa retomada a partir do checkpoint sem reset."""
+    history = FakeHistory([("p2", [make_change()])], checkpoint="p1")
+    projection = AsyncMock()
+    use_case = ReplayHistoryUseCase(history, [projection])
+
+    await use_case.execute(resume=True)
+
+    projection.reset.assert_not_called()
+    assert history.after == "p1"
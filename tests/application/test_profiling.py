@@ -0,0 +1,44 @@
+"""Testes para o profiling sob demanda."""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("pyinstrument")
+
+from src.application.profiling import profiled  # noqa: E402
+
+
+def _busy(seconds: float) -> None:
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        pass
+
+
+def test_profiled_saves_html(tmp_path):
+    """Testa gravação do profile HTML no diretório."""
+    with profiled("GET /orders/{id}", output_dir=tmp_path) as profile:
+        _busy(0.01)
+
+    assert profile.path is not None
+    assert profile.path.parent == tmp_path
+    assert profile.path.name.endswith("-GET_orders_id.html")
+    assert profile.media_type.startswith("text/html")
+    assert profile.duration_seconds > 0
+
+
+def test_profiled_speedscope_in_memory():
+    """Testa flame graph no formato speedscope, sem gravar arquivo."""
+    with profiled("busy", output_format="speedscope") as profile:
+        _busy(0.01)
+
+    assert profile.path is None
+    assert "speedscope" in json.loads(profile.content)["$schema"]
+
+
+def test_profiled_invalid_format():
+    """Testa formato desconhecido."""
+    with pytest.raises(ValueError):
+        with profiled("busy", output_format="svg"):
+            pass
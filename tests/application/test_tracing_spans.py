@@ -0,0 +1,73 @@
+"""Testes para os decorators de tracing sem OpenTelemetry configurado."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application import tracing
+from src.application.tracing import inject_context, server_span, traced
+
+
+@pytest.fixture
+def fake_tracer():
+    """Ativa um tracer falso durante o teste."""
+    tracer = MagicMock()
+    tracing.set_tracer(tracer, inject=lambda headers: headers.update(traceparent="00-abc"))
+    yield tracer
+    tracing.set_tracer(None)
+
+
+@pytest.mark.asyncio
+async def test_traced_disabled_calls_function():
+    """Testa que, sem tracer, a função é chamada diretamente."""
+
+    @traced("use_case.test")
+    async def run() -> int:
+        return 1
+
+    assert tracing.tracing_enabled() is False
+    assert await run() == 1
+    assert inject_context({}) == {}
+    with server_span("GET /", {}) as span:
+        assert span is None
+
+
+@pytest.mark.asyncio
+async def test_traced_enabled_opens_span(fake_tracer):
+    """Testa abertura de span com nome e atributos fixos."""
+
+    @traced("mongo.find_by_id", "client", {"db.system": "mongodb"})
+    async def run() -> int:
+        return 1
+
+    @traced("use_case.sync")
+    def run_sync() -> int:
+        return 2
+
+    assert await run() == 1
+    assert run_sync() == 2
+
+    names = [call.args[0] for call in fake_tracer.start_as_current_span.call_args_list]
+    assert names == ["mongo.find_by_id", "use_case.sync"]
+    first = fake_tracer.start_as_current_span.call_args_list[0].kwargs
+    assert first["attributes"] == {"db.system": "mongodb"}
+    assert inject_context({}) == {"traceparent": "00-abc"}
+
+
+@pytest.mark.asyncio
+async def test_traced_async_generator_spans_whole_stream(fake_tracer):
+    """Testa que o span de um gerador assíncrono só fecha ao fim do stream."""
+    span = fake_tracer.start_as_current_span.return_value
+
+    @traced("use_case.stream")
+    async def stream():
+        yield 1
+        yield 2
+
+    generator = stream()
+    assert await generator.__anext__() == 1
+    span.__exit__.assert_not_called()
+
+    assert [item async for item in generator] == [2]
+    span.__exit__.assert_called_once()
+    fake_tracer.start_as_current_span.assert_called_once()
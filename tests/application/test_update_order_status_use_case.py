@@ -6,7 +6,11 @@ import pytest
 
 from src.application.use_cases.update_order_status import UpdateOrderStatusUseCase
 from src.domain.entities.order import Order
-from src.domain.exceptions import InvalidStatusTransitionError, OrderNotFoundError
+from src.domain.exceptions import (
+    InvalidStatusTransitionError,
+    OrderNotFoundError,
+    OrderStatusConflictError,
+)
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.order_status import OrderStatus
@@ -26,7 +30,7 @@ async def test_update_order_status_success(mock_repository, mock_message_broker)
         status=OrderStatus.PENDING,
     )
     mock_repository.find_by_id = AsyncMock(return_value=order)
-    mock_repository.save = AsyncMock(return_value=order)
+    mock_repository.transition = AsyncMock(return_value=True)
     mock_message_broker.publish_order_status_updated = AsyncMock()
 
     # Act
@@ -35,11 +39,14 @@ async def test_update_order_status_success(mock_repository, mock_message_broker)
     # Assert
     assert result.status == OrderStatus.CONFIRMED
     mock_repository.find_by_id.assert_called_once_with(order_id)
-    mock_repository.save.assert_called_once()
+    mock_repository.transition.assert_called_once_with(
+        order_id, OrderStatus.PENDING, OrderStatus.CONFIRMED, order.updated_at
+    )
     mock_message_broker.publish_order_status_updated.assert_called_once_with(
         order_id=str(order_id),
         old_status="pending",
         new_status="confirmed",
+        customer_id="customer-123",
     )
 
 
@@ -78,3 +85,124 @@ async def test_update_order_status_invalid_transition(mock_repository, mock_mess
         await use_case.execute(order_id, OrderStatus.DELIVERED)
 
     mock_message_broker.publish_order_status_updated.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_order_status_records_change(mock_repository, mock_message_broker):
+    """Testa que a transição é registrada no histórico."""
+    # Arrange
+    recorder = AsyncMock()
+    use_case = UpdateOrderStatusUseCase(mock_repository, mock_message_broker, recorder)
+    order = Order(
+        order_id=OrderId("order-123"),
+        customer_id="customer-123",
+        items=[],
+        total_amount=Money(100.0),
+        status=OrderStatus.PENDING,
+    )
+    mock_repository.find_by_id = AsyncMock(return_value=order)
+    mock_repository.transition = AsyncMock(return_value=True)
+
+    # Act
+    await use_case.execute(OrderId("order-123"), OrderStatus.CONFIRMED)
+
+    # Assert
+    (changes,) = recorder.record.call_args.args
+    assert len(changes) == 1
+    assert changes[0].from_status == OrderStatus.PENDING
+    assert changes[0].to_status == OrderStatus.CONFIRMED
+    assert changes[0].customer_id == "customer-123"
+
+
+@pytest.mark.asyncio
+async def test_update_order_status_same_status_is_noop(mock_repository, mock_message_broker):
+    """Testa que repetir o status atual não registra transição nem publica evento."""
+    # Arrange
+    recorder = AsyncMock()
+    use_case = UpdateOrderStatusUseCase(mock_repository, mock_message_broker, recorder)
+    order = Order(
+        order_id=OrderId("order-123"),
+        customer_id="customer-123",
+        items=[],
+        total_amount=Money(100.0),
+        status=OrderStatus.CANCELLED,
+    )
+    mock_repository.find_by_id = AsyncMock(return_value=order)
+    mock_repository.transition = AsyncMock(return_value=True)
+
+    # Act
+    result = await use_case.execute(OrderId("order-123"), OrderStatus.CANCELLED)
+
+    # Assert
+    assert result is order
+    mock_repository.transition.assert_not_called()
+    recorder.record.assert_not_called()
+    mock_message_broker.publish_order_status_updated.assert_not_called()
+
+
+def _order(status: OrderStatus) -> Order:
+    return Order(
+        order_id=OrderId("order-123"),
+        customer_id="customer-123",
+        items=[],
+        total_amount=Money(100.0),
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_order_status_rereads_after_concurrent_cancel(
+    mock_repository, mock_message_broker
+):
+    """Testa PATCH que lê PENDING enquanto o job cancela o pedido antes da gravação."""
+    # Arrange
+    recorder = AsyncMock()
+    use_case = UpdateOrderStatusUseCase(mock_repository, mock_message_broker, recorder)
+    mock_repository.find_by_id = AsyncMock(
+        side_effect=[_order(OrderStatus.PENDING), _order(OrderStatus.CANCELLED)]
+    )
+    # A gravação condicional não casa: o pedido já não está mais PENDING
+    mock_repository.transition = AsyncMock(return_value=False)
+
+    # Act & Assert
+    with pytest.raises(InvalidStatusTransitionError):
+        await use_case.execute(OrderId("order-123"), OrderStatus.CONFIRMED)
+
+    assert mock_repository.find_by_id.await_count == 2
+    mock_repository.transition.assert_awaited_once()
+    recorder.record.assert_not_called()
+    mock_message_broker.publish_order_status_updated.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_order_status_retries_then_succeeds(mock_repository, mock_message_broker):
+    """Testa nova tentativa quando o status muda para outro que ainda aceita a transição."""
+    use_case = UpdateOrderStatusUseCase(mock_repository, mock_message_broker)
+    mock_repository.find_by_id = AsyncMock(
+        side_effect=[_order(OrderStatus.PENDING), _order(OrderStatus.CONFIRMED)]
+    )
+    mock_repository.transition = AsyncMock(side_effect=[False, True])
+
+    result = await use_case.execute(OrderId("order-123"), OrderStatus.CANCELLED)
+
+    assert result.status == OrderStatus.CANCELLED
+    mock_message_broker.publish_order_status_updated.assert_called_once_with(
+        order_id="order-123",
+        old_status="confirmed",
+        new_status="cancelled",
+        customer_id="customer-123",
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_order_status_conflict_after_attempts(mock_repository, mock_message_broker):
+    """Testa conflito quando a gravação condicional nunca casa."""
+    use_case = UpdateOrderStatusUseCase(mock_repository, mock_message_broker)
+    mock_repository.find_by_id = AsyncMock(side_effect=lambda _: _order(OrderStatus.PENDING))
+    mock_repository.transition = AsyncMock(return_value=False)
+
+    with pytest.raises(OrderStatusConflictError):
+        await use_case.execute(OrderId("order-123"), OrderStatus.CONFIRMED)
+
+    assert mock_repository.transition.await_count == 3
+    mock_message_broker.publish_order_status_updated.assert_not_called()
@@ -0,0 +1,61 @@
+"""Testes para a comparação de resultados da suite de caminhos quentes."""
+
+import json
+from pathlib import Path
+
+from benchmarks.bench_hot_paths import CASES, ITEM_COUNTS, compare, main
+
+BASELINE = Path(__file__).parents[2] / "benchmarks" / "baselines" / "hot_paths.json"
+
+
+def _results(**ns_per_op: float) -> dict:
+    return {"results": {key: {"ns_per_op": value} for key, value in ns_per_op.items()}}
+
+
+def test_compare_flags_only_changes_above_threshold(capsys):
+    """Testa que só aumentos acima do limite contam como regressão."""
+    baseline = _results(fast=100.0, below=100.0, slow=100.0, faster=100.0)
+    current = _results(fast=105.0, below=109.9, slow=111.0, faster=50.0)
+
+    regressions = compare(baseline, current, threshold=0.10)
+
+    assert regressions == ["slow"]
+    assert "REGRESSÃO" in capsys.readouterr().out
+
+
+def test_compare_reports_new_and_missing_cases(capsys):
+    """Testa que casos novos e ausentes são listados sem contar como regressão."""
+    baseline = _results(kept=100.0, removed=100.0)
+    current = _results(kept=100.0, added=500.0)
+
+    regressions = compare(baseline, current)
+
+    assert regressions == []
+    lines = capsys.readouterr().out.splitlines()
+    assert any(line.startswith("added") and "(novo)" in line for line in lines)
+    assert any(line.startswith("removed") and "(ausente)" in line for line in lines)
+
+
+def test_main_compare_exit_code(tmp_path, capsys):
+    """Testa o código de saída do comando compare."""
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(case=100.0)), encoding="utf-8")
+
+    current.write_text(json.dumps(_results(case=120.0)), encoding="utf-8")
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert main(["compare", str(baseline), str(current), "--threshold", "0.25"]) == 0
+    capsys.readouterr()
+
+
+def test_committed_baseline_covers_all_cases():
+    """Testa que o baseline versionado tem todos os casos da suite."""
+    baseline = json.loads(BASELINE.read_text(encoding="utf-8"))
+
+    expected = {
+        f"{case.name}[items={count}]" if case.by_items else case.name
+        for case in CASES
+        for count in (ITEM_COUNTS if case.by_items else (0,))
+    }
+    assert set(baseline["results"]) == expected
+    assert all(result["ns_per_op"] > 0 for result in baseline["results"].values())
@@ -4,7 +4,7 @@ from decimal import Decimal
 
 import pytest
 
-from src.domain.value_objects.money import Money
+from src.domain.value_objects.money import Money, to_minor_units, totals_by_currency
 
 
 def test_create_money():
@@ -103,3 +103,104 @@ def test_money_with_int():
 
     assert money.amount == Decimal("100")
     assert money.currency == "BRL"
+
+
+def test_money_stores_minor_units():
+    """Testa que o valor é guardado como inteiro em centavos."""
+    money = Money(19.99)
+
+    assert money.minor_units == 1999
+    assert money.amount == Decimal("19.99")
+
+
+def test_money_from_minor():
+    """Testa criação a partir de unidades menores."""
+    money = Money.from_minor(1025)
+
+    assert money == Money(Decimal("10.25"))
+    assert money.amount == Decimal("10.25")
+
+
+def test_money_from_minor_negative_raises_error():
+    """Testa que unidades menores negativas são rejeitadas."""
+    with pytest.raises(ValueError):
+        Money.from_minor(-1)
+
+
+def test_money_currency_exponent():
+    """Testa moedas com expoentes diferentes de dois."""
+    assert Money(1500, "JPY").minor_units == 1500
+    assert Money(Decimal("1.234"), "KWD").minor_units == 1234
+    assert Money.from_minor(1234, "KWD").amount == Decimal("1.234")
+
+
+def test_money_rounds_below_minor_unit():
+    """Testa arredondamento de frações abaixo do centavo."""
+    assert Money(Decimal("0.005")).minor_units == 1
+
+
+@pytest.mark.parametrize(
+    ("amount", "exponent", "expected"),
+    [
+        ("2.5", 0, 3),
+        ("0.5", 0, 1),
+        ("0.125", 2, 13),
+        ("1.005", 2, 101),
+        ("0.0125", 3, 13),
+        ("1.2345", 3, 1235),
+    ],
+)
+@pytest.mark.parametrize("amount_type", [float, Decimal])
+def test_to_minor_units_rounds_half_up_for_float_and_decimal(
+    amount_type, amount, exponent, expected
+):
+    """Testa que valores na metade arredondam para cima, seja float ou Decimal."""
+    assert to_minor_units(amount_type(amount), exponent) == expected
+
+
+def test_money_same_amount_for_float_and_decimal():
+    """Testa que o valor guardado não depende do tipo da entrada."""
+    assert Money(0.125) == Money(Decimal("0.125"))
+    assert Money(0.125).amount == Decimal("0.13")
+
+
+def test_money_float_arithmetic_is_exact():
+    """Testa que somas de valores float não acumulam erro binário."""
+    total = Money(0.1) + Money(0.2)
+
+    assert total == Money(Decimal("0.3"))
+
+
+def test_money_multiply_by_fraction():
+    """Testa multiplicação por fator não inteiro."""
+    assert (Money(10) * 0.5).amount == Decimal("5.00")
+
+
+def test_money_hash():
+    """Testa que valores iguais têm o mesmo hash."""
+    assert hash(Money(10)) == hash(Money(Decimal("10.00")))
+
+
+def test_money_sum():
+    """Testa soma de muitos valores."""
+    result = Money.sum([Money(1.5), Money(2.25), Money(0.25)])
+
+    assert result == Money(4)
+
+
+def test_money_sum_different_currencies_raises_error():
+    """Testa soma em lote com moedas diferentes."""
+    with pytest.raises(ValueError):
+        Money.sum([Money(1), Money(1, "USD")])
+
+
+def test_totals_by_currency():
+    """Testa agregação por moeda."""
+    totals = totals_by_currency([Money(1), Money(2, "USD"), Money(3), Money(100, "JPY")])
+
+    assert totals == {"BRL": Money(4), "USD": Money(2, "USD"), "JPY": Money(100, "JPY")}
+
+
+def test_money_is_slotted():
+    """Testa que Money não tem __dict__ por instância."""
+    assert not hasattr(Money(1), "__dict__")
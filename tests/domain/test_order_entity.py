@@ -86,3 +86,31 @@ def test_to_dict():
     assert order_dict["customer_id"] == "customer-123"
     assert order_dict["status"] == "pending"
     assert order_dict["total_amount"]["amount"] == 100.0
+
+
+def test_items_are_read_only_without_copy():
+    """Testa que os itens são expostos como tupla sem cópia a cada acesso."""
+    order = Order(
+        order_id=OrderId("order-123"),
+        customer_id="customer-123",
+        items=[{"product_id": "prod-1"}],
+        total_amount=Money(100.0),
+    )
+
+    assert order.items is order.items
+    assert isinstance(order.items, tuple)
+    with pytest.raises(AttributeError):
+        order.items.append({"product_id": "prod-2"})
+
+
+def test_order_is_slotted():
+    """Testa que a entidade não tem __dict__ por instância."""
+    order = Order(
+        order_id=OrderId("order-123"),
+        customer_id="customer-123",
+        items=(),
+        total_amount=Money(100.0),
+    )
+
+    assert not hasattr(order, "__dict__")
+    assert order.created_at == order.updated_at
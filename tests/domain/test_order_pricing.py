@@ -0,0 +1,131 @@
+"""Testes para o serviço de cálculo de totais."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.domain.exceptions import InvalidOrderItemError, OrderTotalMismatchError
+from src.domain.services.order_pricing import (
+    calculate_items_total,
+    calculate_totals_bulk,
+    reconcile_total,
+    validate_items,
+)
+
+
+def test_validate_items_drops_unknown_fields():
+    """Testa que campos desconhecidos são descartados."""
+    items = validate_items([{"product_id": "prod-1", "quantity": 2, "price": 10, "extra": 1}])
+
+    assert items == [{"product_id": "prod-1", "quantity": 2, "price": 10.0}]
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {"quantity": 1, "price": 1.0},
+        {"product_id": "prod-1", "quantity": 1.5, "price": 1.0},
+        {"product_id": "prod-1", "quantity": True, "price": 1.0},
+        {"product_id": "prod-1", "quantity": 1, "price": 0},
+        {"product_id": "prod-1", "quantity": 1, "price": "10"},
+        {"product_id": 123, "quantity": 1, "price": 1.0},
+        {"product_id": "prod-1", "quantity": 1, "price": float("inf")},
+        {"product_id": "prod-1", "quantity": 1, "price": float("nan")},
+        {"product_id": "prod-1", "quantity": 1, "price": 1e300},
+        {"product_id": "prod-1", "quantity": 1, "price": 0.004},
+        {"product_id": "prod-1", "quantity": 100_001, "price": 1.0},
+        "not-a-dict",
+    ],
+)
+def test_validate_items_rejects_invalid(item):
+    """Testa que itens inválidos são rejeitados."""
+    with pytest.raises(InvalidOrderItemError):
+        validate_items([item])
+
+
+def test_validate_items_rejects_empty():
+    """Testa que pedido sem itens é rejeitado."""
+    with pytest.raises(InvalidOrderItemError, match="ao menos um item"):
+        validate_items([])
+
+
+def test_calculate_items_total_is_exact():
+    """Testa que o total não acumula erro de ponto flutuante."""
+    items = [{"product_id": "p", "quantity": 3, "price": 0.1}] * 10
+
+    assert calculate_items_total(items) == Decimal("3.00")
+
+
+def test_calculate_items_total_rejects_zero_total():
+    """Testa que um total arredondado para zero é rejeitado."""
+    with pytest.raises(InvalidOrderItemError, match="maior que zero"):
+        calculate_items_total([{"product_id": "p", "quantity": 3, "price": 0.004}])
+
+
+def test_calculate_items_total_with_decimal_price():
+    """Testa preços em Decimal."""
+    items = [{"product_id": "p", "quantity": 2, "price": Decimal("19.995")}]
+
+    assert calculate_items_total(items) == Decimal("40.00")
+
+
+def test_calculate_totals_bulk_matches_single():
+    """Testa que o cálculo em lote coincide com o cálculo individual."""
+    orders_items = [
+        [{"product_id": f"p{i}", "quantity": i % 5 + 1, "price": 9.99 + i} for i in range(n)]
+        for n in range(1, 50)
+    ]
+
+    totals = calculate_totals_bulk(orders_items)
+
+    assert totals == [calculate_items_total(items) for items in orders_items]
+    assert totals[0] == Decimal("9.99")
+
+
+def test_calculate_totals_bulk_per_order_exponent():
+    """Testa que cada pedido do lote é somado com o expoente da sua moeda."""
+    items = [{"product_id": "p", "quantity": 2, "price": 1.2345}]
+
+    totals = calculate_totals_bulk([items, items, items], [0, 2, 3])
+
+    assert totals == [calculate_items_total(items, exponent) for exponent in (0, 2, 3)]
+    assert totals == [Decimal("2"), Decimal("2.46"), Decimal("2.470")]
+
+
+def test_reconcile_total_accepts_matching_total():
+    """Testa conferência com total correto."""
+    items = [{"product_id": "p", "quantity": 2, "price": 50.0}]
+
+    assert reconcile_total(items, 100.0) == Decimal("100.00")
+    assert reconcile_total(items) == Decimal("100.00")
+
+
+def test_reconcile_total_rejects_mismatch():
+    """Testa conferência com total divergente."""
+    items = [{"product_id": "p", "quantity": 2, "price": 50.0}]
+
+    with pytest.raises(OrderTotalMismatchError):
+        reconcile_total(items, 100.01)
+
+
+def test_pricing_uses_currency_exponent():
+    """Testa preços, soma e conferência com três casas (KWD) e sem casas (JPY)."""
+    items = validate_items([{"product_id": "p", "quantity": 1, "price": 1.234}], exponent=3)
+
+    assert reconcile_total(items, 1.234, exponent=3) == Decimal("1.234")
+    with pytest.raises(OrderTotalMismatchError):
+        reconcile_total(items, 1.23, exponent=3)
+
+    yen = validate_items([{"product_id": "p", "quantity": 3, "price": 100}], exponent=0)
+    assert calculate_items_total(yen, exponent=0) == Decimal("300")
+    with pytest.raises(InvalidOrderItemError, match="unidade menor"):
+        validate_items([{"product_id": "p", "quantity": 1, "price": 0.4}], exponent=0)
+    assert validate_items([{"product_id": "p", "quantity": 1, "price": 0.004}], exponent=3)
+
+
+def test_calculate_items_total_rejects_total_above_int64():
+    """Testa que totais que não cabem no int64 do MongoDB são rejeitados."""
+    items = [{"product_id": f"p{i}", "quantity": 100_000, "price": 1e9} for i in range(500)]
+
+    with pytest.raises(InvalidOrderItemError, match="excede"):
+        calculate_items_total(items, exponent=3)
@@ -83,3 +83,53 @@ def test_valid_transitions_unknown_status():
     for status in all_statuses:
         transitions = OrderStatus.get_valid_transitions(status)
         assert isinstance(transitions, list)
+
+
+def test_can_transition_to_every_pair_matches_table():
+    """Testa can_transition_to contra a lista de transições para todos os pares."""
+    for current in OrderStatus:
+        for new in OrderStatus:
+            expected = new in OrderStatus.get_valid_transitions(current)
+            assert current.can_transition_to(new) is expected
+
+
+def test_get_valid_transitions_returns_new_list():
+    """Testa que a lista retornada pode ser alterada sem afetar a tabela."""
+    transitions = OrderStatus.get_valid_transitions(OrderStatus.PENDING)
+    transitions.clear()
+
+    assert OrderStatus.get_valid_transitions(OrderStatus.PENDING) == [
+        OrderStatus.CONFIRMED,
+        OrderStatus.CANCELLED,
+    ]
+
+
+def test_terminal_states():
+    """Testa status terminais."""
+    assert OrderStatus.terminal_states() == {OrderStatus.DELIVERED, OrderStatus.CANCELLED}
+    assert OrderStatus.CANCELLED.is_terminal is True
+    assert OrderStatus.SHIPPED.is_terminal is False
+
+
+def test_reachable_terminal_states():
+    """Testa status terminais alcançáveis."""
+    assert OrderStatus.PENDING.reachable_terminal_states() == {
+        OrderStatus.DELIVERED,
+        OrderStatus.CANCELLED,
+    }
+    assert OrderStatus.SHIPPED.reachable_terminal_states() == {OrderStatus.DELIVERED}
+    assert OrderStatus.CANCELLED.reachable_terminal_states() == {OrderStatus.CANCELLED}
+
+
+def test_validate_transitions_batch():
+    """Testa validação de transições em lote."""
+    result = OrderStatus.validate_transitions(
+        [
+            (OrderStatus.PENDING, OrderStatus.CONFIRMED),
+            (OrderStatus.PENDING, OrderStatus.DELIVERED),
+            (OrderStatus.SHIPPED, OrderStatus.DELIVERED),
+            (OrderStatus.DELIVERED, OrderStatus.CANCELLED),
+        ]
+    )
+
+    assert result == [True, False, True, False]